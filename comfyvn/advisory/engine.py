@@ -0,0 +1,473 @@
+"""
+Incremental, parallel runner for advisory scanner plugins.
+
+:func:`comfyvn.advisory.scanner.scan` runs every plugin over the whole bundle
+on each call.  :class:`ScanEngine` instead splits a bundle into *nodes* — one
+per scene, one per character and one ``bundle`` node holding licences,
+assets and metadata — and treats every ``(plugin, node)`` pair as a job:
+
+* each job's findings are cached in SQLite under
+  ``(plugin name, plugin version, node digest)``; the digest covers the node
+  payload plus the project/timeline/source descriptors that end up in
+  findings, so only edited nodes are re-scanned;
+* cache misses fan out over a bounded thread pool and findings stream back
+  from :meth:`ScanEngine.iter_scan` as each job completes (cache hits first).
+
+Plugins registered with ``scope="node"`` receive a single-node
+:class:`~comfyvn.core.advisory_hooks.BundleContext`; ``scope="bundle"``
+plugins (the default for third-party plugins, which may aggregate across
+scenes) receive the full context and are keyed by a digest of every node.
+Fresh findings are logged through ``log_issue`` once; cache hits return the
+originally logged entries instead of logging duplicates.
+
+Set ``COMFYVN_ADVISORY_SCAN_CACHE`` to a database path to route
+:func:`~comfyvn.advisory.scanner.scan` through the process engine.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from comfyvn.advisory import scanner as _scanner
+from comfyvn.core.advisory import log_issue
+from comfyvn.core.advisory_hooks import (
+    BundleContext,
+    annotate_issue,
+    asset_license_issue,
+    scene_issues,
+)
+
+LOGGER = logging.getLogger("comfyvn.advisory.engine")
+
+SCAN_CACHE_ENV = "COMFYVN_ADVISORY_SCAN_CACHE"
+DEFAULT_MAX_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+# Node jobs are submitted to the pool in batches; one future per (plugin,
+# node) costs more than the keyword checks themselves.
+DEFAULT_BATCH_SIZE = 64
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS advisory_scan_cache (
+        plugin TEXT NOT NULL,
+        version TEXT NOT NULL,
+        node_digest TEXT NOT NULL,
+        node_id TEXT NOT NULL,
+        findings TEXT NOT NULL,
+        scanned_at REAL NOT NULL,
+        PRIMARY KEY (plugin, version, node_digest)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_advisory_scan_cache_scanned "
+    "ON advisory_scan_cache(scanned_at)",
+)
+
+CacheKey = Tuple[str, str, str]
+_SQL_CHUNK = 500  # stays under SQLITE_MAX_VARIABLE_NUMBER on old builds
+
+
+# Shared encoder: building one per digest costs as much as small payloads.
+_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _digest(payload: Any) -> str:
+    return hashlib.sha1(_ENCODER.encode(payload).encode("utf-8")).hexdigest()
+
+
+class ScanCache:
+    """Thread-safe SQLite table of per-node plugin findings."""
+
+    def __init__(self, db_path: Path | str) -> None:
+        self.db_path = Path(db_path)
+        if str(db_path) != ":memory:":
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(db_path), check_same_thread=False, timeout=30.0
+        )
+        with self._lock, self._conn:
+            if str(db_path) != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: CacheKey) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT findings FROM advisory_scan_cache "
+                "WHERE plugin = ? AND version = ? AND node_digest = ?",
+                key,
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def get_many(
+        self, keys: Iterable[CacheKey]
+    ) -> Dict[CacheKey, List[Dict[str, Any]]]:
+        """Batch lookup; keys without a cached entry are absent from the result."""
+        grouped: Dict[Tuple[str, str], List[str]] = {}
+        for plugin, version, digest in keys:
+            grouped.setdefault((plugin, version), []).append(digest)
+        found: Dict[CacheKey, List[Dict[str, Any]]] = {}
+        with self._lock:
+            for (plugin, version), digests in grouped.items():
+                for offset in range(0, len(digests), _SQL_CHUNK):
+                    chunk = digests[offset : offset + _SQL_CHUNK]
+                    rows = self._conn.execute(
+                        "SELECT node_digest, findings FROM advisory_scan_cache "
+                        "WHERE plugin = ? AND version = ? AND node_digest IN "
+                        f"({','.join('?' * len(chunk))})",
+                        (plugin, version, *chunk),
+                    ).fetchall()
+                    for digest, findings in rows:
+                        found[(plugin, version, digest)] = json.loads(findings)
+        return found
+
+    def put(self, key: CacheKey, node_id: str, findings: List[Dict[str, Any]]) -> None:
+        self.put_many([(key, node_id, findings)])
+
+    def put_many(
+        self, rows: Iterable[Tuple[CacheKey, str, List[Dict[str, Any]]]]
+    ) -> None:
+        now = time.time()
+        params = [
+            (*key, node_id, json.dumps(findings, ensure_ascii=False, default=str), now)
+            for key, node_id, findings in rows
+        ]
+        if not params:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO advisory_scan_cache "
+                "(plugin, version, node_digest, node_id, findings, scanned_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                params,
+            )
+
+    def prune(self, older_than: float) -> int:
+        """Drop entries last written before ``older_than`` (epoch seconds)."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM advisory_scan_cache WHERE scanned_at < ?", (older_than,)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM advisory_scan_cache")
+
+
+@dataclass
+class ScanNode:
+    node_id: str
+    kind: str  # scene | character | bundle
+    context: BundleContext
+    digest: str
+
+
+def bundle_nodes(context: BundleContext) -> List[ScanNode]:
+    """Split ``context`` into single-node contexts with content digests."""
+
+    metadata = dict(context.metadata or {})
+    scope = [context.project_id, context.timeline_id, metadata.get("source")]
+    base = {"project_id": context.project_id, "timeline_id": context.timeline_id}
+    nodes: List[ScanNode] = []
+    for scene_id, scene in (context.scenes or {}).items():
+        source = (context.scene_sources or {}).get(scene_id)
+        node_id = f"scene:{scene_id}"
+        nodes.append(
+            ScanNode(
+                node_id,
+                "scene",
+                BundleContext(
+                    **base,
+                    scenes={scene_id: scene},
+                    scene_sources={scene_id: source} if source else {},
+                ),
+                _digest([node_id, scope, scene, source]),
+            )
+        )
+    for character_id, character in (context.characters or {}).items():
+        node_id = f"character:{character_id}"
+        nodes.append(
+            ScanNode(
+                node_id,
+                "character",
+                BundleContext(**base, characters={character_id: character}),
+                _digest([node_id, scope, character]),
+            )
+        )
+    licenses = list(context.licenses or [])
+    assets = list(context.assets or [])
+    nodes.append(
+        ScanNode(
+            "bundle",
+            "bundle",
+            BundleContext(**base, licenses=licenses, assets=assets, metadata=metadata),
+            _digest(["bundle", scope, licenses, assets, metadata]),
+        )
+    )
+    return nodes
+
+
+def _scene_keyword_plugin(context: BundleContext) -> List[Any]:
+    return [
+        annotate_issue(context, issue)
+        for scene_id, payload in context.scenes.items()
+        for issue in scene_issues(context, scene_id, payload)
+    ]
+
+
+def _asset_license_plugin(context: BundleContext) -> List[Any]:
+    issue = asset_license_issue(context)
+    return [annotate_issue(context, issue)] if issue is not None else []
+
+
+# The checks ``advisory_hooks.scan`` runs before the registered plugins.
+_BUILTIN_JOBS: Tuple[_scanner.RegisteredPlugin, ...] = (
+    _scanner.RegisteredPlugin("scene_keywords", _scene_keyword_plugin, scope="node"),
+    _scanner.RegisteredPlugin("asset_licenses", _asset_license_plugin, scope="node"),
+)
+
+
+@dataclass
+class _Job:
+    plugin: _scanner.RegisteredPlugin
+    node_id: str
+    context: BundleContext
+    key: CacheKey
+
+
+class ScanEngine:
+    """Runs scanner plugins per node with a content-addressed result cache."""
+
+    def __init__(
+        self,
+        cache: Optional[ScanCache] = None,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self.cache = cache if cache is not None else ScanCache(":memory:")
+        self.max_workers = max(1, int(max_workers))
+        self.batch_size = max(1, int(batch_size))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Findings of the most recent scan; answers repeat scans without SQLite.
+        self._recent: Dict[CacheKey, List[Dict[str, Any]]] = {}
+        self.last_stats: Dict[str, Any] = {}
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="advisory-scan",
+                )
+            return self._executor
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    # Planning -------------------------------------------------------------
+    def _plugins(self) -> List[_scanner.RegisteredPlugin]:
+        plugins = list(_BUILTIN_JOBS)
+        for plugin in _scanner.iter_scanner_plugins():
+            if plugin.name == "nsfw_classifier" and _scanner._NSF_CLASSIFIER is None:
+                continue
+            plugins.append(plugin)
+        return plugins
+
+    def _plan(self, context: BundleContext) -> Tuple[List[ScanNode], List[_Job]]:
+        nodes = bundle_nodes(context)
+        whole = _digest([node.digest for node in nodes])
+        jobs: List[_Job] = []
+        for plugin in self._plugins():
+            if plugin.scope == "node":
+                jobs.extend(
+                    _Job(
+                        plugin,
+                        node.node_id,
+                        node.context,
+                        (plugin.name, plugin.version, node.digest),
+                    )
+                    for node in nodes
+                )
+            else:
+                jobs.append(
+                    _Job(
+                        plugin,
+                        "bundle:*",
+                        context,
+                        (plugin.name, plugin.version, whole),
+                    )
+                )
+        return nodes, jobs
+
+    # Execution ------------------------------------------------------------
+    @staticmethod
+    def _run(job: _Job, source: Any) -> Optional[List[Dict[str, Any]]]:
+        try:
+            payloads = list(job.plugin.handler(job.context) or [])
+        except Exception as exc:  # pragma: no cover - defensive
+            LOGGER.exception("Scanner plugin %s crashed: %s", job.plugin.name, exc)
+            return None
+        entries: List[Dict[str, Any]] = []
+        for payload in payloads:
+            issue = _scanner._coerce_issue(payload, job.plugin.name)
+            if issue is None:
+                continue
+            issue.detail.setdefault("source", source)
+            issue.detail.setdefault("node", job.node_id)
+            entries.append(log_issue(issue))
+        return entries
+
+    @classmethod
+    def _run_batch(
+        cls, jobs: List[_Job], source: Any
+    ) -> List[Tuple[_Job, Optional[List[Dict[str, Any]]]]]:
+        return [(job, cls._run(job, source)) for job in jobs]
+
+    def _lookup(self, jobs: List[_Job]) -> Dict[CacheKey, List[Dict[str, Any]]]:
+        found: Dict[CacheKey, List[Dict[str, Any]]] = {}
+        missing: List[CacheKey] = []
+        for job in jobs:
+            if not job.plugin.cacheable:
+                continue
+            cached = self._recent.get(job.key)
+            if cached is None:
+                missing.append(job.key)
+            else:
+                found[job.key] = cached
+        if missing:
+            found.update(self.cache.get_many(missing))
+        return found
+
+    def iter_scan(
+        self, bundle: Mapping[str, Any] | BundleContext
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield normalised findings as they become available.
+
+        Cached node results come first, then fresh results in completion order.
+        ``last_stats`` is filled in once the iterator is exhausted.
+        """
+
+        started = time.perf_counter()
+        context = (
+            bundle
+            if isinstance(bundle, BundleContext)
+            else _scanner._bundle_context_from_dict(bundle)
+        )
+        source = (context.metadata or {}).get("source")
+        nodes, jobs = self._plan(context)
+        recent: Dict[CacheKey, List[Dict[str, Any]]] = {}
+        pending: List[_Job] = []
+        hits = self._lookup(jobs)
+        for job in jobs:
+            entries = hits.get(job.key) if job.plugin.cacheable else None
+            if entries is None:
+                pending.append(job)
+                continue
+            recent[job.key] = entries
+            for entry in entries:
+                yield _scanner._normalise_entry(entry)
+
+        failed = 0
+        if pending:
+            pool = self._pool()
+            remaining = {
+                pool.submit(
+                    self._run_batch, pending[offset : offset + self.batch_size], source
+                )
+                for offset in range(0, len(pending), self.batch_size)
+            }
+            while remaining:
+                done, remaining = wait(remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    fresh = []
+                    for job, entries in future.result():
+                        if entries is None:
+                            failed += 1
+                            continue
+                        if job.plugin.cacheable:
+                            recent[job.key] = entries
+                            fresh.append((job.key, job.node_id, entries))
+                        for entry in entries:
+                            yield _scanner._normalise_entry(entry)
+                    self.cache.put_many(fresh)
+
+        self._recent = recent
+        self.last_stats = {
+            "nodes": len(nodes),
+            "jobs": len(jobs),
+            "cached": len(jobs) - len(pending),
+            "scanned": len(pending) - failed,
+            "failed": failed,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+        LOGGER.debug("Advisory engine scan stats=%s", self.last_stats)
+
+    def scan(self, bundle: Mapping[str, Any] | BundleContext) -> List[Dict[str, Any]]:
+        """Collect :meth:`iter_scan` into the ordering ``scanner.scan`` uses."""
+        findings = list(self.iter_scan(bundle))
+        findings.sort(key=lambda entry: str(entry.get("issue_id") or ""))
+        return findings
+
+
+_ENGINE: Optional[ScanEngine] = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def _cache_from_env() -> Optional[ScanCache]:
+    path = os.getenv(SCAN_CACHE_ENV, "").strip()
+    if not path:
+        return None
+    try:
+        return ScanCache(path)
+    except Exception:  # pragma: no cover - defensive
+        LOGGER.warning("Unable to open advisory scan cache at %s", path, exc_info=True)
+        return None
+
+
+def get_scan_engine() -> ScanEngine:
+    """Process-wide engine; persistent when ``COMFYVN_ADVISORY_SCAN_CACHE`` is set."""
+    global _ENGINE
+    with _ENGINE_LOCK:
+        if _ENGINE is None:
+            _ENGINE = ScanEngine(_cache_from_env())
+        return _ENGINE
+
+
+def default_engine() -> Optional[ScanEngine]:
+    """The engine ``scanner.scan`` should delegate to, or ``None`` (legacy path)."""
+    if not os.getenv(SCAN_CACHE_ENV, "").strip():
+        return None
+    return get_scan_engine()
+
+
+__all__ = [
+    "SCAN_CACHE_ENV",
+    "ScanCache",
+    "ScanEngine",
+    "ScanNode",
+    "bundle_nodes",
+    "default_engine",
+    "get_scan_engine",
+]
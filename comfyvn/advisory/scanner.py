@@ -22,6 +22,7 @@ from typing import (
 )
 
 from comfyvn.core.advisory import AdvisoryIssue, log_issue
+from comfyvn.core.term_matcher import compile_terms
 
 LOGGER = logging.getLogger("comfyvn.advisory.scanner")
 
@@ -40,6 +41,13 @@ class RegisteredPlugin:
     name: str
     handler: ScannerHook
     optional: bool = False
+    # Bump ``version`` whenever a plugin's output for the same input changes;
+    # it is part of the incremental scan cache key.
+    version: str = "1"
+    # ``node`` plugins are handed one scene/character/bundle slice at a time by
+    # ``comfyvn.advisory.engine``; ``bundle`` plugins always see everything.
+    scope: str = "bundle"
+    cacheable: bool = True
 
 
 _PLUGINS: list[RegisteredPlugin] = []
@@ -52,16 +60,30 @@ def register_scanner_plugin(
     *,
     optional: bool = False,
     replace: bool = False,
+    version: str = "1",
+    scope: str = "bundle",
+    cacheable: bool = True,
 ) -> None:
     """Register a scanner plugin. Existing entry with the same name is replaced when requested."""
 
+    if scope not in {"bundle", "node"}:
+        raise ValueError("scope must be 'bundle' or 'node'")
     existing = next((p for p in _PLUGINS if p.name == name), None)
     if existing:
         if not replace:
             LOGGER.debug("Scanner plugin %s already registered", name)
             return
         _PLUGINS.remove(existing)
-    _PLUGINS.append(RegisteredPlugin(name=name, handler=handler, optional=optional))
+    _PLUGINS.append(
+        RegisteredPlugin(
+            name=name,
+            handler=handler,
+            optional=optional,
+            version=str(version),
+            scope=scope,
+            cacheable=cacheable,
+        )
+    )
     LOGGER.debug("Scanner plugin registered name=%s optional=%s", name, optional)
 
 
@@ -359,11 +381,13 @@ def _license_plugin(context: "BundleContext") -> Iterable[AdvisoryIssue]:
             else:
                 message = f"SPDX license '{spdx}' detected."
         else:
-            label_lower = label.lower()
-            if any(term in label_lower for term in _LICENSE_BLOCK_TERMS):
+            restrictions = compile_terms(
+                {"block": _LICENSE_BLOCK_TERMS, "warn": _LICENSE_WARN_TERMS}
+            ).categorize(label)
+            if "block" in restrictions:
                 severity = "error"
                 message = f"License '{label}' forbids redistribution."
-            elif any(term in label_lower for term in _LICENSE_WARN_TERMS):
+            elif "warn" in restrictions:
                 severity = "warn"
                 message = f"License '{label}' may restrict usage."
             else:
@@ -430,22 +454,19 @@ def _ip_match_plugin(context: "BundleContext") -> Iterable[AdvisoryIssue]:
         if isinstance(value, str):
             segments.append(value)
 
-    haystack = "\n".join(seg for seg in segments if isinstance(seg, str)).lower()
+    haystack = "\n".join(seg for seg in segments if isinstance(seg, str))
     if not haystack.strip():
         return []
 
-    matches: Dict[str, set[str]] = {}
-    for owner, tokens in _IP_TERMS.items():
-        for token in tokens:
-            if token in haystack:
-                matches.setdefault(owner, set()).add(token)
+    # One pass over the haystack for every owner's terms.
+    matches = compile_terms(_IP_TERMS).categorize(haystack)
     if not matches:
         return []
 
     detail = {
         "plugin": "ip_match",
         "matches": [
-            {"owner": owner, "tokens": sorted(tokens)}
+            {"owner": owner, "tokens": tokens}
             for owner, tokens in sorted(matches.items())
         ],
         "source": metadata.get("source"),
@@ -651,9 +672,11 @@ def scan(bundle: BundleDict | "BundleContext") -> List[Dict[str, Any]]:
     Run the advisory scanner for ``bundle`` and normalise severity levels.
 
     The return payload matches the CLI expectations: ``level`` is one of
-    ``info``/``warn``/``block``.
+    ``info``/``warn``/``block``.  When ``COMFYVN_ADVISORY_SCAN_CACHE`` is set
+    the incremental :mod:`comfyvn.advisory.engine` runs the scan instead.
     """
 
+    from comfyvn.advisory.engine import default_engine
     from comfyvn.core.advisory_hooks import BundleContext
     from comfyvn.core.advisory_hooks import scan as _scan_bundle
 
@@ -662,12 +685,19 @@ def scan(bundle: BundleDict | "BundleContext") -> List[Dict[str, Any]]:
     else:
         context = _bundle_context_from_dict(bundle)
 
+    engine = default_engine()
+    if engine is not None:
+        return engine.scan(context)
+
     raw_findings = _scan_bundle(context)
     combined = _dedupe_findings(raw_findings)
     return [_normalise_entry(entry) for entry in combined]
 
 
 # Register built-in plugins at import time.
-register_scanner_plugin("spdx_license", _license_plugin)
-register_scanner_plugin("ip_match", _ip_match_plugin)
-register_scanner_plugin("nsfw_classifier", _nsfw_plugin, optional=True)
+register_scanner_plugin("spdx_license", _license_plugin, scope="node")
+register_scanner_plugin("ip_match", _ip_match_plugin, scope="node")
+# Verdicts depend on the external classifier hook, not just the bundle.
+register_scanner_plugin(
+    "nsfw_classifier", _nsfw_plugin, optional=True, scope="node", cacheable=False
+)
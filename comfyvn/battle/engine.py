@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import logging
+import math
 import os
 import secrets
 from dataclasses import dataclass
@@ -10,6 +11,11 @@ from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional,
 from comfyvn.runner.rng import DeterministicRNG
 from comfyvn.runner.scenario_runner import DEFAULT_POV
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
 LOGGER = logging.getLogger(__name__)
 
 ENV_SEED = "COMFYVN_BATTLE_SEED"
@@ -17,6 +23,20 @@ DEFAULT_ROUNDS = 3
 VARIABLE_KEY = "battle_outcome"
 EDITOR_PROMPT = "Pick winner"
 FORMULA_V0 = "base + STR*1.0 + AGI*0.5 + weapon_tier*0.75 + status_mod + rng(seed)"
+DEFAULT_BATCH_SIZE = 1000
+MAX_BATCH_SIZE = 1_000_000
+DEFAULT_HISTOGRAM_BINS = 20
+MAX_HISTOGRAM_BINS = 1000
+DEFAULT_SENSITIVITY_DELTA = 1.0
+# Stat inputs reported by batch sensitivity analysis, in breakdown order.
+SENSITIVITY_STATS: Tuple[str, ...] = (
+    "base",
+    "str",
+    "agi",
+    "weapon_tier",
+    "status_mod",
+    "rng",
+)
 
 _NARRATOR_TEMPLATES: Tuple[str, ...] = (
     "{winner} seizes the initiative against {opponent}.",
@@ -155,11 +175,8 @@ def _rng_component(rng: DeterministicRNG, variance: float) -> float:
     return jitter * variance
 
 
-def _competitor_breakdown(
-    name: str,
-    payload: Any,
-    rng: DeterministicRNG,
-) -> CompetitorBreakdown:
+def _competitor_inputs(name: str, payload: Any) -> Dict[str, float]:
+    """Coerce a contender payload into the raw ``SENSITIVITY_STATS`` inputs."""
     if isinstance(payload, Mapping):
         base_raw = payload.get("base")
         str_raw = payload.get("str", payload.get("strength"))
@@ -188,11 +205,40 @@ def _competitor_breakdown(
         0.0,
         _coerce_float(variance_raw, competitor=name, field="rng", default=1.0),
     )
+    return {
+        "base": base,
+        "str": strength_input,
+        "agi": agility_input,
+        "weapon_tier": weapon_input,
+        "status_mod": status_mod,
+        "rng": variance,
+    }
+
+
+def _fixed_total(inputs: Mapping[str, float]) -> float:
+    # Same summation order as ``sum(components.values())`` minus the rng term,
+    # so batch totals match single simulations bit for bit.
+    total = 0.0
+    total += inputs["base"]
+    total += inputs["str"] * 1.0
+    total += inputs["agi"] * 0.5
+    total += inputs["weapon_tier"] * 0.75
+    total += inputs["status_mod"]
+    return total
 
-    strength_bonus = strength_input * 1.0
-    agility_bonus = agility_input * 0.5
-    weapon_bonus = weapon_input * 0.75
-    rng_bonus = _rng_component(rng, variance)
+
+def _competitor_breakdown(
+    name: str,
+    payload: Any,
+    rng: DeterministicRNG,
+) -> CompetitorBreakdown:
+    inputs = _competitor_inputs(name, payload)
+    base = inputs["base"]
+    status_mod = inputs["status_mod"]
+    strength_bonus = inputs["str"] * 1.0
+    agility_bonus = inputs["agi"] * 0.5
+    weapon_bonus = inputs["weapon_tier"] * 0.75
+    rng_bonus = _rng_component(rng, inputs["rng"])
 
     components = {
         "base": base,
@@ -495,3 +541,278 @@ def simulate(
         narrate=narrate,
     )
     return result
+
+
+@dataclass(slots=True)
+class BattleBatchResult:
+    """Aggregate of many seeded simulations of one stat block (no narration)."""
+
+    simulations: int
+    seeds: Dict[str, Any]
+    contenders: List[str]
+    wins: Dict[str, int]
+    mean_totals: Dict[str, float]
+    margin_histogram: Dict[str, Any]
+    sensitivity: Dict[str, Dict[str, float]]
+    sensitivity_delta: float
+    outcomes: Optional[List[str]] = None
+
+    def win_rates(self) -> Dict[str, float]:
+        return {name: count / self.simulations for name, count in self.wins.items()}
+
+    def as_dict(self) -> Dict[str, Any]:
+        rates = self.win_rates()
+        distribution: Dict[str, Dict[str, Any]] = {}
+        for name in self.contenders:
+            rate = rates[name]
+            std_error = (rate * (1.0 - rate) / self.simulations) ** 0.5
+            distribution[name] = {
+                "wins": self.wins[name],
+                "win_rate": round(rate, 6),
+                "std_error": round(std_error, 6),
+                "ci95": [
+                    round(max(0.0, rate - 1.96 * std_error), 6),
+                    round(min(1.0, rate + 1.96 * std_error), 6),
+                ],
+                "mean_total": round(self.mean_totals[name], 3),
+            }
+        payload: Dict[str, Any] = {
+            "simulations": self.simulations,
+            "seeds": dict(self.seeds),
+            "formula": FORMULA_V0,
+            "win_probability": distribution,
+            "margin_histogram": dict(self.margin_histogram),
+            "sensitivity": {
+                name: {stat: round(value, 6) for stat, value in stats.items()}
+                for name, stats in self.sensitivity.items()
+            },
+            "sensitivity_delta": self.sensitivity_delta,
+        }
+        if self.outcomes is not None:
+            payload["outcomes"] = list(self.outcomes)
+        return payload
+
+
+def _batch_seeds(
+    count: Optional[int],
+    seeds: Optional[Iterable[Any]],
+    base_seed: Optional[int],
+) -> List[int]:
+    if seeds is not None:
+        try:
+            values = [int(value) % DeterministicRNG._MOD for value in seeds]
+        except Exception as exc:
+            raise ValueError("seeds must be a list of integers") from exc
+        if not values:
+            raise ValueError("seeds must contain at least one seed")
+        if len(values) > MAX_BATCH_SIZE:
+            raise ValueError(f"at most {MAX_BATCH_SIZE} simulations per batch")
+        return values
+    try:
+        total = DEFAULT_BATCH_SIZE if count is None else int(count)
+    except Exception as exc:
+        raise ValueError("count must be an integer") from exc
+    if total < 1 or total > MAX_BATCH_SIZE:
+        raise ValueError(f"count must be between 1 and {MAX_BATCH_SIZE}")
+    start = _build_rng(base_seed, None).seed
+    return [(start + offset) % DeterministicRNG._MOD for offset in range(total)]
+
+
+def _batch_draws(seeds: List[int], contenders: int) -> Any:
+    """
+    Return the ``rng.random()`` draws each contender consumes per seed.
+
+    Column ``i`` is the ``i``-th draw of ``DeterministicRNG.from_seed(seed)``,
+    i.e. exactly what ``_compute_breakdowns`` sees for contender ``i``.
+    """
+    mod = DeterministicRNG._MOD
+    mult = DeterministicRNG._MULT
+    inc = DeterministicRNG._INC
+    if np is not None:
+        values = np.asarray(seeds, dtype=np.uint64)
+        draws = np.empty((len(seeds), contenders), dtype=np.float64)
+        for column in range(contenders):
+            # mult < 2**21 and values < 2**32, so the product fits in uint64.
+            values = (values * np.uint64(mult) + np.uint64(inc)) % np.uint64(mod)
+            draws[:, column] = values / float(mod)
+        return draws
+    rows: List[List[float]] = []
+    for seed in seeds:
+        value = seed
+        row: List[float] = []
+        for _ in range(contenders):
+            value = (mult * value + inc) % mod
+            row.append(value / mod)
+        rows.append(row)
+    return rows
+
+
+def _batch_totals(fixed: List[float], variances: List[float], draws: Any) -> Any:
+    if np is not None:
+        jitter = draws * 2.0 - 1.0
+        scale = np.asarray([v if v > 0 else 0.0 for v in variances])
+        return np.asarray(fixed, dtype=np.float64) + jitter * scale
+    return [
+        [
+            fixed[i]
+            + ((row[i] * 2.0 - 1.0) * variances[i] if variances[i] > 0 else 0.0)
+            for i in range(len(fixed))
+        ]
+        for row in draws
+    ]
+
+
+def _batch_winners(totals: Any, order: List[int]) -> Any:
+    """Winner column per row with ``_prepare_simulation``'s name tie-break."""
+    if np is not None:
+        ranked = totals[:, order]
+        return np.asarray(order)[np.argmax(ranked, axis=1)]
+    winners: List[int] = []
+    for row in totals:
+        best = order[0]
+        for index in order[1:]:
+            if row[index] > row[best]:
+                best = index
+        winners.append(best)
+    return winners
+
+
+def _win_counts(totals: Any, order: List[int], contenders: int) -> List[int]:
+    winners = _batch_winners(totals, order)
+    if np is not None:
+        return np.bincount(winners, minlength=contenders).tolist()
+    counts = [0] * contenders
+    for index in winners:
+        counts[index] += 1
+    return counts
+
+
+def _margin_histogram(totals: Any, bins: int) -> Dict[str, Any]:
+    if np is not None:
+        if totals.shape[1] < 2:
+            return {"bins": [], "counts": []}
+        top_two = np.partition(totals, -2, axis=1)[:, -2:]
+        margins = top_two[:, 1] - top_two[:, 0]
+        counts, edges = np.histogram(margins, bins=bins)
+        return {
+            "bins": [round(float(edge), 6) for edge in edges],
+            "counts": counts.tolist(),
+            "mean": round(float(margins.mean()), 6),
+            "p50": round(float(np.median(margins)), 6),
+        }
+    if not totals or len(totals[0]) < 2:
+        return {"bins": [], "counts": []}
+    margins = []
+    for row in totals:
+        first, second = sorted(row, reverse=True)[:2]
+        margins.append(first - second)
+    low, high = min(margins), max(margins)
+    if high <= low:
+        low, high = low - 0.5, high + 0.5
+    width = (high - low) / bins
+    counts = [0] * bins
+    for margin in margins:
+        counts[min(bins - 1, int((margin - low) / width))] += 1
+    ordered = sorted(margins)
+    return {
+        "bins": [round(low + width * step, 6) for step in range(bins + 1)],
+        "counts": counts,
+        "mean": round(sum(margins) / len(margins), 6),
+        "p50": round(ordered[len(ordered) // 2], 6),
+    }
+
+
+def simulate_batch(
+    stats: Mapping[str, Any],
+    *,
+    count: Optional[int] = None,
+    seed: Optional[int] = None,
+    seeds: Optional[Iterable[Any]] = None,
+    bins: int = DEFAULT_HISTOGRAM_BINS,
+    sensitivity: bool = True,
+    delta: float = DEFAULT_SENSITIVITY_DELTA,
+    include_outcomes: bool = False,
+) -> BattleBatchResult:
+    """
+    Monte Carlo balance analysis: simulate one stat block over many seeds.
+
+    Seed ``k`` reproduces ``simulate(stats, seed=k)`` exactly (same RNG draws,
+    totals and tie-break) but skips breakdown objects and narration.  Seeds are
+    ``seeds`` when given, otherwise ``count`` consecutive values from ``seed``.
+    Sensitivity is the finite-difference change in each contender's win rate
+    when one of their stats is raised by ``delta``, evaluated on the same seeds
+    so the estimate is not swamped by sampling noise.  Uses NumPy when present.
+    """
+    entries = _iter_competitors(stats)
+    names = [name for name, _ in entries]
+    inputs = [_competitor_inputs(name, payload) for name, payload in entries]
+    try:
+        bin_count = max(1, int(bins))
+        delta_value = float(delta)
+    except Exception as exc:
+        raise ValueError("bins must be an integer and delta numeric") from exc
+    if bin_count > MAX_HISTOGRAM_BINS:
+        raise ValueError(f"bins must be at most {MAX_HISTOGRAM_BINS}")
+    if not math.isfinite(delta_value):
+        raise ValueError("delta must be a finite number")
+    seed_values = _batch_seeds(count, seeds, seed)
+    order = sorted(range(len(names)), key=lambda index: names[index].lower())
+
+    draws = _batch_draws(seed_values, len(names))
+    fixed = [_fixed_total(item) for item in inputs]
+    variances = [item["rng"] for item in inputs]
+    totals = _batch_totals(fixed, variances, draws)
+    wins = _win_counts(totals, order, len(names))
+    simulations = len(seed_values)
+
+    if np is not None:
+        means = totals.mean(axis=0).tolist()
+    else:
+        means = [
+            sum(row[index] for row in totals) / simulations
+            for index in range(len(names))
+        ]
+
+    sensitivity_map: Dict[str, Dict[str, float]] = {}
+    if sensitivity and delta_value:
+        for index, name in enumerate(names):
+            per_stat: Dict[str, float] = {}
+            for stat in SENSITIVITY_STATS:
+                bumped = dict(inputs[index])
+                bumped[stat] = bumped[stat] + delta_value
+                if stat == "rng":
+                    bumped["rng"] = max(0.0, bumped["rng"])
+                trial_fixed = list(fixed)
+                trial_variances = list(variances)
+                trial_fixed[index] = _fixed_total(bumped)
+                trial_variances[index] = bumped["rng"]
+                trial = _batch_totals(trial_fixed, trial_variances, draws)
+                trial_wins = _win_counts(trial, order, len(names))[index]
+                per_stat[stat] = (trial_wins - wins[index]) / simulations / delta_value
+            sensitivity_map[name] = per_stat
+
+    outcomes: Optional[List[str]] = None
+    if include_outcomes:
+        outcomes = [names[int(index)] for index in _batch_winners(totals, order)]
+
+    LOGGER.debug(
+        "battle.sim.batch simulations=%s contenders=%s numpy=%s",
+        simulations,
+        len(names),
+        np is not None,
+    )
+    return BattleBatchResult(
+        simulations=simulations,
+        seeds={
+            "first": seed_values[0],
+            "last": seed_values[-1],
+            "explicit": seeds is not None,
+        },
+        contenders=names,
+        wins={name: int(wins[index]) for index, name in enumerate(names)},
+        mean_totals={name: float(means[index]) for index, name in enumerate(names)},
+        margin_histogram=_margin_histogram(totals, bin_count),
+        sensitivity=sensitivity_map,
+        sensitivity_delta=delta_value,
+        outcomes=outcomes,
+    )
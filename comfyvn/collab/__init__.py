@@ -9,11 +9,13 @@ from __future__ import annotations
 
 from .crdt import CRDTDocument, CRDTOperation, OperationResult
 from .room import CollabClientState, CollabHub, CollabPresence, CollabRoom
+from .sequence import LineSequence
 
 __all__ = [
     "CRDTDocument",
     "CRDTOperation",
     "OperationResult",
+    "LineSequence",
     "CollabClientState",
     "CollabPresence",
     "CollabRoom",
@@ -5,9 +5,10 @@ Conflict-free replicated document for collaborative scene authoring.
 
 The CRDT is intentionally conservative: operations use last-writer-wins
 registers on top-level fields, per-node payloads, and individual script
-lines.  Ordering for script lines is driven by an LWW list that keeps the
-latest caller-supplied order.  This keeps merges deterministic while
-remaining easy to serialise for WebSocket clients.
+lines.  Ordering for script lines is a fractional-index sequence CRDT
+(``LineSequence``) so concurrent inserts and reorders merge instead of
+overwriting each other.  This keeps merges deterministic while remaining
+easy to serialise for WebSocket clients.
 """
 
 import time
@@ -17,6 +18,10 @@ from collections.abc import Iterable, MutableMapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any, Deque, Dict, List, Optional
 
+from .sequence import LineSequence
+
+TOMBSTONE_COMPACT_THRESHOLD = 256
+
 
 def _now() -> float:
     return time.time()
@@ -124,34 +129,6 @@ class LWWRegister:
         return False
 
 
-class OrderRegister:
-    """LWW register specialised for maintaining deterministic order."""
-
-    __slots__ = ("ids", "clock", "op_id")
-
-    def __init__(self, ids: Optional[Sequence[str]] = None) -> None:
-        self.ids: List[str] = list(ids or [])
-        self.clock = 0
-        self.op_id = ""
-
-    def assign(self, ids: Sequence[str], *, clock: int, op_id: str) -> None:
-        self.ids = list(dict.fromkeys(str(i) for i in ids if i))
-        self.clock = int(clock)
-        self.op_id = str(op_id)
-
-    def update(self, ids: Sequence[str], *, clock: int, op_id: str) -> bool:
-        clock = int(clock)
-        op_id = str(op_id)
-        incoming = list(dict.fromkeys(str(i) for i in ids if i))
-        if clock > self.clock or (clock == self.clock and op_id > self.op_id):
-            changed = incoming != self.ids
-            self.ids = incoming
-            self.clock = clock
-            self.op_id = op_id
-            return changed
-        return False
-
-
 def _node_payload(raw: MutableMapping[str, Any]) -> Dict[str, Any]:
     payload = {key: value for key, value in raw.items() if key != "id"}
     payload["id"] = str(raw.get("id") or raw.get("node_id") or uuid.uuid4().hex)
@@ -194,10 +171,11 @@ class CRDTDocument:
         self._meta: Dict[str, LWWRegister] = {}
         self._nodes: Dict[str, LWWRegister] = {}
         self._lines: Dict[str, LWWRegister] = {}
-        self._line_order = OrderRegister([])
+        self._line_order = LineSequence()
 
         self._history: Deque[LoggedOperation] = deque()
         self._log_index: Dict[str, LoggedOperation] = {}
+        self._vector: Dict[str, int] = {}
 
         self._handlers = {
             "scene.field.set": self._op_scene_field_set,
@@ -205,6 +183,7 @@ class CRDTDocument:
             "graph.node.upsert": self._op_graph_node_upsert,
             "graph.node.remove": self._op_graph_node_remove,
             "script.line.upsert": self._op_script_line_upsert,
+            "script.line.move": self._op_script_line_move,
             "script.line.remove": self._op_script_line_remove,
             "script.order.replace": self._op_script_order_replace,
         }
@@ -221,6 +200,13 @@ class CRDTDocument:
         """
         self.clock = int(initial.get("clock") or initial.get("lamport") or 0)
         self.version = int(initial.get("version") or 0)
+        vector = initial.get("vector")
+        if isinstance(vector, MutableMapping):
+            for actor, clock in vector.items():
+                try:
+                    self._vector[str(actor)] = int(clock)
+                except (TypeError, ValueError):
+                    continue
 
         title = str(initial.get("title") or initial.get("name") or self.scene_id)
         self._title.assign(title, clock=self.clock, op_id="bootstrap")
@@ -260,7 +246,8 @@ class CRDTDocument:
                     payload, clock=self.clock, op_id="bootstrap"
                 )
             if order_ids:
-                self._line_order.assign(order_ids, clock=self.clock, op_id="bootstrap")
+                keys = LineSequence.decode_keys(initial.get("sequence"))
+                self._line_order.load(order_ids, keys)
 
     def snapshot(self) -> Dict[str, Any]:
         """Return the current document payload."""
@@ -272,14 +259,15 @@ class CRDTDocument:
         nodes.sort(key=lambda item: str(item.get("id")))
 
         order_ids = list(self._line_order.ids)
-        existing_ids = [
-            line_id for line_id, entry in self._lines.items() if entry.value
-        ]
-        extra_ids = [lid for lid in existing_ids if lid not in order_ids]
-        all_ids = order_ids + extra_ids
-
+        # Lines that hold a value but never got a position (should not happen,
+        # but never drop content from a snapshot) go after the ordered ones.
+        order_ids.extend(
+            line_id
+            for line_id, entry in self._lines.items()
+            if entry.value and line_id not in self._line_order
+        )
         lines: List[Dict[str, Any]] = []
-        for line_id in all_ids:
+        for line_id in order_ids:
             entry = self._lines.get(line_id)
             if not entry or not isinstance(entry.value, MutableMapping):
                 continue
@@ -298,7 +286,7 @@ class CRDTDocument:
             "clock": self.clock,
             "nodes": nodes,
             "lines": lines,
-            "order": list(self._line_order.ids),
+            "order": order_ids,
             "meta": meta,
         }
 
@@ -306,8 +294,14 @@ class CRDTDocument:
         """Return payload for storage (includes version and lamport clock)."""
         payload = self.snapshot()
         payload["lamport"] = self.clock
+        payload["vector"] = self.version_vector()
+        payload["sequence"] = self._line_order.encode()
         return payload
 
+    def version_vector(self) -> Dict[str, int]:
+        """Return the highest actor clock observed per actor."""
+        return dict(self._vector)
+
     # ------------------------------------------------------------------
     # Operation handling
     # ------------------------------------------------------------------
@@ -324,6 +318,9 @@ class CRDTDocument:
 
         handler = self._handlers.get(operation.kind)
         incoming_clock = max(0, int(operation.clock))
+        actor = str(operation.actor)
+        if incoming_clock > self._vector.get(actor, 0):
+            self._vector[actor] = incoming_clock
         self.clock = max(self.clock, incoming_clock) + 1
         server_clock = self.clock
 
@@ -364,6 +361,32 @@ class CRDTDocument:
         """Return operation records with version strictly greater than ``version``."""
         return [record for record in self._history if record.version > version]
 
+    def compact_tombstones(self) -> int:
+        """
+        Forget removed-line positions older than the retained history.
+
+        Operations that predate the history window cannot be replayed
+        incrementally anyway (clients resync from a snapshot), so their
+        anchors are no longer needed.
+        """
+        horizon = self._history[0].server_clock if self._history else self.clock + 1
+        return self._line_order.compact(horizon)
+
+    def history_covers(self, version: int) -> bool:
+        """
+        True when ``operations_since(version)`` replays every change after it.
+
+        Clients that fall behind by more than ``max_history`` operations need a
+        full snapshot instead.
+        """
+        if version >= self.version:
+            return True
+        if not self._history:
+            return False
+        oldest = self._history[0]
+        floor = oldest.version - 1 if oldest.applied else oldest.version
+        return version >= floor
+
     # ------------------------------------------------------------------
     # Internal bookkeeping
     # ------------------------------------------------------------------
@@ -429,43 +452,53 @@ class CRDTDocument:
         reg = self._lines.setdefault(line_id, LWWRegister())
         changed = reg.update(payload, clock=server_clock, op_id=op.op_id)
 
-        # Ensure line is registered in order if not already present
-        if line_id not in self._line_order.ids:
-            if isinstance(index, int):
-                new_ids = list(self._line_order.ids)
-                index = max(0, min(len(new_ids), index))
-                new_ids.insert(index, line_id)
-            elif isinstance(after, str) and after in self._line_order.ids:
-                new_ids = list(self._line_order.ids)
-                idx = new_ids.index(after) + 1
-                new_ids.insert(idx, line_id)
-            else:
-                new_ids = list(self._line_order.ids) + [line_id]
-            if self._line_order.update(
-                new_ids, clock=server_clock, op_id=f"{op.op_id}:order"
+        # Place the line if it is new (or was removed and is being revived)
+        if line_id not in self._line_order and reg.value is not None:
+            if self._line_order.insert(
+                line_id,
+                clock=server_clock,
+                op_id=f"{op.op_id}:order",
+                index=index if isinstance(index, int) else None,
+                after=after if isinstance(after, str) else None,
+                position=op.payload.get("position"),
             ):
                 changed = True
         return changed
 
+    def _op_script_line_move(self, op: CRDTOperation, server_clock: int) -> bool:
+        line_id = str(op.payload.get("line_id") or "")
+        if not line_id or line_id not in self._line_order:
+            return False
+        index = op.payload.get("index")
+        after = op.payload.get("after")
+        return self._line_order.insert(
+            line_id,
+            clock=server_clock,
+            op_id=op.op_id,
+            index=index if isinstance(index, int) else None,
+            after=after if isinstance(after, str) else None,
+            position=op.payload.get("position"),
+        )
+
     def _op_script_line_remove(self, op: CRDTOperation, server_clock: int) -> bool:
         line_id = str(op.payload.get("line_id") or "")
         if not line_id:
             return False
         reg = self._lines.setdefault(line_id, LWWRegister())
         changed = reg.update(None, clock=server_clock, op_id=op.op_id)
-        if line_id in self._line_order.ids:
-            new_ids = [lid for lid in self._line_order.ids if lid != line_id]
-            if self._line_order.update(
-                new_ids, clock=server_clock, op_id=f"{op.op_id}:order"
-            ):
-                changed = True
+        if self._line_order.remove(
+            line_id, clock=server_clock, op_id=f"{op.op_id}:order"
+        ):
+            changed = True
+            if self._line_order.tombstone_count > TOMBSTONE_COMPACT_THRESHOLD:
+                self.compact_tombstones()
         return changed
 
     def _op_script_order_replace(self, op: CRDTOperation, server_clock: int) -> bool:
         order = op.payload.get("order")
-        if not isinstance(order, Sequence):
+        if not isinstance(order, Sequence) or isinstance(order, str):
             return False
-        return self._line_order.update(order, clock=server_clock, op_id=op.op_id)
+        return self._line_order.reorder(order, clock=server_clock, op_id=op.op_id)
 
 
 __all__ = ["CRDTDocument", "CRDTOperation", "OperationResult", "LoggedOperation"]
@@ -0,0 +1,124 @@
+"""
+Append-only operation log backing collaborative rooms.
+
+``CollabRoom.apply_operations`` appends every newly processed operation here
+as one JSON line, which is far cheaper than rewriting the whole scene.  The
+room's compactor periodically persists a full snapshot stamped with the last
+log sequence number it covers (``oplog_seq``) and then drops the covered
+entries.  On load the hub replays entries newer than the snapshot's
+``oplog_seq`` so no acknowledged operation is lost between snapshots.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import IO, Iterable, List, Optional
+
+from .crdt import CRDTOperation
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _encode(seq: int, operation: CRDTOperation) -> str:
+    record = {"seq": seq, "op": operation.as_dict()}
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def _decode(line: str) -> Optional[tuple[int, CRDTOperation]]:
+    try:
+        record = json.loads(line)
+        raw = record["op"]
+        operation = CRDTOperation(
+            op_id=str(raw["op_id"]),
+            actor=str(raw.get("actor") or ""),
+            clock=int(raw.get("clock") or 0),
+            kind=str(raw.get("kind") or ""),
+            payload=dict(raw.get("payload") or {}),
+            timestamp=float(raw.get("timestamp") or 0.0),
+        )
+        return int(record["seq"]), operation
+    except Exception:
+        return None
+
+
+class OperationLog:
+    """JSON-lines log of operations for a single scene."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.seq = 0
+        self._handle: Optional[IO[str]] = None
+
+    def replay(self, after_seq: int = 0) -> List[CRDTOperation]:
+        """
+        Return logged operations newer than ``after_seq`` in append order.
+
+        A torn final line (crash mid-write) is ignored.  ``seq`` continues
+        from the highest number seen in the file or ``after_seq``.
+        """
+        self.seq = max(self.seq, int(after_seq))
+        operations: List[CRDTOperation] = []
+        if not self.path.exists():
+            return operations
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                decoded = _decode(line)
+                if decoded is None:
+                    LOGGER.warning("Skipping unreadable op-log entry in %s", self.path)
+                    continue
+                seq, operation = decoded
+                self.seq = max(self.seq, seq)
+                if seq > after_seq:
+                    operations.append(operation)
+        return operations
+
+    def append(self, operations: Iterable[CRDTOperation]) -> int:
+        """Append operations and hand them to the OS; return the last seq."""
+        lines = []
+        for operation in operations:
+            self.seq += 1
+            lines.append(_encode(self.seq, operation))
+        if not lines:
+            return self.seq
+        handle = self._open()
+        handle.write("".join(lines))
+        handle.flush()
+        return self.seq
+
+    def truncate_through(self, seq: int) -> None:
+        """Drop entries with ``seq`` <= the given value (already snapshotted)."""
+        if seq >= self.seq:
+            self._open().truncate(0)
+            return
+        self.close()
+        if not self.path.exists():
+            return
+        keep: List[str] = []
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                decoded = _decode(line)
+                if decoded is not None and decoded[0] > seq:
+                    keep.append(line)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text("".join(keep), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def close(self) -> None:
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            try:
+                handle.close()
+            except Exception:  # pragma: no cover - defensive
+                pass
+
+    def _open(self) -> IO[str]:
+        if self._handle is None or self._handle.closed:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("a", encoding="utf-8")
+        return self._handle
+
+
+__all__ = ["OperationLog"]
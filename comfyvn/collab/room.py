@@ -15,14 +15,88 @@ from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
 
 from .crdt import CRDTDocument, CRDTOperation, OperationResult
+from .oplog import OperationLog
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_SEND_QUEUE = 256
+DEFAULT_SNAPSHOT_INTERVAL = 5.0
+DEFAULT_SNAPSHOT_OPS = 500
+SLOW_CONSUMER_CLOSE_CODE = 1013  # "try again later"
+
 
 def _now() -> float:
     return time.time()
 
 
+class ClientOutbox:
+    """
+    Bounded per-client send queue drained by a dedicated task.
+
+    Broadcasts enqueue pre-encoded frames without awaiting the socket, so one
+    slow reader never holds up the rest of the room.  ``offer`` returns False
+    once the queue is full or the drain task has failed; callers treat that
+    as a slow consumer and evict the client.
+    """
+
+    def __init__(self, websocket: Any, *, max_pending: int = DEFAULT_SEND_QUEUE):
+        self.websocket = websocket
+        self.max_pending = max(1, int(max_pending))
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self.max_pending)
+        self._task: Optional[asyncio.Task[None]] = None
+        self._closed = False
+        self.sent = 0
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def start(self) -> None:
+        if self._task is None and not self._closed:
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    def offer(self, message: str) -> bool:
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _drain(self) -> None:
+        while True:
+            message = await self._queue.get()
+            try:
+                await self.websocket.send_text(message)
+            except Exception as exc:
+                LOGGER.debug("Collab send failed; closing outbox: %s", exc)
+                self._closed = True
+                return
+            self.sent += 1
+
+    async def close(self, *, code: Optional[int] = None) -> None:
+        self._closed = True
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        if code is not None:
+            closer = getattr(self.websocket, "close", None)
+            if closer is not None:
+                try:
+                    await closer(code=code)
+                except Exception:  # pragma: no cover - socket already gone
+                    pass
+
+
 @dataclass
 class CollabClientState:
     client_id: str
@@ -36,6 +110,8 @@ class CollabClientState:
     capabilities: set[str] = field(default_factory=set)
     last_seen: float = field(default_factory=_now)
     headless: bool = False
+    mode: str = "delta"
+    outbox: Optional[ClientOutbox] = field(default=None, repr=False)
 
     def presence_payload(self) -> Dict[str, Any]:
         return {
@@ -92,6 +168,9 @@ class CollabRoom:
         *,
         persist_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
         feature_flags: Optional[Dict[str, Any]] = None,
+        op_log: Optional[OperationLog] = None,
+        snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+        snapshot_ops: int = DEFAULT_SNAPSHOT_OPS,
     ) -> None:
         self.scene_id = scene_id
         self.document = document
@@ -102,6 +181,15 @@ class CollabRoom:
         self._persisted_version = document.version
         self._dirty = False
 
+        # With an op log, applied operations are durable as soon as they are
+        # appended; full snapshots are only written by the debounced compactor.
+        self._op_log = op_log
+        self.snapshot_interval = float(snapshot_interval)
+        self.snapshot_ops = max(1, int(snapshot_ops))
+        self._ops_since_snapshot = 0
+        self._compact_handle: Optional[asyncio.TimerHandle] = None
+        self._compact_task: Optional[asyncio.Task[bool]] = None
+
         self.feature_flags = feature_flags or {}
 
         self.control_owner: Optional[str] = None
@@ -279,6 +367,58 @@ class CollabRoom:
                 changed = True
         return changed
 
+    # Fanout -------------------------------------------------------------------
+    def broadcast(
+        self,
+        message: str,
+        *,
+        exclude: Optional[Iterable[str]] = None,
+        mode: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Queue an encoded frame for every client with an outbox.
+
+        ``mode`` limits delivery to clients that joined with that broadcast
+        mode.  Clients whose queue is full are removed from the room and their
+        ids returned so the caller can close the sockets.
+        """
+        exclude_set = set(exclude or ())
+        evicted: List[str] = []
+        for client_id, state in list(self.clients.items()):
+            if client_id in exclude_set or state.outbox is None:
+                continue
+            if mode is not None and state.mode != mode:
+                continue
+            if not state.outbox.offer(message):
+                evicted.append(client_id)
+        for client_id in evicted:
+            LOGGER.warning(
+                "Evicting slow collab consumer %s from scene %s",
+                client_id,
+                self.scene_id,
+            )
+            self.evict(client_id)
+        return evicted
+
+    def evict(self, client_id: str) -> Optional[CollabClientState]:
+        """Drop a client and schedule its socket to close."""
+        state = self.clients.get(client_id)
+        self.leave(client_id)
+        if state is not None and state.outbox is not None:
+            outbox = state.outbox
+            try:
+                asyncio.get_running_loop().create_task(
+                    outbox.close(code=SLOW_CONSUMER_CLOSE_CODE)
+                )
+            except RuntimeError:  # pragma: no cover - no running loop
+                pass
+        return state
+
+    def modes(self) -> set[str]:
+        return {
+            state.mode for state in self.clients.values() if state.outbox is not None
+        }
+
     # Operations ---------------------------------------------------------------
     def apply_operations(
         self, client_id: str, operations: Sequence[CRDTOperation]
@@ -289,6 +429,11 @@ class CollabRoom:
             results.append(res)
             if res.applied:
                 self._dirty = True
+        if self._op_log is not None:
+            fresh = [res.operation for res in results if not res.duplicate]
+            if fresh:
+                self._op_log.append(fresh)
+                self._ops_since_snapshot += len(fresh)
         state = self.clients.get(client_id)
         if state and operations:
             state.clock = max(state.clock, max(op.clock for op in operations))
@@ -297,25 +442,102 @@ class CollabRoom:
 
     @property
     def dirty(self) -> bool:
+        if self._ops_since_snapshot:
+            return True
         return self._dirty and self.document.version != self._persisted_version
 
+    async def checkpoint(self) -> None:
+        """
+        Make applied operations durable.
+
+        Rooms with an op log are already durable once ``apply_operations``
+        returns, so this only schedules the compactor; rooms without one
+        write a snapshot immediately.
+        """
+        if self._op_log is None:
+            if self.dirty:
+                await self.flush()
+            return
+        self._schedule_compaction()
+
+    def _schedule_compaction(self) -> None:
+        if not self._ops_since_snapshot:
+            return
+        if self._compact_task is not None and not self._compact_task.done():
+            return
+        urgent = self._ops_since_snapshot >= self.snapshot_ops
+        if self._compact_handle is not None:
+            if not urgent:
+                return
+            self._compact_handle.cancel()
+        loop = asyncio.get_running_loop()
+        delay = 0.0 if urgent else self.snapshot_interval
+        self._compact_handle = loop.call_later(delay, self._start_compaction)
+
+    def _start_compaction(self) -> None:
+        self._compact_handle = None
+        self._compact_task = asyncio.ensure_future(self._compact())
+
+    async def _compact(self) -> bool:
+        try:
+            return await self.flush()
+        except Exception as exc:  # pragma: no cover - saver failures
+            LOGGER.warning("Collab snapshot failed for %s: %s", self.scene_id, exc)
+            return False
+        finally:
+            self._compact_task = None
+            # Operations that arrived while the snapshot was written.
+            if self._ops_since_snapshot:
+                self._schedule_compaction()
+
     async def flush(self) -> bool:
         if not self.dirty:
             return False
         if not self._persist_callback:
             self._persisted_version = self.document.version
             self._dirty = False
+            self._ops_since_snapshot = 0
             return False
-        payload = self.document.persistable()
         async with self._persist_lock:
-            if self.document.version == self._persisted_version:
-                self._dirty = False
+            if not self.dirty:
                 return False
+            payload = self.document.persistable()
+            covered = self._ops_since_snapshot
+            seq = self._op_log.seq if self._op_log is not None else None
+            if seq is not None:
+                payload["oplog_seq"] = seq
             await self._persist_callback(payload)
-            self._persisted_version = self.document.version
-            self._dirty = False
+            self._persisted_version = int(payload.get("version") or 0)
+            self._dirty = self.document.version != self._persisted_version
+            if self._op_log is not None and seq is not None:
+                self._op_log.truncate_through(seq)
+                self._ops_since_snapshot = max(0, self._ops_since_snapshot - covered)
             return True
 
+    def replay_log(self, after_seq: int = 0) -> int:
+        """
+        Re-apply logged operations newer than the loaded snapshot.
+
+        Blocking file IO; call before the room is shared (the hub runs it in
+        a worker thread).  Returns the number of operations replayed.
+        """
+        if self._op_log is None:
+            return 0
+        operations = self._op_log.replay(after_seq)
+        for op in operations:
+            if self.document.apply_operation(op).applied:
+                self._dirty = True
+        self._ops_since_snapshot += len(operations)
+        return len(operations)
+
+    def close(self) -> None:
+        """Stop the compactor and release the op log handle."""
+        if self._compact_handle is not None:
+            self._compact_handle.cancel()
+            self._compact_handle = None
+        if self._op_log is not None:
+            self._op_log.close()
+
     # Convenience --------------------------------------------------------------
     def touch(self, client_id: str) -> None:
         state = self.clients.get(client_id)
@@ -337,12 +559,18 @@ class CollabHub:
         loader: Callable[[str], Any],
         saver: Callable[[Dict[str, Any]], Any],
         feature_flags: Optional[Dict[str, Any]] = None,
+        oplog_path: Optional[Callable[[str], Any]] = None,
+        snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+        snapshot_ops: int = DEFAULT_SNAPSHOT_OPS,
     ) -> None:
         self._rooms: Dict[str, CollabRoom] = {}
         self._lock = asyncio.Lock()
         self._loader = loader
         self._saver = saver
         self._feature_flags = feature_flags or {}
+        self._oplog_path = oplog_path
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_ops = snapshot_ops
 
     async def room(self, scene_id: str) -> CollabRoom:
         async with self._lock:
@@ -362,12 +590,32 @@ class CollabHub:
                 if inspect.isawaitable(result):
                     await result
 
+            op_log = None
+            if self._oplog_path is not None:
+                op_log = OperationLog(self._oplog_path(scene_id))
             room = CollabRoom(
                 scene_id,
                 document,
                 persist_callback=_persist,
                 feature_flags=self._feature_flags,
+                op_log=op_log,
+                snapshot_interval=self.snapshot_interval,
+                snapshot_ops=self.snapshot_ops,
             )
+            if op_log is not None:
+                after_seq = 0
+                if isinstance(initial, dict):
+                    try:
+                        after_seq = int(initial.get("oplog_seq") or 0)
+                    except (TypeError, ValueError):
+                        after_seq = 0
+                replayed = await asyncio.to_thread(room.replay_log, after_seq)
+                if replayed:
+                    LOGGER.info(
+                        "Replayed %d logged collab ops for scene %s",
+                        replayed,
+                        scene_id,
+                    )
             self._rooms[scene_id] = room
             return room
 
@@ -380,7 +628,9 @@ class CollabHub:
     def discard_empty(self) -> None:
         empty = [scene_id for scene_id, room in self._rooms.items() if not room.clients]
         for scene_id in empty:
-            self._rooms.pop(scene_id, None)
+            room = self._rooms.pop(scene_id, None)
+            if room is not None:
+                room.close()
 
     def update_feature_flags(self, feature_flags: Dict[str, Any]) -> None:
         self._feature_flags = dict(feature_flags)
@@ -397,6 +647,7 @@ class CollabHub:
 
 
 __all__ = [
+    "ClientOutbox",
     "CollabClientState",
     "CollabPresence",
     "CollabRoom",
@@ -0,0 +1,414 @@
+"""
+Fractional-index sequence CRDT used for script line ordering.
+
+Every line owns a position key: a base-62 string that sorts lexicographically
+in document order.  Inserting or moving a line only mints one new key between
+its neighbours, so concurrent inserts and reorders touch disjoint entries
+instead of overwriting a whole order list.  Keys follow the variable-length
+integer + fraction layout popularised by Figma/rocicorp, which keeps appended
+keys short; when repeated inserts into the same gap grow a key past
+``MAX_KEY_LENGTH`` the sequence respreads every key (order is unchanged).
+
+Removed lines leave a tombstone holding their last key so late operations that
+anchor ``after`` a deleted line still land in the right place.  Tombstones
+older than the caller-supplied clock are dropped by :meth:`compact`.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from typing import Dict, List, Optional, Tuple
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+# ``a0`` is the floor: it only ever appears with a fraction so there is
+# always room to prepend.  Sequences start a few integer widths above it so
+# thousands of prepends stay on short integer keys too.
+SMALLEST_INTEGER = "a0"
+FIRST_KEY = "c000"
+MAX_KEY_LENGTH = 24
+
+_DIGIT_VALUE = {char: index for index, char in enumerate(DIGITS)}
+
+
+def _integer_length(head: str) -> int:
+    if "a" <= head <= "z":
+        return ord(head) - ord("a") + 2
+    raise ValueError(f"invalid position head: {head!r}")
+
+
+def _split(key: str) -> Tuple[str, str]:
+    size = _integer_length(key[0])
+    return key[:size], key[size:]
+
+
+def is_valid_key(key: object) -> bool:
+    """True when ``key`` is a well-formed position key."""
+    if not isinstance(key, str) or not key:
+        return False
+    try:
+        size = _integer_length(key[0])
+    except ValueError:
+        return False
+    if len(key) < size or any(char not in _DIGIT_VALUE for char in key[1:]):
+        return False
+    fraction = key[size:]
+    if not fraction:
+        return key[:size] != SMALLEST_INTEGER
+    return not fraction.endswith("0")
+
+
+def _midpoint(low: str, high: Optional[str]) -> str:
+    """Return a fraction strictly between ``low`` and ``high`` (None = 1)."""
+    if high is not None:
+        shared = 0
+        while shared < len(high) and (low[shared : shared + 1] or "0") == high[shared]:
+            shared += 1
+        if shared:
+            return high[:shared] + _midpoint(low[shared:], high[shared:])
+    low_digit = _DIGIT_VALUE[low[0]] if low else 0
+    high_digit = _DIGIT_VALUE[high[0]] if high is not None else len(DIGITS)
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit + 1) // 2]
+    if high is not None and len(high) > 1:
+        return high[:1]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+
+def _increment_integer(value: str) -> Optional[str]:
+    head, digits = value[0], list(value[1:])
+    for index in range(len(digits) - 1, -1, -1):
+        if digits[index] != "z":
+            digits[index] = DIGITS[_DIGIT_VALUE[digits[index]] + 1]
+            return head + "".join(digits)
+        digits[index] = "0"
+    if head == "z":
+        return None
+    return chr(ord(head) + 1) + "0" * (len(digits) + 1)
+
+
+def _decrement_integer(value: str) -> Optional[str]:
+    head, digits = value[0], list(value[1:])
+    for index in range(len(digits) - 1, -1, -1):
+        if digits[index] != "0":
+            digits[index] = DIGITS[_DIGIT_VALUE[digits[index]] - 1]
+            return head + "".join(digits)
+        digits[index] = "z"
+    if head == "a":
+        return None
+    return chr(ord(head) - 1) + "z" * (len(digits) - 1)
+
+
+def key_between(low: Optional[str], high: Optional[str]) -> str:
+    """Return a position key strictly between ``low`` and ``high``."""
+    if low is not None and high is not None and low >= high:
+        raise ValueError(f"{low!r} must sort before {high!r}")
+    if low is None and high is None:
+        return FIRST_KEY
+    if low is None:
+        integer, fraction = _split(high)  # type: ignore[arg-type]
+        if integer == SMALLEST_INTEGER:
+            return integer + _midpoint("", fraction)
+        if fraction:
+            return integer
+        lower = _decrement_integer(integer)
+        if lower is None or lower == SMALLEST_INTEGER:
+            return SMALLEST_INTEGER + _midpoint("", None)
+        return lower
+    integer, fraction = _split(low)
+    if high is None:
+        following = _increment_integer(integer)
+        return following if following is not None else low + _midpoint(fraction, None)
+    high_integer, high_fraction = _split(high)
+    if integer == high_integer:
+        return integer + _midpoint(fraction, high_fraction)
+    following = _increment_integer(integer)
+    if following is not None and following < high:
+        return following
+    return integer + _midpoint(fraction, None)
+
+
+def spread_keys(count: int) -> List[str]:
+    """Return ``count`` ascending keys with room to insert between each."""
+    keys: List[str] = []
+    key: Optional[str] = None
+    for _ in range(count):
+        key = key_between(key, None)
+        keys.append(key)
+    return keys
+
+
+def _longest_increasing(values: Sequence[int]) -> List[int]:
+    """Return indices into ``values`` forming a longest increasing run."""
+    tails: List[int] = []
+    tail_index: List[int] = []
+    parents: List[int] = [-1] * len(values)
+    for index, value in enumerate(values):
+        slot = bisect_left(tails, value)
+        if slot == len(tails):
+            tails.append(value)
+            tail_index.append(index)
+        else:
+            tails[slot] = value
+            tail_index[slot] = index
+        parents[index] = tail_index[slot - 1] if slot else -1
+    result: List[int] = []
+    cursor = tail_index[-1] if tail_index else -1
+    while cursor >= 0:
+        result.append(cursor)
+        cursor = parents[cursor]
+    result.reverse()
+    return result
+
+
+class LineSequence:
+    """
+    Ordered set of line ids backed by fractional position keys.
+
+    ``ids`` is the live order and is maintained in place, so snapshots only
+    copy it.  Lookups by id use binary search over the sorted ``(key, id)``
+    entries.  Each entry carries a ``(clock, op_id)`` stamp; positional
+    updates with an older stamp are ignored so replays stay idempotent.
+    """
+
+    __slots__ = ("_entries", "_ids", "_keys", "_stamps", "_tombstones")
+
+    def __init__(self) -> None:
+        self._entries: List[Tuple[str, str]] = []
+        self._ids: List[str] = []
+        self._keys: Dict[str, str] = {}
+        self._stamps: Dict[str, Tuple[int, str]] = {}
+        self._tombstones: Dict[str, Tuple[str, int]] = {}
+
+    # Introspection ------------------------------------------------------
+    @property
+    def ids(self) -> List[str]:
+        """Live line ids in order.  Treat as read-only."""
+        return self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, line_id: object) -> bool:
+        return line_id in self._keys
+
+    @property
+    def tombstone_count(self) -> int:
+        return len(self._tombstones)
+
+    def is_tombstoned(self, line_id: str) -> bool:
+        return line_id in self._tombstones
+
+    def key_of(self, line_id: str) -> Optional[str]:
+        return self._keys.get(line_id)
+
+    def index_of(self, line_id: str) -> int:
+        key = self._keys.get(line_id)
+        if key is None:
+            return -1
+        return bisect_left(self._entries, (key, line_id))
+
+    # Encoding -----------------------------------------------------------
+    def load(self, ids: Iterable[str], keys: Optional[Sequence[str]] = None) -> None:
+        """Reset to ``ids``; reuse ``keys`` when they are valid and ascending."""
+        ordered = list(dict.fromkeys(str(i) for i in ids if i))
+        key_list = list(keys or ())
+        usable = len(key_list) == len(ordered) and all(
+            is_valid_key(key) for key in key_list
+        )
+        if usable:
+            usable = all(a < b for a, b in zip(key_list, key_list[1:]))
+        if not usable:
+            key_list = spread_keys(len(ordered))
+        self._entries = list(zip(key_list, ordered))
+        self._ids = ordered
+        self._keys = dict(zip(ordered, key_list))
+        self._stamps = {line_id: (0, "bootstrap") for line_id in ordered}
+        self._tombstones = {}
+
+    def encode(self) -> Dict[str, str]:
+        """Compact positional encoding; pair with ``ids`` to restore."""
+        return {"keys": " ".join(key for key, _ in self._entries)}
+
+    @staticmethod
+    def decode_keys(raw: object) -> List[str]:
+        if isinstance(raw, dict):
+            raw = raw.get("keys")
+        if not isinstance(raw, str):
+            return []
+        return raw.split()
+
+    # Mutation -----------------------------------------------------------
+    def insert(
+        self,
+        line_id: str,
+        *,
+        clock: int,
+        op_id: str,
+        index: Optional[int] = None,
+        after: Optional[str] = None,
+        position: Optional[str] = None,
+    ) -> bool:
+        """
+        Place ``line_id`` (inserting or moving it).
+
+        Precedence: an explicit ``position`` key, then ``index`` in the live
+        order, then ``after`` another (possibly removed) line, else the end.
+        Revived lines without hints return to their tombstoned key.  An
+        ``after`` pointing at the line itself is ignored; an unplaced line
+        still lands at the end rather than being dropped.
+        """
+        stamp = (int(clock), str(op_id))
+        current = self._stamps.get(line_id)
+        if current is not None and stamp <= current:
+            return False
+        has_index = isinstance(index, int) and not isinstance(index, bool)
+        if after == line_id:
+            if line_id in self._keys and not has_index and not is_valid_key(position):
+                return False
+            after = None
+        tombstone = self._tombstones.pop(line_id, None)
+        previous = self._keys.get(line_id)
+        if previous is not None:
+            self._detach(line_id, previous)
+
+        if is_valid_key(position):
+            key = str(position)
+        elif has_index:
+            key = self._key_for_slot(max(0, min(len(self._entries), index)))
+        elif isinstance(after, str) and after:
+            key = self._key_after(after)
+        elif tombstone is not None and previous is None:
+            key = tombstone[0]
+        else:
+            key = self._key_for_slot(len(self._entries))
+
+        self._attach(line_id, key)
+        self._stamps[line_id] = stamp
+        if len(key) > MAX_KEY_LENGTH:
+            self.rebalance()
+        return previous is None or self._keys.get(line_id) != previous
+
+    def remove(self, line_id: str, *, clock: int, op_id: str) -> bool:
+        key = self._keys.get(line_id)
+        if key is None:
+            return False
+        stamp = (int(clock), str(op_id))
+        if stamp <= self._stamps.get(line_id, (0, "")):
+            return False
+        self._detach(line_id, key)
+        self._tombstones[line_id] = (key, int(clock))
+        self._stamps[line_id] = stamp
+        return True
+
+    def reorder(self, order: Iterable[str], *, clock: int, op_id: str) -> bool:
+        """
+        Move lines so the listed ids appear in the given relative order.
+
+        Only lines outside the longest already-ordered run get new keys;
+        lines not listed keep their positions, so concurrent inserts survive.
+        Removed lines are not revived.
+        """
+        desired = [
+            line_id
+            for line_id in dict.fromkeys(str(i) for i in order if i)
+            if line_id not in self._tombstones
+        ]
+        present = [line_id for line_id in desired if line_id in self._keys]
+        slots = [self.index_of(line_id) for line_id in present]
+        keep = {present[i] for i in _longest_increasing(slots)}
+
+        changed = False
+        previous: Optional[str] = None
+        for position, line_id in enumerate(desired):
+            if line_id in keep:
+                previous = line_id
+                continue
+            if previous is not None:
+                moved = self.insert(
+                    line_id,
+                    clock=clock,
+                    op_id=f"{op_id}:{position}",
+                    after=previous,
+                )
+            else:
+                anchor = next((i for i in desired[position:] if i in keep), None)
+                slot = self.index_of(anchor) if anchor is not None else 0
+                moved = self.insert(
+                    line_id, clock=clock, op_id=f"{op_id}:{position}", index=slot
+                )
+            changed = moved or changed
+            previous = line_id
+        return changed
+
+    def compact(self, before_clock: int) -> int:
+        """Drop tombstones removed before ``before_clock``; return count."""
+        stale = [
+            line_id
+            for line_id, (_, clock) in self._tombstones.items()
+            if clock < before_clock
+        ]
+        for line_id in stale:
+            del self._tombstones[line_id]
+            self._stamps.pop(line_id, None)
+        return len(stale)
+
+    def rebalance(self) -> None:
+        """Reassign evenly spaced keys without changing the order.
+
+        Tombstones are re-keyed in the same pass so late inserts anchored on a
+        removed line still land between the right live neighbours.
+        """
+        merged = sorted(
+            self._entries
+            + [(key, line_id) for line_id, (key, _) in self._tombstones.items()]
+        )
+        keys = spread_keys(len(merged))
+        entries: List[Tuple[str, str]] = []
+        for key, (_, line_id) in zip(keys, merged):
+            tombstone = self._tombstones.get(line_id)
+            if tombstone is not None:
+                self._tombstones[line_id] = (key, tombstone[1])
+            else:
+                entries.append((key, line_id))
+        self._entries = entries
+        self._ids = [line_id for _, line_id in entries]
+        self._keys = {line_id: key for key, line_id in entries}
+
+    # Internals ----------------------------------------------------------
+    def _attach(self, line_id: str, key: str) -> None:
+        slot = bisect_left(self._entries, (key, line_id))
+        self._entries.insert(slot, (key, line_id))
+        self._ids.insert(slot, line_id)
+        self._keys[line_id] = key
+
+    def _detach(self, line_id: str, key: str) -> None:
+        slot = bisect_left(self._entries, (key, line_id))
+        del self._entries[slot]
+        del self._ids[slot]
+        del self._keys[line_id]
+
+    def _key_after(self, anchor: str) -> str:
+        key = self._keys.get(anchor)
+        if key is None:
+            tombstone = self._tombstones.get(anchor)
+            if tombstone is None:
+                return self._key_for_slot(len(self._entries))
+            key = tombstone[0]
+        return self._key_for_slot(bisect_right(self._entries, (key, anchor)))
+
+    def _key_for_slot(self, slot: int) -> str:
+        low = self._entries[slot - 1][0] if slot > 0 else None
+        cursor = slot
+        while cursor < len(self._entries) and self._entries[cursor][0] == low:
+            cursor += 1
+        high = self._entries[cursor][0] if cursor < len(self._entries) else None
+        return key_between(low, high)
+
+
+__all__ = [
+    "LineSequence",
+    "is_valid_key",
+    "key_between",
+    "spread_keys",
+]
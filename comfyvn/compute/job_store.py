@@ -0,0 +1,264 @@
+"""
+SQLite persistence for :class:`~comfyvn.compute.scheduler.JobScheduler`.
+
+Jobs live in a single WAL-mode table.  The full job dict is stored as JSON,
+while the fields the scheduler filters and orders on are promoted to
+indexed columns:
+
+* ``(queue, priority DESC, enqueue_ts, seq)`` restricted to queued rows
+  drives claims and queue listings;
+* ``(status, lease_expires)`` finds leases that ran out;
+* ``completed_ts`` pages finished jobs for the scheduler board.
+
+State transitions are conditional updates (``... WHERE status = 'queued'``),
+so two schedulers sharing one database never claim the same job twice.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS scheduler_jobs (
+        id TEXT PRIMARY KEY,
+        queue TEXT NOT NULL,
+        priority INTEGER NOT NULL,
+        enqueue_ts REAL NOT NULL,
+        seq INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        worker_id TEXT,
+        lease_expires REAL,
+        completed_ts REAL,
+        payload TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_sched_jobs_claim "
+    "ON scheduler_jobs(queue, priority DESC, enqueue_ts, seq) "
+    "WHERE status = 'queued'",
+    "CREATE INDEX IF NOT EXISTS idx_sched_jobs_status "
+    "ON scheduler_jobs(status, lease_expires)",
+    "CREATE INDEX IF NOT EXISTS idx_sched_jobs_completed "
+    "ON scheduler_jobs(completed_ts) WHERE completed_ts IS NOT NULL",
+)
+
+_UPSERT = """
+    INSERT INTO scheduler_jobs (
+        id, queue, priority, enqueue_ts, seq, status, worker_id,
+        lease_expires, completed_ts, payload
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        queue=excluded.queue,
+        priority=excluded.priority,
+        enqueue_ts=excluded.enqueue_ts,
+        seq=excluded.seq,
+        status=excluded.status,
+        worker_id=excluded.worker_id,
+        lease_expires=excluded.lease_expires,
+        completed_ts=excluded.completed_ts,
+        payload=excluded.payload
+"""
+
+_QUEUED_ORDER = "ORDER BY priority DESC, enqueue_ts, seq"
+
+
+def _dumps(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _row(job: Mapping[str, Any]) -> Tuple[Any, ...]:
+    return (
+        str(job["id"]),
+        str(job.get("queue") or "local"),
+        int(job.get("priority") or 0),
+        float(job.get("enqueue_ts") or job.get("created_ts") or 0.0),
+        int(job.get("seq") or 0),
+        str(job.get("status") or "queued"),
+        job.get("worker_id"),
+        job.get("lease_expires_ts"),
+        job.get("completed_ts"),
+        _dumps(dict(job)),
+    )
+
+
+def _job(row: sqlite3.Row) -> Dict[str, Any]:
+    job = json.loads(row["payload"])
+    # Heartbeats only touch the columns; they are authoritative.
+    job["status"] = row["status"]
+    job["worker_id"] = row["worker_id"]
+    job["lease_expires_ts"] = row["lease_expires"]
+    return job
+
+
+class JobStore:
+    """Thread-safe, WAL-mode SQLite table of scheduler jobs."""
+
+    def __init__(self, db_path: Path | str) -> None:
+        self.db_path = Path(db_path)
+        if str(db_path) != ":memory:":
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = RLock()
+        self._conn = sqlite3.connect(
+            str(db_path), check_same_thread=False, timeout=30.0
+        )
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            if str(db_path) != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # Writes --------------------------------------------------------------
+    def save(self, job: Mapping[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(_UPSERT, _row(job))
+
+    def save_many(self, jobs: Iterable[Mapping[str, Any]]) -> None:
+        rows = [_row(job) for job in jobs]
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, rows)
+
+    def transition(
+        self,
+        job: Mapping[str, Any],
+        *,
+        expect: str,
+        expired_before: Optional[float] = None,
+    ) -> bool:
+        """
+        Persist ``job`` only if its stored status is still ``expect``.
+
+        With ``expired_before`` the stored lease must also have run out by
+        then.  Returns ``False`` when another scheduler won the race.
+        """
+        row = _row(job)
+        clause = "id = ? AND status = ?"
+        params: List[Any] = [row[0], expect]
+        if expired_before is not None:
+            clause += " AND (lease_expires IS NULL OR lease_expires < ?)"
+            params.append(expired_before)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"""
+                UPDATE scheduler_jobs SET
+                    queue = ?, priority = ?, enqueue_ts = ?, seq = ?, status = ?,
+                    worker_id = ?, lease_expires = ?, completed_ts = ?, payload = ?
+                WHERE {clause}
+                """,
+                (*row[1:], *params),
+            )
+        return cursor.rowcount == 1
+
+    def heartbeat(
+        self,
+        job_id: str,
+        lease_expires: Optional[float],
+        *,
+        worker_id: Optional[str] = None,
+    ) -> bool:
+        """Extend the lease of a running job; ``False`` if it is no longer held."""
+        clause = "id = ? AND status = 'running'"
+        params: List[Any] = [lease_expires, job_id]
+        if worker_id is not None:
+            clause += " AND worker_id = ?"
+            params.append(worker_id)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"UPDATE scheduler_jobs SET lease_expires = ? WHERE {clause}",
+                params,
+            )
+        return cursor.rowcount == 1
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM scheduler_jobs")
+
+    # Reads ---------------------------------------------------------------
+    def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM scheduler_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return _job(row) if row is not None else None
+
+    def queued(
+        self, queue: str, *, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Queued jobs of ``queue`` in claim order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM scheduler_jobs WHERE queue = ? AND status = 'queued' "
+                f"{_QUEUED_ORDER} LIMIT ? OFFSET ?",
+                (queue, -1 if limit is None else int(limit), int(offset)),
+            ).fetchall()
+        return [_job(row) for row in rows]
+
+    def running(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM scheduler_jobs WHERE status = 'running'"
+            ).fetchall()
+        return [_job(row) for row in rows]
+
+    def expired(self, now: float, *, include_unleased: bool = False) -> List[Dict]:
+        """Running jobs whose lease ended before ``now``."""
+        clause = "lease_expires < ?"
+        if include_unleased:
+            clause = f"(lease_expires IS NULL OR {clause})"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM scheduler_jobs WHERE status = 'running' AND {clause}",
+                (now,),
+            ).fetchall()
+        return [_job(row) for row in rows]
+
+    def completed(self, *, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """Finished jobs, most recent first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM scheduler_jobs WHERE completed_ts IS NOT NULL "
+                "ORDER BY completed_ts DESC LIMIT ? OFFSET ?",
+                (int(limit), int(offset)),
+            ).fetchall()
+        return [_job(row) for row in rows]
+
+    def queues(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT queue FROM scheduler_jobs"
+            ).fetchall()
+        return [row["queue"] for row in rows]
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """``{queue: {status: count}}``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT queue, status, COUNT(*) AS n FROM scheduler_jobs "
+                "GROUP BY queue, status"
+            ).fetchall()
+        counts: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            counts.setdefault(row["queue"], {})[row["status"]] = int(row["n"])
+        return counts
+
+    def max_seq(self) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM scheduler_jobs"
+            ).fetchone()
+        return int(row[0])
+
+
+__all__ = ["JobStore"]
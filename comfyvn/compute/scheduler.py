@@ -3,6 +3,9 @@ from __future__ import annotations
 """Job scheduler with local/remote queues, cost estimation, and telemetry."""
 
 import heapq
+import itertools
+import logging
+import os
 import threading
 import time
 import uuid
@@ -11,10 +14,18 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
+from comfyvn.compute.job_store import JobStore
 from comfyvn.compute.providers import ProviderRegistry, load_seed_from_config
 
+LOGGER = logging.getLogger(__name__)
+
 _HISTORY_LIMIT = 200
+_CACHE_SIZE = 512
+_REAP_INTERVAL = 1.0
 _DEFAULT_PROVIDER_PATH = Path("config/compute_providers.json")
+SCHEDULER_DB_ENV = "COMFYVN_SCHEDULER_DB"
+SCHEDULER_LEASE_ENV = "COMFYVN_SCHEDULER_LEASE_SEC"
+DEFAULT_STORE_LEASE_SEC = 300.0
 
 
 def _now_ts() -> float:
@@ -37,16 +48,45 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
 
 
 class JobScheduler:
-    """Thread-safe scheduler for local and remote compute queues."""
+    """
+    Thread-safe scheduler for local and remote compute queues.
+
+    Without a ``store`` everything lives in per-queue heaps, as before.  With a
+    `JobStore` every transition is written through to SQLite and the heaps
+    become a hot cache of the next ``cache_size`` jobs per queue, refilled from
+    the store's claim index when they run dry.  Claims are conditional updates
+    in the store, so schedulers sharing a database never hand out the same job
+    twice.
+
+    ``lease_sec`` gives claimed jobs a lease that `heartbeat` extends; jobs
+    whose lease runs out are requeued.  With a store it defaults to
+    ``COMFYVN_SCHEDULER_LEASE_SEC`` (300s) so a worker that dies mid-job
+    cannot leave it running forever; pass ``lease_sec=0`` to opt out.
+    Opening a store with ``recover=True``
+    requeues expired leases only, so other schedulers sharing the database
+    keep their running jobs.  A single-owner process may also pass
+    ``recover_unleased=True`` to requeue jobs left running without a lease by
+    a crashed predecessor.
+    """
 
     def __init__(
         self,
         registry: ProviderRegistry | None = None,
         *,
         history_limit: int = _HISTORY_LIMIT,
+        store: JobStore | None = None,
+        lease_sec: Optional[float] = None,
+        cache_size: int = _CACHE_SIZE,
+        recover: bool = True,
+        recover_unleased: bool = False,
     ) -> None:
         self.registry = registry
         self.history_limit = max(1, int(history_limit))
+        self.store = store
+        if lease_sec is None and store is not None:
+            lease_sec = _default_lease_sec()
+        self.lease_sec = lease_sec if lease_sec and lease_sec > 0 else None
+        self.cache_size = max(1, int(cache_size))
         self._lock = threading.RLock()
         self._queues: Dict[str, List[Tuple[int, int, str]]] = {
             "local": [],
@@ -56,11 +96,39 @@ class JobScheduler:
         self._active: set[str] = set()
         self._history: Deque[Dict[str, Any]] = deque(maxlen=self.history_limit)
         self._seq = 0
+        self._next_reap = 0.0
+        if store is not None:
+            self._seq = store.max_seq()
+            for name in store.queues():
+                self._queues.setdefault(name, [])
+            self._history.extend(store.completed(limit=self.history_limit))
+            if recover:
+                recovered = self.recover(include_unleased=recover_unleased)
+                if recovered:
+                    LOGGER.info("Requeued %d orphaned scheduler jobs", recovered)
 
     # ------------------------------------------------------------------
     # Queue operations
     # ------------------------------------------------------------------
     def enqueue(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        job = self._build_job(spec)
+        with self._lock:
+            self._push(job)
+            if self.store is not None:
+                self.store.save(job)
+        return dict(job)
+
+    def enqueue_many(self, specs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enqueue several jobs; with a store they are written in one transaction."""
+        jobs = [self._build_job(spec) for spec in specs]
+        with self._lock:
+            for job in jobs:
+                self._push(job)
+            if self.store is not None:
+                self.store.save_many(jobs)
+        return [dict(job) for job in jobs]
+
+    def _build_job(self, spec: Dict[str, Any]) -> Dict[str, Any]:
         if not isinstance(spec, dict):
             raise TypeError("job spec must be a dictionary")
 
@@ -105,16 +173,35 @@ class JobScheduler:
             "vram_gb": spec.get("vram_gb"),
             "cost_estimate": None,
             "meta": spec.get("meta") if isinstance(spec.get("meta"), dict) else {},
+            "enqueue_ts": submitted,
         }
-
-        with self._lock:
-            if queue not in self._queues:
-                self._queues[queue] = []
-            self._jobs[job_id] = job
+        return job
+
+    def _push(self, job: Dict[str, Any]) -> None:
+        """Cache ``job`` and put it on its queue heap (lock held)."""
+        queue = job["queue"]
+        if queue not in self._queues:
+            self._queues[queue] = []
+        self._jobs[job["id"]] = job
+        if "seq" not in job:
             self._seq += 1
-            entry = (-priority, self._seq, job_id)
-            heapq.heappush(self._queues[queue], entry)
-        return dict(job)
+            job["seq"] = self._seq
+        entry = (-int(job.get("priority") or 0), job["seq"], job["id"])
+        heapq.heappush(self._queues[queue], entry)
+
+    def _refill(self, queue: str) -> None:
+        """Load the next queued jobs of ``queue`` from the store (lock held)."""
+        if self.store is None:
+            return
+        heap = self._queues.setdefault(queue, [])
+        for job in self.store.queued(queue, limit=self.cache_size):
+            cached = self._jobs.get(job["id"])
+            if cached is None or cached.get("status") != "queued":
+                self._jobs[job["id"]] = job
+                cached = job
+            self._seq += 1
+            priority = int(cached.get("priority") or 0)
+            heapq.heappush(heap, (-priority, self._seq, job["id"]))
 
     def claim(
         self,
@@ -122,14 +209,22 @@ class JobScheduler:
         *,
         worker_id: Optional[str] = None,
         device_id: Optional[str] = None,
+        lease_sec: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         queue = str(queue or "local").lower()
         now = _now_ts()
+        lease = self.lease_sec if lease_sec is None else lease_sec
         with self._lock:
+            self._reap_expired(now)
             heap = self._queues.get(queue)
-            if not heap:
+            if heap is None and self.store is None:
                 return None
-            while heap:
+            while True:
+                if not heap and self.store is not None:
+                    self._refill(queue)
+                    heap = self._queues[queue]
+                if not heap:
+                    return None
                 _, _, job_id = heapq.heappop(heap)
                 job = self._jobs.get(job_id)
                 if not job or job.get("status") != "queued":
@@ -158,35 +253,161 @@ class JobScheduler:
                     "started_at": job.get("started_at"),
                 }
                 job.setdefault("runs", []).append(run_entry)
+                self._set_lease(job, now, lease)
+                if self.store is not None and not self.store.transition(
+                    job, expect="queued"
+                ):
+                    # Another scheduler sharing the store claimed it first.
+                    self._jobs.pop(job_id, None)
+                    continue
                 self._active.add(job_id)
                 return dict(job)
-        return None
+
+    def heartbeat(
+        self,
+        job_id: str,
+        *,
+        worker_id: Optional[str] = None,
+        lease_sec: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Extend the lease of a running job.
+
+        Raises `KeyError` for unknown jobs and `ValueError` when the job is no
+        longer running (or, with ``worker_id``, held by someone else).
+        """
+        lease = self.lease_sec if lease_sec is None else lease_sec
+        now = _now_ts()
+        with self._lock:
+            job = self._get(job_id)
+            held = job.get("status") == "running" and (
+                worker_id is None or job.get("worker_id") == worker_id
+            )
+            if held:
+                self._set_lease(job, now, lease)
+                if self.store is not None:
+                    held = self.store.heartbeat(
+                        job_id, job.get("lease_expires_ts"), worker_id=worker_id
+                    )
+                    if not held:
+                        self._jobs.pop(job_id, None)
+                        self._active.discard(job_id)
+            if not held:
+                raise ValueError(f"job '{job_id}' is not held by this worker")
+            job["updated_ts"] = now
+            job["updated_at"] = _iso(now)
+            return dict(job)
 
     def requeue(self, job_id: str, *, priority: Optional[int] = None) -> Dict[str, Any]:
         with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                raise KeyError(f"job '{job_id}' not found")
+            job = self._get(job_id)
             if job.get("status") == "queued":
                 return dict(job)
-            queue = job.get("queue") or "local"
-            priority_value = (
-                int(priority) if priority is not None else int(job.get("priority") or 0)
-            )
-            job["status"] = "queued"
-            job["priority"] = priority_value
-            job["updated_ts"] = _now_ts()
-            job["updated_at"] = _iso(job["updated_ts"])
-            job.pop("started_ts", None)
-            job.pop("started_at", None)
-            self._seq += 1
-            entry = (-priority_value, self._seq, job_id)
-            if queue not in self._queues:
-                self._queues[queue] = []
-            heapq.heappush(self._queues[queue], entry)
-            self._active.discard(job_id)
+            job = self._requeued(job, _now_ts(), priority=priority)
+            if self.store is not None:
+                self.store.save(job)
+            self._install_requeued(job)
             return dict(job)
 
+    def recover(self, *, include_unleased: bool = False) -> int:
+        """
+        Requeue running jobs whose lease expired.
+
+        ``include_unleased`` also requeues jobs running without a lease.  Only
+        use it when this process is the sole owner of the store: unleased
+        jobs cannot be told apart from ones another live scheduler is still
+        working on.
+        """
+        with self._lock:
+            return self._reap_expired(
+                _now_ts(), force=True, include_unleased=include_unleased
+            )
+
+    def expire_leases(self) -> int:
+        """Requeue every running job whose lease has run out."""
+        with self._lock:
+            return self._reap_expired(_now_ts(), force=True)
+
+    def _reap_expired(
+        self, now: float, *, force: bool = False, include_unleased: bool = False
+    ) -> int:
+        if not force and now < self._next_reap:
+            return 0
+        self._next_reap = now + _REAP_INTERVAL
+        if self.store is not None:
+            candidates = self.store.expired(now, include_unleased=include_unleased)
+        else:
+            candidates = []
+            for job_id in self._active:
+                job = self._jobs.get(job_id)
+                expires = job.get("lease_expires_ts") if job else None
+                if job and expires is not None and expires < now:
+                    candidates.append(job)
+        reaped = 0
+        for job in candidates:
+            if job.get("runs"):
+                job["runs"][-1]["expired_at"] = _iso(now)
+            requeued = self._requeued(job, now)
+            if self.store is not None and not self.store.transition(
+                requeued, expect="running", expired_before=now
+            ):
+                continue
+            self._install_requeued(requeued)
+            reaped += 1
+        return reaped
+
+    def _requeued(
+        self, job: Dict[str, Any], now: float, *, priority: Optional[int] = None
+    ) -> Dict[str, Any]:
+        job = dict(job)
+        job["status"] = "queued"
+        if priority is not None:
+            job["priority"] = int(priority)
+        job["priority"] = int(job.get("priority") or 0)
+        job["enqueue_ts"] = now
+        job["updated_ts"] = now
+        job["updated_at"] = _iso(now)
+        job.pop("started_ts", None)
+        job.pop("started_at", None)
+        job["lease_expires_ts"] = None
+        job.pop("lease_expires_at", None)
+        self._seq += 1
+        job["seq"] = self._seq
+        return job
+
+    def _install_requeued(self, job: Dict[str, Any]) -> None:
+        self._active.discard(job["id"])
+        self._push(job)
+
+    def _finish(self, job: Dict[str, Any]) -> None:
+        """Move a completed/failed job to history (lock held)."""
+        self._active.discard(job["id"])
+        self._history.appendleft(dict(job))
+        if self.store is not None:
+            self.store.save(job)
+            # The store and history hold finished jobs; keep the cache small.
+            self._jobs.pop(job["id"], None)
+
+    @staticmethod
+    def _set_lease(job: Dict[str, Any], now: float, lease: Optional[float]) -> None:
+        if lease and lease > 0:
+            job["lease_expires_ts"] = now + float(lease)
+            job["lease_expires_at"] = _iso(job["lease_expires_ts"])
+        else:
+            job["lease_expires_ts"] = None
+            job.pop("lease_expires_at", None)
+
+    def _get(self, job_id: str) -> Dict[str, Any]:
+        """Return the cached job, loading it from the store (lock held)."""
+        job = self._jobs.get(job_id)
+        if job is None and self.store is not None:
+            job = self.store.load(job_id)
+            if job is not None:
+                self._jobs[job_id] = job
+        if job is None:
+            raise KeyError(f"job '{job_id}' not found")
+        return job
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -202,9 +423,7 @@ class JobScheduler:
         duration_sec: Optional[float] = None,
     ) -> Dict[str, Any]:
         with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                raise KeyError(f"job '{job_id}' not found")
+            job = self._get(job_id)
             now = _now_ts()
             start = job.get("started_ts") or job.get("created_ts") or now
             duration = (
@@ -236,15 +455,14 @@ class JobScheduler:
             else:
                 job["cost_estimate"] = self._estimate_cost(job)
 
-            self._active.discard(job_id)
-            self._history.appendleft(dict(job))
+            job["lease_expires_ts"] = None
+            job.pop("lease_expires_at", None)
+            self._finish(job)
             return dict(job)
 
     def fail(self, job_id: str, error: Optional[str] = None) -> Dict[str, Any]:
         with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                raise KeyError(f"job '{job_id}' not found")
+            job = self._get(job_id)
             now = _now_ts()
             job["status"] = "failed"
             job["error"] = error
@@ -256,8 +474,9 @@ class JobScheduler:
                 0.0, now - _safe_float(job.get("started_ts") or job.get("created_ts"))
             )
             job["cost_estimate"] = job.get("cost_estimate") or self._estimate_cost(job)
-            self._active.discard(job_id)
-            self._history.appendleft(dict(job))
+            job["lease_expires_ts"] = None
+            job.pop("lease_expires_at", None)
+            self._finish(job)
             return dict(job)
 
     # ------------------------------------------------------------------
@@ -266,36 +485,79 @@ class JobScheduler:
     def state(self) -> Dict[str, Any]:
         with self._lock:
             queues: Dict[str, List[Dict[str, Any]]] = {}
-            for name, heap in self._queues.items():
-                ordered = sorted(heap)
-                items: List[Dict[str, Any]] = []
-                for _, _, job_id in ordered:
-                    job = self._jobs.get(job_id)
-                    if not job:
-                        continue
-                    items.append(self._public_view(job))
-                queues[name] = items
-
-            active = [
-                self._public_view(self._jobs[jid])
-                for jid in self._active
-                if jid in self._jobs
-            ]
+            if self.store is not None:
+                names = list(dict.fromkeys([*self._queues, *self.store.queues()]))
+                for name in names:
+                    queues[name] = [
+                        self._public_view(job) for job in self.store.queued(name)
+                    ]
+                running = self.store.running()
+            else:
+                for name, heap in self._queues.items():
+                    items: List[Dict[str, Any]] = []
+                    seen: set[str] = set()
+                    for _, _, job_id in sorted(heap):
+                        job = self._jobs.get(job_id)
+                        if not job or job_id in seen:
+                            continue
+                        seen.add(job_id)
+                        items.append(self._public_view(job))
+                    queues[name] = items
+                running = [self._jobs[jid] for jid in self._active if jid in self._jobs]
+
+            active = [self._public_view(job) for job in running]
             completed = [self._public_view(job) for job in list(self._history)]
             return {"queues": queues, "active": active, "completed": completed}
 
-    def board(self, limit: int = 100) -> Dict[str, Any]:
+    def queue_depths(self) -> Dict[str, int]:
+        """Number of queued jobs per queue, without building full views."""
+        with self._lock:
+            if self.store is not None:
+                depths = {name: 0 for name in self._queues}
+                for name, statuses in self.store.counts().items():
+                    depths[name] = statuses.get("queued", 0)
+                return depths
+            depths = {}
+            for name, heap in self._queues.items():
+                queued = {
+                    job_id
+                    for _, _, job_id in heap
+                    if (self._jobs.get(job_id) or {}).get("status") == "queued"
+                }
+                depths[name] = len(queued)
+            return depths
+
+    def board(self, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+        """
+        Timeline segments for running jobs plus one page of finished ones.
+
+        Running jobs are only included on the first page (``offset == 0``);
+        ``next_offset`` is ``None`` once the finished jobs are exhausted.
+        """
         now = _now_ts()
+        limit = max(1, int(limit))
+        offset = max(0, int(offset))
         with self._lock:
-            segments: List[Dict[str, Any]] = []
-            for jid in self._active:
-                job = self._jobs.get(jid)
-                if job:
-                    segments.append(self._segment_view(job, default_end=now))
-            for job in list(self._history)[:limit]:
-                segments.append(self._segment_view(job, default_end=now))
+            if self.store is not None:
+                running = self.store.running() if offset == 0 else []
+                finished = self.store.completed(limit=limit, offset=offset)
+            else:
+                running = (
+                    [self._jobs[jid] for jid in self._active if jid in self._jobs]
+                    if offset == 0
+                    else []
+                )
+                finished = list(itertools.islice(self._history, offset, offset + limit))
+            segments = [
+                self._segment_view(job, default_end=now) for job in running + finished
+            ]
         segments.sort(key=lambda item: (item.get("queue"), item.get("start")))
-        return {"jobs": segments, "generated_at": _iso(now)}
+        return {
+            "jobs": segments,
+            "generated_at": _iso(now),
+            "offset": offset,
+            "next_offset": offset + len(finished) if len(finished) == limit else None,
+        }
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -321,6 +583,7 @@ class JobScheduler:
             "vram_gb": job.get("vram_gb"),
             "cost_estimate": job.get("cost_estimate"),
             "attempt": job.get("attempt"),
+            "lease_expires_at": job.get("lease_expires_at"),
             "runs": list(job.get("runs") or []),
         }
 
@@ -657,7 +920,34 @@ def _build_registry() -> ProviderRegistry:
         return ProviderRegistry()
 
 
-DEFAULT_SCHEDULER = JobScheduler(registry=_build_registry())
+def _default_lease_sec() -> float:
+    raw = os.getenv(SCHEDULER_LEASE_ENV, "").strip()
+    if not raw:
+        return DEFAULT_STORE_LEASE_SEC
+    try:
+        return float(raw)
+    except ValueError:
+        LOGGER.warning(
+            "Ignoring invalid %s=%r; using %ss",
+            SCHEDULER_LEASE_ENV,
+            raw,
+            DEFAULT_STORE_LEASE_SEC,
+        )
+        return DEFAULT_STORE_LEASE_SEC
+
+
+def _store_from_env() -> Optional[JobStore]:
+    path = os.getenv(SCHEDULER_DB_ENV, "").strip()
+    if not path:
+        return None
+    try:
+        return JobStore(path)
+    except Exception:  # pragma: no cover - defensive
+        LOGGER.warning("Unable to open scheduler store at %s", path, exc_info=True)
+        return None
+
+
+DEFAULT_SCHEDULER = JobScheduler(registry=_build_registry(), store=_store_from_env())
 
 
 def get_scheduler() -> JobScheduler:
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict
+
+from comfyvn.config.snapshots import ConfigSnapshot, SnapshotCell
 
 FEATURE_DEFAULTS: Dict[str, bool] = {
     "enable_comfy_bridge_hardening": False,
@@ -60,22 +63,20 @@ FEATURE_DEFAULTS: Dict[str, bool] = {
     "enable_diffmerge_tools": False,
 }
 
-_CACHE: Dict[str, bool] | None = None
-_CACHE_SIGNATURE: tuple[float, float] | None = None
-
 
 def _candidate_paths() -> tuple[Path, Path]:
     return (Path("comfyvn.json"), Path("config/comfyvn.json"))
 
 
-def _signature() -> tuple[float, float]:
+def _signature() -> tuple[str, float, float]:
+    # cwd is part of the signature because the candidate paths are relative.
     values: list[float] = []
     for path in _candidate_paths():
         try:
             values.append(path.stat().st_mtime)
         except FileNotFoundError:
             values.append(0.0)
-    return (values[0], values[1])
+    return (os.getcwd(), values[0], values[1])
 
 
 def _read_features(path: Path) -> Dict[str, bool]:
@@ -93,27 +94,36 @@ def _read_features(path: Path) -> Dict[str, bool]:
     return result
 
 
-def load_feature_flags(*, refresh: bool = False) -> Dict[str, bool]:
-    global _CACHE, _CACHE_SIGNATURE
-    signature = _signature()
-    if not refresh and _CACHE is not None and signature == _CACHE_SIGNATURE:
-        return dict(_CACHE)
-
+def _build_flags() -> Dict[str, bool]:
     flags: Dict[str, bool] = dict(FEATURE_DEFAULTS)
     for path in _candidate_paths():
         if not path.exists():
             continue
         flags.update(_read_features(path))
+    return flags
+
+
+_CELL = SnapshotCell("feature_flags", _build_flags, _signature)
 
-    _CACHE = flags
-    _CACHE_SIGNATURE = signature
-    return dict(flags)
+
+def snapshot(*, refresh: bool = False) -> ConfigSnapshot:
+    """Return the current immutable flag snapshot (no I/O between polls)."""
+    return _CELL.current(refresh=refresh)
+
+
+def subscribe(callback: Callable[[ConfigSnapshot], None]) -> Callable[[], None]:
+    """Call ``callback(snapshot)`` whenever the flag set changes."""
+    return _CELL.subscribe(callback)
+
+
+def load_feature_flags(*, refresh: bool = False) -> Dict[str, bool]:
+    return dict(_CELL.current(refresh=refresh).data)
 
 
 def is_enabled(
     name: str, *, default: bool | None = None, refresh: bool = False
 ) -> bool:
-    flags = load_feature_flags(refresh=refresh)
+    flags = _CELL.current(refresh=refresh).data
     if name in flags:
         return bool(flags[name])
     if default is not None:
@@ -125,4 +135,11 @@ def refresh_cache() -> Dict[str, bool]:
     return load_feature_flags(refresh=True)
 
 
-__all__ = ["FEATURE_DEFAULTS", "is_enabled", "load_feature_flags", "refresh_cache"]
+__all__ = [
+    "FEATURE_DEFAULTS",
+    "is_enabled",
+    "load_feature_flags",
+    "refresh_cache",
+    "snapshot",
+    "subscribe",
+]
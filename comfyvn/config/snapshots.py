@@ -0,0 +1,175 @@
+"""
+Versioned, change-notified configuration snapshots.
+
+A `SnapshotCell` owns the current snapshot of one configuration source (the
+feature-flag files, a settings file + database pair, ...).  Readers call
+`current()` and get an immutable `ConfigSnapshot` back: a top-level
+read-only mapping plus a process-wide, monotonically increasing version.
+
+The source's *signature* (file mtimes, a database change counter, ...) is
+checked at most once per poll interval; only when it moves is the snapshot
+rebuilt and subscribers notified.  Writers that already know the new payload
+call `publish()` instead, so their own edits are visible immediately.
+
+``COMFYVN_CONFIG_POLL_INTERVAL`` (seconds, default ``1.0``) bounds how stale
+an out-of-process edit may be; ``0`` checks the signature on every read.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Hashable, List, Mapping, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+POLL_INTERVAL_ENV = "COMFYVN_CONFIG_POLL_INTERVAL"
+DEFAULT_POLL_INTERVAL = 1.0
+
+_VERSIONS = itertools.count(1)
+
+
+def _poll_interval_from_env() -> float:
+    raw = os.getenv(POLL_INTERVAL_ENV)
+    if raw is None or not raw.strip():
+        return DEFAULT_POLL_INTERVAL
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        LOGGER.warning("Ignoring invalid %s=%r", POLL_INTERVAL_ENV, raw)
+        return DEFAULT_POLL_INTERVAL
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """Immutable view of one configuration source at a given version."""
+
+    name: str
+    version: int
+    data: Mapping[str, Any]
+    signature: Hashable
+    created_at: float
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+
+Subscriber = Callable[[ConfigSnapshot], None]
+
+
+class SnapshotCell:
+    """Holds the current `ConfigSnapshot` for one source and rebuilds on change."""
+
+    def __init__(
+        self,
+        name: str,
+        build: Callable[[], Mapping[str, Any]],
+        signature: Callable[[], Hashable],
+        *,
+        poll_interval: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self._build = build
+        self._signature = signature
+        self.poll_interval = (
+            _poll_interval_from_env() if poll_interval is None else poll_interval
+        )
+        self._lock = threading.RLock()
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._next_check = 0.0
+        self._subscribers: List[Subscriber] = []
+
+    @property
+    def version(self) -> int:
+        snapshot = self._snapshot
+        return snapshot.version if snapshot is not None else 0
+
+    def current(self, *, refresh: bool = False) -> ConfigSnapshot:
+        """
+        Return the current snapshot.
+
+        Between signature checks this is a single attribute read.  ``refresh``
+        forces a rebuild even when the signature has not moved.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and not refresh and time.monotonic() < self._next_check:
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            signature = self._signature()
+            if refresh or snapshot is None or signature != snapshot.signature:
+                snapshot = self._install(self._build(), signature)
+            self._next_check = time.monotonic() + self.poll_interval
+            return snapshot
+
+    def publish(
+        self, data: Mapping[str, Any], signature: Optional[Hashable] = None
+    ) -> ConfigSnapshot:
+        """Install ``data`` as the new snapshot after an explicit write."""
+        with self._lock:
+            if signature is None:
+                signature = self._signature()
+            snapshot = self._install(data, signature)
+            self._next_check = time.monotonic() + self.poll_interval
+            return snapshot
+
+    def invalidate(self) -> None:
+        """Force the next `current()` call to re-check the signature."""
+        self._next_check = 0.0
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Call ``callback(snapshot)`` after every rebuild; returns an unsubscriber."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                try:
+                    self._subscribers.remove(callback)
+                except ValueError:
+                    pass
+
+        return _unsubscribe
+
+    def _install(self, data: Mapping[str, Any], signature: Hashable) -> ConfigSnapshot:
+        previous = self._snapshot
+        if previous is not None and dict(previous.data) == dict(data):
+            # Same content (e.g. a touched file): keep the version stable.
+            snapshot = ConfigSnapshot(
+                name=self.name,
+                version=previous.version,
+                data=previous.data,
+                signature=signature,
+                created_at=previous.created_at,
+            )
+            self._snapshot = snapshot
+            return snapshot
+        snapshot = ConfigSnapshot(
+            name=self.name,
+            version=next(_VERSIONS),
+            data=MappingProxyType(dict(data)),
+            signature=signature,
+            created_at=time.time(),
+        )
+        self._snapshot = snapshot
+        for callback in list(self._subscribers):
+            try:
+                callback(snapshot)
+            except Exception:
+                LOGGER.warning(
+                    "Config subscriber for %s failed", self.name, exc_info=True
+                )
+        return snapshot
+
+
+__all__ = [
+    "ConfigSnapshot",
+    "DEFAULT_POLL_INTERVAL",
+    "POLL_INTERVAL_ENV",
+    "SnapshotCell",
+]
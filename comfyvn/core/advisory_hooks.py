@@ -76,6 +76,47 @@ def _flatten_scene_text(scene: dict) -> str:
     return "\n".join(fragments)
 
 
+def scene_issues(
+    bundle: BundleContext, scene_id: str, payload: dict
+) -> List[AdvisoryIssue]:
+    """Keyword/licence findings for one scene (not yet logged)."""
+
+    text = _flatten_scene_text(payload)
+    if not text.strip():
+        return []
+    issues = scanner.scan(f"scene:{scene_id}", text, license_scan=True)
+    source_path = bundle.scene_sources.get(scene_id)
+    for issue in issues:
+        if source_path:
+            issue.detail.setdefault("path", Path(source_path).as_posix())
+    return issues
+
+
+def asset_license_issue(bundle: BundleContext) -> Optional[AdvisoryIssue]:
+    """Warn when assets ship without any licence metadata."""
+
+    if not bundle.assets or bundle.licenses:
+        return None
+    return AdvisoryIssue(
+        target_id=bundle._target("assets"),
+        kind="policy",
+        message="Assets present without accompanying license metadata.",
+        severity="warn",
+        detail={
+            "assets_without_license": len(bundle.assets),
+            "origin": bundle.metadata.get("source", "unspecified"),
+        },
+    )
+
+
+def annotate_issue(bundle: BundleContext, issue: AdvisoryIssue) -> AdvisoryIssue:
+    if bundle.timeline_id and "timeline_id" not in issue.detail:
+        issue.detail["timeline_id"] = bundle.timeline_id
+    if bundle.metadata and "source" not in issue.detail:
+        issue.detail["source"] = bundle.metadata.get("source")
+    return issue
+
+
 def scan(bundle: BundleContext) -> List[Dict[str, Any]]:
     """
     Run advisory scans against a bundle context.
@@ -86,35 +127,14 @@ def scan(bundle: BundleContext) -> List[Dict[str, Any]]:
     findings: List[Dict[str, Any]] = []
 
     def _record(issue: AdvisoryIssue) -> None:
-        if bundle.timeline_id and "timeline_id" not in issue.detail:
-            issue.detail["timeline_id"] = bundle.timeline_id
-        if bundle.metadata and "source" not in issue.detail:
-            issue.detail["source"] = bundle.metadata.get("source")
-        entry = log_issue(issue)
-        findings.append(entry)
+        findings.append(log_issue(annotate_issue(bundle, issue)))
 
     for scene_id, payload in bundle.scenes.items():
-        text = _flatten_scene_text(payload)
-        if not text.strip():
-            continue
-        issues = scanner.scan(f"scene:{scene_id}", text, license_scan=True)
-        source_path = bundle.scene_sources.get(scene_id)
-        for issue in issues:
-            if source_path:
-                issue.detail.setdefault("path", Path(source_path).as_posix())
+        for issue in scene_issues(bundle, scene_id, payload):
             _record(issue)
 
-    if bundle.assets and not bundle.licenses:
-        issue = AdvisoryIssue(
-            target_id=bundle._target("assets"),
-            kind="policy",
-            message="Assets present without accompanying license metadata.",
-            severity="warn",
-            detail={
-                "assets_without_license": len(bundle.assets),
-                "origin": bundle.metadata.get("source", "unspecified"),
-            },
-        )
+    issue = asset_license_issue(bundle)
+    if issue is not None:
         _record(issue)
 
     plugin_findings = run_bundle_plugins(bundle)
@@ -3,17 +3,16 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-import math
 import os
 import random
 import shutil
 import time
 import wave
-from array import array
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from comfyvn.core.audio_cache import AudioCacheEntry, audio_cache
+from comfyvn.core.audio_synth import PCMBuffer, ToneSegment, render_voice, write_wav
 from comfyvn.core.comfyui_audio import (
     ComfyUIAudioRunner,
     ComfyUIWorkflowConfig,
@@ -66,22 +65,17 @@ def _sample_count(duration: float, sample_rate: int) -> int:
     return max(1, int(duration * sample_rate))
 
 
-def _generate_samples(
+def _voice_segments(
     text: str,
     *,
-    voice: str,
+    profile: Dict[str, float],
+    rand: random.Random,
     lang: Optional[str],
-    style: Optional[str],
     sample_rate: int,
-    seed_value: int,
-) -> Tuple[array, float]:
-    """Generate a synthetic waveform approximating speech cadences."""
-
-    profile = _voice_profile(voice, style)
-    rand = random.Random(seed_value)
-    samples = array("h")
+) -> Tuple[List[ToneSegment], float]:
+    """Plan the tone/pause segments for ``text``; consumes ``rand`` in order."""
 
-    amplitude = int(MAX_AMPLITUDE * 32767)
+    segments: List[ToneSegment] = []
     char_durations: Dict[str, float] = {}
     total_time = 0.0
 
@@ -91,7 +85,7 @@ def _generate_samples(
     for word_index, word in enumerate(words):
         if not word:
             total_time += PAUSE_DURATION
-            samples.extend([0] * _sample_count(PAUSE_DURATION, sample_rate))
+            segments.append(ToneSegment(_sample_count(PAUSE_DURATION, sample_rate)))
             continue
 
         for char_index, char in enumerate(word):
@@ -113,31 +107,45 @@ def _generate_samples(
             freq = max(90.0, min(520.0, base_pitch + freq_variance))
 
             vibration = profile["vibrato"] + rand.random() * 0.8
-            frame_count = _sample_count(duration, sample_rate)
-            for frame in range(frame_count):
-                t = frame / sample_rate
-                env = math.sin(
-                    math.pi * frame / frame_count
-                )  # simple attack/release envelope
-                vibrato = math.sin(2 * math.pi * vibration * t) * 0.02
-                sample_value = math.sin(2 * math.pi * (freq + freq * vibrato) * t)
-                sample_value *= env
-                samples.append(int(sample_value * amplitude))
+            segments.append(
+                ToneSegment(_sample_count(duration, sample_rate), freq, vibration)
+            )
             total_time += duration
 
         # word boundary pause (except last word)
         if word_index < len(words) - 1:
             pause = PAUSE_DURATION * (1.2 if word.endswith(",") else 1.0)
-            samples.extend([0] * _sample_count(pause, sample_rate))
+            segments.append(ToneSegment(_sample_count(pause, sample_rate)))
             total_time += pause
 
-    if not samples:
-        raise ValueError("text must contain audible characters")
+    return segments, total_time
+
 
-    # Add gentle tail fade to avoid click
-    tail_frames = min(len(samples), _sample_count(0.1, sample_rate))
-    for i in range(1, tail_frames + 1):
-        samples[-i] = int(samples[-i] * (i / tail_frames))
+def _generate_samples(
+    text: str,
+    *,
+    voice: str,
+    lang: Optional[str],
+    style: Optional[str],
+    sample_rate: int,
+    seed_value: int,
+) -> Tuple[PCMBuffer, float]:
+    """Generate a synthetic waveform approximating speech cadences."""
+
+    profile = _voice_profile(voice, style)
+    rand = random.Random(seed_value)
+    segments, _ = _voice_segments(
+        text, profile=profile, rand=rand, lang=lang, sample_rate=sample_rate
+    )
+    samples = render_voice(
+        segments,
+        sample_rate=sample_rate,
+        amplitude=int(MAX_AMPLITUDE * 32767),
+        # Add gentle tail fade to avoid click
+        tail_frames=_sample_count(0.1, sample_rate),
+    )
+    if not len(samples):
+        raise ValueError("text must contain audible characters")
 
     duration_seconds = len(samples) / sample_rate
     return samples, duration_seconds
@@ -346,11 +354,7 @@ def _synth_voice_fallback(
         seed_value=seed_value,
     )
 
-    with wave.open(str(artifact_path), "wb") as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)  # 16-bit PCM
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(samples.tobytes())
+    write_wav(artifact_path, [samples], sample_rate=sample_rate)
 
     created_at = time.time()
     metadata = {
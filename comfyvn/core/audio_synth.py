@@ -0,0 +1,321 @@
+"""Vectorised PCM synthesis for the offline voice and music fallbacks.
+
+The synthetic TTS (`audio_stub`) and music remix (`music_remix`) fallbacks
+describe their output as a short list of tone segments or oscillator layers.
+This module renders those descriptions to 16-bit PCM. When NumPy is available
+whole segments are computed as arrays (and long music beds are produced in
+bounded chunks); otherwise the original per-sample loops are used. Both paths
+evaluate the same floating point expressions in the same order, so a given
+seed produces bit-identical samples either way.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import wave
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+try:  # numpy is optional but makes synthesis orders of magnitude faster
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
+# Frames rendered per music chunk; bounds peak memory for long tracks.
+DEFAULT_CHUNK_FRAMES = 1 << 16
+MUSIC_FADE_SECONDS = 0.25
+
+PCMBuffer = Union[array, "np.ndarray"]
+
+
+class ToneSegment(NamedTuple):
+    """A voiced character (``freq`` set) or a silent gap (``freq`` is None)."""
+
+    frame_count: int
+    freq: Optional[float] = None
+    vibration: float = 0.0
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+# ---------------------------------------------------------------------------
+# Voice
+# ---------------------------------------------------------------------------
+def render_voice(
+    segments: Iterable[ToneSegment],
+    *,
+    sample_rate: int,
+    amplitude: int,
+    tail_frames: int,
+) -> PCMBuffer:
+    """Render tone segments to mono int16 PCM with a linear tail fade."""
+    if np is None:
+        return _render_voice_python(
+            segments,
+            sample_rate=sample_rate,
+            amplitude=amplitude,
+            tail_frames=tail_frames,
+        )
+    parts: List[Any] = []
+    for segment in segments:
+        if segment.freq is None:
+            parts.append(np.zeros(segment.frame_count, dtype=np.float64))
+            continue
+        frame = np.arange(segment.frame_count, dtype=np.float64)
+        t = frame / sample_rate
+        env = np.sin(math.pi * frame / segment.frame_count)
+        vibrato = np.sin(2 * math.pi * segment.vibration * t) * 0.02
+        value = np.sin(2 * math.pi * (segment.freq + segment.freq * vibrato) * t)
+        value *= env
+        parts.append(np.trunc(value * amplitude))
+    if not parts:
+        return np.zeros(0, dtype="<i2")
+    samples = np.concatenate(parts)
+    tail = min(len(samples), tail_frames)
+    if tail:
+        index = np.arange(1, tail + 1)
+        positions = len(samples) - index
+        samples[positions] = np.trunc(samples[positions] * (index / tail))
+    return samples.astype("<i2")
+
+
+def _render_voice_python(
+    segments: Iterable[ToneSegment],
+    *,
+    sample_rate: int,
+    amplitude: int,
+    tail_frames: int,
+) -> array:
+    samples = array("h")
+    for segment in segments:
+        if segment.freq is None:
+            samples.extend([0] * segment.frame_count)
+            continue
+        freq = segment.freq
+        frame_count = segment.frame_count
+        for frame in range(frame_count):
+            t = frame / sample_rate
+            env = math.sin(math.pi * frame / frame_count)
+            vibrato = math.sin(2 * math.pi * segment.vibration * t) * 0.02
+            sample_value = math.sin(2 * math.pi * (freq + freq * vibrato) * t)
+            sample_value *= env
+            samples.append(int(sample_value * amplitude))
+    tail = min(len(samples), tail_frames)
+    for i in range(1, tail + 1):
+        samples[-i] = int(samples[-i] * (i / tail))
+    return samples
+
+
+# ---------------------------------------------------------------------------
+# Music
+# ---------------------------------------------------------------------------
+def render_music_chunks(
+    *,
+    layers: List[Dict[str, float]],
+    beat_period: float,
+    total_frames: int,
+    sample_rate: int,
+    max_amplitude: float,
+    chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+) -> Iterator[PCMBuffer]:
+    """Yield the mono music bed as consecutive int16 chunks.
+
+    Without NumPy (or for beds too short for the head and tail fades to be
+    disjoint) the whole bed is produced as a single chunk.
+    """
+    fade_frames = int(sample_rate * MUSIC_FADE_SECONDS)
+    if np is None or total_frames < 2 * fade_frames:
+        yield _render_music_python(
+            layers=layers,
+            beat_period=beat_period,
+            total_frames=total_frames,
+            sample_rate=sample_rate,
+            max_amplitude=max_amplitude,
+            fade_frames=fade_frames,
+        )
+        return
+    chunk_frames = max(1, int(chunk_frames))
+    layer_count = max(len(layers), 1)
+    for start in range(0, total_frames, chunk_frames):
+        stop = min(total_frames, start + chunk_frames)
+        frame = np.arange(start, stop, dtype=np.float64)
+        t = frame / sample_rate
+        beat_position = (t % beat_period) / beat_period
+        envelope = np.minimum(1.0, np.sin(math.pi * beat_position) + 0.25)
+        value = np.zeros(stop - start, dtype=np.float64)
+        for layer in layers:
+            lfo = np.sin(2 * math.pi * layer["lfo_freq"] * t) * layer["lfo_depth"]
+            swing = np.sin(2 * math.pi * (layer["freq"] / 4) * t) * layer["swing"]
+            sample_value = np.sin(
+                2 * math.pi * (layer["freq"] + layer["freq"] * (lfo + swing)) * t
+                + layer["phase"]
+            )
+            value += sample_value * layer["volume"]
+        value /= layer_count
+        value *= envelope
+        samples = np.trunc(np.clip(value * max_amplitude, -32767, 32767))
+        if fade_frames:
+            _apply_music_fade(samples, start, total_frames, fade_frames)
+        yield samples.astype("<i2")
+
+
+def _apply_music_fade(
+    samples: "np.ndarray", start: int, total_frames: int, fade_frames: int
+) -> None:
+    stop = start + len(samples)
+    head_stop = min(stop, fade_frames)
+    if start < head_stop:
+        i = np.arange(start, head_stop)
+        fade = np.minimum(
+            1.0, np.minimum(i / fade_frames, (total_frames - i) / fade_frames)
+        )
+        local = i - start
+        samples[local] = np.trunc(samples[local] * fade)
+    tail_start = max(start, total_frames - fade_frames)
+    if tail_start < stop:
+        position = np.arange(tail_start, stop)
+        i = total_frames - 1 - position
+        fade = np.minimum(
+            1.0, np.minimum(i / fade_frames, (total_frames - i) / fade_frames)
+        )
+        local = position - start
+        samples[local] = np.trunc(samples[local] * fade)
+
+
+def _render_music_python(
+    *,
+    layers: List[Dict[str, float]],
+    beat_period: float,
+    total_frames: int,
+    sample_rate: int,
+    max_amplitude: float,
+    fade_frames: int,
+) -> array:
+    samples = array("h")
+    layer_count = len(layers)
+    for frame in range(total_frames):
+        t = frame / sample_rate
+        beat_position = (t % beat_period) / beat_period
+        beat_env = math.sin(math.pi * beat_position)
+        envelope = min(1.0, beat_env + 0.25)
+        value = 0.0
+        for layer in layers:
+            lfo = math.sin(2 * math.pi * layer["lfo_freq"] * t) * layer["lfo_depth"]
+            swing = math.sin(2 * math.pi * (layer["freq"] / 4) * t) * layer["swing"]
+            sample_value = math.sin(
+                2 * math.pi * (layer["freq"] + layer["freq"] * (lfo + swing)) * t
+                + layer["phase"]
+            )
+            value += sample_value * layer["volume"]
+
+        value /= max(layer_count, 1)
+        value *= envelope
+        samples.append(int(max(-32767, min(32767, value * max_amplitude))))
+
+    for i in range(min(fade_frames, len(samples))):
+        fade_in = (i / fade_frames) if fade_frames else 1.0
+        fade_out = ((len(samples) - i) / fade_frames) if fade_frames else 1.0
+        fade = min(1.0, fade_in, fade_out)
+        samples[i] = int(samples[i] * fade)
+        samples[-i - 1] = int(samples[-i - 1] * fade)
+    return samples
+
+
+def concat_pcm(chunks: Iterable[PCMBuffer]) -> PCMBuffer:
+    """Join rendered chunks into a single buffer (mainly for callers/tests)."""
+    parts = list(chunks)
+    if len(parts) == 1:
+        return parts[0]
+    if np is not None:
+        return np.concatenate([np.asarray(part, dtype="<i2") for part in parts])
+    joined = array("h")
+    for part in parts:
+        joined.extend(part)
+    return joined
+
+
+def _stereo_chunks(chunks: Iterable[PCMBuffer], phase_offset: int) -> Iterator[bytes]:
+    """Interleave ``L=s[i]`` with ``R=s[(i + phase_offset) % n]`` chunk by chunk."""
+    iterator = iter(chunks)
+    first = next(iterator, None)
+    if first is None:
+        return
+    second = next(iterator, None)
+    if second is None or np is None:
+        mono = first if second is None else concat_pcm([first, second, *iterator])
+        yield _stereo_whole(mono, phase_offset)
+        return
+
+    head = np.asarray(first, dtype="<i2")
+    pending = head
+    for part in itertools.chain([second], iterator):
+        pending = np.concatenate([pending, np.asarray(part, dtype="<i2")])
+        if len(pending) <= phase_offset:
+            continue
+        emit = len(pending) - phase_offset
+        yield _interleave(pending[:emit], pending[phase_offset:])
+        pending = pending[emit:]
+    # The last ``phase_offset`` frames wrap around to the start of the bed.
+    total = len(pending)
+    wrapped = np.concatenate([pending, head])[phase_offset : phase_offset + total]
+    yield _interleave(pending, wrapped)
+
+
+def _interleave(left: "np.ndarray", right: "np.ndarray") -> bytes:
+    stereo = np.empty(len(left) * 2, dtype="<i2")
+    stereo[0::2] = left
+    stereo[1::2] = right
+    return stereo.tobytes()
+
+
+def _stereo_whole(mono: PCMBuffer, phase_offset: int) -> bytes:
+    if np is not None:
+        samples = np.asarray(mono, dtype="<i2")
+        return _interleave(samples, np.roll(samples, -phase_offset))
+    stereo = array("h")
+    for idx, value in enumerate(mono):
+        paired_idx = (idx + phase_offset) % len(mono)
+        stereo.append(value)
+        stereo.append(mono[paired_idx])
+    return stereo.tobytes()
+
+
+def write_wav(
+    path: Path | str,
+    chunks: Iterable[PCMBuffer],
+    *,
+    sample_rate: int,
+    channels: int = 1,
+    phase_offset: int = 0,
+) -> None:
+    """Stream mono PCM chunks to a 16-bit WAV file.
+
+    Stereo output pairs each sample with the one ``phase_offset`` frames later
+    (wrapping at the end), matching the music fallback's pseudo-stereo image.
+    """
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)  # 16-bit PCM
+        wav_file.setframerate(sample_rate)
+        if channels == 1:
+            for chunk in chunks:
+                wav_file.writeframes(chunk.tobytes())
+            return
+        for payload in _stereo_chunks(chunks, phase_offset):
+            wav_file.writeframes(payload)
+
+
+__all__ = [
+    "DEFAULT_CHUNK_FRAMES",
+    "PCMBuffer",
+    "ToneSegment",
+    "concat_pcm",
+    "numpy_available",
+    "render_music_chunks",
+    "render_voice",
+    "write_wav",
+]
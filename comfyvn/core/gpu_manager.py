@@ -3,12 +3,11 @@ from __future__ import annotations
 import json
 import logging
 import os
-import shutil
-import subprocess
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from comfyvn.config.runtime_paths import settings_file
+from comfyvn.core.gpu_telemetry import get_gpu_sampler
 from comfyvn.core.settings_manager import SettingsManager
 
 try:  # torch is optional at runtime
@@ -153,36 +152,24 @@ class GPUManager:
         except Exception as exc:
             LOGGER.debug("Torch GPU discovery failed: %s", exc)
 
-        # Fallback to nvidia-smi parsing
-        if shutil.which("nvidia-smi"):
-            try:
-                out = subprocess.check_output(
-                    [
-                        "nvidia-smi",
-                        "--query-gpu=index,name,memory.total,memory.used,utilization.gpu,temperature.gpu",
-                        "--format=csv,noheader,nounits",
-                    ],
-                    stderr=subprocess.DEVNULL,
-                ).decode()
-                for line in out.strip().splitlines():
-                    idx, name, mem_total, mem_used, util, temp = [
-                        part.strip() for part in line.split(",")
-                    ]
-                    gpus.append(
-                        {
-                            "id": f"cuda:{idx}",
-                            "name": name,
-                            "kind": "gpu",
-                            "available": True,
-                            "memory_total": float(mem_total),
-                            "memory_used": float(mem_used),
-                            "utilization": int(util),
-                            "temperature": int(temp),
-                            "source": "nvidia-smi",
-                        }
-                    )
-            except Exception as exc:  # pragma: no cover - external binary
-                LOGGER.debug("nvidia-smi discovery failed: %s", exc)
+        # Fall back to the shared telemetry sampler (NVML, then nvidia-smi),
+        # which polls in the background instead of forking per refresh.
+        sampler = get_gpu_sampler()
+        source = "nvidia-smi" if sampler.backend.name == "smi" else sampler.backend.name
+        for entry in sampler.gpus():
+            gpus.append(
+                {
+                    "id": f"cuda:{entry['id']}",
+                    "name": entry.get("name"),
+                    "kind": "gpu",
+                    "available": True,
+                    "memory_total": float(entry.get("mem_total") or 0),
+                    "memory_used": float(entry.get("mem_used") or 0),
+                    "utilization": entry.get("util"),
+                    "temperature": entry.get("temp_c"),
+                    "source": source,
+                }
+            )
         return gpus
 
     def _discover_remote_devices(self) -> List[Dict[str, Any]]:
@@ -0,0 +1,462 @@
+"""
+Shared GPU telemetry sampler.
+
+Metrics routes, the GPU manager and the system monitor used to query NVML
+(init + shutdown) or fork ``nvidia-smi`` on every request.  A single
+:class:`GPUTelemetrySampler` now polls one backend on a background thread at
+a fixed interval and keeps the most recent samples in a fixed-size ring
+buffer; readers get the latest sample or windowed min/max/avg aggregates
+without touching the driver.
+
+Backends, in ``auto`` preference order:
+
+* ``nvml``  — ``pynvml`` initialised once and kept open;
+* ``smi``   — ``nvidia-smi`` CSV query, the last resort;
+* ``none``  — no GPU telemetry (CPU-only host); nothing is sampled.
+
+``fake`` produces deterministic synthetic readings so CPU-only machines and
+tests can exercise the whole path.  Pick one with
+``COMFYVN_GPU_TELEMETRY_BACKEND``; ``COMFYVN_GPU_TELEMETRY_INTERVAL`` (seconds)
+and ``COMFYVN_GPU_TELEMETRY_CAPACITY`` (samples) size the buffer.  Sampling
+pauses after ``idle_timeout`` seconds without readers and resumes on the
+next read.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import shutil
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+BACKEND_ENV = "COMFYVN_GPU_TELEMETRY_BACKEND"
+INTERVAL_ENV = "COMFYVN_GPU_TELEMETRY_INTERVAL"
+CAPACITY_ENV = "COMFYVN_GPU_TELEMETRY_CAPACITY"
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_CAPACITY = 600
+DEFAULT_WINDOW = 60.0
+_AGGREGATED_FIELDS = ("util", "mem_used", "temp_c")
+
+
+# --------------------------------------------------------------------- backends
+class TelemetryBackend:
+    """Source of per-GPU readings: ``{id, name, util, mem_used, mem_total, temp_c}``."""
+
+    name = "none"
+
+    def sample(self) -> List[Dict[str, Any]]:
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class NVMLBackend(TelemetryBackend):
+    """NVML via ``pynvml``; initialised once and reused for every sample."""
+
+    name = "nvml"
+
+    def __init__(self) -> None:
+        import pynvml  # type: ignore
+
+        self._nvml = pynvml
+        pynvml.nvmlInit()
+        try:
+            count = pynvml.nvmlDeviceGetCount()
+            self._devices: List[Tuple[Any, str]] = []
+            for idx in range(count):
+                handle = pynvml.nvmlDeviceGetHandleByIndex(idx)
+                name = pynvml.nvmlDeviceGetName(handle)
+                if isinstance(name, bytes):
+                    name = name.decode("utf-8", errors="replace")
+                self._devices.append((handle, str(name)))
+        except Exception:
+            self.close()
+            raise
+        if not self._devices:
+            self.close()
+            raise RuntimeError("NVML reports no devices")
+
+    def sample(self) -> List[Dict[str, Any]]:
+        nvml = self._nvml
+        entries: List[Dict[str, Any]] = []
+        for idx, (handle, name) in enumerate(self._devices):
+            util = nvml.nvmlDeviceGetUtilizationRates(handle)
+            mem = nvml.nvmlDeviceGetMemoryInfo(handle)
+            temp = nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU)
+            entries.append(
+                {
+                    "id": idx,
+                    "name": name,
+                    "util": int(getattr(util, "gpu", 0)),
+                    "mem_used": int(mem.used // (1024 * 1024)),
+                    "mem_total": int(mem.total // (1024 * 1024)),
+                    "temp_c": int(temp),
+                }
+            )
+        return entries
+
+    def close(self) -> None:
+        try:
+            self._nvml.nvmlShutdown()
+        except Exception:  # pragma: no cover - shutdown best effort
+            pass
+
+
+class NvidiaSmiBackend(TelemetryBackend):
+    """``nvidia-smi`` CSV query; one fork/exec per sample."""
+
+    name = "smi"
+    QUERY = "index,name,utilization.gpu,memory.used,memory.total,temperature.gpu"
+
+    def __init__(self, executable: Optional[str] = None, *, timeout: float = 2.0):
+        executable = executable or shutil.which("nvidia-smi")
+        if not executable:
+            raise FileNotFoundError("nvidia-smi not found")
+        self.executable = executable
+        self.timeout = float(timeout)
+
+    def sample(self) -> List[Dict[str, Any]]:
+        result = subprocess.run(
+            [
+                self.executable,
+                f"--query-gpu={self.QUERY}",
+                "--format=csv,noheader,nounits",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=self.timeout,
+        )
+        return parse_smi_csv(result.stdout)
+
+
+def parse_smi_csv(text: str) -> List[Dict[str, Any]]:
+    entries: List[Dict[str, Any]] = []
+    for line in text.splitlines():
+        parts = [segment.strip() for segment in line.split(",")]
+        if len(parts) != 6:
+            continue
+        idx, name, util, mem_used, mem_total, temp = parts
+        try:
+            entries.append(
+                {
+                    "id": int(idx),
+                    "name": name,
+                    "util": int(float(util)),
+                    "mem_used": int(float(mem_used)),
+                    "mem_total": int(float(mem_total)),
+                    "temp_c": int(float(temp)),
+                }
+            )
+        except (TypeError, ValueError):
+            continue
+    return entries
+
+
+class FakeGPUBackend(TelemetryBackend):
+    """Deterministic synthetic GPUs for CPU-only hosts and tests."""
+
+    name = "fake"
+
+    def __init__(self, count: int = 1, *, mem_total: int = 8192) -> None:
+        self.count = max(1, int(count))
+        self.mem_total = int(mem_total)
+        self.calls = 0
+
+    def sample(self) -> List[Dict[str, Any]]:
+        tick = self.calls
+        self.calls += 1
+        entries = []
+        for idx in range(self.count):
+            wave = math.sin(tick / 5.0 + idx)
+            util = int(round(50 + 45 * wave))
+            entries.append(
+                {
+                    "id": idx,
+                    "name": f"Fake GPU {idx}",
+                    "util": util,
+                    "mem_used": int(self.mem_total * (0.4 + 0.3 * wave)),
+                    "mem_total": self.mem_total,
+                    "temp_c": 40 + util // 3,
+                }
+            )
+        return entries
+
+
+def select_backend(name: Optional[str] = None) -> TelemetryBackend:
+    """Build the backend named ``name`` (default: env, then ``auto``)."""
+    choice = (name or os.getenv(BACKEND_ENV, "") or "auto").strip().lower()
+    if choice == "fake":
+        return FakeGPUBackend()
+    if choice in {"none", "off", "disabled"}:
+        return TelemetryBackend()
+    if choice in {"auto", "nvml"}:
+        try:
+            return NVMLBackend()
+        except Exception as exc:
+            LOGGER.debug("NVML telemetry unavailable: %s", exc)
+    if choice in {"auto", "smi"}:
+        try:
+            return NvidiaSmiBackend()
+        except Exception as exc:
+            LOGGER.debug("nvidia-smi telemetry unavailable: %s", exc)
+    return TelemetryBackend()
+
+
+# --------------------------------------------------------------------- sampler
+@dataclass(frozen=True)
+class TelemetrySample:
+    timestamp: float  # wall clock, for display
+    monotonic: float  # for windowing
+    gpus: Tuple[Dict[str, Any], ...]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": datetime.fromtimestamp(
+                self.timestamp, timezone.utc
+            ).isoformat(),
+            "gpus": [dict(gpu) for gpu in self.gpus],
+        }
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, "") or default)
+    except ValueError:
+        return default
+
+
+class GPUTelemetrySampler:
+    """Background poller writing backend readings into a bounded ring buffer."""
+
+    def __init__(
+        self,
+        backend: Optional[TelemetryBackend] = None,
+        *,
+        interval: float = DEFAULT_INTERVAL,
+        capacity: int = DEFAULT_CAPACITY,
+        idle_timeout: float = 300.0,
+    ) -> None:
+        self.backend = backend if backend is not None else select_backend()
+        self.interval = max(0.01, float(interval))
+        self.capacity = max(1, int(capacity))
+        self.idle_timeout = float(idle_timeout)
+        self._buffer: Deque[TelemetrySample] = deque(maxlen=self.capacity)
+        self._lock = threading.Lock()
+        self._sample_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_read = time.monotonic()
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.last_sample_ms: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend.name != "none"
+
+    # Lifecycle ------------------------------------------------------------
+    def start(self) -> "GPUTelemetrySampler":
+        if not self.enabled:
+            return self
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="gpu-telemetry", daemon=True
+                )
+                self._thread.start()
+        return self
+
+    def stop(self, *, close_backend: bool = True) -> None:
+        self._stop.set()
+        self._wake.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=max(1.0, self.interval * 2))
+        if close_backend:
+            self.backend.close()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if time.monotonic() - self._last_read > self.idle_timeout:
+                self._wake.clear()
+                self._wake.wait()
+                continue
+            self.sample_now()
+            self._stop.wait(self.interval)
+
+    # Sampling -------------------------------------------------------------
+    def sample_now(self) -> Optional[TelemetrySample]:
+        """Take one reading synchronously and append it to the buffer."""
+        with self._sample_lock:
+            started = time.perf_counter()
+            try:
+                gpus = self.backend.sample()
+            except Exception as exc:
+                self.errors += 1
+                self.last_error = str(exc)
+                LOGGER.debug("GPU telemetry sample failed: %s", exc)
+                return None
+            self.last_sample_ms = round((time.perf_counter() - started) * 1000, 3)
+            sample = TelemetrySample(
+                time.time(), time.monotonic(), tuple(dict(gpu) for gpu in gpus)
+            )
+            with self._lock:
+                self._buffer.append(sample)
+            return sample
+
+    def _touch(self) -> None:
+        self._last_read = time.monotonic()
+        if not self._wake.is_set():
+            self._wake.set()
+
+    # Readers --------------------------------------------------------------
+    def latest(self) -> Optional[TelemetrySample]:
+        """Most recent sample; read synchronously when the buffer is stale."""
+        if not self.enabled:
+            return None
+        self._touch()
+        with self._lock:
+            sample = self._buffer[-1] if self._buffer else None
+        stale = sample is None or (
+            time.monotonic() - sample.monotonic > self.interval * 3
+        )
+        if stale:
+            sample = self.sample_now() or sample
+        return sample
+
+    def gpus(self) -> List[Dict[str, Any]]:
+        sample = self.latest()
+        return [dict(gpu) for gpu in sample.gpus] if sample else []
+
+    def samples(self, window: Optional[float] = None) -> List[TelemetrySample]:
+        with self._lock:
+            buffered = list(self._buffer)
+        if window is None:
+            return buffered
+        cutoff = time.monotonic() - float(window)
+        return [sample for sample in buffered if sample.monotonic >= cutoff]
+
+    def window(self, seconds: float = DEFAULT_WINDOW) -> Dict[str, Any]:
+        """Per-GPU min/max/avg of util, memory and temperature over ``seconds``."""
+        self.latest()
+        selected = self.samples(seconds)
+        per_gpu: Dict[Any, Dict[str, Any]] = {}
+        for sample in selected:
+            for gpu in sample.gpus:
+                entry = per_gpu.setdefault(
+                    gpu.get("id"),
+                    {
+                        "id": gpu.get("id"),
+                        "name": gpu.get("name"),
+                        "mem_total": gpu.get("mem_total"),
+                        "samples": 0,
+                        **{field: [] for field in _AGGREGATED_FIELDS},
+                    },
+                )
+                entry["samples"] += 1
+                for field in _AGGREGATED_FIELDS:
+                    value = gpu.get(field)
+                    if isinstance(value, (int, float)):
+                        entry[field].append(value)
+        gpus = []
+        for entry in per_gpu.values():
+            for field in _AGGREGATED_FIELDS:
+                values = entry[field]
+                entry[field] = (
+                    {
+                        "min": min(values),
+                        "max": max(values),
+                        "avg": round(sum(values) / len(values), 2),
+                    }
+                    if values
+                    else None
+                )
+            gpus.append(entry)
+        return {
+            "window_s": float(seconds),
+            "samples": len(selected),
+            "from": selected[0].as_dict()["timestamp"] if selected else None,
+            "to": selected[-1].as_dict()["timestamp"] if selected else None,
+            "gpus": gpus,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            buffered = len(self._buffer)
+        return {
+            "backend": self.backend.name,
+            "running": self.running,
+            "interval": self.interval,
+            "capacity": self.capacity,
+            "buffered": buffered,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "last_sample_ms": self.last_sample_ms,
+        }
+
+
+_SAMPLER: Optional[GPUTelemetrySampler] = None
+_SAMPLER_LOCK = threading.Lock()
+
+
+def get_gpu_sampler() -> GPUTelemetrySampler:
+    """Process-wide sampler, started on first use."""
+    global _SAMPLER
+    with _SAMPLER_LOCK:
+        if _SAMPLER is None:
+            _SAMPLER = GPUTelemetrySampler(
+                interval=_env_float(INTERVAL_ENV, DEFAULT_INTERVAL),
+                capacity=int(_env_float(CAPACITY_ENV, DEFAULT_CAPACITY)),
+            )
+            LOGGER.info(
+                "GPU telemetry sampler backend=%s interval=%.2fs capacity=%d",
+                _SAMPLER.backend.name,
+                _SAMPLER.interval,
+                _SAMPLER.capacity,
+            )
+        sampler = _SAMPLER
+    return sampler.start()
+
+
+def reset_gpu_sampler(sampler: Optional[GPUTelemetrySampler] = None) -> None:
+    """Stop the process sampler and optionally install ``sampler`` in its place."""
+    global _SAMPLER
+    with _SAMPLER_LOCK:
+        previous, _SAMPLER = _SAMPLER, sampler
+    if previous is not None and previous is not sampler:
+        previous.stop()
+
+
+__all__ = [
+    "BACKEND_ENV",
+    "CAPACITY_ENV",
+    "FakeGPUBackend",
+    "GPUTelemetrySampler",
+    "INTERVAL_ENV",
+    "NVMLBackend",
+    "NvidiaSmiBackend",
+    "TelemetryBackend",
+    "TelemetrySample",
+    "get_gpu_sampler",
+    "parse_smi_csv",
+    "reset_gpu_sampler",
+    "select_backend",
+]
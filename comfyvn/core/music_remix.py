@@ -9,12 +9,18 @@ import random
 import shutil
 import time
 import wave
-from array import array
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from comfyvn.config.runtime_paths import music_cache_file
+from comfyvn.core.audio_synth import (
+    DEFAULT_CHUNK_FRAMES,
+    PCMBuffer,
+    concat_pcm,
+    render_music_chunks,
+    write_wav,
+)
 from comfyvn.core.comfyui_audio import (
     ComfyUIAudioRunner,
     ComfyUIWorkflowConfig,
@@ -160,20 +166,10 @@ def _style_profile(
     }
 
 
-def _generate_music_samples(
-    *,
-    duration: float,
-    sample_rate: int,
-    style_profile: Dict[str, float],
-    seed: int,
-) -> Tuple[array, Dict[str, object]]:
+def _plan_music_layers(
+    *, style_profile: Dict[str, float], seed: int
+) -> List[Dict[str, float]]:
     rand = random.Random(seed)
-    total_frames = int(duration * sample_rate)
-    samples = array("h")
-    max_amplitude = 0.32 * 32767
-
-    tempo = style_profile["tempo"]
-    beat_period = 60.0 / max(tempo, 1.0)
     layer_count = int(style_profile["layer_count"])
     layers: List[Dict[str, float]] = []
 
@@ -190,36 +186,18 @@ def _generate_music_samples(
             "volume": 0.6 + rand.random() * 0.4,
         }
         layers.append(layer)
+    return layers
 
-    for frame in range(total_frames):
-        t = frame / sample_rate
-        beat_position = (t % beat_period) / beat_period
-        beat_env = math.sin(math.pi * beat_position)
-        envelope = min(1.0, beat_env + 0.25)
-        value = 0.0
-        for layer in layers:
-            lfo = math.sin(2 * math.pi * layer["lfo_freq"] * t) * layer["lfo_depth"]
-            swing = math.sin(2 * math.pi * (layer["freq"] / 4) * t) * layer["swing"]
-            sample_value = math.sin(
-                2 * math.pi * (layer["freq"] + layer["freq"] * (lfo + swing)) * t
-                + layer["phase"]
-            )
-            value += sample_value * layer["volume"]
-
-        value /= max(layer_count, 1)
-        value *= envelope
-        samples.append(int(max(-32767, min(32767, value * max_amplitude))))
 
-    fade_frames = int(sample_rate * 0.25)
-    for i in range(min(fade_frames, len(samples))):
-        fade_in = (i / fade_frames) if fade_frames else 1.0
-        fade_out = ((len(samples) - i) / fade_frames) if fade_frames else 1.0
-        fade = min(1.0, fade_in, fade_out)
-        samples[i] = int(samples[i] * fade)
-        samples[-i - 1] = int(samples[-i - 1] * fade)
-
-    metadata = {
-        "tempo": tempo,
+def _music_metadata(
+    *,
+    duration: float,
+    sample_rate: int,
+    style_profile: Dict[str, float],
+    layers: List[Dict[str, float]],
+) -> Dict[str, object]:
+    return {
+        "tempo": style_profile["tempo"],
         "duration_seconds": duration,
         "sample_rate": sample_rate,
         "layers": [
@@ -232,6 +210,48 @@ def _generate_music_samples(
             for layer in layers
         ],
     }
+
+
+def _music_chunks(
+    *,
+    duration: float,
+    sample_rate: int,
+    style_profile: Dict[str, float],
+    layers: List[Dict[str, float]],
+    chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+) -> Iterator[PCMBuffer]:
+    return render_music_chunks(
+        layers=layers,
+        beat_period=60.0 / max(style_profile["tempo"], 1.0),
+        total_frames=int(duration * sample_rate),
+        sample_rate=sample_rate,
+        max_amplitude=0.32 * 32767,
+        chunk_frames=chunk_frames,
+    )
+
+
+def _generate_music_samples(
+    *,
+    duration: float,
+    sample_rate: int,
+    style_profile: Dict[str, float],
+    seed: int,
+) -> Tuple[PCMBuffer, Dict[str, object]]:
+    layers = _plan_music_layers(style_profile=style_profile, seed=seed)
+    samples = concat_pcm(
+        _music_chunks(
+            duration=duration,
+            sample_rate=sample_rate,
+            style_profile=style_profile,
+            layers=layers,
+        )
+    )
+    metadata = _music_metadata(
+        duration=duration,
+        sample_rate=sample_rate,
+        style_profile=style_profile,
+        layers=layers,
+    )
     return samples, metadata
 
 
@@ -372,11 +392,12 @@ def remix_track(
     style_profile = _style_profile(target, mood_tags, random.Random(derived_seed))
     duration = DEFAULT_DURATION + len(mood_tags) * 1.5
 
-    samples, music_meta = _generate_music_samples(
+    layers = _plan_music_layers(style_profile=style_profile, seed=derived_seed)
+    music_meta = _music_metadata(
         duration=duration,
         sample_rate=DEFAULT_SAMPLE_RATE,
         style_profile=style_profile,
-        seed=derived_seed,
+        layers=layers,
     )
 
     provider, section_cfg = _resolve_provider()
@@ -403,22 +424,19 @@ def remix_track(
         except Exception as exc:  # pragma: no cover - defensive logging
             LOGGER.exception("Unexpected ComfyUI music failure: %s", exc)
 
-    with wave.open(str(artifact), "wb") as wav_file:
-        wav_file.setnchannels(2 if len(music_meta["layers"]) > 3 else 1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(DEFAULT_SAMPLE_RATE)
-
-        if wav_file.getnchannels() == 1:
-            wav_file.writeframes(samples.tobytes())
-        else:
-            # rudimentary stereo: alternate samples between L/R with slight phase offset
-            stereo = array("h")
-            phase_offset = int(DEFAULT_SAMPLE_RATE * 0.002)
-            for idx, value in enumerate(samples):
-                paired_idx = (idx + phase_offset) % len(samples)
-                stereo.append(value)
-                stereo.append(samples[paired_idx])
-            wav_file.writeframes(stereo.tobytes())
+    # rudimentary stereo: pair each sample with one slightly later for R
+    write_wav(
+        artifact,
+        _music_chunks(
+            duration=duration,
+            sample_rate=DEFAULT_SAMPLE_RATE,
+            style_profile=style_profile,
+            layers=layers,
+        ),
+        sample_rate=DEFAULT_SAMPLE_RATE,
+        channels=2 if len(music_meta["layers"]) > 3 else 1,
+        phase_offset=int(DEFAULT_SAMPLE_RATE * 0.002),
+    )
 
     created_at = time.time()
     payload.update(
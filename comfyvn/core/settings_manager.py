@@ -5,8 +5,10 @@ from __future__ import annotations
 import copy
 import json
 import sqlite3
+import threading
+from contextlib import closing
 from pathlib import Path
-from typing import Any, Mapping, MutableMapping
+from typing import Any, Callable, Mapping, MutableMapping
 
 from pydantic import BaseModel, Field
 
@@ -17,6 +19,7 @@ except ImportError:  # pragma: no cover - compatibility with pydantic<2
 
 from comfyvn.config.baseurl_authority import default_base_url
 from comfyvn.config.runtime_paths import settings_file
+from comfyvn.config.snapshots import ConfigSnapshot, SnapshotCell
 from comfyvn.core.db_manager import DEFAULT_DB_PATH, DBManager
 
 try:
@@ -287,7 +290,8 @@ def _default_section(key: str) -> dict[str, Any]:
 
 def _model_dump(model: BaseModel) -> dict[str, Any]:
     if hasattr(model, "model_dump"):
-        return model.model_dump(mode="python", deep=True)  # type: ignore[call-arg]
+        # model_dump builds fresh containers; it takes no ``deep`` argument.
+        return model.model_dump(mode="python")
     return model.dict()  # type: ignore[call-arg]
 
 
@@ -362,7 +366,54 @@ class SettingsModel(BaseModel):
             extra = "allow"
 
 
+class _SettingsSource:
+    """Process-wide state shared by every manager bound to one file/DB pair."""
+
+    def __init__(self, path: Path, db_path: Path) -> None:
+        self.path = path
+        self.db_path = db_path
+        self.lock = threading.RLock()
+        self.persisted: dict[str, Any] | None = None
+        self._watch: sqlite3.Connection | None = None
+        self.cell: SnapshotCell | None = None
+
+    def signature(self) -> tuple[Any, ...]:
+        try:
+            stat = self.path.stat()
+            file_sig: tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            file_sig = (0, -1)
+        return file_sig + (self._data_version(),)
+
+    def _data_version(self) -> int:
+        # ``PRAGMA data_version`` moves whenever another connection commits,
+        # so a long-lived connection doubles as the DB change counter.
+        with self.lock:
+            try:
+                if self._watch is None:
+                    self._watch = sqlite3.connect(self.db_path, check_same_thread=False)
+                row = self._watch.execute("PRAGMA data_version").fetchone()
+                return int(row[0]) if row else 0
+            except sqlite3.Error:
+                self._watch = None
+                return -1
+
+
+_SOURCES: dict[tuple[str, str], _SettingsSource] = {}
+_SOURCES_LOCK = threading.Lock()
+
+
 class SettingsManager:
+    """
+    Settings backed by a JSON file and the ``settings`` SQLite table.
+
+    All managers bound to the same file/DB pair share one versioned
+    `ConfigSnapshot` (see `comfyvn.config.snapshots`).  Reads are served from
+    it; the sources are re-merged only when the file's mtime/size or the DB
+    change counter moves (checked at most once per poll interval) or after a
+    write through any manager.  ``subscribe()`` registers hot-reload callbacks.
+    """
+
     def __init__(
         self,
         path: str | Path | None = None,
@@ -371,13 +422,29 @@ class SettingsManager:
         self.path = (
             Path(path) if path is not None else Path(settings_file("config.json"))
         )
-        self.path.parent.mkdir(parents=True, exist_ok=True)
         self.db_path = Path(db_path) if db_path is not None else Path(DEFAULT_DB_PATH)
-        self._db_manager = DBManager(self.db_path)
-        self._db_manager.ensure_schema()
-        self._cached_payload: dict[str, Any] | None = None
+        key = (str(self.path.resolve()), str(self.db_path.resolve()))
+        with _SOURCES_LOCK:
+            source = _SOURCES.get(key)
+            created = source is None
+            if source is None:
+                source = _SettingsSource(self.path, self.db_path)
+                _SOURCES[key] = source
+            self._source = source
+            if created:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                DBManager(self.db_path).ensure_schema()
+                source.cell = SnapshotCell(
+                    f"settings:{self.path.name}", self._rebuild, source.signature
+                )
+                source.cell.current()
+        self._cell: SnapshotCell = source.cell  # type: ignore[assignment]
+
+    def _rebuild(self) -> dict[str, Any]:
         model = self._merge_sources()
-        self._persist(model)
+        payload = _model_dump(model)
+        self._persist_payload(payload)
+        return payload
 
     def _merge_sources(self) -> SettingsModel:
         base = _model_dump(SettingsModel())
@@ -389,7 +456,7 @@ class SettingsManager:
 
     def _load_db(self) -> dict[str, Any]:
         result: dict[str, Any] = {}
-        with sqlite3.connect(self.db_path) as conn:
+        with closing(sqlite3.connect(self.db_path)) as conn:
             rows = conn.execute("SELECT key, value_json FROM settings").fetchall()
             for key, raw in rows:
                 if raw is None:
@@ -401,36 +468,69 @@ class SettingsManager:
         return result
 
     def _write_db(self, payload: Mapping[str, Any]) -> None:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DELETE FROM settings")
-            for key, value in payload.items():
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO settings (key, value_json)
-                    VALUES (?, ?)
-                    """,
-                    (key, json.dumps(value)),
+        """Write only the keys that changed, in a single transaction."""
+        encoded = {str(key): json.dumps(value) for key, value in payload.items()}
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                existing = dict(
+                    conn.execute("SELECT key, value_json FROM settings").fetchall()
                 )
-            conn.commit()
+                stale = [(key,) for key in existing if key not in encoded]
+                changed = [
+                    (key, value)
+                    for key, value in encoded.items()
+                    if existing.get(key) != value
+                ]
+                if stale:
+                    conn.executemany("DELETE FROM settings WHERE key = ?", stale)
+                if changed:
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO settings (key, value_json)
+                        VALUES (?, ?)
+                        """,
+                        changed,
+                    )
 
     def _write_file(self, payload: Mapping[str, Any]) -> None:
         self.path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
+    def _persist_payload(self, payload: dict[str, Any]) -> bool:
+        source = self._source
+        with source.lock:
+            if source.persisted == payload:
+                return False
+            self._write_file(payload)
+            self._write_db(payload)
+            source.persisted = copy.deepcopy(payload)
+            return True
+
     def _persist(self, model: SettingsModel) -> None:
         payload = _model_dump(model)
-        if self._cached_payload == payload:
-            return
-        self._write_file(payload)
-        self._write_db(payload)
-        self._cached_payload = copy.deepcopy(payload)
+        with self._source.lock:
+            self._persist_payload(payload)
+            self._cell.publish(payload)
+
+    def snapshot(self, *, refresh: bool = False) -> ConfigSnapshot:
+        """Return the shared snapshot; treat its nested values as read-only."""
+        return self._cell.current(refresh=refresh)
+
+    @property
+    def version(self) -> int:
+        return self._cell.current().version
+
+    def subscribe(
+        self, callback: Callable[[ConfigSnapshot], None]
+    ) -> Callable[[], None]:
+        """Call ``callback(snapshot)`` whenever these settings change."""
+        return self._cell.subscribe(callback)
 
     def load_model(self) -> SettingsModel:
-        model = self._merge_sources()
-        self._persist(model)
-        return model
+        return _model_validate(self.load())
 
     def load(self) -> dict[str, Any]:
-        return _model_dump(self.load_model())
+        return copy.deepcopy(dict(self._cell.current().data))
 
     def save(self, data: Mapping[str, Any] | BaseModel) -> dict[str, Any]:
         model = _model_validate(data)
@@ -438,7 +538,12 @@ class SettingsManager:
         return _model_dump(model)  # type: ignore[arg-type]
 
     def get(self, key: str, default: Any | None = None) -> Any:
-        return self.load().get(key, default)
+        value = self._cell.current().data.get(key, default)
+        if isinstance(value, (dict, list)):
+            # Callers may mutate what they get back; never hand out the
+            # snapshot's own containers.
+            return copy.deepcopy(value)
+        return value
 
     def patch(self, key: str, value: Any) -> dict[str, Any]:
         current = self.load()
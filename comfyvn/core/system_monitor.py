@@ -10,7 +10,6 @@ logger = logging.getLogger(__name__)
 
 import json
 import os
-import subprocess
 import threading
 import time
 from datetime import datetime
@@ -19,6 +18,7 @@ import psutil
 import requests
 
 from comfyvn.config.baseurl_authority import default_base_url
+from comfyvn.core.gpu_telemetry import get_gpu_sampler
 
 try:
     import torch
@@ -188,7 +188,7 @@ class SystemMonitor:
             return {"cpu_percent": 0, "ram_percent": 0, "gpu_percent": 0, "gpus": []}
 
     def _collect_gpu_details(self):
-        """Try torch first, then nvidia-smi."""
+        """Try torch first, then the shared GPU telemetry sampler."""
         gpus = []
         # --- torch route ---
         try:
@@ -216,32 +216,17 @@ class SystemMonitor:
         except Exception:
             pass
 
-        # --- fallback nvidia-smi ---
+        # --- fallback: shared telemetry sampler (NVML / nvidia-smi) ---
         try:
-            out = (
-                subprocess.check_output(
-                    [
-                        "nvidia-smi",
-                        "--query-gpu=index,name,utilization.gpu,memory.used,memory.total,temperature.gpu",
-                        "--format=csv,noheader,nounits",
-                    ],
-                    stderr=subprocess.DEVNULL,
-                )
-                .decode()
-                .strip()
-            )
-            for line in out.splitlines():
-                idx, name, util, mem_used, mem_total, temp = [
-                    x.strip() for x in line.split(",")
-                ]
+            for entry in get_gpu_sampler().gpus():
                 gpus.append(
                     {
-                        "id": int(idx),
-                        "name": name,
-                        "utilization": int(util),
-                        "mem_used": int(mem_used),
-                        "mem_total": int(mem_total),
-                        "temp_c": int(temp),
+                        "id": entry["id"],
+                        "name": entry["name"],
+                        "utilization": entry["util"],
+                        "mem_used": entry["mem_used"],
+                        "mem_total": entry["mem_total"],
+                        "temp_c": entry["temp_c"],
                     }
                 )
         except Exception:
@@ -0,0 +1,237 @@
+"""
+Compiled multi-term matcher shared by the advisory scanner and rating classifier.
+
+A term set is a mapping of ``category -> terms``.  :func:`compile_terms`
+normalises it, hashes it, and returns a cached :class:`TermMatcher`, so a
+given version of a term list is compiled exactly once per process; editing
+the list changes the key and yields a fresh matcher.
+
+Matching is case-insensitive and reports *every* occurrence of every term,
+overlaps included, in one call.  Two engines sit behind the same API:
+
+* small sets scan once per term with ``str.find`` — CPython's substring
+  search runs in C and beats a per-character automaton until the term count
+  reaches the low hundreds;
+* larger sets compile into a single regex trie (shared prefixes factorised)
+  wrapped in a lookahead, giving one left-to-right pass whose cost no longer
+  grows with the number of terms.  Shorter terms that are prefixes of the
+  longest hit at a position are reported from a precomputed table.
+
+With ``whole_tokens=True`` an occurrence only counts when it is delimited by
+whitespace or the text edges, which matches set-of-tokens lookups on
+pre-tokenised text.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Mapping, Set, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+# Term count at which the regex trie overtakes per-term ``str.find`` scans
+# (see tools/bench_term_matcher.py).
+REGEX_MIN_TERMS = 160
+_CACHE_LIMIT = 64
+
+
+@dataclass(frozen=True)
+class TermMatch:
+    """One occurrence of ``term``; offsets index the lower-cased text."""
+
+    start: int
+    end: int
+    term: str
+    categories: Tuple[str, ...]
+
+
+def _normalise(groups: Mapping[str, Iterable[str]]) -> List[Tuple[str, List[str]]]:
+    normalised: List[Tuple[str, List[str]]] = []
+    for category, terms in groups.items():
+        seen: Dict[str, None] = {}
+        for term in terms:
+            if isinstance(term, str) and term.strip():
+                seen[term.strip().lower()] = None
+        normalised.append((str(category), list(seen)))
+    return normalised
+
+
+def term_set_key(
+    groups: Mapping[str, Iterable[str]], *, whole_tokens: bool = False
+) -> str:
+    """Stable digest of a term set; the cache key for compiled matchers."""
+    payload = json.dumps(
+        [_normalise(groups), bool(whole_tokens)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    root: Dict[str, dict] = {}
+    for term in terms:
+        node = root
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional group: the longest term at a position wins.
+        return f"(?:{body})?" if "" in node else body
+
+    return build(root)
+
+
+class TermMatcher:
+    """Immutable matcher for one compiled term set; build via :func:`compile_terms`."""
+
+    def __init__(
+        self, groups: Mapping[str, Iterable[str]], *, whole_tokens: bool = False
+    ) -> None:
+        self.key = term_set_key(groups, whole_tokens=whole_tokens)
+        self.whole_tokens = bool(whole_tokens)
+        categories: Dict[str, List[str]] = {}
+        for category, terms in _normalise(groups):
+            for term in terms:
+                categories.setdefault(term, []).append(category)
+        self._categories: Dict[str, Tuple[str, ...]] = {
+            term: tuple(dict.fromkeys(owners)) for term, owners in categories.items()
+        }
+        self.terms: Tuple[str, ...] = tuple(self._categories)
+        self.engine = "regex" if len(self.terms) >= REGEX_MIN_TERMS else "find"
+        self._regex = None
+        self._prefixes: Dict[str, Tuple[str, ...]] = {}
+        if self.engine == "regex":
+            self._regex = re.compile(f"(?=({_trie_pattern(self.terms)}))")
+            term_set = set(self.terms)
+            for term in self.terms:
+                self._prefixes[term] = tuple(
+                    term[:size]
+                    for size in range(len(term) - 1, 0, -1)
+                    if term[:size] in term_set
+                )
+
+    def __contains__(self, term: object) -> bool:
+        return isinstance(term, str) and term.lower() in self._categories
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def categories(self, term: str) -> Tuple[str, ...]:
+        return self._categories.get(term.lower(), ())
+
+    def _bounded(self, text: str, start: int, end: int) -> bool:
+        if not self.whole_tokens:
+            return True
+        return (start == 0 or text[start - 1].isspace()) and (
+            end == len(text) or text[end].isspace()
+        )
+
+    def _occurrences(self, text: str) -> Iterator[Tuple[int, str]]:
+        if self._regex is not None:
+            for match in self._regex.finditer(text):
+                start = match.start()
+                longest = match.group(1)
+                yield start, longest
+                for prefix in self._prefixes[longest]:
+                    yield start, prefix
+            return
+        for term in self.terms:
+            find = text.find
+            index = find(term)
+            while index != -1:
+                yield index, term
+                index = find(term, index + 1)
+
+    def finditer(self, text: str) -> List[TermMatch]:
+        """All occurrences in ``text``, ordered by start then longest first."""
+        if not text:
+            return []
+        lowered = text.lower()
+        hits = [
+            TermMatch(start, start + len(term), term, self._categories[term])
+            for start, term in self._occurrences(lowered)
+            if self._bounded(lowered, start, start + len(term))
+        ]
+        hits.sort(key=lambda hit: (hit.start, -len(hit.term)))
+        return hits
+
+    def matched_terms(self, text: str) -> Set[str]:
+        """Distinct terms present in ``text`` (cheapest query; no spans)."""
+        if not text:
+            return set()
+        lowered = text.lower()
+        if self._regex is None and not self.whole_tokens:
+            return {term for term in self.terms if term in lowered}
+        return {
+            term
+            for start, term in self._occurrences(lowered)
+            if self._bounded(lowered, start, start + len(term))
+        }
+
+    def categorize(self, text: str) -> Dict[str, List[str]]:
+        """``{category: sorted terms}`` for every category with a hit."""
+        grouped: Dict[str, List[str]] = {}
+        for term in sorted(self.matched_terms(text)):
+            for category in self._categories[term]:
+                grouped.setdefault(category, []).append(term)
+        return grouped
+
+
+_LOCK = threading.Lock()
+_COMPILED: "OrderedDict[str, TermMatcher]" = OrderedDict()
+
+
+def compile_terms(
+    groups: Mapping[str, Iterable[str]], *, whole_tokens: bool = False
+) -> TermMatcher:
+    """Return the cached matcher for ``groups``, compiling it on first use."""
+    key = term_set_key(groups, whole_tokens=whole_tokens)
+    with _LOCK:
+        matcher = _COMPILED.get(key)
+        if matcher is not None:
+            _COMPILED.move_to_end(key)
+            return matcher
+    matcher = TermMatcher(groups, whole_tokens=whole_tokens)
+    LOGGER.debug(
+        "Compiled term matcher key=%s terms=%d engine=%s",
+        key[:12],
+        len(matcher),
+        matcher.engine,
+    )
+    with _LOCK:
+        matcher = _COMPILED.setdefault(key, matcher)
+        _COMPILED.move_to_end(key)
+        while len(_COMPILED) > _CACHE_LIMIT:
+            _COMPILED.popitem(last=False)
+    return matcher
+
+
+def clear_cache() -> None:
+    with _LOCK:
+        _COMPILED.clear()
+
+
+__all__ = [
+    "REGEX_MIN_TERMS",
+    "TermMatch",
+    "TermMatcher",
+    "clear_cache",
+    "compile_terms",
+    "term_set_key",
+]
@@ -4,10 +4,11 @@ from __future__ import annotations
 Diffing and graph helpers for worldline-aware scene timelines.
 """
 
-from .scene_diff import diff_worldline_scenes
+from .scene_diff import clear_diff_caches, diff_worldline_scenes
 from .worldline_graph import build_worldline_graph, preview_worldline_merge
 
 __all__ = [
+    "clear_diff_caches",
     "diff_worldline_scenes",
     "build_worldline_graph",
     "preview_worldline_merge",
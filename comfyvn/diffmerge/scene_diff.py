@@ -4,13 +4,56 @@ from __future__ import annotations
 Scene/worldline diff helpers used by the diff-merge API surface.
 """
 
+from collections import OrderedDict
+from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
+from threading import Lock
+from typing import Any, Dict, Hashable, Iterable, Mapping, Optional, Sequence
 
 from comfyvn.pov.timeline_worlds import diff_worlds
 from comfyvn.pov.worldlines import WORLDLINES, Worldline, WorldlineRegistry
 
-__all__ = ["diff_worldline_scenes"]
+__all__ = ["diff_worldline_scenes", "clear_diff_caches"]
+
+_CACHE_SIZE = 128
+
+
+class _VersionCache:
+    """
+    Small LRU keyed by worldline ``(id, version)`` tuples.
+
+    ``Worldline.version`` changes on every registry mutation, so stale entries
+    simply stop being hit and age out.  Values are deep-copied on the way out
+    because callers are free to mutate the payloads they receive.
+    """
+
+    def __init__(self, maxsize: int = _CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return deepcopy(self._entries[key])
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        with self._lock:
+            self._entries[key] = deepcopy(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_ORDER_CACHE = _VersionCache(maxsize=512)
+_DIFF_CACHE = _VersionCache()
 
 
 @dataclass(slots=True, frozen=True)
@@ -41,7 +84,19 @@ def _filter_choices(world: Worldline, mask_by_pov: bool) -> Dict[str, Dict[str,
     return {pov_key: dict(payload)}
 
 
+def _world_key(world: Worldline) -> tuple[str, int]:
+    return (world.id, world.version)
+
+
 def _order_nodes(world: Worldline) -> list[str]:
+    key = _world_key(world)
+    cached = _ORDER_CACHE.get(key)
+    if cached is None:
+        cached = _ORDER_CACHE.put(key, _compute_order(world))
+    return list(cached)
+
+
+def _compute_order(world: Worldline) -> list[str]:
     metadata = world.metadata or {}
     timeline = metadata.get("timeline")
     if isinstance(timeline, Mapping):
@@ -230,6 +285,15 @@ def diff_worldline_scenes(
     world_a = _resolve_worldline(source, registry)
     world_b = _resolve_worldline(target, registry)
 
+    # Scenario payloads are arbitrary objects, so only scenario-free diffs are
+    # memoised; those depend on nothing but the two worldline versions.
+    cache_key = None
+    if scenario is None:
+        cache_key = ("diff", _world_key(world_a), _world_key(world_b), mask_by_pov)
+        cached = _DIFF_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
     base_diff = diff_worlds(
         world_a,
         world_b,
@@ -274,4 +338,12 @@ def diff_worldline_scenes(
         "node_details": node_details,
     }
 
+    if cache_key is not None:
+        _DIFF_CACHE.put(cache_key, result)
     return result
+
+
+def clear_diff_caches() -> None:
+    """Drop memoised node orders, diffs and graphs."""
+    _ORDER_CACHE.clear()
+    _DIFF_CACHE.clear()
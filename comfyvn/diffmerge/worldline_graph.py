@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional, Sequence
 from comfyvn.pov.timeline_worlds import merge_worlds
 from comfyvn.pov.worldlines import WORLDLINES, Worldline, WorldlineRegistry
 
-from .scene_diff import _order_nodes, _resolve_worldline
+from .scene_diff import _DIFF_CACHE, _order_nodes, _resolve_worldline, _world_key
 
 __all__ = ["build_worldline_graph", "preview_worldline_merge"]
 
@@ -75,6 +75,10 @@ def build_worldline_graph(
 ) -> Dict[str, Any]:
     """
     Compile a lightweight graph representation of worldline timelines.
+
+    Results are memoised on the participating worldline versions, the active
+    world and the resolved target, so repeated polling of an unchanged
+    registry skips the per-pair merge previews.
     """
 
     registry = registry or WORLDLINES
@@ -106,6 +110,17 @@ def build_worldline_graph(
         if target_world is None:
             target_world = worlds[0]
 
+    cache_key = (
+        "graph",
+        tuple(_world_key(world) for world in worlds),
+        _world_key(target_world),
+        active_id,
+        include_fast_forward,
+    )
+    cached = _DIFF_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     timeline_map: Dict[str, List[str]] = {}
     node_map: Dict[str, Dict[str, Any]] = {}
     edges: List[Dict[str, Any]] = []
@@ -186,4 +201,4 @@ def build_worldline_graph(
     }
     if fast_forward_map:
         response["fast_forward"] = fast_forward_map
-    return response
+    return _DIFF_CACHE.put(cache_key, response)
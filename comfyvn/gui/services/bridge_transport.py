@@ -0,0 +1,435 @@
+"""
+Pooled HTTP transport shared by the GUI `ServerBridge`.
+
+`ServerBridge` used to open a fresh ``httpx.Client`` (and usually a fresh
+thread) for every call.  `BridgeTransport` keeps one keep-alive connection
+pool and a bounded worker executor for callback-style requests instead, and
+folds identical GETs that are already in flight into a single round trip.
+
+Timeouts are resolved per endpoint from `ENDPOINT_TIMEOUTS` (longest matching
+path prefix wins) unless the caller passes one explicitly.
+
+`MetricsStream` follows the server's ``/system/metrics/stream`` SSE feed on a
+daemon thread so the bridge only has to poll while the stream is down.
+
+Neither class depends on Qt, so both can be exercised headless.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+import httpx
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_CONNECTIONS = 16
+
+# Longest matching prefix wins; callers may still pass an explicit timeout.
+ENDPOINT_TIMEOUTS: Dict[str, float] = {
+    "/system/ping": 0.5,
+    "/health": 2.0,
+    "/system/metrics": 3.0,
+    "/api/system/warnings": 3.0,
+    "/api/providers/health": 15.0,
+    "/api/schedule": 10.0,
+    "/api/export": 30.0,
+    "/api/import": 30.0,
+}
+
+METRICS_STREAM_PATH = "/system/metrics/stream"
+STREAM_ENV = "COMFYVN_BRIDGE_METRICS_STREAM"
+
+_WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def stream_enabled() -> bool:
+    """Whether the bridge should follow the SSE metrics feed (default: yes)."""
+    raw = os.getenv(STREAM_ENV, "1").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+@dataclass(slots=True)
+class _RawResponse:
+    status: int
+    content: bytes
+    text_fallback: Optional[str] = None
+
+
+class BridgeTransport:
+    """Keep-alive HTTP pool with bounded workers and GET coalescing."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeouts: Optional[Dict[str, float]] = None,
+        default_timeout: float = DEFAULT_TIMEOUT,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.max_connections = max(1, int(max_connections))
+        self.default_timeout = float(default_timeout)
+        self._timeouts = sorted(
+            (timeouts if timeouts is not None else ENDPOINT_TIMEOUTS).items(),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._transport = transport
+        self._client: Optional[httpx.Client] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Future] = {}
+        self._stats = {"requests": 0, "coalesced": 0, "errors": 0}
+
+    # ─────────────────────────────
+    # Resources
+    # ─────────────────────────────
+    @property
+    def client(self) -> httpx.Client:
+        client = self._client
+        if client is None:
+            with self._lock:
+                client = self._client
+                if client is None:
+                    client = httpx.Client(
+                        timeout=self.default_timeout,
+                        limits=httpx.Limits(
+                            max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_connections,
+                        ),
+                        transport=self._transport,
+                    )
+                    self._client = client
+        return client
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        executor = self._executor
+        if executor is None:
+            with self._lock:
+                executor = self._executor
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="ServerBridge",
+                    )
+                    self._executor = executor
+        return executor
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if client is not None:
+            client.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, inflight=len(self._inflight))
+
+    # ─────────────────────────────
+    # Requests
+    # ─────────────────────────────
+    def timeout_for(self, url: str) -> float:
+        path = httpx.URL(url).path
+        for prefix, value in self._timeouts:
+            if path.startswith(prefix):
+                return value
+        return self.default_timeout
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        data: Any = None,
+        json_payload: Any = None,
+        files: Any = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Perform one request and return the bridge's ``{ok, status, data}`` dict.
+
+        Plain GETs (no body, no files) that match one already in flight wait
+        for that response instead of issuing their own; every caller still
+        gets an independently decoded payload.
+        """
+        method_upper = method.upper()
+        if timeout is None:
+            timeout = self.timeout_for(url)
+        with self._lock:
+            self._stats["requests"] += 1
+        try:
+            if method_upper == "GET" and data is None and files is None:
+                raw = self._coalesced_get(url, params, timeout)
+            else:
+                raw = self._send(
+                    method_upper,
+                    url,
+                    params=params,
+                    data=data,
+                    json_payload=json_payload,
+                    files=files,
+                    timeout=timeout,
+                )
+        except Exception as exc:
+            with self._lock:
+                self._stats["errors"] += 1
+            LOGGER.warning("HTTP %s %s failed: %s", method_upper, url, exc)
+            return {"ok": False, "status": None, "data": None, "error": str(exc)}
+
+        LOGGER.debug("HTTP %s %s -> %s", method_upper, url, raw.status)
+        return {
+            "ok": raw.status < 400,
+            "status": raw.status,
+            "data": _decode(raw),
+        }
+
+    def submit(
+        self,
+        fn: Callable[[], Dict[str, Any]],
+        cb: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Future:
+        """Run ``fn`` on the bounded executor and hand its result to ``cb``."""
+
+        def _run() -> Dict[str, Any]:
+            result = fn()
+            if cb is not None:
+                try:
+                    cb(result)
+                except Exception:
+                    LOGGER.exception("ServerBridge callback failed")
+            return result
+
+        return self.executor.submit(_run)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        data: Any = None,
+        json_payload: Any = None,
+        files: Any = None,
+        timeout: float,
+    ) -> _RawResponse:
+        response = self.client.request(
+            method,
+            url,
+            params=params,
+            data=data,
+            json=json_payload,
+            files=files,
+            timeout=timeout,
+        )
+        content = response.content
+        fallback = None
+        if response.encoding and response.encoding.lower() not in {"utf-8", "utf8"}:
+            fallback = response.text
+        return _RawResponse(response.status_code, content, fallback)
+
+    def _coalesced_get(
+        self, url: str, params: Optional[Dict[str, Any]], timeout: float
+    ) -> _RawResponse:
+        key = (url, _params_key(params))
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self._stats["coalesced"] += 1
+        if not leader:
+            return future.result()
+        try:
+            raw = self._send("GET", url, params=params, timeout=timeout)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(raw)
+            return raw
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, str], ...]:
+    if not params:
+        return ()
+    return tuple(sorted((str(key), str(value)) for key, value in params.items()))
+
+
+def _decode(raw: _RawResponse) -> Any:
+    try:
+        return json.loads(raw.content)
+    except Exception:
+        if raw.text_fallback is not None:
+            return raw.text_fallback
+        return raw.content.decode("utf-8", errors="replace")
+
+
+def iter_sse(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Parse Server-Sent Events from decoded lines into ``(event, data)`` pairs.
+
+    Comment lines (``:``) are ignored, multi-line ``data`` fields are joined
+    with newlines and the event name defaults to ``message``.
+    """
+    event = "message"
+    data: list[str] = []
+    for line in lines:
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event = "message"
+            data = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            event = value or "message"
+        elif field == "data":
+            data.append(value)
+    if data:
+        yield event, "\n".join(data)
+
+
+class MetricsStream:
+    """
+    Follow the SSE metrics feed on a daemon thread.
+
+    ``on_event(payload)`` is called for each metrics sample and
+    ``on_state(state)`` with ``connected`` / ``disconnected`` / ``stopped``.
+    Reconnects back off along ``backoff``; `live()` reports whether a sample
+    arrived recently enough that the caller can skip polling.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        on_event: Callable[[Dict[str, Any]], None],
+        *,
+        on_state: Optional[Callable[[str], None]] = None,
+        interval: float = 3.0,
+        backoff: Tuple[float, ...] = (1.0, 2.0, 5.0, 10.0),
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
+        self.url = url
+        self.interval = float(interval)
+        self._on_event = on_event
+        self._on_state = on_state
+        self._backoff = backoff
+        self._transport = transport
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_event = 0.0
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="ServerBridgeMetricsStream"
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread and thread.is_alive() and threading.current_thread() is not thread:
+            thread.join(timeout=0.5)
+        self._thread = None
+        self._last_event = 0.0
+
+    def live(self) -> bool:
+        if not self._last_event:
+            return False
+        return time.monotonic() - self._last_event < self.interval * 2 + 1.0
+
+    def _emit_state(self, state: str) -> None:
+        if self._on_state is None:
+            return
+        try:
+            self._on_state(state)
+        except Exception:
+            LOGGER.exception("Metrics stream state callback failed")
+
+    def _run(self) -> None:
+        attempt = 0
+        timeout = httpx.Timeout(5.0, read=self.interval * 2 + 10.0)
+        with httpx.Client(timeout=timeout, transport=self._transport) as client:
+            while not self._stop.is_set():
+                try:
+                    self._consume(client)
+                    attempt = 0
+                except Exception as exc:
+                    LOGGER.debug("Metrics stream error: %s", exc)
+                    attempt += 1
+                self._last_event = 0.0
+                if self._stop.is_set():
+                    break
+                self._emit_state("disconnected")
+                delay = self._backoff[min(attempt, len(self._backoff) - 1)]
+                self._stop.wait(delay)
+        self._emit_state("stopped")
+
+    def _consume(self, client: httpx.Client) -> None:
+        params = {"interval": self.interval}
+        with client.stream("GET", self.url, params=params) as response:
+            if response.status_code != 200:
+                raise httpx.HTTPStatusError(
+                    f"metrics stream returned {response.status_code}",
+                    request=response.request,
+                    response=response,
+                )
+            self._emit_state("connected")
+            for event, data in iter_sse(response.iter_lines()):
+                if self._stop.is_set():
+                    return
+                if event != "metrics":
+                    continue
+                try:
+                    payload = json.loads(data)
+                except ValueError:
+                    continue
+                if not isinstance(payload, dict):
+                    continue
+                self._last_event = time.monotonic()
+                try:
+                    self._on_event(payload)
+                except Exception:
+                    LOGGER.exception("Metrics stream callback failed")
+
+
+__all__ = [
+    "BridgeTransport",
+    "DEFAULT_MAX_CONNECTIONS",
+    "DEFAULT_MAX_WORKERS",
+    "DEFAULT_TIMEOUT",
+    "ENDPOINT_TIMEOUTS",
+    "METRICS_STREAM_PATH",
+    "MetricsStream",
+    "STREAM_ENV",
+    "iter_sse",
+    "stream_enabled",
+]
@@ -212,7 +212,11 @@ class CollabClient(QObject):
 
     def _open(self) -> None:
         self._reconnect_timer.stop()
-        url = _build_ws_url(self.base_url, f"/api/collab/ws?scene_id={self._scene_id}")
+        # The editor reloads whole scenes, so ask for snapshot broadcasts
+        # rather than applying operation deltas locally.
+        url = _build_ws_url(
+            self.base_url, f"/api/collab/ws?scene_id={self._scene_id}&mode=snapshot"
+        )
         request = QNetworkRequest(url)
         request.setRawHeader(b"x-comfyvn-name", self._actor_name.encode("utf-8"))
         request.setRawHeader(b"x-comfyvn-user", self._actor_id.encode("utf-8"))
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 # comfyvn/gui/services/server_bridge.py
 # [ComfyVN Architect | Phase 2.05 | Async Bridge + Non-blocking refresh]
-import asyncio
 import json
 import logging
 import os
@@ -12,7 +11,6 @@ from collections import defaultdict
 from typing import Any, Callable, Dict, Optional
 from urllib.parse import urlparse
 
-import httpx
 from PySide6.QtCore import QObject, QTimer, QUrl, Signal
 from PySide6.QtNetwork import QAbstractSocket
 from PySide6.QtWebSockets import QWebSocket
@@ -22,6 +20,12 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 
 from comfyvn.config import feature_flags
 from comfyvn.config.baseurl_authority import current_authority, default_base_url
+from comfyvn.gui.services.bridge_transport import (
+    METRICS_STREAM_PATH,
+    BridgeTransport,
+    MetricsStream,
+    stream_enabled,
+)
 from comfyvn.gui.services.job_stream import JobStreamClient
 
 _AUTHORITY = current_authority()
@@ -47,9 +51,13 @@ class ServerBridge(QObject):
     warnings_updated = Signal(list)
     event_triggered = Signal(str, dict)
 
-    def __init__(self, base: Optional[str] = None):
+    def __init__(
+        self, base: Optional[str] = None, *, transport: BridgeTransport | None = None
+    ):
         super().__init__()
         self.base_url = (base or DEFAULT_BASE).rstrip("/")
+        self._transport = transport or BridgeTransport()
+        self._metrics_stream: MetricsStream | None = None
         self._stop = False
         self._thread: Optional[threading.Thread] = None
         self._base_interval = 3.0
@@ -74,65 +82,15 @@ class ServerBridge(QObject):
         self.event_triggered.connect(self._dispatch_event)
 
     # ─────────────────────────────
-    # Async polling loop (non-blocking)
+    # Metrics: SSE stream with polling fallback (non-blocking)
     # ─────────────────────────────
-    async def _poll_once(self) -> None:
+    def _poll_once(self) -> None:
         if not self._poll_lock.acquire(blocking=False):
             logger.debug("Polling skipped: previous request still in flight")
             return
         try:
-            debug_enabled = feature_flags.is_enabled(
-                "debug_health_checks", default=False
-            )
-            self._health_debug_enabled = debug_enabled
-
-            async with httpx.AsyncClient(timeout=3.0) as cli:
-                metrics_payload, metrics_ok = await self._fetch_metrics(cli)
-                overall_ok = bool(metrics_payload.get("ok"))
-                combined: Dict[str, Any] = dict(metrics_payload)
-
-                health_payload: Optional[Dict[str, Any]] = None
-                if not metrics_ok or not overall_ok or debug_enabled:
-                    health_payload = await self._fetch_health(cli)
-                    if health_payload is not None:
-                        combined["health"] = health_payload
-                        if not overall_ok:
-                            overall_ok = bool(health_payload.get("ok"))
-
-                if health_payload is None:
-                    combined["health"] = {
-                        "ok": overall_ok,
-                        "status": 200 if overall_ok else 503,
-                        "data": {"status": "Healthy" if overall_ok else "Unavailable"},
-                        "source": "cached",
-                    }
-
-                combined["ok"] = overall_ok
-
-                if metrics_ok:
-                    self._backoff_step = 0
-                    self._current_interval = self._base_interval
-                else:
-                    if self._backoff_step < len(self._backoff_schedule) - 1:
-                        self._backoff_step += 1
-                    self._current_interval = self._backoff_schedule[self._backoff_step]
-
-                combined["retry_in"] = self._current_interval
-                combined["state"] = "online" if overall_ok else "waiting"
-                combined["poll_interval"] = self._current_interval
-                combined["backoff_step"] = self._backoff_step
-                combined["actions"] = self._build_actions(overall_ok)
-                combined["timestamp"] = time.time()
-
-                self._latest = combined
-                self._log_status_change(
-                    overall_ok, combined, debug_enabled=debug_enabled
-                )
-                self.status_updated.emit(dict(combined))
-                self._emit_event("system:metrics", dict(combined))
-
-                if metrics_ok and overall_ok:
-                    await self._process_warnings(cli)
+            metrics_payload, metrics_ok = self._fetch_metrics()
+            self._apply_metrics(metrics_payload, metrics_ok)
         except Exception as exc:
             logger.error("Metrics polling error: %s", exc, exc_info=True)
             if self._backoff_step < len(self._backoff_schedule) - 1:
@@ -153,24 +111,88 @@ class ServerBridge(QObject):
         finally:
             self._poll_lock.release()
 
-    async def _fetch_metrics(
-        self, client: httpx.AsyncClient
-    ) -> tuple[Dict[str, Any], bool]:
+    def _on_stream_metrics(self, payload: Dict[str, Any]) -> None:
+        if not self._poll_lock.acquire(blocking=False):
+            return
         try:
-            response = await client.get(f"{self.base_url}/system/metrics")
-        except Exception as exc:
-            logger.warning("Metrics request failed: %s", exc)
-            payload: Dict[str, Any] = {"ok": False, "error": str(exc)}
+            payload.setdefault("ok", True)
+            self._apply_metrics(payload, True, source="stream")
+        except Exception:
+            logger.exception("Metrics stream handling failed")
+        finally:
+            self._poll_lock.release()
+
+    def _on_stream_state(self, state: str) -> None:
+        logger.debug("Metrics stream %s", state)
+        if state == "disconnected":
+            # Fall back to polling straight away instead of after a full interval.
+            self._wake_event.set()
+
+    def _apply_metrics(
+        self, metrics_payload: Dict[str, Any], metrics_ok: bool, *, source: str = "poll"
+    ) -> None:
+        debug_enabled = feature_flags.is_enabled("debug_health_checks", default=False)
+        self._health_debug_enabled = debug_enabled
+
+        overall_ok = bool(metrics_payload.get("ok"))
+        combined: Dict[str, Any] = dict(metrics_payload)
+
+        health_payload: Optional[Dict[str, Any]] = None
+        if not metrics_ok or not overall_ok or debug_enabled:
+            health_payload = self._fetch_health()
+            if health_payload is not None:
+                combined["health"] = health_payload
+                if not overall_ok:
+                    overall_ok = bool(health_payload.get("ok"))
+
+        if health_payload is None:
+            combined["health"] = {
+                "ok": overall_ok,
+                "status": 200 if overall_ok else 503,
+                "data": {"status": "Healthy" if overall_ok else "Unavailable"},
+                "source": "cached",
+            }
+
+        combined["ok"] = overall_ok
+
+        if metrics_ok:
+            self._backoff_step = 0
+            self._current_interval = self._base_interval
+        else:
+            if self._backoff_step < len(self._backoff_schedule) - 1:
+                self._backoff_step += 1
+            self._current_interval = self._backoff_schedule[self._backoff_step]
+
+        combined["retry_in"] = self._current_interval
+        combined["state"] = "online" if overall_ok else "waiting"
+        combined["poll_interval"] = self._current_interval
+        combined["backoff_step"] = self._backoff_step
+        combined["actions"] = self._build_actions(overall_ok)
+        combined["timestamp"] = time.time()
+        combined["source"] = source
+
+        self._latest = combined
+        self._log_status_change(overall_ok, combined, debug_enabled=debug_enabled)
+        self.status_updated.emit(dict(combined))
+        self._emit_event("system:metrics", dict(combined))
+
+        if metrics_ok and overall_ok:
+            self._process_warnings()
+
+    def _fetch_metrics(self) -> tuple[Dict[str, Any], bool]:
+        result = self._transport.request("GET", f"{self.base_url}/system/metrics")
+        if result["status"] is None:
+            logger.warning("Metrics request failed: %s", result.get("error"))
+            payload: Dict[str, Any] = {"ok": False, "error": result.get("error")}
             return payload, False
-        return await self._process_metrics_response(response)
+        return self._process_metrics_response(result)
 
-    async def _process_metrics_response(
-        self, response: httpx.Response
+    def _process_metrics_response(
+        self, result: Dict[str, Any]
     ) -> tuple[Dict[str, Any], bool]:
-        if response.status_code == 200:
-            try:
-                payload = response.json()
-            except Exception:
+        if result["status"] == 200:
+            payload = result["data"]
+            if isinstance(payload, str):
                 payload = {}
             if not isinstance(payload, dict):
                 payload = {"ok": True, "data": payload}
@@ -178,26 +200,22 @@ class ServerBridge(QObject):
             logger.debug("Received system metrics: %s", payload)
             return payload, True
 
-        logger.warning("Metrics request failed: %s", response.status_code)
-        payload = {"ok": False, "status": response.status_code}
+        logger.warning("Metrics request failed: %s", result["status"])
+        payload = {"ok": False, "status": result["status"]}
         return payload, False
 
-    async def _fetch_health(
-        self, client: httpx.AsyncClient
-    ) -> Optional[Dict[str, Any]]:
-        try:
-            response = await client.get(f"{self.base_url}/health")
-        except Exception as exc:
-            logger.debug("Health request failed: %s", exc)
-            return {"ok": False, "error": str(exc)}
+    def _fetch_health(self) -> Optional[Dict[str, Any]]:
+        result = self._transport.request("GET", f"{self.base_url}/health")
+        if result["status"] is None:
+            logger.debug("Health request failed: %s", result.get("error"))
+            return {"ok": False, "error": result.get("error")}
 
         payload: Dict[str, Any]
-        try:
-            data = response.json()
-        except Exception:
+        data = result["data"]
+        if isinstance(data, str):
             data = {}
 
-        ok = response.status_code < 400
+        ok = result["status"] < 400
         if isinstance(data, dict):
             data_ok = data.get("ok")
             if data_ok is not None:
@@ -207,27 +225,23 @@ class ServerBridge(QObject):
 
         payload = {
             "ok": ok,
-            "status": response.status_code,
+            "status": result["status"],
             "data": data if isinstance(data, dict) else {"raw": data},
         }
         return payload
 
-    async def _process_warnings(self, client: httpx.AsyncClient) -> None:
-        try:
-            warn_resp = await client.get(
-                f"{self.base_url}/api/system/warnings", params={"limit": 20}
-            )
-        except Exception as exc:
-            logger.debug("Warning fetch failed: %s", exc)
+    def _process_warnings(self) -> None:
+        result = self._transport.request(
+            "GET", f"{self.base_url}/api/system/warnings", params={"limit": 20}
+        )
+        if result["status"] is None:
+            logger.debug("Warning fetch failed: %s", result.get("error"))
             return
 
-        if warn_resp.status_code != 200:
+        if result["status"] != 200:
             return
 
-        try:
-            warn_payload = warn_resp.json()
-        except Exception:
-            warn_payload = {}
+        warn_payload = result["data"]
         warnings = (
             warn_payload.get("warnings", []) if isinstance(warn_payload, dict) else []
         )
@@ -306,12 +320,13 @@ class ServerBridge(QObject):
             return
         self._stop = False
         self._wake_event.clear()
+        self._start_metrics_stream()
 
         def _loop():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             while not self._stop:
-                loop.run_until_complete(self._poll_once())
+                stream = self._metrics_stream
+                if stream is None or not stream.live():
+                    self._poll_once()
                 if self._stop:
                     break
                 wait_for = self._current_interval
@@ -331,12 +346,40 @@ class ServerBridge(QObject):
     def stop_polling(self) -> None:
         self._stop = True
         self._wake_event.set()
+        self._stop_metrics_stream()
         thread = self._thread
         if thread and thread.is_alive() and threading.current_thread() is not thread:
             thread.join(timeout=0.5)
         self._thread = None
         logger.info("ServerBridge polling stopped")
 
+    def _start_metrics_stream(self) -> None:
+        if self._metrics_stream is not None or not stream_enabled():
+            return
+        self._metrics_stream = MetricsStream(
+            self._build_url(METRICS_STREAM_PATH),
+            self._on_stream_metrics,
+            on_state=self._on_stream_state,
+            interval=self._base_interval,
+        )
+        self._metrics_stream.start()
+
+    def _stop_metrics_stream(self) -> None:
+        stream, self._metrics_stream = self._metrics_stream, None
+        if stream is not None:
+            stream.stop()
+
+    def _restart_metrics_stream_if_needed(self) -> None:
+        if self._metrics_stream is None:
+            return
+        self._stop_metrics_stream()
+        self._start_metrics_stream()
+
+    def close(self) -> None:
+        """Stop background work and release pooled connections."""
+        self.stop_polling()
+        self._transport.close()
+
     # ─────────────────────────────
     # REST helpers
     # ─────────────────────────────
@@ -353,32 +396,18 @@ class ServerBridge(QObject):
         path: str,
         payload: Optional[Dict[str, Any]] = None,
         *,
-        timeout: float = 5.0,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         url = self._build_url(path)
-        result: Dict[str, Any] = {"ok": False, "status": None, "data": None}
-        try:
-            with httpx.Client(timeout=timeout) as cli:
-                method_upper = method.upper()
-                if method_upper in {"POST", "PUT", "PATCH", "DELETE"}:
-                    response = cli.request(
-                        method_upper, url, json=payload if payload else None
-                    )
-                else:
-                    response = cli.get(url, params=payload)
-        except Exception as exc:
-            logger.warning("%s %s failed: %s", method.upper(), url, exc)
-            result.update({"error": str(exc)})
-            return result
-
-        result["status"] = response.status_code
-        result["ok"] = response.status_code < 400
-        try:
-            result["data"] = response.json()
-        except Exception:
-            result["data"] = response.text
-        logger.debug("%s %s -> %s", method.upper(), url, response.status_code)
-        return result
+        method_upper = method.upper()
+        if method_upper in {"POST", "PUT", "PATCH", "DELETE"}:
+            return self._transport.request(
+                method_upper,
+                url,
+                json_payload=payload if payload else None,
+                timeout=timeout,
+            )
+        return self._transport.request("GET", url, params=payload, timeout=timeout)
 
     def _request(
         self,
@@ -386,24 +415,14 @@ class ServerBridge(QObject):
         path: str,
         payload: Optional[Dict[str, Any]] = None,
         *,
-        timeout: float = 5.0,
+        timeout: Optional[float] = None,
         cb: Optional[Callable[[Dict[str, Any]], None]] = None,
     ):
         def worker():
-            result = self._request_sync(method, path, payload, timeout=timeout)
-            if cb:
-                try:
-                    cb(result)
-                except Exception:
-                    logger.exception("ServerBridge callback failed")
-            return result
+            return self._request_sync(method, path, payload, timeout=timeout)
 
         if cb:
-            thread = threading.Thread(
-                target=worker, daemon=True, name=f"ServerBridge{method.upper()}:{path}"
-            )
-            thread.start()
-            return thread
+            return self._transport.submit(worker, cb)
         return worker()
 
     def request(
@@ -415,41 +434,24 @@ class ServerBridge(QObject):
         data: Any = None,
         json_payload: Any = None,
         files: Any = None,
-        timeout: float = 5.0,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
-        method_upper = method.upper()
-        url = self._build_url(path)
-        result: Dict[str, Any] = {"ok": False, "status": None, "data": None}
-        try:
-            with httpx.Client(timeout=timeout) as cli:
-                response = cli.request(
-                    method_upper,
-                    url,
-                    params=params,
-                    data=data,
-                    json=json_payload,
-                    files=files,
-                )
-        except Exception as exc:
-            logger.warning("HTTP %s %s failed: %s", method_upper, url, exc)
-            result["error"] = str(exc)
-            return result
-
-        result["status"] = response.status_code
-        result["ok"] = response.status_code < 400
-        try:
-            result["data"] = response.json()
-        except Exception:
-            result["data"] = response.text
-        logger.debug("HTTP %s %s -> %s", method_upper, url, response.status_code)
-        return result
+        return self._transport.request(
+            method,
+            self._build_url(path),
+            params=params,
+            data=data,
+            json_payload=json_payload,
+            files=files,
+            timeout=timeout,
+        )
 
     def get(
         self,
         path: str,
         *,
         params: Optional[Dict[str, Any]] = None,
-        timeout: float = 5.0,
+        timeout: Optional[float] = None,
         default: Any = _UNSET,
     ):
         result = self.request(
@@ -469,7 +471,7 @@ class ServerBridge(QObject):
         path: str,
         params: Optional[Dict[str, Any]] = None,
         *,
-        timeout: float = 3.0,
+        timeout: Optional[float] = None,
         cb: Optional[Callable[[Dict[str, Any]], None]] = None,
         default: Any = _UNSET,
     ):
@@ -487,7 +489,7 @@ class ServerBridge(QObject):
         path: str,
         payload: Dict[str, Any],
         *,
-        timeout: float = 5.0,
+        timeout: Optional[float] = None,
         cb: Optional[Callable[[Dict[str, Any]], None]] = None,
         default: Any = _UNSET,
     ):
@@ -518,7 +520,7 @@ class ServerBridge(QObject):
         path: str,
         payload: Optional[Dict[str, Any]] = None,
         *,
-        timeout: float = 5.0,
+        timeout: Optional[float] = None,
         cb: Optional[Callable[[Dict[str, Any]], None]] = None,
         default: Any = _UNSET,
         data: Any = None,
@@ -552,11 +554,7 @@ class ServerBridge(QObject):
                     )
                 return result
 
-            thread = threading.Thread(
-                target=_worker, daemon=True, name=f"ServerBridgePOST:{path}"
-            )
-            thread.start()
-            return thread
+            return self._transport.submit(_worker)
 
         result = _run_request()
         if result.get("ok"):
@@ -653,9 +651,7 @@ class ServerBridge(QObject):
         return None
 
     def providers_remove(self, provider_id: str) -> Optional[Dict[str, Any]]:
-        result = self._request(
-            "DELETE", f"/api/providers/remove/{provider_id}", timeout=5.0
-        )
+        result = self._request("DELETE", f"/api/providers/remove/{provider_id}")
         if not isinstance(result, dict):
             return None
         data = result.get("data")
@@ -719,8 +715,9 @@ class ServerBridge(QObject):
         ok = wait_for_server(self.base_url, autostart=True, deadline=deadline)
         if ok:
             new_base = refresh_authority_cache(refresh=True)
-            if self._is_local_base():
+            if self._is_local_base() and new_base != self.base_url:
                 self.base_url = new_base
+                self._restart_metrics_stream_if_needed()
         return ok
 
     def projects(self) -> list[Dict[str, Any]]:
@@ -742,6 +739,7 @@ class ServerBridge(QObject):
     def set_host(self, host: str):
         self.base_url = host
         self._restart_job_stream_if_needed()
+        self._restart_metrics_stream_if_needed()
         return self.base_url
 
     @property
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 """SillyTavern chat importer utilities."""
 
-from .mapper import map_to_scenes, segment_scenes
-from .parser import parse_st_file, parse_st_payload
+from .mapper import iter_segments, map_to_scenes, segment_scenes
+from .parser import iter_st_file, parse_st_file, parse_st_payload
 
 __all__ = [
+    "iter_st_file",
     "parse_st_file",
     "parse_st_payload",
     "map_to_scenes",
+    "iter_segments",
     "segment_scenes",
 ]
@@ -7,7 +7,17 @@ import logging
 import math
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from comfyvn.scenario.models import (
     ChoiceNode,
@@ -349,14 +359,24 @@ class SceneBuildContext:
 
 
 def segment_scenes(
-    turns: Sequence[Mapping[str, Any]],
+    turns: Iterable[Mapping[str, Any]],
     *,
     max_gap_seconds: float = 5400.0,
 ) -> List[List[Mapping[str, Any]]]:
     """
     Segment turns into sessions using chat titles or gaps between timestamps.
     """
-    segments: List[List[Mapping[str, Any]]] = []
+    return list(iter_segments(turns, max_gap_seconds=max_gap_seconds))
+
+
+def iter_segments(
+    turns: Iterable[Mapping[str, Any]],
+    *,
+    max_gap_seconds: float = 5400.0,
+) -> Iterator[List[Mapping[str, Any]]]:
+    """
+    Lazily segment a turn stream; each segment is yielded once it is closed.
+    """
     current: List[Mapping[str, Any]] = []
     last_ts: Optional[float] = None
     last_session: Optional[str] = None
@@ -378,7 +398,7 @@ def segment_scenes(
             )
             if str(meta.get("scene_break") or "").lower() in {"true", "1"}:
                 if current:
-                    segments.append(current)
+                    yield current
                     current = []
                 last_ts = None
                 last_session = session
@@ -404,7 +424,7 @@ def segment_scenes(
                 if text in {"---", "***", "==="}:
                     should_split = True
         if should_split and current:
-            segments.append(current)
+            yield current
             current = []
             last_ts = None
         current.append(turn)
@@ -412,8 +432,7 @@ def segment_scenes(
         last_session = session or last_session
         last_title = title or last_title
     if current:
-        segments.append(current)
-    return segments
+        yield current
 
 
 def _line_node(
@@ -486,16 +505,19 @@ def _prepare_persona_aliases(
 
 def map_to_scenes(
     project_id: str,
-    turns: Sequence[Mapping[str, Any]],
+    turns: Iterable[Mapping[str, Any]],
     *,
     persona_aliases: Optional[Mapping[str, str]] = None,
     default_player_persona: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
     Convert parsed ST turns to ScenarioSpec-compatible scene dictionaries.
+
+    ``turns`` may be a lazy stream (e.g. :func:`iter_st_file`); only the turns
+    of the scene currently being built are held in memory.
     """
     persona_catalog = _prepare_persona_aliases(persona_aliases)
-    segments = segment_scenes(turns)
+    segments = iter_segments(turns)
     scenes: List[Dict[str, Any]] = []
     used_scene_ids: set[str] = set()
 
@@ -627,4 +649,4 @@ def map_to_scenes(
     return scenes
 
 
-__all__ = ["segment_scenes", "map_to_scenes"]
+__all__ = ["iter_segments", "segment_scenes", "map_to_scenes"]
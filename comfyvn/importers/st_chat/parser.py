@@ -1,4 +1,10 @@
-"""Parser for SillyTavern chat exports (.json / .txt)."""
+"""Parser for SillyTavern chat exports (.json / .jsonl / .txt).
+
+Files are parsed as a stream: the format is sniffed from the first
+non-whitespace character and turns are yielded one at a time (JSON arrays via
+an incremental decoder, JSONL and transcripts line by line), so large exports
+are never held in memory as a whole.
+"""
 
 from __future__ import annotations
 
@@ -7,7 +13,17 @@ import logging
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    TextIO,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -70,13 +86,10 @@ _TEXT_SPEAKER_PATTERN = re.compile(
 )
 
 _TEXT_INLINE_TIMESTAMP = re.compile(r"^\s*\[(?P<ts>[^\]]+)\]\s*(?P<rest>.*)$")
+_NON_WHITESPACE = re.compile(r"\S")
 
-
-def _read_text(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        return path.read_text(encoding="utf-8", errors="replace")
+# Characters read per chunk when streaming an export from disk.
+STREAM_CHUNK_CHARS = 1 << 16
 
 
 def _coerce_timestamp(value: Any) -> Optional[float]:
@@ -374,43 +387,52 @@ def _parse_json_text(text: str) -> List[Dict[str, Any]]:
         return _parse_json_payload(data)
     except json.JSONDecodeError:
         # Attempt JSONL fallback.
-        turns: List[Dict[str, Any]] = []
-        for index, line in enumerate(text.splitlines()):
-            ln = line.strip()
-            if not ln:
-                continue
-            try:
-                entry = json.loads(ln)
-            except json.JSONDecodeError:
-                LOGGER.debug(
-                    "Skipping non-JSON line %d when reading JSONL payload", index
-                )
-                continue
-            if not isinstance(entry, Mapping):
-                continue
-            normalised = _normalise_json_message(
-                entry,
-                index=len(turns),
-                session_id=None,
-                conversation_title=None,
-                default_role=None,
-                source="st_jsonl",
-                extra_meta={"line": index},
-            )
-            if normalised:
-                turns.append(normalised)
-        return turns
+        return list(_iter_jsonl(text.splitlines()))
+
+
+def _iter_jsonl(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    count = 0
+    for index, line in enumerate(lines):
+        ln = line.strip()
+        if not ln:
+            continue
+        try:
+            entry = json.loads(ln)
+        except json.JSONDecodeError:
+            LOGGER.debug("Skipping non-JSON line %d when reading JSONL payload", index)
+            continue
+        if not isinstance(entry, Mapping):
+            continue
+        normalised = _normalise_json_message(
+            entry,
+            index=count,
+            session_id=None,
+            conversation_title=None,
+            default_role=None,
+            source="st_jsonl",
+            extra_meta={"line": index},
+        )
+        if normalised:
+            count += 1
+            yield normalised
 
 
 def _parse_roleplay_text(text: str) -> List[Dict[str, Any]]:
-    turns: List[Dict[str, Any]] = []
+    return list(_iter_roleplay_turns(text.splitlines()))
+
+
+def _iter_roleplay_turns(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield transcript turns once no further continuation lines can join them."""
+    count = 0
     current: Optional[MutableMapping[str, Any]] = None
     line_index = 0
 
-    for raw_line in text.splitlines():
+    for raw_line in lines:
         original = raw_line.rstrip("\n")
         stripped = original.strip()
         if not stripped:
+            if current is not None:
+                yield current
             current = None
             continue
 
@@ -430,13 +452,15 @@ def _parse_roleplay_text(text: str) -> List[Dict[str, Any]]:
                 "ts": timestamp_hint,
                 "meta": {
                     "source": "st_txt",
-                    "index": len(turns),
+                    "index": count,
                     "line": line_index,
                 },
             }
             if timestamp_hint is not None:
                 payload["meta"]["timestamp_hint"] = timestamp_hint
-            turns.append(payload)
+            if current is not None:
+                yield current
+            count += 1
             current = payload
         else:
             if current is None:
@@ -446,20 +470,139 @@ def _parse_roleplay_text(text: str) -> List[Dict[str, Any]]:
                     "ts": timestamp_hint,
                     "meta": {
                         "source": "st_txt",
-                        "index": len(turns),
+                        "index": count,
                         "line": line_index,
                     },
                 }
                 if timestamp_hint is not None:
                     current["meta"]["timestamp_hint"] = timestamp_hint
-                turns.append(current)
+                count += 1
             else:
                 current["text"] = f"{current['text']}\n{stripped}"
                 if timestamp_hint is not None and not current.get("ts"):
                     current["ts"] = timestamp_hint
                     current["meta"]["timestamp_hint"] = timestamp_hint
         line_index += 1
-    return turns
+    if current is not None:
+        yield current
+
+
+class _StreamReader:
+    """Buffered view over a text handle for incremental JSON decoding."""
+
+    def __init__(self, handle: TextIO, chunk_chars: Optional[int] = None):
+        self._handle = handle
+        self._chunk_chars = max(1, chunk_chars or STREAM_CHUNK_CHARS)
+        self._decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, minimum: int = 0) -> bool:
+        if self.eof:
+            return False
+        if self.pos >= self._chunk_chars:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        data = self._handle.read(max(self._chunk_chars, minimum))
+        if not data:
+            self.eof = True
+            return False
+        self.buffer += data
+        return True
+
+    def peek(self) -> Optional[str]:
+        """Skip whitespace and return the next character (``None`` at EOF)."""
+        while True:
+            match = _NON_WHITESPACE.search(self.buffer, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.buffer[self.pos]
+            self.pos = len(self.buffer)
+            if not self._fill():
+                return None
+
+    def decode(self) -> Any:
+        """Decode the JSON value at the cursor, reading more text as needed."""
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Grow reads with the pending value so re-decoding stays linear.
+                if self._fill(len(self.buffer) - self.pos):
+                    continue
+                raise
+            if end == len(self.buffer) and not isinstance(value, (dict, list)):
+                # A scalar ending at the buffer edge may continue in the next read.
+                if self._fill():
+                    continue
+            self.pos = end
+            return value
+
+
+def _iter_json_array(reader: _StreamReader) -> Iterator[Dict[str, Any]]:
+    """Yield turns from a top-level JSON array one element at a time."""
+    reader.pos += 1  # opening bracket
+    index = 0
+    while True:
+        char = reader.peek()
+        if char == "]":
+            return
+        if index:
+            if char != ",":
+                raise json.JSONDecodeError("Expected ',' delimiter", "", reader.pos)
+            reader.pos += 1
+            reader.peek()
+        entry = reader.decode()
+        if isinstance(entry, Mapping):
+            normalised = _normalise_json_message(
+                entry,
+                index=index,
+                session_id=None,
+                conversation_title=None,
+                default_role=None,
+                source="st_json",
+            )
+            if normalised:
+                yield normalised
+        index += 1
+
+
+def _iter_lines(handle: TextIO) -> Iterator[str]:
+    """Iterate lines with ``str.splitlines`` semantics, skipping leading blanks."""
+    started = False
+    for raw in handle:
+        for line in raw.splitlines() or [raw]:
+            if not started and not line.strip():
+                continue
+            started = True
+            yield line
+
+
+def _iter_json_stream(handle: TextIO) -> Iterator[Dict[str, Any]]:
+    """Stream turns from a JSON array, a JSON object, or JSONL."""
+    reader = _StreamReader(handle)
+    first = reader.peek()
+    yielded = False
+    try:
+        if first == "[":
+            for turn in _iter_json_array(reader):
+                yielded = True
+                yield turn
+            return
+        if first == "{":
+            payload = reader.decode()
+            if reader.peek() is None:
+                # A single document; the message list has to be materialised.
+                yield from _parse_json_payload(payload)
+                return
+    except json.JSONDecodeError as exc:
+        if yielded:
+            LOGGER.warning("Stopped reading malformed ST JSON export: %s", exc)
+            return
+    # Not a single JSON document: treat the file as JSON lines.
+    handle.seek(0)
+    yield from _iter_jsonl(_iter_lines(handle))
 
 
 def parse_st_payload(
@@ -500,25 +643,43 @@ def parse_st_payload(
     return []
 
 
-def parse_st_file(path: str | Path) -> List[Dict[str, Any]]:
+def iter_st_file(path: str | Path) -> Iterator[Dict[str, Any]]:
     """
-    Load and parse a SillyTavern export file (.json/.txt) into canonical turns.
+    Stream canonical turns from a SillyTavern export file (.json/.jsonl/.txt).
     """
     file_path = Path(path)
     if not file_path.exists():
         raise FileNotFoundError(f"ST chat file not found: {file_path}")
 
     suffix = file_path.suffix.lower()
-    text = _read_text(file_path)
-    if suffix in {".json", ".jsonl"}:
-        return parse_st_payload(text, source_hint="json")
-    if suffix in {".txt", ".log"}:
-        return parse_st_payload(text, source_hint="txt")
-    # Fallback: attempt JSON first then text.
-    turns = parse_st_payload(text, source_hint="json")
-    if turns:
-        return turns
-    return parse_st_payload(text, source_hint="txt")
+    # utf-8-sig drops a leading BOM; undecodable bytes are replaced.
+    with file_path.open("r", encoding="utf-8-sig", errors="replace") as handle:
+        if suffix in {".txt", ".log"}:
+            yield from _iter_roleplay_turns(_iter_raw_lines(handle))
+            return
+        if suffix in {".json", ".jsonl"}:
+            yield from _iter_json_stream(handle)
+            return
+        # Fallback: attempt JSON first then text.
+        found = False
+        for turn in _iter_json_stream(handle):
+            found = True
+            yield turn
+        if not found:
+            handle.seek(0)
+            yield from _iter_roleplay_turns(_iter_raw_lines(handle))
+
+
+def _iter_raw_lines(handle: TextIO) -> Iterator[str]:
+    for raw in handle:
+        yield from raw.splitlines() or [raw]
+
+
+def parse_st_file(path: str | Path) -> List[Dict[str, Any]]:
+    """
+    Load and parse a SillyTavern export file (.json/.txt) into canonical turns.
+    """
+    return list(iter_st_file(path))
 
 
-__all__ = ["parse_st_file", "parse_st_payload"]
+__all__ = ["iter_st_file", "parse_st_file", "parse_st_payload"]
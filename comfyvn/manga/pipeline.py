@@ -5,6 +5,8 @@ from __future__ import annotations
 import concurrent.futures
 import json
 import logging
+import os
+import queue
 import shutil
 import threading
 import time
@@ -12,12 +14,14 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
 
 from comfyvn.manga.providers import (
     ProviderError,
     StageContext,
     StageKey,
+    StageProvider,
+    StageResult,
     all_providers,
     default_provider_map,
     get_provider,
@@ -26,6 +30,27 @@ from comfyvn.manga.providers import (
 LOGGER = logging.getLogger(__name__)
 JobState = Literal["queued", "running", "done", "error"]
 IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif", ".tif", ".tiff"}
+STAGES: Tuple[StageKey, ...] = ("segment", "ocr", "group", "speaker")
+# ``StageContext.data`` key each stage's payload is published under.
+STAGE_DATA_KEYS: Dict[StageKey, str] = {
+    "segment": "panels",
+    "ocr": "ocr",
+    "group": "groups",
+    "speaker": "scenes",
+}
+STAGE_AGGREGATE_FILES: Dict[StageKey, Tuple[str, str]] = {
+    "segment": ("raw", "panels.json"),
+    "ocr": ("ocr", "ocr_results.json"),
+    "group": ("group", "groups.json"),
+}
+DEFAULT_STAGE_WORKERS: Dict[StageKey, int] = {
+    "segment": 2,
+    "ocr": max(2, (os.cpu_count() or 2) // 2),
+    "group": 1,
+    "speaker": 2,
+}
+DEFAULT_STREAM_QUEUE_SIZE = 8
+_STREAM_END = object()
 
 try:  # pragma: no cover - optional dependency
     from comfyvn.core.job_lifecycle import JobLifecycle  # type: ignore
@@ -43,6 +68,21 @@ class PipelineConfig:
     providers: Dict[StageKey, str]
     provider_settings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    streaming: bool = True
+    stage_workers: Dict[StageKey, int] = field(default_factory=dict)
+    queue_size: int = DEFAULT_STREAM_QUEUE_SIZE
+
+
+@dataclass(slots=True)
+class _PageItem:
+    """A single page flowing through the streaming stage graph."""
+
+    page_number: int
+    scene_number: int
+    path: Path
+    root: Path
+    data: Dict[str, Any] = field(default_factory=dict)
+    results: Dict[StageKey, StageResult] = field(default_factory=dict)
 
 
 @dataclass(slots=True)
@@ -195,33 +235,34 @@ class MangaPipeline:
         self._persist_manifest(job, {"state": "running"})
         try:
             raw_pages = self._ingest_sources(job, paths["raw"], sources)
-            stage_data: Dict[str, Any] = {"pages": [str(path) for path in raw_pages]}
-            stages: List[StageKey] = ["segment", "ocr", "group", "speaker"]
-            for index, stage in enumerate(stages, start=1):
-                provider_id = (
-                    config.providers.get(stage) or default_provider_map()[stage]
+            selected = {
+                stage: config.providers.get(stage) or default_provider_map()[stage]
+                for stage in STAGES
+            }
+            providers = {
+                stage: get_provider(provider_id)
+                for stage, provider_id in selected.items()
+            }
+            if config.streaming and all(
+                getattr(provider, "page_local", False)
+                for provider in providers.values()
+            ):
+                self._run_streaming(
+                    job=job,
+                    config=config,
+                    selected=selected,
+                    providers=providers,
+                    paths=paths,
+                    raw_pages=raw_pages,
                 )
-                settings = config.provider_settings.get(stage, {})
-                job.record_event(stage, f"Starting stage with provider {provider_id}")
-                result = self._run_stage(
+            else:
+                self._run_batch(
                     job=job,
-                    stage=stage,
-                    provider_id=provider_id,
-                    settings=settings,
+                    config=config,
+                    selected=selected,
                     paths=paths,
                     raw_pages=raw_pages,
-                    stage_data=stage_data,
                 )
-                stage_data[stage] = result.payload
-                job.stages[stage] = {
-                    "provider": provider_id,
-                    "artifacts": [str(path) for path in result.artifacts],
-                    "notes": result.notes,
-                }
-                job.notes.extend(result.notes)
-                progress = index / len(stages)
-                job.update_progress(progress, f"{stage} complete")
-                job.record_event(stage, "Stage complete")
             manifest = {
                 "state": "done",
                 "providers": job.providers,
@@ -242,6 +283,259 @@ class MangaPipeline:
             job.record_event("pipeline", f"Error: {exc}")
             self._persist_manifest(job, {"state": "error", "error": str(exc)})
 
+    def _run_batch(
+        self,
+        *,
+        job: MangaJob,
+        config: PipelineConfig,
+        selected: Dict[StageKey, str],
+        paths: Dict[str, Path],
+        raw_pages: List[Path],
+    ) -> None:
+        """Run each stage over the whole book before starting the next one."""
+        stage_data: Dict[str, Any] = {"pages": [str(path) for path in raw_pages]}
+        for index, stage in enumerate(STAGES, start=1):
+            provider_id = selected[stage]
+            settings = config.provider_settings.get(stage, {})
+            job.record_event(stage, f"Starting stage with provider {provider_id}")
+            result = self._run_stage(
+                job=job,
+                stage=stage,
+                provider_id=provider_id,
+                settings=settings,
+                paths=paths,
+                raw_pages=raw_pages,
+                stage_data=stage_data,
+            )
+            stage_data[stage] = result.payload
+            job.stages[stage] = {
+                "provider": provider_id,
+                "artifacts": [str(path) for path in result.artifacts],
+                "notes": result.notes,
+            }
+            job.notes.extend(result.notes)
+            progress = index / len(STAGES)
+            job.update_progress(progress, f"{stage} complete")
+            job.record_event(stage, "Stage complete")
+
+    def _run_streaming(
+        self,
+        *,
+        job: MangaJob,
+        config: PipelineConfig,
+        selected: Dict[StageKey, str],
+        providers: Dict[StageKey, StageProvider],
+        paths: Dict[str, Path],
+        raw_pages: List[Path],
+    ) -> None:
+        """Flow each page through every stage independently.
+
+        Each stage owns a small worker pool fed by a bounded queue, so early
+        pages reach the speaker stage (and land as scene files) while later
+        pages are still being segmented, and only ``queue_size`` pages per
+        stage are held in memory at once.
+        """
+        pages_root = Path(job.artifacts["base"]) / "pages"
+        items: List[_PageItem] = []
+        scene_number = 0
+        for page_number, page in enumerate(raw_pages, start=1):
+            if page.suffix.lower() not in IMAGE_EXTS:
+                job.record_event("segment", f"Skipping non-image resource {page.name}")
+                continue
+            scene_number += 1
+            items.append(
+                _PageItem(
+                    page_number=page_number,
+                    scene_number=scene_number,
+                    path=page,
+                    root=pages_root / f"{page_number:04d}",
+                )
+            )
+        total = len(items)
+        for stage in STAGES:
+            job.record_event(stage, f"Streaming stage with provider {selected[stage]}")
+
+        queue_size = max(1, int(config.queue_size))
+        inboxes: List[queue.Queue] = [queue.Queue(maxsize=queue_size) for _ in STAGES]
+        workers = [
+            max(
+                1,
+                int(config.stage_workers.get(stage) or DEFAULT_STAGE_WORKERS[stage]),
+            )
+            for stage in STAGES
+        ]
+        remaining = list(workers)
+        completed: List[_PageItem] = []
+        errors: List[BaseException] = []
+        abort = threading.Event()
+        lock = threading.Lock()
+
+        def _worker(stage_index: int) -> None:
+            stage = STAGES[stage_index]
+            inbox = inboxes[stage_index]
+            is_last = stage_index == len(STAGES) - 1
+            while True:
+                item = inbox.get()
+                if item is _STREAM_END:
+                    with lock:
+                        remaining[stage_index] -= 1
+                        drained = remaining[stage_index] == 0
+                    if drained and not is_last:
+                        for _ in range(workers[stage_index + 1]):
+                            inboxes[stage_index + 1].put(_STREAM_END)
+                    return
+                if abort.is_set():
+                    continue
+                try:
+                    self._run_page_stage(
+                        job=job,
+                        stage=stage,
+                        provider=providers[stage],
+                        settings=config.provider_settings.get(stage, {}),
+                        paths=paths,
+                        item=item,
+                    )
+                except Exception as exc:
+                    with lock:
+                        errors.append(exc)
+                    abort.set()
+                    continue
+                if not is_last:
+                    inboxes[stage_index + 1].put(item)
+                    continue
+                self._persist_page(job, item)
+                with lock:
+                    completed.append(item)
+                    done = len(completed)
+                job.update_progress(
+                    done / total if total else 1.0,
+                    f"Page {done}/{total} complete",
+                )
+
+        threads = [
+            threading.Thread(
+                target=_worker,
+                args=(stage_index,),
+                name=f"manga-{job.id[:8]}-{STAGES[stage_index]}-{slot}",
+                daemon=True,
+            )
+            for stage_index, count in enumerate(workers)
+            for slot in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for item in items:
+            if abort.is_set():
+                break
+            inboxes[0].put(item)
+        for _ in range(workers[0]):
+            inboxes[0].put(_STREAM_END)
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+        completed.sort(key=lambda item: item.page_number)
+        for stage in STAGES:
+            self._finalise_streamed_stage(
+                job=job,
+                stage=stage,
+                provider_id=selected[stage],
+                paths=paths,
+                completed=completed,
+            )
+            job.record_event(stage, "Stage complete")
+
+    def _run_page_stage(
+        self,
+        *,
+        job: MangaJob,
+        stage: StageKey,
+        provider: StageProvider,
+        settings: Dict[str, Any],
+        paths: Dict[str, Path],
+        item: _PageItem,
+    ) -> None:
+        stage_dirs = {name: item.root / name for name in ("raw", "ocr", "group")}
+        for path in stage_dirs.values():
+            path.mkdir(parents=True, exist_ok=True)
+        ctx = StageContext(
+            job_id=job.id,
+            stage=stage,
+            base_dir=Path(job.artifacts["base"]),
+            raw_dir=stage_dirs["raw"],
+            ocr_dir=stage_dirs["ocr"],
+            group_dir=stage_dirs["group"],
+            scenes_dir=paths["scenes"],
+            pages=[item.path],
+            data=dict(item.data),
+            log=lambda msg: job.record_event(stage, msg),
+            metadata=job.metadata,
+            page_offset=item.page_number - 1,
+            scene_offset=item.scene_number - 1,
+        )
+        try:
+            result = provider.run(ctx, settings)
+        except ProviderError as exc:
+            job.record_event(stage, f"Provider error on {item.path.name}: {exc}")
+            raise
+        item.results[stage] = result
+        item.data[STAGE_DATA_KEYS[stage]] = result.payload
+
+    def _persist_page(self, job: MangaJob, item: _PageItem) -> None:
+        """Write the finished page's stage outputs so partial books are usable."""
+        payload = {
+            "job": job.id,
+            "page": item.path.name,
+            "page_number": item.page_number,
+            "stages": {
+                stage: {
+                    "payload": result.payload,
+                    "artifacts": [str(path) for path in result.artifacts],
+                }
+                for stage, result in item.results.items()
+            },
+        }
+        target = item.root / "page.json"
+        target.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        job.record_event("pipeline", f"Page {item.path.name} complete")
+
+    def _finalise_streamed_stage(
+        self,
+        *,
+        job: MangaJob,
+        stage: StageKey,
+        provider_id: str,
+        paths: Dict[str, Path],
+        completed: List[_PageItem],
+    ) -> None:
+        payload: List[Any] = []
+        artifacts: List[str] = []
+        notes: List[str] = []
+        for item in completed:
+            result = item.results[stage]
+            if isinstance(result.payload, list):
+                payload.extend(result.payload)
+            elif result.payload is not None:
+                payload.append(result.payload)
+            artifacts.extend(str(path) for path in result.artifacts)
+            for note in result.notes:
+                if note not in notes:
+                    notes.append(note)
+        aggregate = STAGE_AGGREGATE_FILES.get(stage)
+        if aggregate:
+            dir_key, filename = aggregate
+            target = paths[dir_key] / filename
+            target.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            artifacts.insert(0, str(target))
+        notes.append(f"Streamed {len(completed)} pages through {stage}.")
+        job.stages[stage] = {
+            "provider": provider_id,
+            "artifacts": artifacts,
+            "notes": notes,
+        }
+        job.notes.extend(notes)
+
     def _run_stage(
         self,
         *,
@@ -351,6 +645,9 @@ def build_config(
     providers: Optional[Dict[str, str]] = None,
     provider_settings: Optional[Dict[str, Dict[str, Any]]] = None,
     metadata: Optional[Dict[str, Any]] = None,
+    streaming: bool = True,
+    stage_workers: Optional[Dict[str, int]] = None,
+    queue_size: int = DEFAULT_STREAM_QUEUE_SIZE,
 ) -> PipelineConfig:
     resolved_sources = [Path(src).expanduser().resolve() for src in sources]
     default_map = default_provider_map()
@@ -364,11 +661,20 @@ def build_config(
     if provider_settings:
         for key, value in provider_settings.items():
             resolved_settings[key.lower()] = dict(value)
+    resolved_workers: Dict[StageKey, int] = {}
+    if stage_workers:
+        for key, value in stage_workers.items():
+            stage = key.lower()
+            if stage in resolved_providers and value:
+                resolved_workers[stage] = max(1, int(value))
     return PipelineConfig(
         sources=resolved_sources,
         providers=resolved_providers,
         provider_settings=resolved_settings,
         metadata=dict(metadata or {}),
+        streaming=streaming,
+        stage_workers=resolved_workers,
+        queue_size=max(1, int(queue_size)),
     )
 
 
@@ -55,6 +55,10 @@ class StageContext:
     data: Dict[str, Any]
     log: Callable[[str], None]
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Streaming runs hand providers one page at a time; offsets keep panel and
+    # scene identifiers identical to a whole-book batch run.
+    page_offset: int = 0
+    scene_offset: int = 0
 
 
 @dataclass(slots=True)
@@ -95,6 +99,10 @@ class StageProvider:
     """Base callable provider."""
 
     metadata: ProviderMetadata
+    # Providers that only look at the pages in ``ctx`` set this to True so the
+    # pipeline can stream pages through them; anything else keeps the
+    # whole-book batch execution.
+    page_local: bool = False
 
     def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
         raise NotImplementedError
@@ -112,11 +120,12 @@ class BasicSegmenter(StageProvider):
         ),
         tags=["fallback", "no-op"],
     )
+    page_local = True
 
     def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
         panels: List[Dict[str, Any]] = []
         artifacts: List[Path] = []
-        for index, page in enumerate(ctx.pages, start=1):
+        for index, page in enumerate(ctx.pages, start=ctx.page_offset + 1):
             if not _is_image(page):
                 ctx.log(f"Skipping non-image resource during segmentation: {page.name}")
                 continue
@@ -158,6 +167,7 @@ class WhitespaceSegmenter(StageProvider):
         default_settings={"threshold": 245, "min_band_pct": 0.035},
         tags=["heuristic"],
     )
+    page_local = True
 
     def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
         if Image is None:
@@ -166,7 +176,7 @@ class WhitespaceSegmenter(StageProvider):
         min_band_pct = float(settings.get("min_band_pct", 0.035))
         panels: List[Dict[str, Any]] = []
         notes: List[str] = []
-        for page_index, page_path in enumerate(ctx.pages, start=1):
+        for page_index, page_path in enumerate(ctx.pages, start=ctx.page_offset + 1):
             if not _is_image(page_path):
                 ctx.log(
                     f"Skipping non-image resource during segmentation: {page_path.name}"
@@ -228,6 +238,7 @@ class TesseractOCRProvider(StageProvider):
         default_settings={"lang": "eng"},
         docs_url="https://github.com/tesseract-ocr/tesseract",
     )
+    page_local = True
 
     def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
         if pytesseract is None or Image is None:
@@ -278,6 +289,8 @@ class EasyOCROCRProvider(StageProvider):
         default_settings={"lang": ["en"]},
         docs_url="https://github.com/JaidedAI/EasyOCR",
     )
+    # Loads the EasyOCR model on every run(), so it stays on whole-book batches
+    # rather than reloading it once per streamed page.
 
     def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
         if easyocr is None or Image is None:
@@ -349,6 +362,7 @@ class ComfyUIOCRProvider(StageProvider):
         docs_url="https://github.com/comfyanonymous/ComfyUI",
         tags=["comfyui", "workflow"],
     )
+    page_local = True
 
     def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
         base_url = settings.get("base_url")
@@ -434,6 +448,7 @@ class AzureComputerVisionProvider(StageProvider):
         docs_url="https://learn.microsoft.com/azure/cognitive-services/computer-vision/overview-ocr",
         tags=["cloud", "rest"],
     )
+    page_local = True
 
     def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
         endpoint = settings.get("endpoint")
@@ -504,6 +519,7 @@ class GoogleVisionProvider(StageProvider):
         docs_url="https://cloud.google.com/vision/docs/ocr",
         tags=["cloud", "rest"],
     )
+    page_local = True
 
     def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
         api_key = settings.get("api_key")
@@ -567,13 +583,14 @@ class PlaceholderGroupingProvider(StageProvider):
         ),
         tags=["deterministic"],
     )
+    page_local = True
 
     def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
         panels = ctx.data.get("panels") or []
         ocr_results = ctx.data.get("ocr") or []
         results: List[Dict[str, Any]] = []
         ocr_by_panel = {entry["panel_id"]: entry for entry in ocr_results}
-        for index, page in enumerate(panels, start=1):
+        for index, page in enumerate(panels, start=ctx.scene_offset + 1):
             scene_id = f"{ctx.job_id}_scene_{index:03d}"
             panel_entries: List[Dict[str, Any]] = []
             for panel in page.get("panels", []):
@@ -612,12 +629,13 @@ class PatternSpeakerProvider(StageProvider):
         ),
         tags=["deterministic"],
     )
+    page_local = True
 
     def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
         grouped = ctx.data.get("groups") or []
         scenes: List[Dict[str, Any]] = []
         artifacts: List[Path] = []
-        for index, group in enumerate(grouped, start=1):
+        for index, group in enumerate(grouped, start=ctx.scene_offset + 1):
             scene_id = group["scene_id"]
             lines: List[Dict[str, Any]] = []
             speakers_seen: set[str] = set()
@@ -671,6 +689,7 @@ class LLMSpeakerProvider(StageProvider):
         docs_url="https://platform.openai.com/docs/",
         tags=["llm", "cloud"],
     )
+    page_local = True
 
     def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
         api_key = settings.get("api_key")
@@ -687,7 +706,7 @@ class LLMSpeakerProvider(StageProvider):
         }
         scenes: List[Dict[str, Any]] = []
         artifacts: List[Path] = []
-        for index, group in enumerate(grouped, start=1):
+        for index, group in enumerate(grouped, start=ctx.scene_offset + 1):
             prompt = _build_llm_prompt(group)
             payload = {"model": model, "messages": prompt, "temperature": 0.2}
             response = requests.post(
@@ -45,6 +45,8 @@ class MangaPipelineStartRequest(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
     providers: ProviderSelection = Field(default_factory=ProviderSelection)
     provider_settings: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+    streaming: bool = True
+    stage_workers: Dict[str, int] = Field(default_factory=dict)
 
     @field_validator("sources", mode="before")
     def _normalize_source(cls, value):
@@ -78,6 +80,8 @@ def start_pipeline(payload: MangaPipelineStartRequest = Body(...)) -> Dict[str,
         providers=provider_overrides,
         provider_settings=payload.provider_settings,
         metadata=payload.metadata,
+        streaming=payload.streaming,
+        stage_workers=payload.stage_workers,
     )
     job_id = start_job(root, config)
     snapshot = job_status(job_id)
@@ -8,17 +8,22 @@ resource pressure (CPU, RAM, VRAM), coordinates lazy asset unloads, and emits
 modder-friendly hook envelopes whenever the state changes.  The implementation
 is deliberately side-effect light so it can run in both the FastAPI process and
 offline tooling (tests, workers) without requiring Redis or GUI dependencies.
+
+Delayed jobs are indexed by the budget class that blocked them (queue
+capacity, job cap, CPU, RAM, VRAM).  Each class keeps a min-heap keyed by the
+headroom the job needs, so a refresh only pops the jobs that the current
+resource snapshot can actually admit instead of rescanning every deferred job.
 """
 
+import heapq
+import itertools
 import logging
 import threading
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from typing import (
     Any,
     Callable,
-    Deque,
     Dict,
     Iterable,
     List,
@@ -44,6 +49,10 @@ except Exception:  # pragma: no cover - optional dependency
 
 LOGGER = logging.getLogger(__name__)
 
+# Evaluation order of ``BudgetManager._classify``; a delayed job belongs to the
+# first class whose check failed.
+BUDGET_CLASSES: Tuple[str, ...] = ("capacity", "jobs", "cpu", "ram", "vram")
+
 
 # --------------------------------------------------------------------------- Data
 @dataclass
@@ -153,6 +162,17 @@ def _fallback_collect_metrics() -> Dict[str, Any]:
     return metrics
 
 
+def _resource_usage(metrics: Dict[str, Any]) -> Tuple[float, float, float]:
+    """``(cpu %, RAM MB, VRAM MB)`` currently in use according to ``metrics``."""
+    gpus = metrics.get("gpus") or []
+    first_gpu = metrics.get("first_gpu") or (gpus[0] if gpus else None)
+    return (
+        float(metrics.get("cpu") or 0.0),
+        float(metrics.get("mem_used_mb") or 0.0),
+        float((first_gpu or {}).get("mem_used") or 0.0),
+    )
+
+
 def _default_metrics_provider() -> Dict[str, Any]:
     if _collect_metrics:
         try:
@@ -177,8 +197,18 @@ class BudgetManager:
         self._metrics_provider = metrics_provider or _default_metrics_provider
         self._lock = threading.RLock()
         self._jobs: Dict[str, JobRecord] = {}
-        self._queued: Deque[str] = deque()
-        self._delayed: Deque[str] = deque()
+        # Insertion-ordered dicts double as O(1)-removal FIFO queues.
+        self._queued: Dict[str, None] = {}
+        # job_id -> (budget class, heap entry seq); heap entries whose seq no
+        # longer matches are stale and skipped lazily.
+        self._delayed: Dict[str, Tuple[str, int]] = {}
+        self._delay_heaps: Dict[str, List[Tuple[float, int, str]]] = {
+            name: [] for name in BUDGET_CLASSES
+        }
+        self._delayed_by_class: Dict[str, int] = dict.fromkeys(BUDGET_CLASSES, 0)
+        self._readmitted_by_class: Dict[str, int] = dict.fromkeys(BUDGET_CLASSES, 0)
+        self._delay_seq = itertools.count()
+        self._stale_entries = 0
         self._running: Dict[str, JobRecord] = {}
         self._assets: Dict[str, AssetHandle] = {}
         self._api_asset_unload: Optional[Callable[[Dict[str, Any]], None]] = None
@@ -227,17 +257,20 @@ class BudgetManager:
                 self._jobs[job_id] = record
 
             metrics = self._metrics_provider()
-            queue_state, reason = self._evaluate_job(record, metrics)
-            record.status = queue_state
-            record.reason = reason
-            record.last_transition = time.time()
-
-            if queue_state == "queued":
-                self._queued.append(record.job_id)
+            if record.status == "running":
+                queue_state, reason = "running", record.reason
             else:
-                self._delayed.append(record.job_id)
-
-            state = self._snapshot_locked(metrics)
+                self._queued.pop(job_id, None)
+                self._undefer(job_id)
+                budget_class, reason = self._classify(record, metrics)
+                queue_state = "queued" if budget_class is None else "delayed"
+                record.status = queue_state
+                record.reason = reason
+                record.last_transition = time.time()
+                if budget_class is None:
+                    self._queued[job_id] = None
+                else:
+                    self._defer(record, budget_class)
 
         self._emit_budget_event(
             "job.registered",
@@ -245,14 +278,14 @@ class BudgetManager:
                 "job": record.to_public_dict(),
                 "queue_state": queue_state,
                 "reason": reason,
-                "metrics": state["metrics"],
+                "metrics": metrics,
             },
         )
         return {
             "queue_state": queue_state,
             "reason": reason,
-            "metrics": state["metrics"],
-            "limits": state["limits"],
+            "metrics": metrics,
+            "limits": self._limits.__dict__,
         }
 
     def mark_started(self, job_id: str) -> Optional[JobRecord]:
@@ -262,13 +295,8 @@ class BudgetManager:
                 return None
             if record.status not in {"queued", "delayed"}:
                 return record
-            try:
-                self._queued.remove(job_id)
-            except ValueError:
-                try:
-                    self._delayed.remove(job_id)
-                except ValueError:
-                    pass
+            self._queued.pop(job_id, None)
+            self._undefer(job_id)
             record.status = "running"
             record.last_transition = time.time()
             self._running[job_id] = record
@@ -287,22 +315,15 @@ class BudgetManager:
             record.reason = reason
             record.last_transition = time.time()
             self._running.pop(job_id, None)
-            try:
-                self._queued.remove(job_id)
-            except ValueError:
-                pass
-            try:
-                self._delayed.remove(job_id)
-            except ValueError:
-                pass
+            self._queued.pop(job_id, None)
+            self._undefer(job_id)
             LOGGER.debug("Job %s finished (status=%s)", job_id, status)
             metrics = self._metrics_provider()
-            state = self._snapshot_locked(metrics)
         self._emit_budget_event(
             "job.finished",
             {
                 "job": record.to_public_dict(),
-                "metrics": state["metrics"],
+                "metrics": metrics,
                 "status": status,
             },
         )
@@ -312,6 +333,10 @@ class BudgetManager:
         """
         Re-evaluate delayed jobs against current metrics, returning transition envelopes.
 
+        Only jobs whose blocking budget now has enough headroom are re-checked,
+        so the cost is O(k log n) for k admitted (or re-classified) jobs.  Jobs
+        that stay blocked by the same budget keep their previous ``reason``.
+
         Returns a list of ``{"job": <JobRecord>, "queue_state": "...", "reason": "..."}``.
         """
         transitions: List[Dict[str, Any]] = []
@@ -329,41 +354,46 @@ class BudgetManager:
             metrics = self._metrics_provider()
             self._maybe_trim_assets(metrics)
 
-            pending_ids = list(self._delayed)
-            for job_id in pending_ids:
-                record = self._jobs.get(job_id)
-                if not record:
-                    try:
-                        self._delayed.remove(job_id)
-                    except ValueError:
-                        pass
-                    continue
-                queue_state, reason = self._evaluate_job(record, metrics)
-                record.status = queue_state
-                record.reason = reason
-                record.last_transition = time.time()
-                if queue_state == "queued":
-                    try:
-                        self._delayed.remove(job_id)
-                    except ValueError:
-                        pass
-                    self._queued.append(job_id)
-                transitions.append(
-                    {
-                        "job": record.to_public_dict(),
-                        "queue_state": queue_state,
-                        "reason": reason,
-                    }
-                )
-
-            state = self._snapshot_locked(metrics)
+            headroom = self._headroom(metrics)
+            for budget_class in BUDGET_CLASSES:
+                heap = self._delay_heaps[budget_class]
+                limit = headroom[budget_class]
+                while heap and heap[0][0] <= limit:
+                    entry = heapq.heappop(heap)
+                    job_id = entry[2]
+                    if self._delayed.get(job_id) != (budget_class, entry[1]):
+                        self._stale_entries -= 1
+                        continue
+                    record = self._jobs[job_id]
+                    new_class, reason = self._classify(record, metrics)
+                    if new_class == budget_class:
+                        # Headroom and the full check disagree (float edge).
+                        heapq.heappush(heap, entry)
+                        break
+                    del self._delayed[job_id]
+                    self._delayed_by_class[budget_class] -= 1
+                    record.reason = reason
+                    record.last_transition = time.time()
+                    if new_class is None:
+                        record.status = "queued"
+                        self._queued[job_id] = None
+                        self._readmitted_by_class[budget_class] += 1
+                    else:
+                        self._defer(record, new_class)
+                    transitions.append(
+                        {
+                            "job": record.to_public_dict(),
+                            "queue_state": record.status,
+                            "reason": reason,
+                        }
+                    )
 
         if transitions:
             self._emit_budget_event(
                 "queue.refreshed",
                 {
                     "transitions": transitions,
-                    "metrics": state["metrics"],
+                    "metrics": metrics,
                 },
             )
         return transitions
@@ -409,6 +439,8 @@ class BudgetManager:
                     "delayed": len(self._delayed),
                     "running": len(self._running),
                     "seen_jobs": len(self._jobs),
+                    "delayed_by_class": dict(self._delayed_by_class),
+                    "readmitted_by_class": dict(self._readmitted_by_class),
                 },
                 "assets": {
                     "registered": len(self._assets),
@@ -501,40 +533,86 @@ class BudgetManager:
         return events
 
     # ---------------------------------------------------------------- Internal Ops
-    def _evaluate_job(
+    def _classify(
         self, record: JobRecord, metrics: Dict[str, Any]
-    ) -> Tuple[str, Optional[str]]:
-        if record.status == "running":
-            return "running", record.reason
-
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Return ``(budget_class, reason)``; ``(None, None)`` means admissible."""
         limits = self._limits
         depth = len(self._queued) + len(self._delayed) + len(self._running)
         if limits.max_queue_depth and depth >= limits.max_queue_depth:
-            return "delayed", "queue capacity reached"
+            return "capacity", "queue capacity reached"
 
         running_count = len(self._running)
         if limits.max_running_jobs and running_count >= limits.max_running_jobs:
-            return "delayed", "job cap reached"
+            return "jobs", "job cap reached"
 
         cpu_budget = limits.max_cpu_percent
         mem_budget = limits.max_mem_mb
         vram_budget = limits.max_vram_mb
-
-        cpu_usage = float(metrics.get("cpu") or 0.0)
-        mem_used = float(metrics.get("mem_used_mb") or 0.0)
-        gpus = metrics.get("gpus") or []
-        first_gpu = metrics.get("first_gpu") or (gpus[0] if gpus else None)
-        vram_used = float((first_gpu or {}).get("mem_used") or 0.0)
+        cpu_usage, mem_used, vram_used = _resource_usage(metrics)
 
         req = record.requirements
         if cpu_budget and cpu_usage + req.cpu_percent > cpu_budget:
-            return "delayed", f"cpu {cpu_usage:.1f}%/{cpu_budget:.1f}%"
+            return "cpu", f"cpu {cpu_usage:.1f}%/{cpu_budget:.1f}%"
         if mem_budget and mem_used + req.ram_mb > mem_budget:
-            return "delayed", f"ram {mem_used + req.ram_mb:.0f}MB/{mem_budget}MB"
+            return "ram", f"ram {mem_used + req.ram_mb:.0f}MB/{mem_budget}MB"
         if vram_budget and vram_used + req.vram_mb > vram_budget:
-            return "delayed", f"vram {vram_used + req.vram_mb:.0f}MB/{vram_budget}MB"
+            return "vram", f"vram {vram_used + req.vram_mb:.0f}MB/{vram_budget}MB"
 
-        return "queued", None
+        return None, None
+
+    def _headroom(self, metrics: Dict[str, Any]) -> Dict[str, float]:
+        """Largest heap key each budget class can admit under ``metrics``."""
+        limits = self._limits
+        open_, shut = float("inf"), float("-inf")
+        depth = len(self._queued) + len(self._delayed) + len(self._running)
+        cpu_usage, mem_used, vram_used = _resource_usage(metrics)
+        return {
+            "capacity": (
+                open_
+                if not limits.max_queue_depth or depth < limits.max_queue_depth
+                else shut
+            ),
+            "jobs": (
+                open_
+                if not limits.max_running_jobs
+                or len(self._running) < limits.max_running_jobs
+                else shut
+            ),
+            "cpu": (
+                limits.max_cpu_percent - cpu_usage if limits.max_cpu_percent else open_
+            ),
+            "ram": limits.max_mem_mb - mem_used if limits.max_mem_mb else open_,
+            "vram": limits.max_vram_mb - vram_used if limits.max_vram_mb else open_,
+        }
+
+    def _defer(self, record: JobRecord, budget_class: str) -> None:
+        req = record.requirements
+        key = {
+            "cpu": req.cpu_percent,
+            "ram": req.ram_mb,
+            "vram": req.vram_mb,
+        }.get(budget_class, 0.0)
+        seq = next(self._delay_seq)
+        self._delayed[record.job_id] = (budget_class, seq)
+        self._delayed_by_class[budget_class] += 1
+        heapq.heappush(self._delay_heaps[budget_class], (key, seq, record.job_id))
+
+    def _undefer(self, job_id: str) -> None:
+        entry = self._delayed.pop(job_id, None)
+        if entry is None:
+            return
+        self._delayed_by_class[entry[0]] -= 1
+        self._stale_entries += 1
+        if self._stale_entries > max(1024, len(self._delayed)):
+            for budget_class, heap in self._delay_heaps.items():
+                heap[:] = [
+                    item
+                    for item in heap
+                    if self._delayed.get(item[2]) == (budget_class, item[1])
+                ]
+                heapq.heapify(heap)
+            self._stale_entries = 0
 
     def _maybe_trim_assets(self, metrics: Dict[str, Any]) -> None:
         limits = self._limits
@@ -542,10 +620,7 @@ class BudgetManager:
             return
         mem_budget = limits.max_mem_mb
         vram_budget = limits.max_vram_mb
-        mem_used = float(metrics.get("mem_used_mb") or 0.0)
-        gpus = metrics.get("gpus") or []
-        first_gpu = metrics.get("first_gpu") or (gpus[0] if gpus else None)
-        vram_used = float((first_gpu or {}).get("mem_used") or 0.0)
+        _, mem_used, vram_used = _resource_usage(metrics)
 
         target = 0.0
         if mem_budget and mem_used > mem_budget:
@@ -577,6 +652,7 @@ budget_manager = BudgetManager()
 
 __all__ = [
     "AssetHandle",
+    "BUDGET_CLASSES",
     "BudgetLimits",
     "BudgetManager",
     "JobRecord",
@@ -4,10 +4,12 @@ from .image2persona import (
     ANALYZER_VERSION,
     ImageLoadError,
     ImagePersonaAnalyzer,
+    PersonaBatchProgress,
     PersonaImageOptions,
     PersonaImageReport,
     PersonaSuggestion,
     analyze_images,
+    analyze_images_batch,
 )
 from .style_suggestions import StyleSuggestionRegistry, suggest_styles
 
@@ -15,10 +17,12 @@ __all__ = [
     "ANALYZER_VERSION",
     "ImageLoadError",
     "ImagePersonaAnalyzer",
+    "PersonaBatchProgress",
     "PersonaImageOptions",
     "PersonaImageReport",
     "PersonaSuggestion",
     "StyleSuggestionRegistry",
     "analyze_images",
+    "analyze_images_batch",
     "suggest_styles",
 ]
@@ -1,9 +1,22 @@
 from __future__ import annotations
 
+import atexit
 import dataclasses
 import hashlib
 import json
+import logging
+import multiprocessing
+import os
 import statistics
+import threading
+from collections import OrderedDict
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import (
@@ -11,6 +24,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     MutableMapping,
     Optional,
@@ -23,11 +37,35 @@ from PIL import Image, ImageOps, ImageStat
 
 from .style_suggestions import StyleSuggestionRegistry, suggest_styles
 
+try:  # numpy is optional but keeps the subject-mask scan off the Python loop
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
+LOGGER = logging.getLogger(__name__)
+
 RGBTuple = Tuple[int, int, int]
 Point = Tuple[float, float]
 
 ANALYZER_VERSION = "p6.image2persona.v1"
 
+# Hooks that receive decoded pixels; batch mode runs serially when any is set.
+_IMAGE_HOOKS = ("palette", "appearance", "anchors", "expressions")
+_BATCH_CACHE_LIMIT = 4096
+# The shared pool is only used once every worker has at least this many images
+# to analyse; smaller batches run inline instead of waiting on worker spawns.
+_MIN_JOBS_PER_WORKER = 2
+# EXIF orientation -> transpose, applied after reduced-size decoding.
+_ORIENTATION = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
 
 class ImageLoadError(RuntimeError):
     """Raised when an input image cannot be processed."""
@@ -85,6 +123,19 @@ class PersonaSuggestion:
         return json.dumps(payload, indent=indent, ensure_ascii=False)
 
 
+@dataclass(slots=True)
+class PersonaBatchProgress:
+    """One completed image from :meth:`ImagePersonaAnalyzer.iter_analyze_batch`."""
+
+    index: int
+    completed: int
+    total: int
+    source: str
+    report: Optional[PersonaImageReport] = None
+    cached: bool = False
+    error: Optional[str] = None
+
+
 class ImagePersonaAnalyzer:
     """Extracts appearance hints, palette, anchors, and expressions from persona images."""
 
@@ -121,6 +172,129 @@ class ImagePersonaAnalyzer:
             provenance=provenance,
         )
 
+    def analyze_batch(
+        self,
+        sources: Sequence[Union[str, Path, Image.Image]],
+        *,
+        persona_id: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        progress: Optional[Callable[[PersonaBatchProgress], None]] = None,
+    ) -> PersonaSuggestion:
+        """Batch counterpart of :meth:`analyze_images`; see :meth:`iter_analyze_batch`."""
+        reports: List[Optional[PersonaImageReport]] = [None] * len(sources)
+        for event in self.iter_analyze_batch(sources, max_workers=max_workers):
+            if progress is not None:
+                progress(event)
+            if event.error is not None:
+                raise ImageLoadError(event.error)
+            reports[event.index] = event.report
+        ordered = [report for report in reports if report is not None]
+        summary, provenance = self._merge_reports(ordered, persona_id=persona_id)
+        return PersonaSuggestion(
+            persona_id=persona_id,
+            summary=summary,
+            per_image=ordered,
+            provenance=provenance,
+        )
+
+    def iter_analyze_batch(
+        self,
+        sources: Sequence[Union[str, Path, Image.Image]],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[PersonaBatchProgress]:
+        """
+        Analyse many images, yielding a progress event as each one finishes.
+
+        Files are decoded at reduced size (JPEG ``draft()`` scaling, then
+        ``reduce()``) straight to the palette working resolution, and
+        quantisation plus subject-mask probing run across a process pool.
+        Per-image features are cached by content hash (file bytes, or
+        pixels for in-memory images) together with the analyzer version and
+        sizing options, so repeated or duplicate inputs skip decoding.
+        Reports carry the content hash as ``digest`` and the original
+        dimensions; statistics come from the downscaled image, so values
+        can differ slightly from :meth:`analyze_images`.  Events arrive in
+        completion order; ``index`` points back into ``sources``.  When a
+        pixel-level hook is configured the images are analysed serially.
+        """
+        if not sources:
+            raise ValueError("at least one image is required")
+        total = len(sources)
+        if any(callable(self.options.hooks.get(name)) for name in _IMAGE_HOOKS):
+            for index, source in enumerate(sources):
+                try:
+                    report = self._analyze_single(source, index=index)
+                except ImageLoadError as exc:
+                    yield PersonaBatchProgress(
+                        index,
+                        index + 1,
+                        total,
+                        _source_label(source, index),
+                        None,
+                        error=str(exc),
+                    )
+                    continue
+                yield PersonaBatchProgress(
+                    index, index + 1, total, report.source, report
+                )
+            return
+
+        settings = (
+            self.options.quantize_edge,
+            max(self.options.palette_max, 2),
+            self.options.anchor_probe_size,
+        )
+        pending: Dict[str, Tuple[Any, ...]] = {}
+        waiting: Dict[str, List[Tuple[int, str]]] = {}
+        completed = 0
+        for index, source in enumerate(sources):
+            label = _source_label(source, index)
+            try:
+                digest, job = self._batch_job(source, label)
+            except ImageLoadError as exc:
+                completed += 1
+                yield PersonaBatchProgress(
+                    index, completed, total, label, None, error=str(exc)
+                )
+                continue
+            key = _batch_cache_key(digest, settings)
+            features = _batch_cache_get(key)
+            if features is not None:
+                completed += 1
+                yield PersonaBatchProgress(
+                    index,
+                    completed,
+                    total,
+                    label,
+                    self._report_from_features(features, label),
+                    cached=True,
+                )
+                continue
+            waiting.setdefault(key, []).append((index, label))
+            pending.setdefault(key, (*job, digest, *settings))
+
+        if not pending:
+            return
+        workers = max_workers if max_workers is not None else _default_workers()
+        for key, features, error in _run_batch_jobs(pending, workers):
+            if features is not None:
+                _batch_cache_put(key, features)
+            for index, label in waiting[key]:
+                completed += 1
+                if features is None:
+                    yield PersonaBatchProgress(
+                        index, completed, total, label, None, error=error
+                    )
+                    continue
+                yield PersonaBatchProgress(
+                    index,
+                    completed,
+                    total,
+                    label,
+                    self._report_from_features(features, label),
+                )
+
     def merge_into_persona_profile(
         self,
         persona_profile: MutableMapping[str, Any],
@@ -151,14 +325,41 @@ class ImagePersonaAnalyzer:
     ) -> PersonaImageReport:
         image, label = self._load_image(source, index=index)
         digest = self._digest(image)
-        palette = self._extract_palette(image)
-        appearance = self._extract_appearance(image, palette)
-        anchors = self._estimate_anchors(image)
-        expressions = self._estimate_expressions(image, appearance, anchors)
+        stats = ImageStat.Stat(image)
+        palette = self._extract_palette(image, mean_rgb=stats.mean[:3])
+        probe = _estimate_subject_bbox(image, self.options.anchor_probe_size)
+        return self._build_report(
+            label,
+            digest,
+            image.size,
+            palette,
+            stats.mean[:3],
+            stats.stddev[:3],
+            probe,
+            image=image,
+        )
+
+    def _build_report(
+        self,
+        label: str,
+        digest: str,
+        size: Tuple[int, int],
+        palette: List[Dict[str, Any]],
+        mean_rgb: Sequence[float],
+        std_rgb: Sequence[float],
+        probe: Tuple[Dict[str, Any], Optional[Tuple[float, float, float, float]]],
+        *,
+        image: Optional[Image.Image] = None,
+    ) -> PersonaImageReport:
+        appearance = self._extract_appearance(image, palette, mean_rgb=mean_rgb)
+        anchors = self._estimate_anchors(image, probe=probe)
+        expressions = self._estimate_expressions(
+            image, appearance, anchors, mean_rgb=mean_rgb, std_rgb=std_rgb
+        )
         debug_payload = None
         if self.options.debug:
             debug_payload = {
-                "metrics": self._calc_metrics(image),
+                "metrics": _metrics(mean_rgb, std_rgb, size),
                 "palette_names": [entry["name"] for entry in palette],
                 "anchors": anchors,
                 "appearance": appearance,
@@ -166,8 +367,8 @@ class ImagePersonaAnalyzer:
         return PersonaImageReport(
             source=label,
             digest=digest,
-            width=image.width,
-            height=image.height,
+            width=size[0],
+            height=size[1],
             palette=palette,
             appearance=appearance,
             anchors=anchors,
@@ -175,6 +376,41 @@ class ImagePersonaAnalyzer:
             debug=debug_payload,
         )
 
+    def _batch_job(
+        self, source: Union[str, Path, Image.Image], label: str
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        """Content digest plus the picklable worker payload for one source."""
+        if isinstance(source, Image.Image):
+            try:
+                image = ImageOps.exif_transpose(source).convert("RGB")
+            except Exception as exc:  # pragma: no cover - defensive
+                raise ImageLoadError(f"unable to normalize image: {label}") from exc
+            small = _downscale(image, self.options.quantize_edge)
+            return self._digest(image), ("image", small.copy(), image.size)
+        path = Path(source)
+        try:
+            data = path.read_bytes()
+        except OSError as exc:
+            raise ImageLoadError(f"input image not found: {source}") from exc
+        digest = hashlib.sha1(f"{ANALYZER_VERSION}:".encode("utf-8") + data)
+        return digest.hexdigest(), ("path", str(path), None)
+
+    def _report_from_features(
+        self, features: Dict[str, Any], label: str
+    ) -> PersonaImageReport:
+        palette = self.options.clamp_palette(
+            _palette_swatches(features["colors"], features["mean"])
+        )
+        return self._build_report(
+            label,
+            features["digest"],
+            tuple(features["size"]),
+            palette,
+            features["mean"],
+            features["stddev"],
+            (dict(features["mask"]), features["bbox"]),
+        )
+
     def _load_image(
         self, source: Union[str, Path, Image.Image], *, index: int
     ) -> Tuple[Image.Image, str]:
@@ -199,59 +435,14 @@ class ImagePersonaAnalyzer:
         payload += image.tobytes()
         return hashlib.sha1(payload).hexdigest()
 
-    def _extract_palette(self, image: Image.Image) -> List[Dict[str, Any]]:
-        edge = self.options.quantize_edge
-        target_w, target_h = image.size
-        scale = max(target_w, target_h) / float(edge)
-        if scale > 1.0:
-            resized = image.resize(
-                (
-                    max(32, int(target_w / scale)),
-                    max(32, int(target_h / scale)),
-                ),
-                Image.Resampling.LANCZOS,
-            )
-        else:
-            resized = image
-
-        quantized = resized.quantize(
-            colors=max(self.options.palette_max, 2),
-            method=Image.Mediancut,
-            dither=Image.Dither.NONE,
-        )
-        palette_raw = quantized.getpalette() or []
-        color_counts = quantized.getcolors() or []
-        total = sum(count for count, _ in color_counts) or 1
-        swatches: List[Dict[str, Any]] = []
-        for count, idx in color_counts:
-            base = idx * 3
-            if base + 3 > len(palette_raw):
-                continue
-            rgb = tuple(palette_raw[base : base + 3])  # type: ignore[assignment]
-            ratio = count / total
-            swatches.append(
-                {
-                    "hex": "#%02x%02x%02x" % rgb,
-                    "rgb": list(rgb),
-                    "ratio": round(ratio, 4),
-                    "luma": round(_luma(rgb), 4),
-                    "name": _color_token(rgb),
-                }
-            )
-        if not swatches:
-            # fallback to average color
-            avg = tuple(int(round(x)) for x in ImageStat.Stat(image).mean[:3])
-            swatches.append(
-                {
-                    "hex": "#%02x%02x%02x" % avg,
-                    "rgb": list(avg),
-                    "ratio": 1.0,
-                    "luma": round(_luma(avg), 4),
-                    "name": _color_token(avg),
-                }
-            )
-        swatches = sorted(swatches, key=lambda entry: (-entry["ratio"], entry["hex"]))
-        swatches = self.options.clamp_palette(swatches)
+    def _extract_palette(
+        self, image: Image.Image, *, mean_rgb: Optional[Sequence[float]] = None
+    ) -> List[Dict[str, Any]]:
+        resized = _downscale(image, self.options.quantize_edge)
+        colors = _quantize_colors(resized, max(self.options.palette_max, 2))
+        if mean_rgb is None:
+            mean_rgb = ImageStat.Stat(image).mean[:3]
+        swatches = self.options.clamp_palette(_palette_swatches(colors, mean_rgb))
 
         palette_hook = self.options.hooks.get("palette")
         if callable(palette_hook):
@@ -263,11 +454,14 @@ class ImagePersonaAnalyzer:
 
     def _extract_appearance(
         self,
-        image: Image.Image,
+        image: Optional[Image.Image],
         palette: Sequence[Dict[str, Any]],
+        *,
+        mean_rgb: Optional[Sequence[float]] = None,
     ) -> Dict[str, Any]:
-        stats = ImageStat.Stat(image)
-        avg_rgb = tuple(int(round(value)) for value in stats.mean[:3])
+        if mean_rgb is None:
+            mean_rgb = ImageStat.Stat(image).mean[:3]
+        avg_rgb = tuple(int(round(value)) for value in mean_rgb)
         avg_luma = _luma(avg_rgb)
         saturation = _approx_saturation(avg_rgb)
         palette_tokens = [entry["name"] for entry in palette]
@@ -306,10 +500,18 @@ class ImagePersonaAnalyzer:
         }
         return appearance
 
-    def _estimate_anchors(self, image: Image.Image) -> Dict[str, Any]:
-        mask_data, bbox = _estimate_subject_bbox(image, self.options.anchor_probe_size)
+    def _estimate_anchors(
+        self,
+        image: Optional[Image.Image],
+        *,
+        probe: Optional[
+            Tuple[Dict[str, Any], Optional[Tuple[float, float, float, float]]]
+        ] = None,
+    ) -> Dict[str, Any]:
+        if probe is None:
+            probe = _estimate_subject_bbox(image, self.options.anchor_probe_size)
+        mask_data, bbox = probe
         if bbox is None:
-            width, height = image.size
             bbox = (0.25, 0.15, 0.75, 0.95)
         left, top, right, bottom = bbox
         cx = (left + right) / 2.0
@@ -353,13 +555,17 @@ class ImagePersonaAnalyzer:
 
     def _estimate_expressions(
         self,
-        image: Image.Image,
+        image: Optional[Image.Image],
         appearance: Dict[str, Any],
         anchors: Dict[str, Any],
+        *,
+        mean_rgb: Optional[Sequence[float]] = None,
+        std_rgb: Optional[Sequence[float]] = None,
     ) -> Dict[str, Any]:
-        stats = ImageStat.Stat(image)
-        mean_rgb = stats.mean[:3]
-        std_rgb = stats.stddev[:3]
+        if mean_rgb is None or std_rgb is None:
+            stats = ImageStat.Stat(image)
+            mean_rgb = stats.mean[:3]
+            std_rgb = stats.stddev[:3]
         contrast = sum(std_rgb) / (sum(mean_rgb) + 1e-6)
         warmth = mean_rgb[0] - mean_rgb[2]
         brightness = sum(mean_rgb) / 3.0
@@ -478,20 +684,88 @@ class ImagePersonaAnalyzer:
 
     def _calc_metrics(self, image: Image.Image) -> Dict[str, Any]:
         stat = ImageStat.Stat(image)
-        mean_rgb = stat.mean[:3]
-        std_rgb = stat.stddev[:3]
-        return {
-            "mean_rgb": [round(x, 3) for x in mean_rgb],
-            "std_rgb": [round(x, 3) for x in std_rgb],
-            "contrast": round(
-                sum(std_rgb) / (sum(mean_rgb) + 1e-6),
-                4,
-            ),
-            "dimensions": [image.width, image.height],
-        }
+        return _metrics(stat.mean[:3], stat.stddev[:3], image.size)
+
+
+def _metrics(
+    mean_rgb: Sequence[float], std_rgb: Sequence[float], size: Tuple[int, int]
+) -> Dict[str, Any]:
+    return {
+        "mean_rgb": [round(x, 3) for x in mean_rgb],
+        "std_rgb": [round(x, 3) for x in std_rgb],
+        "contrast": round(
+            sum(std_rgb) / (sum(mean_rgb) + 1e-6),
+            4,
+        ),
+        "dimensions": [size[0], size[1]],
+    }
 
 
 # Palette helpers ------------------------------------------------------
+def _downscale(image: Image.Image, edge: int) -> Image.Image:
+    """Resize so the longest side is ``edge`` (never below 32px per side)."""
+    target_w, target_h = image.size
+    scale = max(target_w, target_h) / float(edge)
+    if scale <= 1.0:
+        return image
+    return image.resize(
+        (
+            max(32, int(target_w / scale)),
+            max(32, int(target_h / scale)),
+        ),
+        Image.Resampling.LANCZOS,
+    )
+
+
+def _quantize_colors(image: Image.Image, colors: int) -> List[Tuple[int, RGBTuple]]:
+    """Median-cut ``image`` and return ``(pixel count, rgb)`` per palette entry."""
+    quantized = image.quantize(
+        colors=colors,
+        method=Image.Quantize.MEDIANCUT,
+        dither=Image.Dither.NONE,
+    )
+    palette_raw = quantized.getpalette() or []
+    result: List[Tuple[int, RGBTuple]] = []
+    for count, idx in quantized.getcolors() or []:
+        base = idx * 3
+        if base + 3 > len(palette_raw):
+            continue
+        result.append((count, tuple(palette_raw[base : base + 3])))  # type: ignore[arg-type]
+    return result
+
+
+def _palette_swatches(
+    colors: Sequence[Tuple[int, Sequence[int]]], mean_rgb: Sequence[float]
+) -> List[Dict[str, Any]]:
+    total = sum(count for count, _ in colors) or 1
+    swatches: List[Dict[str, Any]] = []
+    for count, rgb_values in colors:
+        rgb = tuple(rgb_values)
+        ratio = count / total
+        swatches.append(
+            {
+                "hex": "#%02x%02x%02x" % rgb,
+                "rgb": list(rgb),
+                "ratio": round(ratio, 4),
+                "luma": round(_luma(rgb), 4),
+                "name": _color_token(rgb),
+            }
+        )
+    if not swatches:
+        # fallback to average color
+        avg = tuple(int(round(x)) for x in mean_rgb)
+        swatches.append(
+            {
+                "hex": "#%02x%02x%02x" % avg,
+                "rgb": list(avg),
+                "ratio": 1.0,
+                "luma": round(_luma(avg), 4),
+                "name": _color_token(avg),
+            }
+        )
+    return sorted(swatches, key=lambda entry: (-entry["ratio"], entry["hex"]))
+
+
 def _luma(rgb: RGBTuple) -> float:
     r, g, b = rgb
     return (0.2126 * r + 0.7152 * g + 0.0722 * b) / 255.0
@@ -614,24 +888,31 @@ def _estimate_subject_bbox(
             threshold = value
             break
 
-    pixels = list(resized.getdata())
     width, height = resized.size
-    subject_pixels: List[Tuple[int, int]] = []
-    for idx, intensity in enumerate(pixels):
-        if intensity <= threshold:
-            x = idx % width
-            y = idx // width
-            subject_pixels.append((x, y))
-    if not subject_pixels:
+    if np is not None:
+        ys_arr, xs_arr = np.nonzero(np.asarray(resized) <= threshold)
+        count = int(xs_arr.size)
+        if count:
+            min_x, max_x = int(xs_arr.min()), int(xs_arr.max())
+            min_y, max_y = int(ys_arr.min()), int(ys_arr.max())
+    else:
+        xs: List[int] = []
+        ys: List[int] = []
+        for idx, intensity in enumerate(resized.getdata()):
+            if intensity <= threshold:
+                xs.append(idx % width)
+                ys.append(idx // width)
+        count = len(xs)
+        if count:
+            min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+    if not count:
         return {"confidence": 0.1, "threshold": threshold}, None
 
-    xs = [p[0] for p in subject_pixels]
-    ys = [p[1] for p in subject_pixels]
-    left = min(xs) / width
-    right = (max(xs) + 1) / width
-    top = min(ys) / height
-    bottom = (max(ys) + 1) / height
-    coverage = len(subject_pixels) / (width * height)
+    left = min_x / width
+    right = (max_x + 1) / width
+    top = min_y / height
+    bottom = (max_y + 1) / height
+    coverage = count / (width * height)
     confidence = round(min(0.9, max(0.25, coverage * 1.2)), 4)
     return {
         "confidence": confidence,
@@ -865,6 +1146,159 @@ def _most_common(values: Sequence[Optional[str]]) -> Optional[str]:
     return best[0]
 
 
+# Batch helpers --------------------------------------------------------
+def _source_label(source: Union[str, Path, Image.Image], index: int) -> str:
+    if isinstance(source, Image.Image):
+        return getattr(source, "filename", "") or f"in-memory://{index}"
+    return str(Path(source))
+
+
+def _decode_reduced(path: str, edge: int) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Decode ``path`` near ``edge`` px; returns the image and original size."""
+    with Image.open(path) as handle:
+        width, height = handle.size
+        orientation = handle.getexif().get(0x0112, 1)
+        handle.draft("RGB", (edge, edge))  # JPEG: DCT-domain 1/2..1/8 scaling
+        image = handle if handle.mode == "RGB" else handle.convert("RGB")
+        factor = max(image.size) // (edge * 2)
+        image = image.reduce(factor) if factor > 1 else image.copy()
+    transpose = _ORIENTATION.get(orientation)
+    if transpose is not None:
+        image = image.transpose(transpose)
+        if orientation >= 5:
+            width, height = height, width
+    return image, (width, height)
+
+
+def _batch_features(job: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Process-pool worker: decode, quantize and probe one image."""
+    kind, payload, size, digest, edge, colors, probe_size = job
+    if kind == "path":
+        image, size = _decode_reduced(payload, edge)
+        image = _downscale(image, edge)
+    else:
+        image = payload
+    stats = ImageStat.Stat(image)
+    mask, bbox = _estimate_subject_bbox(image, probe_size)
+    return {
+        "digest": digest,
+        "size": list(size),
+        "colors": [
+            (count, list(rgb)) for count, rgb in _quantize_colors(image, colors)
+        ],
+        "mean": stats.mean[:3],
+        "stddev": stats.stddev[:3],
+        "mask": mask,
+        "bbox": bbox,
+    }
+
+
+def _default_workers() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def _batch_executor(workers: int) -> Executor:
+    try:
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    except Exception as exc:  # pragma: no cover - platform dependent
+        LOGGER.info("image2persona process pool unavailable (%s); using threads", exc)
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Persona")
+
+
+_POOL_LOCK = threading.Lock()
+_BATCH_POOL: Optional[Executor] = None
+_BATCH_POOL_WORKERS = 0
+_pool_atexit_registered = False
+
+
+def _batch_pool(workers: int) -> Executor:
+    """Return the shared batch pool, (re)creating it for ``workers``."""
+    global _BATCH_POOL, _BATCH_POOL_WORKERS, _pool_atexit_registered
+    with _POOL_LOCK:
+        if _BATCH_POOL is not None and _BATCH_POOL_WORKERS == workers:
+            return _BATCH_POOL
+        previous = _BATCH_POOL
+        _BATCH_POOL = _batch_executor(workers)
+        _BATCH_POOL_WORKERS = workers
+        if not _pool_atexit_registered:
+            atexit.register(shutdown_batch_pool)
+            _pool_atexit_registered = True
+    if previous is not None:
+        # Batches still iterating over the old pool keep their queued work.
+        previous.shutdown(wait=False)
+    return _BATCH_POOL
+
+
+def shutdown_batch_pool(wait: bool = False) -> None:
+    """Stop the shared batch worker pool; the next batch starts a new one."""
+    global _BATCH_POOL, _BATCH_POOL_WORKERS
+    with _POOL_LOCK:
+        pool, _BATCH_POOL, _BATCH_POOL_WORKERS = _BATCH_POOL, None, 0
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _run_batch_jobs(
+    jobs: Dict[str, Tuple[Any, ...]], workers: int
+) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+    """Yield ``(key, features, error)`` per job in completion order."""
+    if workers <= 1 or len(jobs) < workers * _MIN_JOBS_PER_WORKER:
+        for key, job in jobs.items():
+            try:
+                result = (key, _batch_features(job), None)
+            except Exception as exc:
+                result = (key, None, f"unable to analyze image: {exc}")
+            yield result
+        return
+    executor = _batch_pool(workers)
+    futures: Dict[Future, str] = {
+        executor.submit(_batch_features, job): key for key, job in jobs.items()
+    }
+    try:
+        for future in as_completed(futures):
+            try:
+                result = (futures[future], future.result(), None)
+            except Exception as exc:
+                result = (futures[future], None, f"unable to analyze image: {exc}")
+            yield result
+    finally:
+        # The pool outlives this batch; drop whatever the caller abandoned.
+        for future in futures:
+            future.cancel()
+
+
+_BATCH_LOCK = threading.Lock()
+_BATCH_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _batch_cache_key(digest: str, settings: Tuple[int, int, int]) -> str:
+    return f"{ANALYZER_VERSION}:{settings[0]}:{settings[1]}:{settings[2]}:{digest}"
+
+
+def _batch_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    with _BATCH_LOCK:
+        features = _BATCH_CACHE.get(key)
+        if features is not None:
+            _BATCH_CACHE.move_to_end(key)
+        return features
+
+
+def _batch_cache_put(key: str, features: Dict[str, Any]) -> None:
+    with _BATCH_LOCK:
+        _BATCH_CACHE[key] = features
+        _BATCH_CACHE.move_to_end(key)
+        while len(_BATCH_CACHE) > _BATCH_CACHE_LIMIT:
+            _BATCH_CACHE.popitem(last=False)
+
+
+def clear_batch_cache() -> None:
+    with _BATCH_LOCK:
+        _BATCH_CACHE.clear()
+
+
 def analyze_images(
     sources: Sequence[Union[str, Path, Image.Image]],
     *,
@@ -875,12 +1309,30 @@ def analyze_images(
     return analyzer.analyze_images(sources, persona_id=persona_id)
 
 
+def analyze_images_batch(
+    sources: Sequence[Union[str, Path, Image.Image]],
+    *,
+    persona_id: Optional[str] = None,
+    options: Optional[PersonaImageOptions] = None,
+    max_workers: Optional[int] = None,
+    progress: Optional[Callable[[PersonaBatchProgress], None]] = None,
+) -> PersonaSuggestion:
+    analyzer = ImagePersonaAnalyzer(options=options)
+    return analyzer.analyze_batch(
+        sources, persona_id=persona_id, max_workers=max_workers, progress=progress
+    )
+
+
 __all__ = [
     "ANALYZER_VERSION",
     "ImageLoadError",
     "ImagePersonaAnalyzer",
+    "PersonaBatchProgress",
     "PersonaImageOptions",
     "PersonaImageReport",
     "PersonaSuggestion",
     "analyze_images",
+    "analyze_images_batch",
+    "clear_batch_cache",
+    "shutdown_batch_pool",
 ]
@@ -20,6 +20,11 @@ Each exported image is paired with a provenance sidecar that captures
 {tool, version, params} so downstream tooling can audit the intermediate
 products. Deterministic seeds + ordered processing guarantee repeatable
 results for identical input/parameter pairs.
+
+With NumPy available the depth, mask-statistics and plane-splitting stages run
+over bounded tiles (``FlatToLayersOptions.tile_size``) that share a single
+uint16 depth buffer, so peak memory no longer scales with several full-size
+float arrays per plate. Tiled and whole-image runs produce identical outputs.
 """
 
 from __future__ import annotations
@@ -31,7 +36,8 @@ import math
 import statistics
 import time
 import uuid
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
@@ -81,6 +87,10 @@ except Exception:  # pragma: no cover - optional dependency
 
 Vec2 = Tuple[float, float]
 Vec4 = Tuple[int, int, int, int]
+Tile = Tuple[int, int, int, int]
+
+# Edge length (px) of the square tiles used by the NumPy stages.
+DEFAULT_TILE_SIZE = 512
 
 
 @dataclass(slots=True)
@@ -118,6 +128,7 @@ class FlatToLayersOptions:
     parallax_scale: float = 1.0
     enable_real_esrgan: bool = False
     enable_lama_inpaint: bool = False
+    tile_size: Optional[int] = DEFAULT_TILE_SIZE
     interactive_session: Optional["SAMInteractiveSession"] = None
     provenance_inputs: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -198,10 +209,23 @@ def _normalize_thresholds(
     return [round(step * t, 4) for t in range(1, count)]
 
 
-def _mask_statistics(mask: Image.Image) -> Dict[str, Any]:
+def _iter_tiles(width: int, height: int, tile_size: int) -> Iterable[Tile]:
+    """Yield ``(y0, y1, x0, x1)`` bounds covering the image row by row."""
+    step = max(1, int(tile_size))
+    for y0 in range(0, height, step):
+        y1 = min(height, y0 + step)
+        for x0 in range(0, width, step):
+            yield y0, y1, x0, min(width, x0 + step)
+
+
+def _mask_statistics(
+    mask: Image.Image, *, tile_size: Optional[int] = None
+) -> Dict[str, Any]:
     mask = mask.convert("L")
     width, height = mask.size
-    if np is None:
+    if np is not None and tile_size:
+        bbox, centroid, area = _mask_extent_tiled(mask, tile_size)
+    elif np is None:
         # Manual iteration fallback (small images remain fast).
         pixels = mask.load()
         coords: List[Tuple[int, int]] = []
@@ -238,6 +262,41 @@ def _mask_statistics(mask: Image.Image) -> Dict[str, Any]:
             )
             area = int(foreground.sum())
 
+    return _mask_summary(bbox, centroid, area, width, height)
+
+
+def _mask_extent_tiled(mask: Image.Image, tile_size: int) -> Tuple[Vec4, Vec2, int]:
+    """Accumulate bbox/centroid/area tile by tile.
+
+    Coordinate sums are kept as exact integers, so the centroid matches the
+    whole-image ``mean`` of the foreground indices bit for bit.
+    """
+    width, height = mask.size
+    arr = np.asarray(mask)
+    area = 0
+    sum_x = 0
+    sum_y = 0
+    xmin, ymin, xmax, ymax = width, height, -1, -1
+    for y0, y1, x0, x1 in _iter_tiles(width, height, tile_size):
+        ys, xs = np.nonzero(arr[y0:y1, x0:x1])
+        count = int(ys.size)
+        if not count:
+            continue
+        area += count
+        sum_x += int(xs.sum()) + x0 * count
+        sum_y += int(ys.sum()) + y0 * count
+        xmin = min(xmin, x0 + int(xs.min()))
+        xmax = max(xmax, x0 + int(xs.max()))
+        ymin = min(ymin, y0 + int(ys.min()))
+        ymax = max(ymax, y0 + int(ys.max()))
+    if not area:
+        return (0, 0, width, height), (width * 0.5, height * 0.5), 0
+    return (xmin, ymin, xmax + 1, ymax + 1), (sum_x / area, sum_y / area), area
+
+
+def _mask_summary(
+    bbox: Vec4, centroid: Vec2, area: int, width: int, height: int
+) -> Dict[str, Any]:
     bbox_w = bbox[2] - bbox[0]
     bbox_h = bbox[3] - bbox[1]
     coverage = area / float(width * height) if width and height else 0.0
@@ -282,6 +341,51 @@ def _depth_gradient(image: Image.Image) -> Image.Image:
     return Image.fromarray((depth * 65535).astype("uint16"), mode="I;16")
 
 
+def _depth_gradient_tiled(image: Image.Image, tile_size: int) -> "np.ndarray":
+    """Tiled :func:`_depth_gradient` returning the uint16 depth buffer.
+
+    Distances are built per tile from 1-D offset vectors instead of a full
+    ``np.indices`` grid; the arithmetic (dtype and operation order) matches
+    the whole-image path exactly.
+    """
+    width, height = image.size
+    center = (width * 0.5, height * 0.5)
+    gray = ImageOps.grayscale(image).filter(ImageFilter.GaussianBlur(radius=5))
+    gray_arr = np.asarray(gray)
+    dx2 = (np.arange(width) - center[0]) ** 2
+    dy2 = (np.arange(height) - center[1]) ** 2
+    # The farthest pixel from the centre is always one of the corners.
+    corners = np.sqrt(dx2[[0, -1, 0, -1]] + dy2[[0, 0, -1, -1]])
+    max_distance = corners.max() if corners.max() else 1.0
+    depth_out = np.empty((height, width), dtype=np.uint16)
+    for y0, y1, x0, x1 in _iter_tiles(width, height, tile_size):
+        dist = np.sqrt(dx2[np.newaxis, x0:x1] + dy2[y0:y1, np.newaxis])
+        dist /= max_distance
+        arr = gray_arr[y0:y1, x0:x1].astype(np.float32) / 255.0
+        depth = (1.0 - dist) * 0.7 + arr * 0.3
+        np.clip(depth, 0.0, 1.0, out=depth)
+        depth *= 65535
+        depth_out[y0:y1, x0:x1] = depth
+    return depth_out
+
+
+def _normalize_depth_tiled(depth: "np.ndarray", tile_size: int) -> "np.ndarray":
+    """Min/max-normalise a uint16 depth buffer in place, one tile at a time."""
+    if not depth.size:
+        return depth
+    mn = float(depth.min())
+    mx = float(depth.max())
+    span = mx - mn if mx != mn else 1.0
+    height, width = depth.shape
+    for y0, y1, x0, x1 in _iter_tiles(width, height, tile_size):
+        arr = depth[y0:y1, x0:x1].astype(np.float32)
+        arr -= mn
+        arr /= span
+        arr *= 65535
+        depth[y0:y1, x0:x1] = arr
+    return depth
+
+
 def _normalize_depth_map(depth_map: Image.Image) -> Image.Image:
     if depth_map.mode not in {"I;16", "F"}:
         depth_map = depth_map.convert("F")
@@ -308,18 +412,7 @@ def _split_planes(
 ) -> List[Tuple[Tuple[float, float], Image.Image]]:
     normalized = _normalize_depth_map(depth_map)
     width, height = normalized.size
-    thresholds = sorted(set(max(0.0, min(1.0, value)) for value in thresholds))
-    if len(thresholds) < plane_count - 1:
-        thresholds = list(thresholds)
-        step = 1.0 / plane_count
-        while len(thresholds) < plane_count - 1:
-            thresholds.append(round(step * (len(thresholds) + 1), 4))
-    buckets: List[Tuple[float, float]] = []
-    prev = 0.0
-    for value in thresholds:
-        buckets.append((prev, value))
-        prev = value
-    buckets.append((prev, 1.0))
+    buckets = _plane_buckets(thresholds, plane_count)
 
     if np is None:
         normalized = normalized.convert("F")
@@ -352,6 +445,54 @@ def _split_planes(
     return result
 
 
+def _split_planes_tiled(
+    depth: "np.ndarray",
+    *,
+    thresholds: Sequence[float],
+    plane_count: int,
+    mask: Optional[Image.Image] = None,
+    tile_size: int = DEFAULT_TILE_SIZE,
+) -> List[Tuple[Tuple[float, float], Image.Image]]:
+    """Tiled :func:`_split_planes` over a uint16 depth buffer.
+
+    The buffer is normalised in place, and plane masks are filled tile by tile
+    so only tile-sized float temporaries exist at any time.
+    """
+    depth = _normalize_depth_tiled(depth, tile_size)
+    height, width = depth.shape
+    buckets = _plane_buckets(thresholds, plane_count)
+    mask_arr = np.asarray(mask.convert("L")) if mask is not None else None
+    planes = [np.zeros((height, width), dtype=np.uint8) for _ in buckets]
+    for y0, y1, x0, x1 in _iter_tiles(width, height, tile_size):
+        arr = depth[y0:y1, x0:x1] / 65535.0
+        if mask_arr is not None:
+            arr *= mask_arr[y0:y1, x0:x1] / 255.0
+        for plane, (lo, hi) in zip(planes, buckets):
+            plane[y0:y1, x0:x1][(arr >= lo) & (arr <= hi + 1e-6)] = 255
+    return [
+        (bucket, Image.fromarray(plane, mode="L"))
+        for bucket, plane in zip(buckets, planes)
+    ]
+
+
+def _plane_buckets(
+    thresholds: Sequence[float], plane_count: int
+) -> List[Tuple[float, float]]:
+    thresholds = sorted(set(max(0.0, min(1.0, value)) for value in thresholds))
+    if len(thresholds) < plane_count - 1:
+        thresholds = list(thresholds)
+        step = 1.0 / plane_count
+        while len(thresholds) < plane_count - 1:
+            thresholds.append(round(step * (len(thresholds) + 1), 4))
+    buckets: List[Tuple[float, float]] = []
+    prev = 0.0
+    for value in thresholds:
+        buckets.append((prev, value))
+        prev = value
+    buckets.append((prev, 1.0))
+    return buckets
+
+
 def _composite_plane(image: Image.Image, mask: Image.Image) -> Image.Image:
     mask = mask.convert("L")
     blank = Image.new("RGBA", image.size, (0, 0, 0, 0))
@@ -634,7 +775,7 @@ class FlatToLayersPipeline:
             )
 
         start_ts = time.time()
-        options = FlatToLayersOptions(**vars(options))  # defensive copy
+        options = replace(options)  # defensive copy
         character_id = options.normalized_character_id()
         source_path = options.source_path.expanduser().resolve()
         if not source_path.exists():
@@ -661,25 +802,34 @@ class FlatToLayersPipeline:
         cutout = _composite_plane(image, mask)
 
         # Anchors metadata
-        anchors = _mask_statistics(mask)
+        tile_size = options.tile_size if np is not None else None
+        anchors = _mask_statistics(mask, tile_size=tile_size)
         anchors["version"] = 1
         anchors["character_id"] = character_id
         anchors["source"] = source_path.as_posix()
 
         # Depth estimation
-        depth_map = _depth_gradient(image)
-        depth_debug = {"strategy": "fallback_gradient"}
+        depth_debug = {"strategy": "fallback_gradient", "tile_size": tile_size}
         background_mask = ImageChops.invert(mask)
 
         thresholds = _normalize_thresholds(
             options.plane_thresholds, count=options.plane_count
         )
-        planes_with_masks = _split_planes(
-            depth_map,
-            thresholds=thresholds,
-            plane_count=options.plane_count,
-            mask=background_mask,
-        )
+        if tile_size:
+            planes_with_masks = _split_planes_tiled(
+                _depth_gradient_tiled(image, tile_size),
+                thresholds=thresholds,
+                plane_count=options.plane_count,
+                mask=background_mask,
+                tile_size=tile_size,
+            )
+        else:
+            planes_with_masks = _split_planes(
+                _depth_gradient(image),
+                thresholds=thresholds,
+                plane_count=options.plane_count,
+                mask=background_mask,
+            )
 
         # Prepare output directories
         output_root = options.output_root.expanduser().resolve()
@@ -820,8 +970,35 @@ class FlatToLayersPipeline:
         )
         return result
 
+    def run_many(
+        self,
+        jobs: Sequence[FlatToLayersOptions],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> List[FlatToLayersResult]:
+        """Run several independent jobs concurrently; results keep job order.
+
+        The tiled NumPy/Pillow stages release the GIL and keep per-job memory
+        bounded, so a small thread pool overlaps plates on one machine. Jobs
+        should target distinct ``output_root`` directories.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        workers = max(1, min(len(jobs), max_workers or 2))
+        if workers == 1:
+            return [self.run(job) for job in jobs]
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="flat2layers"
+        ) as pool:
+            results = list(pool.map(self.run, jobs))
+        self._last_result = results[-1]
+        self._last_debug = dict(results[-1].debug)
+        return results
+
 
 __all__ = [
+    "DEFAULT_TILE_SIZE",
     "FlatToLayersPipeline",
     "FlatToLayersOptions",
     "FlatToLayersResult",
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
 import re
 import shutil
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from comfyvn.bridge.comfy_hardening import (
     HardenedBridgeError,
@@ -23,6 +27,7 @@ LOGGER = logging.getLogger("comfyvn.pov.render")
 
 DEFAULT_RENDER_ROOT = data_dir("renders", "pov")
 DEFAULT_CACHE_PATH = cache_dir("pov", "render_cache.json")
+DEFAULT_MAX_CONCURRENCY = 4
 
 
 class POVRenderError(RuntimeError):
@@ -67,13 +72,19 @@ class POVRenderCacheEntry:
 
 
 class POVRenderCache:
-    """JSON-backed cache for POV render artifacts."""
+    """JSON-backed cache for POV render artifacts.
+
+    Writes issued inside :meth:`batch` are deferred and flushed once when the
+    outermost batch exits, so multi-pose renders rewrite the index only once.
+    """
 
     def __init__(self, path: Path | str = DEFAULT_CACHE_PATH) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self._entries: Dict[str, POVRenderCacheEntry] = {}
         self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty = False
         self._load()
 
     @staticmethod
@@ -104,21 +115,47 @@ class POVRenderCache:
 
     def _persist(self) -> None:
         serialisable = {key: entry.to_dict() for key, entry in self._entries.items()}
-        self.path.write_text(json.dumps(serialisable, indent=2), encoding="utf-8")
+        tmp_path = self.path.with_suffix(f"{self.path.suffix}.tmp")
+        tmp_path.write_text(json.dumps(serialisable, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._persist()
+
+    @contextmanager
+    def batch(self) -> Iterator["POVRenderCache"]:
+        """Defer index writes until the outermost batch exits."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty:
+                    self._persist()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._dirty:
+                self._persist()
 
     def lookup(self, key: str) -> Optional[POVRenderCacheEntry]:
         with self._lock:
             entry = self._entries.get(key)
             if entry:
                 entry.touch()
-                self._persist()
+                self._mark_dirty()
             return entry
 
     def store(self, entry: POVRenderCacheEntry) -> POVRenderCacheEntry:
         with self._lock:
             entry.touch()
             self._entries[entry.key] = entry
-            self._persist()
+            self._mark_dirty()
             LOGGER.debug(
                 "POV render cache stored key=%s artifact=%s",
                 entry.key,
@@ -130,11 +167,16 @@ class POVRenderCache:
         with self._lock:
             if key in self._entries:
                 self._entries.pop(key)
-                self._persist()
+                self._mark_dirty()
 
 
 class POVRenderPipeline:
-    """Coordinates POV portrait renders with per-character LoRA support."""
+    """Coordinates POV portrait renders with per-character LoRA support.
+
+    Missing poses are submitted to the bridge concurrently (bounded by
+    ``max_concurrency``) and concurrent requests for the same cache key share a
+    single in-flight render.
+    """
 
     def __init__(
         self,
@@ -143,6 +185,7 @@ class POVRenderPipeline:
         registry: Optional[AssetRegistry] = None,
         render_root: Path | str | None = None,
         cache: Optional[POVRenderCache] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         self.bridge = bridge or HardenedComfyBridge()
         self.registry = registry or AssetRegistry()
@@ -153,7 +196,11 @@ class POVRenderPipeline:
         )
         self.render_root.mkdir(parents=True, exist_ok=True)
         self.cache = cache or POVRenderCache()
+        self.max_concurrency = max(1, int(max_concurrency))
         self._lock = threading.RLock()
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def ensure_poses(
         self,
@@ -168,43 +215,124 @@ class POVRenderPipeline:
         if not character_id or not str(character_id).strip():
             raise POVRenderError("character_id is required")
         pose_list = self._normalise_poses(poses)
-        results: List[Dict[str, Any]] = []
-        for pose in pose_list:
-            result = self._ensure_pose(
-                character_id=character_id,
-                style=style,
-                pose=pose,
-                workflow_path=workflow_path,
-                force=force,
-                extra_metadata=extra_metadata,
-            )
-            if result:
-                results.append(result)
+        slots: List[Tuple[Optional[Dict[str, Any]], Optional[Future], bool]] = []
+        with self.cache.batch():
+            for pose in pose_list:
+                key = self.cache.make_key(character_id, style, pose)
+                if not force:
+                    cached_payload = self._cached_payload(
+                        key, character_id=character_id, style=style, pose=pose
+                    )
+                    if cached_payload:
+                        slots.append((cached_payload, None, False))
+                        continue
+                future, leader = self._claim_render(key)
+                if leader:
+                    self._dispatch_render(
+                        future,
+                        key=key,
+                        character_id=character_id,
+                        style=style,
+                        pose=pose,
+                        workflow_path=workflow_path,
+                        force=force,
+                        extra_metadata=extra_metadata,
+                    )
+                slots.append((None, future, not leader))
+
+            results: List[Dict[str, Any]] = []
+            for payload, future, coalesced in slots:
+                if future is not None:
+                    payload = dict(future.result())
+                    if coalesced:
+                        payload["coalesced"] = True
+                if payload:
+                    results.append(payload)
         return results
 
-    def _ensure_pose(
+    async def ensure_poses_async(
+        self,
+        character_id: str,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """Async wrapper so API handlers do not block the event loop."""
+        return await asyncio.to_thread(self.ensure_poses, character_id, **kwargs)
+
+    def _cached_payload(
+        self,
+        key: str,
+        *,
+        character_id: str,
+        style: Optional[str],
+        pose: str,
+    ) -> Optional[Dict[str, Any]]:
+        cached = self.cache.lookup(key)
+        cached_payload = self._materialise_cache_entry(cached)
+        if cached_payload:
+            LOGGER.debug(
+                "POV render cache hit char=%s style=%s pose=%s",
+                character_id,
+                style or "default",
+                pose,
+            )
+        return cached_payload
+
+    def _claim_render(self, key: str) -> Tuple[Future, bool]:
+        """Return the in-flight future for ``key`` and whether the caller owns it."""
+        with self._inflight_lock:
+            existing = self._inflight.get(key)
+            if existing is not None:
+                LOGGER.debug("POV render coalesced onto in-flight key=%s", key)
+                return existing, False
+            future: Future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def _dispatch_render(self, future: Future, *, key: str, **kwargs: Any) -> None:
+        def _job() -> None:
+            try:
+                result = self._render_pose(key=key, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+            finally:
+                with self._inflight_lock:
+                    if self._inflight.get(key) is future:
+                        self._inflight.pop(key)
+
+        if self.max_concurrency <= 1:
+            _job()
+            return
+        self._get_executor().submit(_job)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._inflight_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="pov-render",
+                )
+            return self._executor
+
+    def _render_pose(
         self,
         *,
+        key: str,
         character_id: str,
         style: Optional[str],
         pose: str,
         workflow_path: Optional[str | Path],
         force: bool,
         extra_metadata: Optional[Dict[str, Any]],
-    ) -> Optional[Dict[str, Any]]:
-        key = self.cache.make_key(character_id, style, pose)
+    ) -> Dict[str, Any]:
         if not force:
-            cached = self.cache.lookup(key)
-            cached_payload = self._materialise_cache_entry(cached)
+            # Another caller may have finished this key between lookup and claim.
+            cached_payload = self._cached_payload(
+                key, character_id=character_id, style=style, pose=pose
+            )
             if cached_payload:
-                LOGGER.debug(
-                    "POV render cache hit char=%s style=%s pose=%s",
-                    character_id,
-                    style or "default",
-                    pose,
-                )
                 return cached_payload
-
         LOGGER.info(
             "POV render triggering char=%s style=%s pose=%s",
             character_id,
@@ -223,13 +351,14 @@ class POVRenderPipeline:
             style=style,
             pose=pose,
         )
-        asset_payload = self._register_asset(
-            render_result=render_result,
-            character_id=character_id,
-            style=style,
-            pose=pose,
-            extra_metadata=extra_metadata,
-        )
+        with self._lock:
+            asset_payload = self._register_asset(
+                render_result=render_result,
+                character_id=character_id,
+                style=style,
+                pose=pose,
+                extra_metadata=extra_metadata,
+            )
         entry = POVRenderCacheEntry(
             key=key,
             character_id=character_id,
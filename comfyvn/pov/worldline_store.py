@@ -0,0 +1,361 @@
+"""
+SQLite persistence for :class:`~comfyvn.pov.worldlines.WorldlineRegistry`.
+
+Worldlines are stored as deltas against their fork parent: only metadata keys
+that differ from the parent are written, keys the child dropped are listed in
+``unset``, and the canonical ``nodes`` list is encoded as ``drop``/``add``
+sets whenever that round-trips exactly.  Snapshot thumbnails live in their own
+table indexed by cache key, by worldline + node, and by worldline + cache key
+so lookups never scan every snapshot.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+SNAPSHOTS_KEY = "snapshots"
+NODES_KEY = "nodes"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS worldlines (
+        id TEXT PRIMARY KEY,
+        parent_id TEXT,
+        label TEXT NOT NULL,
+        pov TEXT NOT NULL,
+        root_node TEXT NOT NULL,
+        notes TEXT NOT NULL DEFAULT '',
+        lane TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        delta TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_worldlines_parent ON worldlines(parent_id)",
+    """
+    CREATE TABLE IF NOT EXISTS worldline_snapshots (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        worldline TEXT NOT NULL,
+        cache_key TEXT NOT NULL,
+        node TEXT,
+        scene TEXT,
+        captured_at TEXT,
+        payload TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_wl_snapshots_cache_key "
+    "ON worldline_snapshots(cache_key)",
+    "CREATE INDEX IF NOT EXISTS idx_wl_snapshots_world_node "
+    "ON worldline_snapshots(worldline, node)",
+    "CREATE INDEX IF NOT EXISTS idx_wl_snapshots_world_key "
+    "ON worldline_snapshots(worldline, cache_key)",
+)
+
+
+_INSERT_SNAPSHOT = """
+    INSERT INTO worldline_snapshots (
+        worldline, cache_key, node, scene, captured_at, payload
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _dumps(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _snapshot_row(world_id: str, entry: Mapping[str, Any]) -> Tuple[Any, ...]:
+    node = entry.get("node")
+    scene = entry.get("scene")
+    return (
+        world_id,
+        str(entry.get("cache_key")),
+        None if node is None else str(node),
+        None if scene is None else str(scene),
+        entry.get("captured_at"),
+        _dumps(dict(entry)),
+    )
+
+
+def _parse_timestamp(value: str) -> datetime:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return datetime.now(timezone.utc)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _list_delta(base: List[Any], values: List[Any]) -> Optional[Dict[str, List[Any]]]:
+    """Encode ``values`` as drop/add against ``base`` if that is lossless."""
+    try:
+        value_set = set(values)
+        base_set = set(base)
+    except TypeError:
+        return None
+    drop = [item for item in base if item not in value_set]
+    add = [item for item in values if item not in base_set]
+    dropped = set(drop)
+    if [item for item in base if item not in dropped] + add != values:
+        return None
+    return {"drop": drop, "add": add}
+
+
+def encode_metadata_delta(
+    metadata: Mapping[str, Any], parent: Optional[Mapping[str, Any]]
+) -> Dict[str, Any]:
+    """Return the compact delta of ``metadata`` relative to ``parent``."""
+    base = {k: v for k, v in (parent or {}).items() if k != SNAPSHOTS_KEY}
+    changed: Dict[str, Any] = {}
+    nodes_delta: Optional[Dict[str, List[Any]]] = None
+    for key, value in metadata.items():
+        if key == SNAPSHOTS_KEY:
+            continue
+        if key in base and base[key] == value:
+            continue
+        base_nodes = base.get(NODES_KEY)
+        if (
+            key == NODES_KEY
+            and isinstance(value, list)
+            and isinstance(base_nodes, list)
+        ):
+            nodes_delta = _list_delta(base_nodes, value)
+            if nodes_delta is not None:
+                continue
+        changed[key] = value
+    delta: Dict[str, Any] = {"meta": changed}
+    unset = [key for key in base if key not in metadata]
+    if unset:
+        delta["unset"] = unset
+    if nodes_delta is not None:
+        delta["nodes"] = nodes_delta
+    return delta
+
+
+def decode_metadata_delta(
+    delta: Mapping[str, Any], parent: Optional[Mapping[str, Any]]
+) -> Dict[str, Any]:
+    """Inverse of :func:`encode_metadata_delta`."""
+    resolved = {k: v for k, v in (parent or {}).items() if k != SNAPSHOTS_KEY}
+    for key in delta.get("unset") or ():
+        resolved.pop(key, None)
+    nodes_delta = delta.get("nodes")
+    if isinstance(nodes_delta, Mapping):
+        dropped = set(nodes_delta.get("drop") or ())
+        base_nodes = resolved.get(NODES_KEY) or []
+        resolved[NODES_KEY] = [
+            item for item in base_nodes if item not in dropped
+        ] + list(nodes_delta.get("add") or ())
+    resolved.update(delta.get("meta") or {})
+    return json.loads(_dumps(resolved))
+
+
+class WorldlineStore:
+    """Thread-safe SQLite store for worldlines and their snapshots."""
+
+    def __init__(self, db_path: Path | str) -> None:
+        self.db_path = Path(db_path)
+        if str(db_path) != ":memory:":
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = RLock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            if str(db_path) != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # Worldlines ----------------------------------------------------------
+    def save_world(
+        self,
+        world: Any,
+        parent_metadata: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        delta = encode_metadata_delta(world.metadata, parent_metadata)
+        row = (
+            world.id,
+            world.parent_id,
+            world.label,
+            world.pov,
+            world.root_node,
+            world.notes or "",
+            world.lane,
+            world.created_at.isoformat(),
+            world.updated_at.isoformat(),
+            _dumps(delta),
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO worldlines (
+                    id, parent_id, label, pov, root_node, notes, lane,
+                    created_at, updated_at, delta
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    parent_id=excluded.parent_id,
+                    label=excluded.label,
+                    pov=excluded.pov,
+                    root_node=excluded.root_node,
+                    notes=excluded.notes,
+                    lane=excluded.lane,
+                    updated_at=excluded.updated_at,
+                    delta=excluded.delta
+                """,
+                row,
+            )
+
+    def load_worlds(self) -> List[Dict[str, Any]]:
+        """
+        Return stored worldlines parent-first with metadata fully resolved.
+
+        Each entry carries the row fields plus ``metadata`` (including the
+        ``snapshots`` list in capture order).
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM worldlines").fetchall()
+            snapshot_rows = self._conn.execute(
+                "SELECT worldline, payload FROM worldline_snapshots ORDER BY seq"
+            ).fetchall()
+        by_id = {row["id"]: row for row in rows}
+        snapshots: Dict[str, List[Dict[str, Any]]] = {}
+        for row in snapshot_rows:
+            snapshots.setdefault(row["worldline"], []).append(
+                json.loads(row["payload"])
+            )
+
+        resolved: Dict[str, Dict[str, Any]] = {}
+        ordered: List[Dict[str, Any]] = []
+
+        def _resolve(world_id: str, trail: Tuple[str, ...] = ()) -> Dict[str, Any]:
+            if world_id in resolved:
+                return resolved[world_id]["metadata"]
+            row = by_id[world_id]
+            parent_id = row["parent_id"]
+            parent_meta: Optional[Dict[str, Any]] = None
+            if parent_id in by_id and parent_id not in trail:
+                parent_meta = _resolve(parent_id, trail + (world_id,))
+            metadata = decode_metadata_delta(json.loads(row["delta"]), parent_meta)
+            if world_id in snapshots:
+                metadata[SNAPSHOTS_KEY] = snapshots[world_id]
+            entry = {
+                "id": world_id,
+                "parent_id": parent_id,
+                "label": row["label"],
+                "pov": row["pov"],
+                "root_node": row["root_node"],
+                "notes": row["notes"],
+                "lane": row["lane"],
+                "created_at": _parse_timestamp(row["created_at"]),
+                "updated_at": _parse_timestamp(row["updated_at"]),
+                "metadata": metadata,
+            }
+            resolved[world_id] = entry
+            ordered.append(entry)
+            return metadata
+
+        for world_id in by_id:
+            _resolve(world_id)
+        return ordered
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM worldline_snapshots")
+            self._conn.execute("DELETE FROM worldlines")
+
+    # Snapshots -----------------------------------------------------------
+    def add_snapshot(
+        self,
+        world_id: str,
+        entry: Mapping[str, Any],
+        *,
+        dedupe: bool = True,
+        limit: Optional[int] = None,
+    ) -> None:
+        cache_key = str(entry.get("cache_key"))
+        with self._lock, self._conn:
+            if dedupe:
+                self._conn.execute(
+                    "DELETE FROM worldline_snapshots "
+                    "WHERE worldline = ? AND cache_key = ?",
+                    (world_id, cache_key),
+                )
+            self._conn.execute(_INSERT_SNAPSHOT, _snapshot_row(world_id, entry))
+            if limit and limit > 0:
+                self._conn.execute(
+                    """
+                    DELETE FROM worldline_snapshots
+                    WHERE worldline = ? AND seq <= (
+                        SELECT seq FROM worldline_snapshots WHERE worldline = ?
+                        ORDER BY seq DESC LIMIT 1 OFFSET ?
+                    )
+                    """,
+                    (world_id, world_id, int(limit)),
+                )
+
+    def replace_snapshots(
+        self, world_id: str, entries: Iterable[Mapping[str, Any]]
+    ) -> None:
+        """Overwrite the stored snapshot list for ``world_id``."""
+        rows = [
+            _snapshot_row(world_id, entry)
+            for entry in entries
+            if isinstance(entry, Mapping)
+        ]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM worldline_snapshots WHERE worldline = ?", (world_id,)
+            )
+            self._conn.executemany(_INSERT_SNAPSHOT, rows)
+
+    def find_snapshots(
+        self,
+        *,
+        worldline: Optional[str] = None,
+        node: Optional[str] = None,
+        cache_key: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (
+            ("worldline", worldline),
+            ("node", node),
+            ("cache_key", cache_key),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(str(value))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT payload FROM worldline_snapshots {where} ORDER BY seq",
+                params,
+            ).fetchall()
+        return [json.loads(row["payload"]) for row in rows]
+
+    def delete_worlds(self, world_ids: Iterable[str]) -> None:
+        ids = [(str(world_id),) for world_id in world_ids]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM worldline_snapshots WHERE worldline = ?", ids
+            )
+            self._conn.executemany("DELETE FROM worldlines WHERE id = ?", ids)
+
+
+__all__ = [
+    "WorldlineStore",
+    "decode_metadata_delta",
+    "encode_metadata_delta",
+]
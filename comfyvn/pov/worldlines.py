@@ -8,8 +8,10 @@ for switching the active world so the global POV manager stays in sync.
 """
 
 import hashlib
+import itertools
 import json
 import logging
+import os
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -27,6 +29,7 @@ except Exception:  # pragma: no cover - defensive import fallback
     COMFYVN_VERSION = "0.0.0"
 
 from .manager import POV, POVManager
+from .worldline_store import WorldlineStore
 
 __all__ = [
     "Worldline",
@@ -91,6 +94,11 @@ META_DELTA_BASE = "_wl_delta_base"
 META_DELTA_SCHEMA = "_wl_delta_schema"
 DELTA_SKIP_KEYS = {"snapshots"}
 DEFAULT_SNAPSHOT_TOOL = "comfyvn.snapshot"
+WORLDLINE_DB_ENV = "COMFYVN_WORLDLINE_DB"
+
+# Versions come from one process-wide counter so a (world id, version) pair is
+# never reused, even after ``reset()`` recreates a world with the same id.
+_VERSIONS = itertools.count(1)
 
 
 def _register_modder_hooks() -> None:
@@ -341,6 +349,12 @@ class Worldline:
     parent_id: Optional[str] = None
     created_at: datetime = field(default_factory=_utc_now)
     updated_at: datetime = field(default_factory=_utc_now)
+    version: int = field(default_factory=lambda: next(_VERSIONS))
+
+    def touch(self) -> None:
+        """Mark the worldline as changed so version-keyed caches refresh."""
+        self.updated_at = _utc_now()
+        self.version = next(_VERSIONS)
 
     def snapshot(self, *, include_metadata: bool = True) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
@@ -390,7 +404,7 @@ class Worldline:
         if parent_id is not None:
             self.parent_id = parent_id
         _ensure_lane_metadata(self.metadata, self.lane, self.parent_id)
-        self.updated_at = _utc_now()
+        self.touch()
 
     def branch_nodes(self) -> List[str]:
         return _normalise_nodes(self.metadata)
@@ -418,11 +432,19 @@ class WorldlineRegistry:
     Thread-safe worldline registry coordinating with the global POV manager.
     """
 
-    def __init__(self, manager: Optional[POVManager] = None) -> None:
+    def __init__(
+        self,
+        manager: Optional[POVManager] = None,
+        *,
+        store: Optional[WorldlineStore] = None,
+    ) -> None:
         self._lock = RLock()
         self._worlds: Dict[str, Worldline] = {}
         self._active: Optional[str] = None
         self._manager = manager or POV
+        self._store: Optional[WorldlineStore] = None
+        if store is not None:
+            self.attach_store(store)
 
     # ---------------------------------------------------------------- manager
     def attach_manager(self, manager: POVManager) -> None:
@@ -431,6 +453,62 @@ class WorldlineRegistry:
         with self._lock:
             self._manager = manager
 
+    # ---------------------------------------------------------------- storage
+    @property
+    def store(self) -> Optional[WorldlineStore]:
+        return self._store
+
+    def attach_store(self, store: Optional[WorldlineStore]) -> None:
+        """
+        Persist worldlines through ``store``.
+
+        Worlds already in the store are loaded (replacing in-memory entries with
+        the same id); in-memory worlds the store does not know are written out.
+        Passing ``None`` detaches persistence.
+        """
+
+        with self._lock:
+            self._store = store
+            if store is None:
+                return
+            stored_ids = set()
+            for entry in store.load_worlds():
+                world = Worldline(
+                    id=entry["id"],
+                    label=entry["label"],
+                    pov=entry["pov"],
+                    root_node=entry["root_node"],
+                    notes=entry["notes"],
+                    metadata=entry["metadata"],
+                    lane=_normalise_lane(entry["lane"], world_id=entry["id"]),
+                    parent_id=entry["parent_id"],
+                    created_at=entry["created_at"],
+                    updated_at=entry["updated_at"],
+                )
+                self._worlds[world.id] = world
+                stored_ids.add(world.id)
+            for world in self._worlds.values():
+                if world.id not in stored_ids:
+                    self._persist(world, snapshots=True)
+            LOGGER.debug(
+                "Worldline store attached: %s (%d loaded)",
+                store.db_path,
+                len(stored_ids),
+            )
+
+    def _persist(self, world: Worldline, *, snapshots: bool = False) -> None:
+        """Write ``world`` (and re-encode its direct forks) to the store."""
+        store = self._store
+        if store is None:
+            return
+        parent = self._worlds.get(world.parent_id) if world.parent_id else None
+        store.save_world(world, parent.metadata if parent else None)
+        if snapshots:
+            store.replace_snapshots(world.id, world.metadata.get("snapshots") or [])
+        for child in self._worlds.values():
+            if child.parent_id == world.id and child is not world:
+                store.save_world(child, world.metadata)
+
     # ---------------------------------------------------------------- helpers
     def _ensure_world_id(self, world_id: str) -> str:
         key = str(world_id or "").strip()
@@ -441,7 +519,7 @@ class WorldlineRegistry:
     def _activate(self, world: Worldline) -> Dict[str, Any]:
         snapshot = self._manager.set(world.pov)
         self._active = world.id
-        world.updated_at = _utc_now()
+        world.touch()
         return snapshot
 
     def ensure(self, world_id: str) -> Worldline:
@@ -538,6 +616,7 @@ class WorldlineRegistry:
             pov_snapshot: Optional[Dict[str, Any]] = None
             if set_active:
                 pov_snapshot = self._activate(world)
+            self._persist(world, snapshots=meta_payload is not None)
             if created:
                 hook_payload = world.snapshot()
         if created and hook_payload and modder_hooks is not None:
@@ -593,6 +672,8 @@ class WorldlineRegistry:
         with self._lock:
             self._worlds.clear()
             self._active = None
+            if self._store is not None:
+                self._store.clear()
 
     def fork(
         self,
@@ -720,7 +801,9 @@ class WorldlineRegistry:
             if limit and limit > 0:
                 snapshots = snapshots[-limit:]
             world.metadata["snapshots"] = snapshots
-            world.updated_at = _utc_now()
+            world.touch()
+            if self._store is not None:
+                self._store.add_snapshot(world.id, entry, dedupe=dedupe, limit=limit)
         if modder_hooks is not None:
             try:
                 modder_hooks.emit("on_snapshot", dict(entry))
@@ -739,6 +822,40 @@ class WorldlineRegistry:
         return entry
 
     # ---------------------------------------------------------------- queries
+    def find_snapshots(
+        self,
+        *,
+        world_id: Optional[str] = None,
+        node: Optional[str] = None,
+        cache_key: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return recorded snapshots matching every supplied filter.
+
+        Served from the store's indexes when one is attached; otherwise the
+        in-memory snapshot lists are scanned.
+        """
+
+        with self._lock:
+            if self._store is not None:
+                return self._store.find_snapshots(
+                    worldline=world_id, node=node, cache_key=cache_key
+                )
+            if world_id is not None:
+                world = self._worlds.get(str(world_id))
+                worlds = [world] if world is not None else []
+            else:
+                worlds = list(self._worlds.values())
+            matches: List[Dict[str, Any]] = []
+            for world in worlds:
+                for item in world.metadata.get("snapshots") or []:
+                    if node is not None and str(item.get("node")) != str(node):
+                        continue
+                    if cache_key is not None and item.get("cache_key") != cache_key:
+                        continue
+                    matches.append(dict(item))
+            return matches
+
     def list(self) -> List[Worldline]:
         with self._lock:
             return list(self._worlds.values())
@@ -765,7 +882,18 @@ class WorldlineRegistry:
             return snapshot
 
 
-WORLDLINES = WorldlineRegistry(POV)
+def _store_from_env() -> Optional[WorldlineStore]:
+    path = os.getenv(WORLDLINE_DB_ENV, "").strip()
+    if not path:
+        return None
+    try:
+        return WorldlineStore(path)
+    except Exception:  # pragma: no cover - defensive
+        LOGGER.warning("Unable to open worldline store at %s", path, exc_info=True)
+        return None
+
+
+WORLDLINES = WorldlineRegistry(POV, store=_store_from_env())
 
 
 def create_world(
@@ -4,4 +4,4 @@ Presentation planning helpers and directive compilation utilities.
 
 from __future__ import annotations
 
-__all__ = ["directives"]
+__all__ = ["directives", "timeline"]
@@ -0,0 +1,271 @@
+"""
+Timeline-level batch compilation of presentation directives.
+
+`compile_plan` resolves one node against one `SceneState`.  Previewing or
+exporting a whole timeline through it means re-validating the scene state and
+recompiling identical character/camera setups for every line.  This module
+walks scenes node by node instead:
+
+* each scene's `SceneState` is validated once and carried forward, with
+  optional per-node `StatePatch` updates applied incrementally;
+* compiled plans are memoised on ``(state fingerprint, node fingerprint)``
+  where the node fingerprint covers only the fields `compile_plan` reads
+  (speaker and directives), so repeated lines hit the cache regardless of id;
+* results can be collected as dicts or streamed as NDJSON lines built from the
+  cached JSON fragments without re-encoding.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .directives import (
+    CameraState,
+    CharacterState,
+    PresentationNode,
+    SceneState,
+    TimingState,
+    compile_plan,
+)
+
+DEFAULT_MEMO_SIZE = 4096
+
+
+class StatePatch(BaseModel):
+    """Incremental scene-state update applied before compiling a node."""
+
+    characters: list[dict[str, Any]] = Field(default_factory=list)
+    exit: list[str] = Field(default_factory=list)
+    camera: dict[str, Any] | None = None
+    timing: dict[str, Any] | None = None
+    ambient_sfx: list[str | dict[str, Any]] | None = None
+    meta: dict[str, Any] | None = None
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class TimelineScene(BaseModel):
+    """Scene state plus the ordered nodes presented against it."""
+
+    scene_state: SceneState
+    nodes: list[PresentationNode] = Field(default_factory=list)
+    updates: dict[str, StatePatch] = Field(default_factory=dict)
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class PlanMemo:
+    """Thread-safe LRU of compiled plans stored as JSON fragments."""
+
+    def __init__(self, max_entries: int = DEFAULT_MEMO_SIZE) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[tuple[str, str], tuple[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, str]) -> Optional[tuple[str, int]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: tuple[str, str], fragment: str, count: int) -> None:
+        with self._lock:
+            self._entries[key] = (fragment, count)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+PLAN_MEMO = PlanMemo()
+
+
+def state_fingerprint(state: SceneState) -> str:
+    return hashlib.blake2b(
+        state.model_dump_json().encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def node_fingerprint(node: PresentationNode) -> str:
+    raw = json.dumps(node.speaker) + node.directives.model_dump_json()
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def apply_patch(state: SceneState, patch: StatePatch) -> SceneState:
+    """
+    Return ``state`` with ``patch`` applied.
+
+    Characters are merged by id (fields in the patch override the existing
+    entry, unknown ids enter the stage); ``exit`` removes ids.  Camera and
+    timing patches merge into the current values; ``ambient_sfx`` replaces the
+    bed and ``meta`` is shallow-merged.
+    """
+    update: Dict[str, Any] = {}
+    if patch.characters or patch.exit:
+        leaving = set(patch.exit)
+        characters: List[CharacterState] = [
+            character for character in state.characters if character.id not in leaving
+        ]
+        index = {character.id: pos for pos, character in enumerate(characters)}
+        for raw in patch.characters:
+            char_id = str(raw.get("id") or "")
+            if not char_id:
+                continue
+            if char_id in index:
+                pos = index[char_id]
+                merged = {**characters[pos].model_dump(), **raw}
+                characters[pos] = CharacterState.model_validate(merged)
+            else:
+                index[char_id] = len(characters)
+                characters.append(CharacterState.model_validate(raw))
+        update["characters"] = characters
+    if patch.camera is not None:
+        current = state.camera.model_dump() if state.camera else {}
+        update["camera"] = CameraState.model_validate({**current, **patch.camera})
+    if patch.timing is not None:
+        current = state.timing.model_dump() if state.timing else {}
+        update["timing"] = TimingState.model_validate({**current, **patch.timing})
+    if patch.ambient_sfx is not None:
+        update["ambient_sfx"] = list(patch.ambient_sfx)
+    if patch.meta is not None:
+        update["meta"] = {**state.meta, **patch.meta}
+    if not update:
+        return state
+    return state.model_copy(update=update)
+
+
+def _compile_fragment(
+    state: SceneState,
+    state_key: str,
+    node: PresentationNode,
+    memo: PlanMemo,
+) -> tuple[str, int, bool]:
+    key = (state_key, node_fingerprint(node))
+    cached = memo.get(key)
+    if cached is not None:
+        return cached[0], cached[1], True
+    plan = compile_plan(state, node)
+    fragment = json.dumps(plan, separators=(",", ":"), ensure_ascii=False)
+    memo.put(key, fragment, len(plan))
+    return fragment, len(plan), False
+
+
+def iter_timeline_fragments(
+    scenes: Iterable[TimelineScene],
+    *,
+    memo: Optional[PlanMemo] = None,
+) -> Iterator[tuple[str, str, str, int, bool]]:
+    """
+    Yield ``(scene_id, node_id, plan_json, directive_count, cached)`` per node.
+
+    The scene state is fingerprinted once and again only after a patch.
+    """
+    memo = memo if memo is not None else PLAN_MEMO
+    for scene in scenes:
+        state = scene.scene_state
+        state_key = state_fingerprint(state)
+        for node in scene.nodes:
+            patch = scene.updates.get(node.id)
+            if patch is not None:
+                patched = apply_patch(state, patch)
+                if patched is not state:
+                    state = patched
+                    state_key = state_fingerprint(state)
+            fragment, count, cached = _compile_fragment(state, state_key, node, memo)
+            yield state.scene_id, node.id, fragment, count, cached
+
+
+def compile_timeline(
+    scenes: Iterable[TimelineScene],
+    *,
+    memo: Optional[PlanMemo] = None,
+) -> Dict[str, Any]:
+    """Compile every node of ``scenes`` and return all plans in one payload."""
+    plans: List[Dict[str, Any]] = []
+    directives = 0
+    hits = 0
+    for scene_id, node_id, fragment, count, cached in iter_timeline_fragments(
+        scenes, memo=memo
+    ):
+        plans.append(
+            {"scene_id": scene_id, "node_id": node_id, "plan": json.loads(fragment)}
+        )
+        directives += count
+        hits += int(cached)
+    return {
+        "plans": plans,
+        "meta": {"nodes": len(plans), "count": directives, "cache_hits": hits},
+    }
+
+
+def iter_timeline_ndjson(
+    scenes: Iterable[TimelineScene],
+    *,
+    memo: Optional[PlanMemo] = None,
+) -> Iterator[str]:
+    """
+    Stream one JSON line per node followed by a ``{"done": true}`` summary.
+
+    Lines splice the cached plan fragment directly, so memo hits cost no
+    re-encoding.
+    """
+    nodes = 0
+    directives = 0
+    hits = 0
+    for scene_id, node_id, fragment, count, cached in iter_timeline_fragments(
+        scenes, memo=memo
+    ):
+        nodes += 1
+        directives += count
+        hits += int(cached)
+        yield (
+            '{"scene_id":'
+            + json.dumps(scene_id, ensure_ascii=False)
+            + ',"node_id":'
+            + json.dumps(node_id, ensure_ascii=False)
+            + ',"plan":'
+            + fragment
+            + "}\n"
+        )
+    summary = {"done": True, "nodes": nodes, "count": directives, "cache_hits": hits}
+    yield json.dumps(summary, separators=(",", ":")) + "\n"
+
+
+__all__ = [
+    "DEFAULT_MEMO_SIZE",
+    "PLAN_MEMO",
+    "PlanMemo",
+    "StatePatch",
+    "TimelineScene",
+    "apply_patch",
+    "compile_timeline",
+    "iter_timeline_fragments",
+    "iter_timeline_ndjson",
+    "node_fingerprint",
+    "state_fingerprint",
+]
@@ -3,10 +3,12 @@ from __future__ import annotations
 import ast
 import hashlib
 import json
+import operator
 import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 POSE_ANCHORS: Dict[str, Dict[str, float]] = {
     "face_forehead": {"x": 0.5, "y": 0.16},
@@ -180,84 +182,127 @@ class _EnsuredProp:
     alpha_mode: str
 
 
-class _ConditionEvaluator(ast.NodeVisitor):
-    """Deterministic, safe evaluator for simple boolean expressions."""
+_COMPARATORS: Dict[type, Callable[[Any, Any], bool]] = {
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
 
-    def __init__(self, context: Mapping[str, Any], allowed_names: Iterable[str]):
-        self._context = context
-        self._allowed: Tuple[str, ...] = tuple(dict.fromkeys(allowed_names))
+CONDITION_CACHE_SIZE = 1024
 
-    # pylint: disable=missing-docstring, invalid-name
-    def visit_Expression(self, node: ast.Expression) -> bool:  # type: ignore[override]
-        return bool(self.visit(node.body))
+_Evaluator = Callable[[Mapping[str, Any]], Any]
+
+
+def _coerce_operand(value: Any) -> Any:
+    if isinstance(value, (int, float, bool)):
+        return float(value)
+    return value
+
+
+class _ConditionCompiler(ast.NodeVisitor):
+    """Compile simple boolean expressions into closures over a context mapping.
+
+    Validation happens once here: unsupported nodes or operators raise
+    ``ValueError`` at compile time, so the closures only look up names and
+    compare values.
+    """
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
 
-    def visit_BoolOp(self, node: ast.BoolOp) -> bool:  # type: ignore[override]
-        values = [bool(self.visit(value)) for value in node.values]
+    # pylint: disable=missing-docstring, invalid-name
+    def visit_Expression(self, node: ast.Expression) -> _Evaluator:  # type: ignore[override]
+        body = self.visit(node.body)
+        return lambda context: bool(body(context))
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> _Evaluator:  # type: ignore[override]
+        values = tuple(self.visit(value) for value in node.values)
+        # Every operand is evaluated (no short-circuit) so comparison errors
+        # surface regardless of operand order.
         if isinstance(node.op, ast.And):
-            return all(values)
+            return lambda context: all([bool(value(context)) for value in values])
         if isinstance(node.op, ast.Or):
-            return any(values)
+            return lambda context: any([bool(value(context)) for value in values])
         raise ValueError("unsupported boolean operator")
 
-    def visit_UnaryOp(self, node: ast.UnaryOp) -> bool:  # type: ignore[override]
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> _Evaluator:  # type: ignore[override]
         if isinstance(node.op, ast.Not):
-            return not bool(self.visit(node.operand))
+            operand = self.visit(node.operand)
+            return lambda context: not bool(operand(context))
         raise ValueError("unsupported unary operator")
 
-    def visit_Compare(self, node: ast.Compare) -> bool:  # type: ignore[override]
+    def visit_Compare(self, node: ast.Compare) -> _Evaluator:  # type: ignore[override]
         if len(node.ops) != len(node.comparators):
             raise ValueError("malformed comparison expression")
         left = self.visit(node.left)
+        steps: List[Tuple[Callable[[Any, Any], bool], _Evaluator]] = []
         for op, comparator in zip(node.ops, node.comparators):
-            right = self.visit(comparator)
-            left_val = self._coerce(left)
-            right_val = self._coerce(right)
-            if isinstance(op, ast.Gt):
-                ok = left_val > right_val
-            elif isinstance(op, ast.GtE):
-                ok = left_val >= right_val
-            elif isinstance(op, ast.Lt):
-                ok = left_val < right_val
-            elif isinstance(op, ast.LtE):
-                ok = left_val <= right_val
-            elif isinstance(op, ast.Eq):
-                ok = left_val == right_val
-            elif isinstance(op, ast.NotEq):
-                ok = left_val != right_val
-            else:
+            compare = _COMPARATORS.get(type(op))
+            if compare is None:
                 raise ValueError("unsupported comparison operator")
-            if not ok:
-                return False
-            left = right
-        return True
-
-    def visit_Name(self, node: ast.Name) -> Any:  # type: ignore[override]
-        if node.id not in self._allowed:
-            raise ValueError(f"unsupported condition variable '{node.id}'")
-        return self._context.get(node.id, None)
-
-    def visit_Constant(self, node: ast.Constant) -> Any:  # type: ignore[override]
-        return node.value
+            steps.append((compare, self.visit(comparator)))
+        chain = tuple(steps)
+
+        def evaluate(context: Mapping[str, Any]) -> bool:
+            left_val = _coerce_operand(left(context))
+            for compare, right in chain:
+                right_val = _coerce_operand(right(context))
+                if not compare(left_val, right_val):
+                    return False
+                left_val = right_val
+            return True
+
+        return evaluate
+
+    def visit_Name(self, node: ast.Name) -> _Evaluator:  # type: ignore[override]
+        name = node.id
+        if name not in self.names:
+            self.names.append(name)
+        return lambda context: context.get(name, None)
+
+    def visit_Constant(self, node: ast.Constant) -> _Evaluator:  # type: ignore[override]
+        value = node.value
+        return lambda context: value
 
     def generic_visit(self, node: ast.AST) -> Any:  # type: ignore[override]
         raise ValueError(f"unsupported expression node: {type(node).__name__}")
 
-    @staticmethod
-    def _coerce(value: Any) -> Any:
-        if isinstance(value, (int, float, bool)):
-            return float(value)
-        return value
 
+@dataclass(frozen=True, slots=True)
+class _CompiledCondition:
+    expression: str
+    names: Tuple[str, ...]
+    evaluate: _Evaluator
 
-def _evaluate_condition(
-    expression: str, context: Mapping[str, Any], allowed_names: Iterable[str]
-) -> bool:
+    def __call__(
+        self, context: Mapping[str, Any], allowed_names: Iterable[str]
+    ) -> bool:
+        if not isinstance(allowed_names, (tuple, list, set, frozenset)):
+            allowed_names = tuple(allowed_names)
+        for name in self.names:
+            if name not in allowed_names:
+                raise ValueError(f"unsupported condition variable '{name}'")
+        return bool(self.evaluate(context))
+
+
+@lru_cache(maxsize=CONDITION_CACHE_SIZE)
+def _compile_condition(expression: str) -> _CompiledCondition:
     try:
         tree = ast.parse(expression, mode="eval")
     except SyntaxError as exc:
         raise ValueError(f"invalid condition '{expression}'") from exc
-    evaluator = _ConditionEvaluator(context, allowed_names)
-    return bool(evaluator.visit(tree))
+    compiler = _ConditionCompiler()
+    evaluate = compiler.visit(tree)
+    return _CompiledCondition(expression, tuple(compiler.names), evaluate)
+
+
+def _evaluate_condition(
+    expression: str, context: Mapping[str, Any], allowed_names: Iterable[str]
+) -> bool:
+    return _compile_condition(expression)(context, allowed_names)
 
 
 def _build_context(
@@ -550,6 +595,43 @@ class PropManager:
             response["thumbnail"] = None
         return response
 
+    def evaluate_conditions(
+        self,
+        conditions: Mapping[Any, Optional[Iterable[str] | str]],
+        state: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Resolve visibility for many props against one state in a single pass.
+
+        ``conditions`` maps prop ids to the same expression input accepted by
+        `apply_prop`.  The context is built once and each distinct expression
+        is evaluated once, however many props share it.
+        """
+        with self._lock:
+            allowed_names = tuple(self._condition_whitelist)
+        context = _build_context(state, allowed_names)
+        results: Dict[str, bool] = {}
+        props: Dict[str, Dict[str, Any]] = {}
+        for prop_id, raw in conditions.items():
+            prop_key = _coerce_prop_id(prop_id)
+            condition_list = _normalise_conditions(raw)
+            evaluations: Dict[str, bool] = {}
+            for expression in condition_list:
+                outcome = results.get(expression)
+                if outcome is None:
+                    outcome = _evaluate_condition(expression, context, allowed_names)
+                    results[expression] = outcome
+                evaluations[expression] = outcome
+            props[prop_key] = {
+                "visible": all(evaluations.values()) if evaluations else True,
+                "evaluations": evaluations,
+            }
+        return {
+            "props": props,
+            "visible": sorted(key for key, entry in props.items() if entry["visible"]),
+            "context": {key: context[key] for key in sorted(context)},
+        }
+
     def clear(self) -> None:
         with self._lock:
             self._props.clear()
@@ -558,6 +640,7 @@ class PropManager:
 
 __all__ = [
     "ANCHORS",
+    "CONDITION_CACHE_SIZE",
     "Z_ORDER_VALUES",
     "DEFAULT_TWEEN",
     "PropManager",
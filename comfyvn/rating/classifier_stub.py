@@ -11,6 +11,7 @@ request gating decisions that respect the current SFW mode.
 
 import json
 import logging
+import re
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -19,6 +20,7 @@ from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from comfyvn.config import feature_flags
 from comfyvn.config.runtime_paths import config_dir
+from comfyvn.core.term_matcher import TermMatcher, compile_terms
 
 LOGGER = logging.getLogger("comfyvn.rating")
 
@@ -111,10 +113,26 @@ RATING_MATRIX: Dict[str, Dict[str, Sequence[str]]] = {
 }
 
 
+# Everything ``str.isalnum`` rejects except ``+``/``#``; ``\w`` also admits "_".
+_TOKEN_STRIP = re.compile(r"[^\w+#]|_")
+
+
 def _now() -> float:
     return time.time()
 
 
+def _rating_matcher() -> TermMatcher:
+    """Whole-token matcher over ``RATING_MATRIX``; recompiled when it changes."""
+    return compile_terms(
+        {
+            f"{rating}:{category}": rule.get(f"{category}s") or ()
+            for rating, rule in RATING_MATRIX.items()
+            for category in ("keyword", "tag")
+        },
+        whole_tokens=True,
+    )
+
+
 def _normalize_tokens(payload: Mapping[str, Any] | None) -> Tuple[set[str], set[str]]:
     text_tokens: set[str] = set()
     tag_tokens: set[str] = set()
@@ -125,10 +143,8 @@ def _normalize_tokens(payload: Mapping[str, Any] | None) -> Tuple[set[str], set[
     def _push_text(value: Any) -> None:
         if isinstance(value, str):
             lowered = value.lower()
-            for token in lowered.replace("\n", " ").replace("\t", " ").split():
-                cleaned = "".join(
-                    ch for ch in token if ch.isalnum() or ch in {"+", "#"}
-                )
+            for token in lowered.split():
+                cleaned = _TOKEN_STRIP.sub("", token)
                 if cleaned:
                     text_tokens.add(cleaned)
 
@@ -403,10 +419,14 @@ class RatingClassifier:
         confidence = 0.55
         reasons: List[str] = []
 
+        matcher = _rating_matcher()
+        found = matcher.matched_terms(" ".join(text_tokens))
+        found.update(tag for tag in tag_tokens if tag in matcher)
+
         def _match(rule_rating: str, category: str, candidates: Iterable[str]) -> None:
             for candidate in candidates:
                 lower = candidate.lower()
-                if lower in text_tokens or lower in tag_tokens:
+                if lower in found:
                     matched.setdefault(rule_rating, []).append(f"{category}:{lower}")
 
         for rating, rule in RATING_MATRIX.items():
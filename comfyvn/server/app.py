@@ -3,22 +3,38 @@ ComfyVN FastAPI entrypoint.
 
 Provides a ``create_app`` factory that configures logging, CORS, core routes,
 and dynamically loads all available API routers under ``comfyvn.server.modules``.
+
+Router loading honours ``COMFYVN_ROUTER_MODE``:
+
+* ``eager`` (default) imports and mounts every router inside ``create_app``.
+* ``warmup`` mounts the builtin/priority routers immediately and imports the
+  rest in parallel once the server has started.
+* ``lazy`` mounts the rest on the first request under one of their path
+  prefixes, using the manifest written by :func:`write_route_manifest`.
+
+Every mode records per-module import times on ``app.state.router_import_times``
+and logs the slowest imports.
 """
 
 from __future__ import annotations
 
+import asyncio
 import importlib
+import json
 import logging
 import os
 import pkgutil
 import threading
+import time
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence, Set, Tuple
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.routing import APIRoute
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute, APIWebSocketRoute
 
 from comfyvn.config import ports as ports_config
 from comfyvn.config.baseurl_authority import find_open_port
@@ -29,7 +45,7 @@ from comfyvn.obs.telemetry import get_telemetry
 from comfyvn.server.core.errors import register_exception_handlers
 from comfyvn.server.core.event_stream import AsyncEventHub
 from comfyvn.server.core.middleware_ex import RequestIDMiddleware, TimingMiddleware
-from comfyvn.server.system_metrics import collect_system_metrics
+from comfyvn.server.system_metrics import collect_system_metrics, iter_metrics_sse
 
 try:
     import orjson as _orjson  # type: ignore
@@ -57,6 +73,15 @@ DEFAULT_ALLOWED_ORIGINS: tuple[str, ...] = (
     "http://localhost:5173",
 )
 DEFAULT_LOG_PATH = Path("./logs/server.log").resolve()
+ROUTER_MODE_ENV = "COMFYVN_ROUTER_MODE"
+ROUTER_MODES: tuple[str, ...] = ("eager", "warmup", "lazy")
+ROUTE_MANIFEST_ENV = "COMFYVN_ROUTE_MANIFEST"
+DEFAULT_ROUTE_MANIFEST = Path("./cache/route_manifest.json")
+IMPORT_REPORT_ENV = "COMFYVN_IMPORT_REPORT"
+IMPORT_REPORT_TOP = 10
+WARMUP_IMPORT_WORKERS = 8
+# Requests that describe the whole API mount every deferred router first.
+CATALOG_PATHS = frozenset({"/status", "/openapi.json", "/docs", "/redoc"})
 PRIORITY_MODULES: tuple[str, ...] = (
     "comfyvn.server.modules.system_api",
     "comfyvn.server.modules.settings_api",
@@ -235,6 +260,123 @@ def _collect_route_signatures(routes: Iterable[Any]) -> Set[Tuple[str, str]]:
     return signatures
 
 
+def _route_signature_index(app: FastAPI) -> Set[Tuple[str, str]]:
+    """
+    Return the app's running set of mounted ``(path, method)`` signatures.
+
+    Kept on ``app.state`` and extended as routers are included so collision
+    checks cost O(router size) rather than rescanning every mounted route.  The
+    set picks up routes added behind its back (``app.get`` etc.) whenever the
+    route count moved.
+    """
+
+    index = getattr(app.state, "route_signatures", None)
+    if index is None:
+        index = app.state.route_signatures = set()
+        app.state.route_signature_count = -1
+    if app.state.route_signature_count != len(app.routes):
+        index.update(_collect_route_signatures(app.routes))
+        app.state.route_signature_count = len(app.routes)
+    return index
+
+
+def _index_routes(
+    app: FastAPI, index: Set[Tuple[str, str]], added: Set[Tuple[str, str]]
+) -> None:
+    index.update(added)
+    app.state.route_signature_count = len(app.routes)
+
+
+def _route_prefixes(routes: Iterable[Any]) -> list[str]:
+    prefixes: set[str] = set()
+    for route in routes:
+        if not isinstance(route, (APIRoute, APIWebSocketRoute)):
+            continue
+        path = str(route.path)
+        prefixes.add(path.split("{", 1)[0] or "/")
+    return sorted(prefixes)
+
+
+def _prefix_matches(path: str, prefix: str) -> bool:
+    return path.startswith(prefix) or path == prefix.rstrip("/")
+
+
+def _timed_import(module_name: str, timings: Optional[dict[str, float]]) -> Any:
+    started = time.perf_counter()
+    try:
+        return importlib.import_module(module_name)
+    finally:
+        if timings is not None and module_name not in timings:
+            timings[module_name] = time.perf_counter() - started
+
+
+def _resolve_router_mode(mode: Optional[str] = None) -> str:
+    value = (mode or os.getenv(ROUTER_MODE_ENV) or "eager").strip().lower()
+    if value not in ROUTER_MODES:
+        LOGGER.warning("Unknown %s=%r; using eager", ROUTER_MODE_ENV, value)
+        return "eager"
+    return value
+
+
+def _route_manifest_path() -> Path:
+    override = os.getenv(ROUTE_MANIFEST_ENV, "").strip()
+    return Path(override).expanduser() if override else DEFAULT_ROUTE_MANIFEST
+
+
+def _load_route_manifest(path: Path) -> Optional[dict[str, list[str]]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        LOGGER.warning("Ignoring unreadable route manifest %s: %s", path, exc)
+        return None
+    modules = payload.get("modules") if isinstance(payload, dict) else None
+    if not isinstance(modules, dict):
+        return None
+    return {
+        str(name): [str(prefix) for prefix in prefixes or ()]
+        for name, prefixes in modules.items()
+    }
+
+
+def _log_import_report(app: FastAPI, *, phase: str) -> None:
+    timings: dict[str, float] = app.state.router_import_times
+    if not timings:
+        return
+    slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)
+    LOGGER.info(
+        "Router imports (%s): %d modules in %.1f ms; slowest: %s",
+        phase,
+        len(timings),
+        sum(timings.values()) * 1000.0,
+        ", ".join(
+            f"{name}={seconds * 1000.0:.1f}ms"
+            for name, seconds in slowest[:IMPORT_REPORT_TOP]
+        ),
+    )
+    report_path = os.getenv(IMPORT_REPORT_ENV, "").strip()
+    if report_path:
+        try:
+            target = Path(report_path).expanduser()
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(
+                json.dumps(
+                    {
+                        "phase": phase,
+                        "modules": {
+                            name: round(seconds * 1000.0, 3)
+                            for name, seconds in slowest
+                        },
+                    },
+                    indent=2,
+                ),
+                encoding="utf-8",
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            LOGGER.debug("Failed to write import report %s: %s", report_path, exc)
+
+
 def _configure_logging() -> tuple[Path, str]:
     level = os.getenv("LOG_LEVEL") or os.getenv("COMFYVN_LOG_LEVEL", "INFO")
     log_dir_env = os.getenv("LOG_DIR")
@@ -261,8 +403,9 @@ def _include_router_module(
 ) -> None:
     if module_name in seen:
         return
+    timings = getattr(app.state, "router_import_times", None)
     try:
-        module = importlib.import_module(module_name)
+        module = _timed_import(module_name, timings)
     except Exception as exc:
         LOGGER.warning("Skipping router %s (import failed: %s)", module_name, exc)
         return
@@ -272,7 +415,7 @@ def _include_router_module(
     router_routes = getattr(router, "routes", None)
     if not router_routes:
         return
-    existing_signatures = _collect_route_signatures(app.routes)
+    existing_signatures = _route_signature_index(app)
     router_signatures = _collect_route_signatures(router_routes)
     collisions = router_signatures.intersection(existing_signatures)
     if collisions:
@@ -284,9 +427,13 @@ def _include_router_module(
         return
     try:
         app.include_router(router)
+        _index_routes(app, existing_signatures, router_signatures)
         seen.add(module_name)
         if registry is not None:
             registry.append(module_name)
+        prefixes = getattr(app.state, "router_prefixes", None)
+        if prefixes is not None:
+            prefixes[module_name] = _route_prefixes(router_routes)
         LOGGER.debug(
             "Included router: %s (prefix=%s)",
             module_name,
@@ -321,6 +468,13 @@ def _iter_module_names(
     yield from _walk([str(base_path)], f"{package}.")
 
 
+def _discovered_router_modules() -> list[str]:
+    names = [*PRIORITY_MODULES]
+    names.extend(_iter_module_names(MODULE_PATH, MODULE_PACKAGE))
+    names.extend(_iter_module_names(ROUTES_PATH, ROUTES_PACKAGE))
+    return list(dict.fromkeys(names))
+
+
 def _include_routers(
     app: FastAPI,
     *,
@@ -328,20 +482,146 @@ def _include_routers(
     registry: Optional[list[str]] = None,
 ) -> None:
     seen = set(seen or ())
-    for module_name in PRIORITY_MODULES:
-        _include_router_module(app, module_name, seen=seen, registry=registry)
-    for module_name in _iter_module_names(MODULE_PATH, MODULE_PACKAGE):
-        _include_router_module(app, module_name, seen=seen, registry=registry)
-    for module_name in _iter_module_names(ROUTES_PATH, ROUTES_PACKAGE):
+    for module_name in _discovered_router_modules():
         _include_router_module(app, module_name, seen=seen, registry=registry)
 
 
+class _DeferredRouters:
+    """
+    Routers left out of ``create_app`` in ``warmup``/``lazy`` mode.
+
+    Imports run in worker threads (in parallel for batches); ``include_router``
+    always happens on the event loop, in discovery order, so collision winners
+    match an eager start.  Modules the manifest maps to path prefixes are
+    mounted on the first request under those prefixes.
+    """
+
+    def __init__(
+        self,
+        app: FastAPI,
+        modules: Sequence[str],
+        *,
+        seen: Set[str],
+        manifest: Optional[dict[str, list[str]]] = None,
+    ) -> None:
+        self.app = app
+        self.seen = seen
+        self.order = {name: index for index, name in enumerate(modules)}
+        self.pending: dict[str, list[str]] = {
+            name: list((manifest or {}).get(name) or ()) for name in modules
+        }
+        self.fallback_routes: list[Any] = []
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _import_parallel(self, names: Sequence[str]) -> None:
+        timings = self.app.state.router_import_times
+
+        def _load(name: str) -> None:
+            try:
+                _timed_import(name, timings)
+            except Exception:
+                # Re-raised (and logged) by the serial include that follows.
+                timings.pop(name, None)
+
+        if len(names) == 1:
+            _load(names[0])
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(WARMUP_IMPORT_WORKERS, len(names)),
+            thread_name_prefix="router-import",
+        ) as pool:
+            list(pool.map(_load, names))
+
+    def _mount(self, names: Sequence[str]) -> None:
+        for name in sorted(names, key=self.order.__getitem__):
+            if self.pending.pop(name, None) is None:
+                continue
+            _include_router_module(
+                self.app,
+                name,
+                seen=self.seen,
+                registry=self.app.state.router_catalog,
+            )
+        routes = self.app.router.routes
+        for route in self.fallback_routes:
+            if route in routes:
+                routes.remove(route)
+                routes.append(route)
+        self.app.state.route_signature_count = len(self.app.routes)
+        self.app.openapi_schema = None
+
+    def matching(self, path: str) -> list[str]:
+        if path in CATALOG_PATHS:
+            return list(self.pending)
+        return [
+            name
+            for name, prefixes in self.pending.items()
+            if any(_prefix_matches(path, prefix) for prefix in prefixes)
+        ]
+
+    async def load(self, names: Sequence[str]) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            names = [name for name in names if name in self.pending]
+            if not names:
+                return
+            await asyncio.to_thread(self._import_parallel, names)
+            self._mount(names)
+
+    async def warm_all(self) -> None:
+        await self.load(list(self.pending))
+        _log_import_report(self.app, phase="warmup")
+
+
+class _LazyRouterMiddleware:
+    """ASGI middleware mounting deferred routers before routing a request."""
+
+    def __init__(self, app: Any, deferred: _DeferredRouters) -> None:
+        self.app = app
+        self.deferred = deferred
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope.get("type") in {"http", "websocket"} and self.deferred.pending:
+            names = self.deferred.matching(str(scope.get("path") or ""))
+            if names:
+                await self.deferred.load(names)
+        await self.app(scope, receive, send)
+
+
+def write_route_manifest(path: Optional[Path] = None) -> Path:
+    """
+    Build an eager app and record the path prefixes each router serves.
+
+    ``lazy`` mode reads this file to decide which module to import for an
+    incoming request; regenerate it whenever routers are added or moved.
+    """
+
+    target = Path(path) if path is not None else _route_manifest_path()
+    app = create_app(enable_cors=False, router_mode="eager")
+    builtin = {name.split(":", 1)[0] for name, _ in BUILTIN_ROUTERS}
+    modules = {
+        name: prefixes
+        for name, prefixes in app.state.router_prefixes.items()
+        if name not in builtin
+    }
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(
+        json.dumps({"version": 1, "modules": modules}, indent=2, sort_keys=True),
+        encoding="utf-8",
+    )
+    LOGGER.info("Route manifest written: %s (%d modules)", target, len(modules))
+    return target
+
+
 def include_builtin_routers(app: FastAPI) -> tuple[list[str], Set[str]]:
     registry: list[str] = []
     seen: Set[str] = set()
+    existing_signatures = _route_signature_index(app)
+    timings = getattr(app.state, "router_import_times", None)
     for module_name, attr_names in BUILTIN_ROUTERS:
         try:
-            module = importlib.import_module(module_name)
+            module = _timed_import(module_name, timings)
         except Exception as exc:
             LOGGER.warning(
                 "Skipping builtin router %s (import failed: %s)", module_name, exc
@@ -354,7 +634,6 @@ def include_builtin_routers(app: FastAPI) -> tuple[list[str], Set[str]]:
             router_routes = getattr(router, "routes", None)
             if not router_routes:
                 continue
-            existing_signatures = _collect_route_signatures(app.routes)
             router_signatures = _collect_route_signatures(router_routes)
             collisions = router_signatures.intersection(existing_signatures)
             if collisions:
@@ -367,6 +646,7 @@ def include_builtin_routers(app: FastAPI) -> tuple[list[str], Set[str]]:
                 continue
             try:
                 app.include_router(router)
+                _index_routes(app, existing_signatures, router_signatures)
                 registry.append(f"{module_name}:{attr_name}")
             except Exception as exc:
                 LOGGER.warning(
@@ -404,7 +684,10 @@ def _resolve_cors_origins(allowed_origins: Optional[Sequence[str]]) -> list[str]
 
 
 def create_app(
-    *, enable_cors: bool = True, allowed_origins: Optional[Sequence[str]] = None
+    *,
+    enable_cors: bool = True,
+    allowed_origins: Optional[Sequence[str]] = None,
+    router_mode: Optional[str] = None,
 ) -> FastAPI:
     """Application factory used by both CLI launches and ASGI servers."""
     install_sys_hook()
@@ -426,6 +709,9 @@ def create_app(
     app.state.bind_host = bind_host
     app.state.active_port = active_port
     app.state.router_catalog: list[str] = []
+    app.state.router_import_times: dict[str, float] = {}
+    app.state.router_prefixes: dict[str, list[str]] = {}
+    app.state.router_mode = _resolve_router_mode(router_mode)
 
     global _LOGGED_BASE
     if not _LOGGED_BASE:
@@ -466,10 +752,37 @@ def create_app(
     builtin_registry, preloaded_modules = include_builtin_routers(app)
     app.state.router_catalog.extend(builtin_registry)
 
-    _include_routers(
-        app, seen=set(preloaded_modules), registry=app.state.router_catalog
-    )
+    app.state.deferred_routers = None
+    if app.state.router_mode == "eager":
+        _include_routers(
+            app, seen=set(preloaded_modules), registry=app.state.router_catalog
+        )
+        _log_import_report(app, phase="startup")
+    else:
+        seen = set(preloaded_modules)
+        for module_name in PRIORITY_MODULES:
+            _include_router_module(
+                app, module_name, seen=seen, registry=app.state.router_catalog
+            )
+        manifest = _load_route_manifest(_route_manifest_path())
+        remaining = [name for name in _discovered_router_modules() if name not in seen]
+        deferred = _DeferredRouters(app, remaining, seen=seen, manifest=manifest)
+        app.state.deferred_routers = deferred
+        if manifest is not None:
+            app.add_middleware(_LazyRouterMiddleware, deferred=deferred)
+        _log_import_report(app, phase="startup")
+        if app.state.router_mode == "warmup" or manifest is None:
+            if manifest is None and app.state.router_mode == "lazy":
+                LOGGER.info(
+                    "No route manifest at %s; warming routers after startup",
+                    _route_manifest_path(),
+                )
+
+            @app.on_event("startup")
+            async def _warm_routers() -> None:
+                app.state.router_warmup = asyncio.create_task(deferred.warm_all())
 
+    core_start = len(app.routes)
     if not _route_exists(app, "/health", {"GET"}):
 
         @app.get("/health", tags=["System"], summary="Simple health probe")
@@ -503,8 +816,31 @@ def create_app(
             tags=["System"],
             summary="System metrics snapshot",
         )
-        async def core_metrics():
-            return collect_system_metrics()
+        async def core_metrics(window: float | None = None):
+            if window is not None:
+                window = min(max(window, 1.0), 86400.0)
+            return collect_system_metrics(window=window)
+
+    if not _route_exists(app, "/system/metrics/stream", {"GET"}):
+
+        @app.get(
+            "/system/metrics/stream",
+            tags=["System"],
+            summary="Server-sent system metrics feed",
+        )
+        async def core_metrics_stream(interval: float = 2.0, limit: int | None = None):
+            interval = min(max(interval, 0.25), 60.0)
+            return StreamingResponse(
+                iter_metrics_sse(interval, limit=limit),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache"},
+            )
+
+    if app.state.deferred_routers is not None:
+        # Core routes are fallbacks: deferred routers must neither collide with
+        # them nor be shadowed by them, exactly as when they mount eagerly.
+        app.state.deferred_routers.fallback_routes = list(app.routes[core_start:])
+        app.state.route_signature_count = len(app.routes)
 
     LOGGER.info(
         "FastAPI application ready",
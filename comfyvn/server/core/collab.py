@@ -6,7 +6,7 @@ from typing import Any, Dict
 
 from comfyvn.collab import CollabClientState, CollabHub
 from comfyvn.config.feature_flags import load_feature_flags
-from comfyvn.server.core.storage import scene_load, scene_save
+from comfyvn.server.core.storage import scene_load, scene_oplog_path, scene_save
 
 LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +23,7 @@ HUB = CollabHub(
     loader=_loader,
     saver=_saver,
     feature_flags=load_feature_flags(),
+    oplog_path=scene_oplog_path,
 )
 
 
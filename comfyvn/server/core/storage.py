@@ -16,6 +16,11 @@ def _path(scene_id: str) -> Path:
     return _ROOT / f"{scene_id}.json"
 
 
+def scene_oplog_path(scene_id: str) -> Path:
+    """Append-only collab operation log that sits next to the scene file."""
+    return _ROOT / "_oplog" / f"{scene_id}.jsonl"
+
+
 def _lock(scene_id: str) -> threading.Lock:
     with _GUARD:
         _LOCKS.setdefault(scene_id, threading.Lock())
@@ -103,6 +108,10 @@ def scene_save(
             new["nodes"] = scene["nodes"]
         if isinstance(scene.get("order"), list):
             new["order"] = scene["order"]
+        if isinstance(scene.get("sequence"), dict):
+            new["sequence"] = scene["sequence"]
+        if scene.get("oplog_seq") is not None:
+            new["oplog_seq"] = scene["oplog_seq"]
         if isinstance(scene.get("meta"), dict):
             new["meta"] = scene["meta"]
 
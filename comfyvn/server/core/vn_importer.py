@@ -9,9 +9,12 @@ import shutil
 import tempfile
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
 
 from comfyvn.core.file_importer import FileImporter, log_license_issues
 from comfyvn.core.normalizer import NormalizerResult, normalize_tree
@@ -25,6 +28,13 @@ from comfyvn.server.core.translation_pipeline import (
 
 logger = logging.getLogger(__name__)
 _ALLOWED_ROOTS = {"scenes", "characters", "assets", "timelines", "licenses"}
+# JSON members parsed in memory, keyed by package root -> log label.
+_JSON_HEADS = {"scenes": "scene", "characters": "character", "timelines": "timeline"}
+# Binary members are streamed in chunks of this size instead of read whole.
+COPY_CHUNK_SIZE = 1 << 20
+DEFAULT_IMPORT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+ProgressCallback = Callable[[Dict[str, object]], None]
 
 
 class VNImportError(RuntimeError):
@@ -228,19 +238,56 @@ def _disallow_overwrite(dest: Path, *, warnings: List[str]) -> bool:
     return False
 
 
-def _entries_from_zip(package_path: Path) -> List[tuple[str, bytes]]:
-    entries: List[tuple[str, bytes]] = []
-    with zipfile.ZipFile(package_path, "r") as archive:
-        for member in archive.infolist():
-            if member.is_dir():
-                continue
-            entries.append((member.filename, archive.read(member)))
-    return entries
+@dataclass
+class _ArchiveMember:
+    """A package member that is only read when it is staged."""
+
+    name: str
+    size: int
+    open: Callable[[], BinaryIO]
+    path: Optional[Path] = None  # extractor output already on disk
+
+
+@dataclass
+class _ImportTargets:
+    scenes: Path
+    characters: Path
+    timelines: Path
+    assets: Path
+    licenses: Path
+    manifest: Path
+
+
+@dataclass
+class _MemberPlan:
+    index: int
+    member: _ArchiveMember
+    safe_rel: Path
+    stage_path: Path
+    normalised: Optional[Path]
+    dest: Optional[Path]
 
 
-def _entries_from_extractor(
+@dataclass
+class _MemberOutcome:
+    index: int
+    warnings: List[str] = field(default_factory=list)
+    manifest: Optional[Dict[str, object]] = None
+    kind: Optional[str] = None
+    value: Optional[str] = None
+
+
+def _iter_zip_members(archive: zipfile.ZipFile) -> Iterator[_ArchiveMember]:
+    for info in archive.infolist():
+        if info.is_dir():
+            continue
+        yield _ArchiveMember(info.filename, info.file_size, partial(archive.open, info))
+
+
+@contextmanager
+def _extractor_members(
     tool_name: str, package_path: Path
-) -> tuple[List[tuple[str, bytes]], str, Optional[str]]:
+) -> Iterator[tuple[Iterator[_ArchiveMember], str, Optional[str]]]:
     tool = extractor_manager.get(tool_name)
     if not tool:
         raise VNImportError(f"extractor '{tool_name}' not registered")
@@ -252,37 +299,197 @@ def _entries_from_extractor(
         except Exception as exc:  # pragma: no cover - defensive
             raise VNImportError(f"extractor '{tool_name}' failed: {exc}") from exc
 
-        entries: List[tuple[str, bytes]] = []
-        for file_path in output_dir.rglob("*"):
-            if file_path.is_file():
-                rel = file_path.relative_to(output_dir).as_posix()
-                entries.append((rel, file_path.read_bytes()))
-    warning = tool.warning if tool.warning else None
-    return entries, tool.name, warning
+        members = (
+            _ArchiveMember(
+                file_path.relative_to(output_dir).as_posix(),
+                file_path.stat().st_size,
+                partial(file_path.open, "rb"),
+                file_path,
+            )
+            for file_path in output_dir.rglob("*")
+            if file_path.is_file()
+        )
+        warning = tool.warning if tool.warning else None
+        yield members, tool.name, warning
 
 
-def _gather_entries(
+@contextmanager
+def _open_members(
     package_path: Path, *, tool_hint: Optional[str] = None
-) -> tuple[List[tuple[str, bytes]], Optional[str], Optional[str]]:
+) -> Iterator[tuple[Iterator[_ArchiveMember], Optional[str], Optional[str]]]:
+    """Yield a lazy member iterator plus ``(extractor, warning)`` for a package."""
     if tool_hint:
-        return _entries_from_extractor(tool_hint, package_path)
+        with _extractor_members(tool_hint, package_path) as opened:
+            yield opened
+        return
     if zipfile.is_zipfile(package_path):
-        return _entries_from_zip(package_path), None, None
+        with zipfile.ZipFile(package_path, "r") as archive:
+            yield _iter_zip_members(archive), None, None
+        return
     tool = extractor_manager.resolve_for_extension(package_path.suffix)
     if tool:
-        entries, _, warning = _entries_from_extractor(tool.name, package_path)
-        return entries, tool.name, warning
+        with _extractor_members(tool.name, package_path) as (members, _, warning):
+            yield members, tool.name, warning
+        return
     raise VNImportError(f"unsupported package format: {package_path.suffix}")
 
 
+def _member_destination(
+    normalised: Path, safe_rel: Path, targets: _ImportTargets
+) -> Optional[Path]:
+    head = normalised.parts[0]
+    if head == "manifest.json":
+        return targets.manifest
+    if head in _JSON_HEADS:
+        rel = (
+            Path(*normalised.parts[1:])
+            if len(normalised.parts) > 1
+            else Path(safe_rel).with_suffix("")
+        )
+        dest = getattr(targets, head) / rel
+        if dest.suffix.lower() != ".json":
+            dest = dest.with_suffix(".json")
+        return dest
+    if head == "assets":
+        return targets.assets / Path(*normalised.parts[1:])
+    if head == "licenses":
+        rel = (
+            Path(*normalised.parts[1:]) if len(normalised.parts) > 1 else Path(safe_rel)
+        )
+        return targets.licenses / rel
+    return None
+
+
+def _stage_member(member: _ArchiveMember, stage_path: Path) -> None:
+    stage_path.parent.mkdir(parents=True, exist_ok=True)
+    if member.path is not None:
+        shutil.move(str(member.path), stage_path)
+        return
+    with member.open() as source, stage_path.open("wb") as target:
+        shutil.copyfileobj(source, target, COPY_CHUNK_SIZE)
+
+
+def _import_member(plan: _MemberPlan, *, overwrite: bool) -> _MemberOutcome:
+    """Stage one member and route it to its workspace destination."""
+    outcome = _MemberOutcome(plan.index)
+    warnings = outcome.warnings
+    safe_rel = plan.safe_rel
+    stage_path = plan.stage_path
+    _stage_member(plan.member, stage_path)
+
+    normalised = plan.normalised
+    if normalised is None:
+        warnings.append(f"ignored path: {safe_rel.as_posix()}")
+        logger.debug("Ignoring archive member %s", safe_rel)
+        return outcome
+
+    head = normalised.parts[0]
+    dest = plan.dest
+    if head == "manifest.json":
+        manifest = _load_json_bytes(
+            stage_path.read_bytes(), source=safe_rel.as_posix(), warnings=warnings
+        )
+        if manifest:
+            outcome.manifest = manifest
+            _write_json(dest, manifest)
+            logger.debug("Loaded manifest from %s", safe_rel)
+        return outcome
+
+    if dest is None:
+        warnings.append(f"unhandled member: {safe_rel.as_posix()}")
+        logger.debug("Unhandled archive member %s", safe_rel)
+        return outcome
+
+    if not overwrite and _disallow_overwrite(dest, warnings=warnings):
+        return outcome
+
+    if head in _JSON_HEADS:
+        data = _load_json_bytes(
+            stage_path.read_bytes(), source=str(normalised), warnings=warnings
+        )
+        if data is None:
+            return outcome
+        _write_json(dest, data)
+        outcome.kind = head
+        outcome.value = dest.stem
+        logger.debug("Imported %s %s -> %s", _JSON_HEADS[head], safe_rel, dest)
+        return outcome
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(stage_path, dest)
+    if head == "assets":
+        outcome.kind = head
+        outcome.value = str(Path(*normalised.parts[1:]))
+        logger.debug("Imported asset %s -> %s", outcome.value, dest)
+    else:
+        logger.debug("Stored license artifact %s -> %s", safe_rel, dest)
+    return outcome
+
+
+def _import_members(
+    groups: List[List[_MemberPlan]],
+    *,
+    overwrite: bool,
+    max_workers: int,
+    progress: Optional[ProgressCallback],
+) -> List[_MemberOutcome]:
+    """Import member groups in parallel; members sharing a path run in order."""
+    total = sum(len(group) for group in groups)
+    outcomes: List[_MemberOutcome] = []
+
+    def _run(group: List[_MemberPlan]) -> List[_MemberOutcome]:
+        return [_import_member(plan, overwrite=overwrite) for plan in group]
+
+    def _report(group: List[_MemberPlan]) -> None:
+        if progress is None:
+            return
+        first = len(outcomes) - len(group)
+        for offset, plan in enumerate(group, start=1):
+            completed = first + offset
+            try:
+                progress(
+                    {
+                        "member": plan.safe_rel.as_posix(),
+                        "bytes": plan.member.size,
+                        "completed": completed,
+                        "total": total,
+                    }
+                )
+            except Exception:  # pragma: no cover - defensive
+                logger.debug("VN import progress callback failed", exc_info=True)
+
+    if max_workers <= 1 or len(groups) <= 1:
+        for group in groups:
+            outcomes.extend(_run(group))
+            _report(group)
+        return outcomes
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="vn-import"
+    ) as pool:
+        futures = {pool.submit(_run, group): group for group in groups}
+        for future in as_completed(futures):
+            outcomes.extend(future.result())
+            _report(futures[future])
+    return outcomes
+
+
 def import_vn_package(
     package: str | Path,
     *,
     data_root: Optional[Path] = None,
     overwrite: bool = False,
     tool: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
 ) -> Dict[str, object]:
-    """Import a packaged VN archive (.cvnpack/.zip/.pak) into the workspace."""
+    """Import a packaged VN archive (.cvnpack/.zip/.pak) into the workspace.
+
+    Members are read lazily from the archive and streamed to the staging area,
+    so memory use does not grow with package size. Independent members are
+    imported on ``max_workers`` threads; ``progress`` receives one
+    ``{member, bytes, completed, total}`` payload per finished member.
+    """
 
     package_path = Path(package).expanduser().resolve()
     if not package_path.exists():
@@ -298,168 +505,79 @@ def import_vn_package(
     except FileNotFoundError as exc:  # pragma: no cover - defensive
         raise VNImportError(str(exc)) from exc
 
-    entries, extractor_name, extractor_warning = _gather_entries(
-        package_path, tool_hint=tool
-    )
-
-    summary = ImportSummary(
-        import_id=import_id, package_path=str(package_path), data_root=str(root)
-    )
-    summary.raw_path = session.raw_path.as_posix()
-    summary.extracted_path = session.extracted_dir.as_posix()
-    summary.converted_path = session.converted_dir.as_posix()
-
-    logger.info("Starting VN import '%s' from %s", import_id, package_path)
-
-    stage_root = session.extracted_dir
-    stage_root.mkdir(parents=True, exist_ok=True)
-
-    staged_entries: List[tuple[Path, Path]] = []
-    for raw_name, payload in entries:
-        safe_rel = _sanitize_member(raw_name)
-        if safe_rel is None:
-            summary.warnings.append(f"ignored unsafe member: {raw_name}")
-            logger.debug("Skipping unsafe archive member %s", raw_name)
-            continue
-        stage_path = stage_root / safe_rel
-        stage_path.parent.mkdir(parents=True, exist_ok=True)
-        stage_path.write_bytes(payload)
-        staged_entries.append((safe_rel, stage_path))
-
-    scenes_dir = root / "scenes"
-    characters_dir = root / "characters"
-    timelines_dir = root / "timelines"
-    assets_dir = root / "assets"
-    licenses_dir = session.converted_dir / "licenses"
-    manifest_path = session.manifest_path
-
-    seen_member_names: List[str] = []
-    original_manifest: Optional[Dict[str, object]] = None
-
-    for safe_rel, stage_path in staged_entries:
-        normalised = _normalise_member(safe_rel.as_posix())
-        if normalised is None:
-            summary.warnings.append(f"ignored path: {safe_rel.as_posix()}")
-            logger.debug("Ignoring archive member %s", safe_rel)
-            continue
-
-        head = normalised.parts[0]
-        seen_member_names.append(safe_rel.as_posix())
-
-        if head == "manifest.json":
-            manifest = _load_json_bytes(
-                stage_path.read_bytes(),
-                source=safe_rel.as_posix(),
-                warnings=summary.warnings,
-            )
-            if manifest:
-                original_manifest = manifest
-                summary.manifest = manifest
-                summary.licenses = (
-                    list(manifest.get("licenses", []))
-                    if isinstance(manifest.get("licenses"), list)
-                    else []
-                )
-                _write_json(manifest_path, manifest)
-                logger.debug("Loaded manifest from %s", safe_rel)
-            continue
-
-        if head == "scenes":
-            rel = (
-                Path(*normalised.parts[1:])
-                if len(normalised.parts) > 1
-                else Path(safe_rel).with_suffix("")
-            )
-            dest = scenes_dir / rel
-            if dest.suffix.lower() != ".json":
-                dest = dest.with_suffix(".json")
-            if not overwrite and _disallow_overwrite(dest, warnings=summary.warnings):
-                continue
-            data = _load_json_bytes(
-                stage_path.read_bytes(),
-                source=str(normalised),
-                warnings=summary.warnings,
-            )
-            if data is None:
-                continue
-            _write_json(dest, data)
-            summary.scenes.append(dest.stem)
-            logger.debug("Imported scene %s -> %s", rel, dest)
-            continue
-
-        if head == "characters":
-            rel = (
-                Path(*normalised.parts[1:])
-                if len(normalised.parts) > 1
-                else Path(safe_rel).with_suffix("")
-            )
-            dest = characters_dir / rel
-            if dest.suffix.lower() != ".json":
-                dest = dest.with_suffix(".json")
-            if not overwrite and _disallow_overwrite(dest, warnings=summary.warnings):
-                continue
-            data = _load_json_bytes(
-                stage_path.read_bytes(),
-                source=str(normalised),
-                warnings=summary.warnings,
-            )
-            if data is None:
-                continue
-            _write_json(dest, data)
-            summary.characters.append(dest.stem)
-            logger.debug("Imported character %s -> %s", rel, dest)
-            continue
-
-        if head == "timelines":
-            rel = (
-                Path(*normalised.parts[1:])
-                if len(normalised.parts) > 1
-                else Path(safe_rel).with_suffix("")
-            )
-            dest = timelines_dir / rel
-            if dest.suffix.lower() != ".json":
-                dest = dest.with_suffix(".json")
-            if not overwrite and _disallow_overwrite(dest, warnings=summary.warnings):
-                continue
-            data = _load_json_bytes(
-                stage_path.read_bytes(),
-                source=str(normalised),
-                warnings=summary.warnings,
-            )
-            if data is None:
-                continue
-            _write_json(dest, data)
-            summary.timelines.append(dest.stem)
-            logger.debug("Imported timeline %s -> %s", rel, dest)
-            continue
+    with _open_members(package_path, tool_hint=tool) as opened:
+        members, extractor_name, extractor_warning = opened
+        summary = ImportSummary(
+            import_id=import_id, package_path=str(package_path), data_root=str(root)
+        )
+        summary.raw_path = session.raw_path.as_posix()
+        summary.extracted_path = session.extracted_dir.as_posix()
+        summary.converted_path = session.converted_dir.as_posix()
+
+        logger.info("Starting VN import '%s' from %s", import_id, package_path)
+
+        stage_root = session.extracted_dir
+        stage_root.mkdir(parents=True, exist_ok=True)
+
+        scenes_dir = root / "scenes"
+        characters_dir = root / "characters"
+        timelines_dir = root / "timelines"
+        assets_dir = root / "assets"
+        targets = _ImportTargets(
+            scenes=scenes_dir,
+            characters=characters_dir,
+            timelines=timelines_dir,
+            assets=assets_dir,
+            licenses=session.converted_dir / "licenses",
+            manifest=session.manifest_path,
+        )
 
-        if head == "assets":
-            rel = Path(*normalised.parts[1:])
-            dest = assets_dir / rel
-            if not overwrite and _disallow_overwrite(dest, warnings=summary.warnings):
+        # Plan from member metadata only; members that share a stage or
+        # destination path are grouped so they keep archive order.
+        seen_member_names: List[str] = []
+        groups: Dict[Path, List[_MemberPlan]] = {}
+        for index, member in enumerate(members):
+            safe_rel = _sanitize_member(member.name)
+            if safe_rel is None:
+                summary.warnings.append(f"ignored unsafe member: {member.name}")
+                logger.debug("Skipping unsafe archive member %s", member.name)
                 continue
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(stage_path, dest)
-            summary.assets.append(str(rel))
-            logger.debug("Imported asset %s -> %s", rel, dest)
-            continue
+            stage_path = stage_root / safe_rel
+            normalised = _normalise_member(safe_rel.as_posix())
+            dest = None
+            if normalised is not None:
+                seen_member_names.append(safe_rel.as_posix())
+                dest = _member_destination(normalised, safe_rel, targets)
+            plan = _MemberPlan(index, member, safe_rel, stage_path, normalised, dest)
+            groups.setdefault(dest or stage_path, []).append(plan)
+
+        outcomes = _import_members(
+            list(groups.values()),
+            overwrite=overwrite,
+            max_workers=DEFAULT_IMPORT_WORKERS if max_workers is None else max_workers,
+            progress=progress,
+        )
 
-        if head == "licenses":
-            rel = (
-                Path(*normalised.parts[1:])
-                if len(normalised.parts) > 1
-                else Path(safe_rel)
+    original_manifest: Optional[Dict[str, object]] = None
+    collected: Dict[str, List[str]] = {
+        "scenes": summary.scenes,
+        "characters": summary.characters,
+        "timelines": summary.timelines,
+        "assets": summary.assets,
+    }
+    for outcome in sorted(outcomes, key=lambda item: item.index):
+        summary.warnings.extend(outcome.warnings)
+        if outcome.manifest:
+            manifest = outcome.manifest
+            original_manifest = manifest
+            summary.manifest = manifest
+            summary.licenses = (
+                list(manifest.get("licenses", []))
+                if isinstance(manifest.get("licenses"), list)
+                else []
             )
-            dest = licenses_dir / rel
-            if not overwrite and _disallow_overwrite(dest, warnings=summary.warnings):
-                continue
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(stage_path, dest)
-            logger.debug("Stored license artifact %s -> %s", rel, dest)
-            continue
-
-        summary.warnings.append(f"unhandled member: {safe_rel.as_posix()}")
-        logger.debug("Unhandled archive member %s", safe_rel)
+        if outcome.kind and outcome.value is not None:
+            collected[outcome.kind].append(outcome.value)
 
     summary.extractor = extractor_name
     if extractor_warning:
@@ -9,6 +9,7 @@ from typing import Any, Dict, Iterable, List, Sequence
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 
 from comfyvn.collab import CRDTOperation
+from comfyvn.collab.room import SLOW_CONSUMER_CLOSE_CODE, ClientOutbox
 from comfyvn.core.modder_hooks import emit as emit_modder_hook
 from comfyvn.server.core.collab import (
     HUB,
@@ -26,6 +27,10 @@ LOGGER = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/collab", tags=["Collaboration"])
 
+# ``delta`` clients receive operations + version vectors and resync on demand;
+# ``snapshot`` clients also get the full document whenever it changes.
+BROADCAST_MODES = ("delta", "snapshot")
+
 
 def _dumps(payload: Dict[str, Any]) -> str:
     return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
@@ -77,25 +82,41 @@ def _parse_operations(
 
 async def _send(state: CollabClientState, payload: Dict[str, Any]) -> None:
     message = _dumps(payload)
-    await state.websocket.send_text(message)
+    outbox = state.outbox
+    if outbox is None:
+        await state.websocket.send_text(message)
+        return
+    if not outbox.offer(message):
+        raise WebSocketDisconnect(code=SLOW_CONSUMER_CLOSE_CODE)
 
 
 async def _broadcast(
-    room, payload: Dict[str, Any], *, exclude: Iterable[str] | None = None
+    room,
+    payload: Dict[str, Any],
+    *,
+    exclude: Iterable[str] | None = None,
+    mode: str | None = None,
 ) -> None:
-    message = _dumps(payload)
-    exclude_set = set(exclude or ())
-    failures: List[str] = []
-    for client_id, state in list(room.clients.items()):
-        if client_id in exclude_set:
-            continue
-        try:
-            await state.websocket.send_text(message)
-        except Exception as exc:  # pragma: no cover - network path
-            LOGGER.warning("Collab broadcast failed for %s: %s", client_id, exc)
-            failures.append(client_id)
-    for client_id in failures:
-        room.leave(client_id)
+    """Encode ``payload`` once and queue it on every matching client outbox."""
+    room.broadcast(_dumps(payload), exclude=exclude, mode=mode)
+
+
+def _client_mode(websocket: WebSocket) -> str:
+    mode = (websocket.query_params.get("mode") or "").strip().lower()
+    return mode if mode in BROADCAST_MODES else "delta"
+
+
+def _snapshot_payload(room, **extra: Any) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "type": "doc.snapshot",
+        "scene_id": room.scene_id,
+        "version": room.document.version,
+        "clock": room.document.clock,
+        "vector": room.document.version_vector(),
+        "snapshot": room.document.snapshot(),
+    }
+    payload.update(extra)
+    return payload
 
 
 async def _broadcast_presence(room) -> None:
@@ -129,12 +150,17 @@ async def collab_ws(websocket: WebSocket) -> None:
     user_name = actor["name"] or "anon"
 
     room = await get_room(scene_id)
+    mode = _client_mode(websocket)
+    outbox = ClientOutbox(websocket)
     state = CollabClientState(
         client_id=client_id,
         user_name=user_name,
         websocket=websocket,
+        mode=mode,
+        outbox=outbox,
     )
     room.join(state)
+    outbox.start()
     try:
         if WS_CONN:
             WS_CONN.labels(scene=scene_id).inc()  # type: ignore[attr-defined]
@@ -148,9 +174,11 @@ async def collab_ws(websocket: WebSocket) -> None:
                 "type": "room.joined",
                 "scene_id": scene_id,
                 "actor": actor,
+                "mode": mode,
                 "feature_flags": flags,
                 "version": room.document.version,
                 "clock": room.document.clock,
+                "vector": room.document.version_vector(),
                 "snapshot": room.document.snapshot(),
                 "presence": room.presence().as_dict(),
             },
@@ -177,46 +205,84 @@ async def collab_ws(websocket: WebSocket) -> None:
                 continue
 
             if msg_type == "doc.pull":
-                await _send(
-                    state,
-                    {
-                        "type": "doc.snapshot",
-                        "scene_id": scene_id,
-                        "version": room.document.version,
-                        "clock": room.document.clock,
-                        "snapshot": room.document.snapshot(),
-                    },
-                )
+                await _send(state, _snapshot_payload(room))
                 continue
 
-            if msg_type == "doc.apply":
-                ops_raw = body.get("operations") or []
+            if msg_type == "doc.resync":
                 since = body.get("since")
-                operations = _parse_operations(ops_raw, client_id)
-                if not operations:
+                if (
+                    isinstance(since, int)
+                    and since >= 0
+                    and room.document.history_covers(since)
+                ):
                     await _send(
                         state,
                         {
-                            "type": "doc.update",
+                            "type": "doc.history",
                             "scene_id": scene_id,
+                            "since": since,
                             "version": room.document.version,
                             "clock": room.document.clock,
-                            "operations": [],
-                            "snapshot": room.document.snapshot(),
+                            "vector": room.document.version_vector(),
+                            "history": [
+                                record.as_dict()
+                                for record in room.document.operations_since(since)
+                            ],
                         },
                     )
+                else:
+                    await _send(state, _snapshot_payload(room, resync=True))
+                continue
+
+            if msg_type == "doc.apply":
+                ops_raw = body.get("operations") or []
+                since = body.get("since")
+                want_snapshot = bool(body.get("include_snapshot"))
+                operations = _parse_operations(ops_raw, client_id)
+                if not operations:
+                    payload = {
+                        "type": "doc.update",
+                        "scene_id": scene_id,
+                        "version": room.document.version,
+                        "clock": room.document.clock,
+                        "vector": room.document.version_vector(),
+                        "operations": [],
+                    }
+                    if want_snapshot or state.mode == "snapshot":
+                        payload["snapshot"] = room.document.snapshot()
+                    await _send(state, payload)
                     continue
+                base_version = room.document.version
                 results = room.apply_operations(client_id, operations)
                 changed = any(res.applied for res in results)
                 payload: Dict[str, Any] = {
                     "type": "doc.update",
                     "scene_id": scene_id,
+                    "mode": "delta",
+                    "base_version": base_version,
                     "version": room.document.version,
                     "clock": room.document.clock,
+                    "vector": room.document.version_vector(),
                     "operations": [res.as_dict() for res in results],
                 }
-                if changed or body.get("include_snapshot"):
-                    payload["snapshot"] = room.document.snapshot()
+                if isinstance(since, int) and since >= 0:
+                    history = [
+                        record.as_dict()
+                        for record in room.document.operations_since(since)
+                    ]
+                    payload["history"] = history
+                snapshot = None
+                if (changed or want_snapshot) and "snapshot" in room.modes():
+                    snapshot = room.document.snapshot()
+                    await _broadcast(
+                        room,
+                        {**payload, "mode": "snapshot", "snapshot": snapshot},
+                        mode="snapshot",
+                    )
+                await _broadcast(room, payload, mode="delta")
+                if want_snapshot and state.mode == "delta":
+                    # Explicit resync request: only the caller pays for it.
+                    await _send(state, _snapshot_payload(room))
                 mod_payload = {
                     "scene_id": scene_id,
                     "version": room.document.version,
@@ -226,8 +292,12 @@ async def collab_ws(websocket: WebSocket) -> None:
                     "actor": client_id,
                     "timestamp": time.time(),
                 }
-                if "snapshot" in payload:
-                    mod_payload["snapshot"] = payload["snapshot"]
+                if changed or want_snapshot:
+                    # The hook contract mirrors the snapshot-mode payload, even
+                    # when every client in the room runs in delta mode.
+                    if snapshot is None:
+                        snapshot = room.document.snapshot()
+                    mod_payload["snapshot"] = snapshot
                 if changed:
                     LOGGER.info(
                         "collab.op applied scene=%s version=%s ops=%s",
@@ -236,15 +306,7 @@ async def collab_ws(websocket: WebSocket) -> None:
                         [res.operation.op_id for res in results],
                     )
                 emit_modder_hook("on_collab_operation", mod_payload)
-                if isinstance(since, int) and since >= 0:
-                    history = [
-                        record.as_dict()
-                        for record in room.document.operations_since(since)
-                    ]
-                    payload["history"] = history
-                await _broadcast(room, payload)
-                if room.dirty:
-                    await room.flush()
+                await room.checkpoint()
                 continue
 
             if msg_type == "control.request":
@@ -319,6 +381,7 @@ async def collab_ws(websocket: WebSocket) -> None:
             pass
     finally:
         room.leave(client_id)
+        await outbox.close()
         try:
             await room.flush()
         except Exception:
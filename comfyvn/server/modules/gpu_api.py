@@ -7,6 +7,7 @@ from fastapi import APIRouter, Body, HTTPException, Query
 
 from comfyvn.core.compute_advisor import advise as compute_advise
 from comfyvn.core.gpu_manager import POLICY_MODES, get_gpu_manager
+from comfyvn.core.gpu_telemetry import get_gpu_sampler
 from comfyvn.server.system_metrics import collect_system_metrics
 
 LOGGER = logging.getLogger(__name__)
@@ -85,6 +86,21 @@ async def list_gpus(
     return response
 
 
+@router.get("/telemetry")
+async def gpu_telemetry(
+    window: float = Query(60.0, ge=1.0, le=86400.0, description="Seconds to aggregate"),
+) -> Dict[str, Any]:
+    """Latest buffered GPU sample plus min/max/avg over ``window`` seconds."""
+    sampler = get_gpu_sampler()
+    latest = sampler.latest()
+    return {
+        "ok": True,
+        "latest": latest.as_dict() if latest else None,
+        "window": sampler.window(window),
+        "sampler": sampler.stats(),
+    }
+
+
 def _set_policy(
     mode: str, device: Optional[str], preferred_id: Optional[str]
 ) -> Dict[str, Any]:
@@ -3,9 +3,9 @@ from __future__ import annotations
 import os
 import shutil
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 
 from comfyvn.server.system_metrics import collect_system_metrics
 
@@ -43,8 +43,12 @@ async def status(request: Request) -> Dict[str, Any]:
 
 
 @router.get("/metrics")
-async def system_metrics() -> Dict[str, Any]:
-    return collect_system_metrics()
+async def system_metrics(
+    window: Optional[float] = Query(
+        None, ge=1.0, le=86400.0, description="Add GPU min/max/avg over N seconds"
+    ),
+) -> Dict[str, Any]:
+    return collect_system_metrics(window=window)
 
 
 @router.post("/verify_data")
@@ -163,8 +163,34 @@ def _execute_import(
     except KeyError:
         pass
 
+    reported = {"percent": 5}
+
+    def _on_member(event: Dict[str, Any]) -> None:
+        total = int(event.get("total") or 0)
+        if total <= 0:
+            return
+        # Member staging spans 5%..90%; the remainder covers normalisation.
+        percent = 5 + int(85 * int(event.get("completed") or 0) / total)
+        if percent <= reported["percent"]:
+            return
+        reported["percent"] = percent
+        message = f"Imported {event.get('completed')}/{total} members"
+        task_registry.update(task_id, progress=percent / 100.0, message=message)
+        try:
+            import_status_store.update(
+                task_id,
+                percent=float(percent),
+                message=message,
+                stage="members",
+                detail=str(event.get("member") or ""),
+            )
+        except KeyError:
+            pass
+
     try:
-        summary = import_vn_package(package_path, overwrite=overwrite, tool=tool)
+        summary = import_vn_package(
+            package_path, overwrite=overwrite, tool=tool, progress=_on_member
+        )
         _log_line(log_file, "Archive imported successfully")
     except (
         Exception
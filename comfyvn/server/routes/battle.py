@@ -251,3 +251,35 @@ async def battle_simulate(payload: Mapping[str, Any]) -> Mapping[str, Any]:
     data = _ensure_mapping(payload, detail="payload must be an object")
     LOGGER.debug("battle.simulate legacy route invoked via /api/battle/simulate")
     return _handle_simulation_request(data)
+
+
+@router.post("/sim/batch")
+async def battle_sim_batch(payload: Mapping[str, Any]) -> Mapping[str, Any]:
+    _ensure_sim_enabled()
+    data = _ensure_mapping(payload, detail="payload must be an object")
+    stats_raw = data.get("stats")
+    if not isinstance(stats_raw, Mapping):
+        raise HTTPException(
+            status_code=400, detail="stats must be an object of contenders"
+        )
+    seeds_raw = data.get("seeds")
+    if seeds_raw is not None and not isinstance(seeds_raw, list):
+        raise HTTPException(status_code=400, detail="seeds must be a list")
+    try:
+        result = engine.simulate_batch(
+            stats_raw,
+            count=data.get("count"),
+            seed=data.get("seed"),
+            seeds=seeds_raw,
+            bins=data.get("bins", engine.DEFAULT_HISTOGRAM_BINS),
+            sensitivity=_coerce_bool(data.get("sensitivity"), default=True),
+            delta=data.get("delta", engine.DEFAULT_SENSITIVITY_DELTA),
+            include_outcomes=_coerce_bool(data.get("include_outcomes"), default=False),
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    response = result.as_dict()
+    context = _context_payload(data)
+    if context:
+        response["context"] = context
+    return response
@@ -283,6 +283,7 @@ async def room_apply(request: RoomApplyRequest) -> Dict[str, Any]:
         raise HTTPException(status_code=400, detail="no_operations_supplied")
 
     results = room.apply_operations(request.client_id, operations)
+    await room.checkpoint()
     changed = any(res.applied for res in results)
     result_payload: Dict[str, Any] = {
         "scene_id": room.scene_id,
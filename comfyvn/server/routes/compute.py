@@ -238,11 +238,11 @@ async def compute_advise(request: Request, payload: Dict[str, Any]) -> Dict[str,
 
     metrics = collect_system_metrics() or {}
     try:
-        scheduler_state = _SCHEDULER.state()
+        queue_depths = _SCHEDULER.queue_depths()
     except Exception:  # pragma: no cover - defensive
-        scheduler_state = {}
+        queue_depths = {}
 
-    remote_queue_depth = len((scheduler_state.get("queues") or {}).get("remote") or [])
+    remote_queue_depth = int(queue_depths.get("remote") or 0)
 
     context = {
         "has_gpu": bool((metrics.get("gpus") or [])),
@@ -297,11 +297,12 @@ async def compute_advise(request: Request, payload: Dict[str, Any]) -> Dict[str,
 
     if details is not None:
         details["context"] = context
+        try:
+            scheduler_state = _SCHEDULER.state()
+        except Exception:  # pragma: no cover - defensive
+            scheduler_state = {}
         scheduler_summary = {
-            "queues": {
-                name: len(items)
-                for name, items in (scheduler_state.get("queues") or {}).items()
-            },
+            "queues": dict(queue_depths),
             "active": len(scheduler_state.get("active") or []),
             "completed": len(scheduler_state.get("completed") or []),
         }
@@ -7,7 +7,17 @@ import logging
 import time
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Sequence
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+)
 
 import httpx
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
@@ -15,7 +25,7 @@ from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 from comfyvn.assets.persona_manager import PersonaManager
 from comfyvn.config import feature_flags
 from comfyvn.core.scene_store import SceneStore
-from comfyvn.importers.st_chat import map_to_scenes, parse_st_file, parse_st_payload
+from comfyvn.importers.st_chat import iter_st_file, map_to_scenes, parse_st_payload
 
 try:  # Optional import guard for CLI contexts
     from comfyvn.core import modder_hooks  # type: ignore
@@ -34,6 +44,7 @@ TURN_FILE = "turns.json"
 SCENES_FILE = "scenes.json"
 STATUS_FILE = "status.json"
 PREVIEW_FILE = "preview.json"
+UPLOAD_CHUNK_BYTES = 1 << 20
 
 _SCENE_STORE = SceneStore()
 _PERSONA_MANAGER = PersonaManager()
@@ -180,6 +191,53 @@ def _write_json(path: Path, payload: Mapping[str, Any]) -> None:
     path.write_text(text, encoding="utf-8")
 
 
+class _TurnSpool:
+    """Write ``{"turns": [...]}`` incrementally as turns stream through.
+
+    The output matches ``_write_json(path, {"turns": turns})`` byte for byte
+    without keeping the turn list in memory.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.count = 0
+        self._handle: Optional[TextIO] = None
+
+    def __enter__(self) -> "_TurnSpool":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("w", encoding="utf-8")
+        self._handle.write('{\n  "turns": [')
+        return self
+
+    def feed(self, turns: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        assert self._handle is not None
+        for turn in turns:
+            body = json.dumps(turn, indent=2, ensure_ascii=False)
+            prefix = ",\n    " if self.count else "\n    "
+            self._handle.write(prefix + body.replace("\n", "\n    "))
+            self.count += 1
+            yield turn
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._handle is None:
+            return
+        self._handle.write("\n  ]\n}" if self.count else "]\n}")
+        self._handle.close()
+        self._handle = None
+
+
+async def _spool_upload(file: UploadFile, dest: Path) -> int:
+    written = 0
+    with dest.open("wb") as handle:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            handle.write(chunk)
+            written += len(chunk)
+    return written
+
+
 def _read_json(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
@@ -226,7 +284,7 @@ def _aggregate_warnings(scenes: Sequence[Mapping[str, Any]]) -> List[str]:
 def _build_preview(
     project_id: str,
     run_id: str,
-    turns: Sequence[Mapping[str, Any]],
+    turn_count: int,
     scenes: Sequence[Mapping[str, Any]],
 ) -> Dict[str, Any]:
     participants = set()
@@ -238,7 +296,7 @@ def _build_preview(
         "run_id": run_id,
         "project_id": project_id,
         "scene_count": len(scenes),
-        "turn_count": len(list(turns)),
+        "turn_count": turn_count,
         "participants": sorted(participants, key=lambda s: s.lower()),
         "generated_at": time.time(),
     }
@@ -378,48 +436,51 @@ async def st_import_start(
     )
     try:
         tmp_path: Optional[Path] = None
+        turns: Iterable[Dict[str, Any]]
         if file:
-            data = await file.read()
-            if not data:
+            tmp_path = run_dir / Path(file.filename or "upload.bin").name
+            if not await _spool_upload(file, tmp_path):
                 raise HTTPException(status_code=400, detail="Uploaded file is empty.")
-            tmp_path = run_dir / (file.filename or "upload.bin")
-            tmp_path.write_bytes(data)
-            turns = parse_st_file(tmp_path)
+            turns = iter_st_file(tmp_path)
         elif url:
             remote_bytes = await _load_from_url(url)
             tmp_path = run_dir / "remote_payload"
             tmp_path.write_bytes(remote_bytes)
-            text_payload = remote_bytes.decode("utf-8", errors="replace")
-            turns = parse_st_payload(text_payload)
+            del remote_bytes
+            turns = iter_st_file(tmp_path)
         else:
             text_payload = text or ""
             tmp_path = run_dir / "inline.txt"
             tmp_path.write_text(text_payload, encoding="utf-8")
             turns = parse_st_payload(text_payload)
 
+        # Turns stream from the parser through the spool into the mapper, so
+        # only the scene currently being built is held in memory.
+        persona_aliases = _collect_persona_aliases()
+        with _TurnSpool(run_dir / TURN_FILE) as spool:
+            scenes = map_to_scenes(
+                project_id,
+                spool.feed(turns),
+                persona_aliases=persona_aliases,
+                default_player_persona=(
+                    _PERSONA_MANAGER.state.get("active_persona")
+                    if hasattr(_PERSONA_MANAGER, "state")
+                    else None
+                ),
+            )
+        turn_count = spool.count
+
         status = _update_status(
             run_dir,
             phase="parsed",
             progress=0.4,
             project_id=project_id,
-            turns=len(turns),
+            turns=turn_count,
         )
-        if not turns:
+        if not turn_count:
             raise HTTPException(
                 status_code=422, detail="No chat turns detected in the supplied input."
             )
-
-        persona_aliases = _collect_persona_aliases()
-        scenes = map_to_scenes(
-            project_id,
-            turns,
-            persona_aliases=persona_aliases,
-            default_player_persona=(
-                _PERSONA_MANAGER.state.get("active_persona")
-                if hasattr(_PERSONA_MANAGER, "state")
-                else None
-            ),
-        )
         if not scenes:
             raise HTTPException(
                 status_code=422,
@@ -433,12 +494,11 @@ async def st_import_start(
             scenes=[scene.get("id") for scene in scenes if scene.get("id")],
         )
 
-        # Persist artifacts
-        _write_json(run_dir / TURN_FILE, {"turns": turns})
+        # Persist artifacts (turns were spooled while mapping)
         _write_json(run_dir / SCENES_FILE, {"scenes": scenes})
 
         _save_scenes(scenes)
-        preview_payload = _build_preview(project_id, run_id, turns, scenes)
+        preview_payload = _build_preview(project_id, run_id, turn_count, scenes)
         preview_path = run_dir / PREVIEW_FILE
         _write_json(preview_path, preview_payload)
         _persist_project_payload(project_id, scenes, run_id, preview_path)
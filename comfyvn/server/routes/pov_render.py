@@ -66,7 +66,7 @@ async def pov_switch(payload: Any = Body(...)) -> Dict[str, Any]:
 
     state = POV.set(character_id)
     try:
-        results = _pipeline.ensure_poses(
+        results = await _pipeline.ensure_poses_async(
             state["pov"],
             style=style,
             poses=poses,
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any, List
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
 from comfyvn.presentation.directives import (
@@ -11,6 +13,11 @@ from comfyvn.presentation.directives import (
     SceneState,
     compile_plan,
 )
+from comfyvn.presentation.timeline import (
+    TimelineScene,
+    compile_timeline,
+    iter_timeline_ndjson,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +39,13 @@ class PlanResponse(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
 
+class PlanBatchRequest(BaseModel):
+    scenes: List[TimelineScene] = Field(default_factory=list)
+    stream: bool = False
+
+    model_config = ConfigDict(extra="ignore")
+
+
 @router.post("/plan", response_model=PlanResponse)
 async def presentation_plan(payload: PlanRequest) -> PlanResponse:
     """
@@ -51,4 +65,34 @@ async def presentation_plan(payload: PlanRequest) -> PlanResponse:
     return response
 
 
-__all__ = ["router", "PlanRequest", "PlanResponse"]
+@router.post("/plan/batch")
+async def presentation_plan_batch(payload: PlanBatchRequest, request: Request):
+    """
+    Compile plans for every node of one or more scenes in a single request.
+
+    Scene state is carried forward between nodes (see ``TimelineScene.updates``)
+    and plans are memoised on state/directive fingerprints.  Set ``stream`` or
+    send ``Accept: application/x-ndjson`` to receive one JSON line per node.
+    """
+    accept = request.headers.get("accept", "")
+    if payload.stream or "application/x-ndjson" in accept:
+        return StreamingResponse(
+            _ndjson_lines(payload.scenes), media_type="application/x-ndjson"
+        )
+    try:
+        return compile_timeline(payload.scenes)
+    except Exception as exc:  # pragma: no cover - defensive guardrail
+        logger.warning("Presentation batch compile failed: %s", exc, exc_info=True)
+        raise HTTPException(status_code=400, detail=f"Unable to compile plan: {exc}")
+
+
+def _ndjson_lines(scenes: List[TimelineScene]):
+    try:
+        for line in iter_timeline_ndjson(scenes):
+            yield line.encode("utf-8")
+    except Exception as exc:  # pragma: no cover - defensive guardrail
+        logger.warning("Presentation batch stream failed: %s", exc, exc_info=True)
+        yield (json.dumps({"error": str(exc)}) + "\n").encode("utf-8")
+
+
+__all__ = ["router", "PlanRequest", "PlanResponse", "PlanBatchRequest"]
@@ -47,6 +47,13 @@ class ApplyPropRequest(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
 
+class PropVisibilityRequest(BaseModel):
+    props: dict[str, list[str] | str | None] = Field(default_factory=dict)
+    state: Mapping[str, Any] | None = None
+
+    model_config = ConfigDict(extra="ignore")
+
+
 class RemovePropRequest(BaseModel):
     prop_id: str = Field(alias="id")
 
@@ -205,6 +212,26 @@ async def apply_prop(payload: Mapping[str, Any]) -> Mapping[str, Any]:
     return result
 
 
+@router.post("/visibility")
+async def evaluate_prop_visibility(payload: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Evaluate every prop's conditions against one state in a single pass."""
+    _ensure_enabled()
+    try:
+        request = PropVisibilityRequest.model_validate(payload)
+    except Exception as exc:  # pragma: no cover - defensive
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    try:
+        result = PROP_MANAGER.evaluate_conditions(request.props, request.state)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    LOGGER.debug(
+        "Prop visibility evaluated props=%s visible=%s",
+        len(result["props"]),
+        len(result["visible"]),
+    )
+    return result
+
+
 @router.post("/remove")
 async def remove_prop(payload: Mapping[str, Any]) -> Mapping[str, Any]:
     _ensure_enabled()
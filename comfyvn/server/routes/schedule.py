@@ -2,6 +2,7 @@ from __future__ import annotations
 
 """FastAPI endpoints for the compute job scheduler."""
 
+import math
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, HTTPException
@@ -12,9 +13,24 @@ router = APIRouter(prefix="/api/schedule", tags=["Scheduler"])
 SCHEDULER = get_scheduler()
 
 
+def _lease_sec(payload: Dict[str, Any]) -> Optional[float]:
+    raw = payload.get("lease_sec")
+    if raw is None:
+        return None
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        value = math.nan
+    if isinstance(raw, bool) or not math.isfinite(value) or value <= 0:
+        raise HTTPException(
+            status_code=400, detail="lease_sec must be a positive number"
+        )
+    return value
+
+
 @router.get("/health")
 async def schedule_health() -> Dict[str, Any]:
-    return {"ok": True, "queues": list(SCHEDULER.state().get("queues", {}).keys())}
+    return {"ok": True, "queues": list(SCHEDULER.queue_depths())}
 
 
 @router.get("/state")
@@ -23,8 +39,8 @@ async def schedule_state() -> Dict[str, Any]:
 
 
 @router.get("/board")
-async def schedule_board(limit: int = 100) -> Dict[str, Any]:
-    return SCHEDULER.board(limit=limit)
+async def schedule_board(limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+    return SCHEDULER.board(limit=limit, offset=offset)
 
 
 @router.post("/enqueue")
@@ -44,7 +60,32 @@ async def schedule_claim(payload: Optional[Dict[str, Any]] = None) -> Dict[str,
     queue = payload.get("queue") or "local"
     worker_id = payload.get("worker_id")
     device_id = payload.get("device_id")
-    job = SCHEDULER.claim(queue, worker_id=worker_id, device_id=device_id)
+    job = SCHEDULER.claim(
+        queue,
+        worker_id=worker_id,
+        device_id=device_id,
+        lease_sec=_lease_sec(payload),
+    )
+    return {"ok": True, "job": job}
+
+
+@router.post("/heartbeat")
+async def schedule_heartbeat(payload: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid payload")
+    job_id = payload.get("job_id")
+    if not job_id:
+        raise HTTPException(status_code=400, detail="Missing job_id")
+    try:
+        job = SCHEDULER.heartbeat(
+            job_id,
+            worker_id=payload.get("worker_id"),
+            lease_sec=_lease_sec(payload),
+        )
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
     return {"ok": True, "job": job}
 
 
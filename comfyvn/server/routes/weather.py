@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Any, Mapping, MutableMapping
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel, ConfigDict, Field
 
 from comfyvn.config import feature_flags
@@ -56,14 +56,16 @@ def _ensure_enabled() -> None:
 
 
 @router.get("/state", response_model=WeatherPlanResponse)
-async def weather_state_snapshot() -> WeatherPlanResponse:
+async def weather_state_snapshot() -> Response:
     _ensure_enabled()
-    plan = WEATHER_PLANNER.snapshot()
-    return WeatherPlanResponse.model_validate(plan)
+    # The store keeps the current plan pre-encoded; serve the bytes as-is.
+    return Response(
+        content=WEATHER_PLANNER.snapshot_json(), media_type="application/json"
+    )
 
 
 @router.post("/state", response_model=WeatherPlanResponse)
-async def update_weather_state(payload: WeatherStateRequest) -> WeatherPlanResponse:
+async def update_weather_state(payload: WeatherStateRequest) -> Response:
     _ensure_enabled()
     if payload.state is not None:
         merged_payload = dict(_ensure_mapping(payload.state, field="state"))
@@ -77,11 +79,12 @@ async def update_weather_state(payload: WeatherStateRequest) -> WeatherPlanRespo
         current = WEATHER_PLANNER.snapshot()
         base_state = dict(current.get("state", {}))
         base_state.update(merged_payload)
-        plan = WEATHER_PLANNER.update(base_state)
+        plan, body = WEATHER_PLANNER.update(base_state)
     else:
-        plan = WEATHER_PLANNER.snapshot()
-
-    response = WeatherPlanResponse.model_validate(plan)
+        plan, body = WEATHER_PLANNER.snapshot_with_json()
+    # Plans are frozen and shared, so the hook payload and log extras below
+    # reference them directly instead of re-validating a response model.
+    response = WeatherPlanResponse.model_construct(**plan)
 
     logger.info(
         "Weather plan updated",
@@ -121,7 +124,7 @@ async def update_weather_state(payload: WeatherStateRequest) -> WeatherPlanRespo
         },
     )
 
-    return response
+    return Response(content=body, media_type="application/json")
 
 
 __all__ = ["router", "WeatherStateRequest", "WeatherPlanResponse"]
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 """System metrics helpers shared by server endpoints and GUI clients."""
 
-import shutil
-import subprocess
+import asyncio
+import json
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from comfyvn.core.gpu_telemetry import get_gpu_sampler
 
 
 def _safe_import_psutil():
@@ -18,92 +21,18 @@ def _safe_import_psutil():
 
 
 def _collect_gpu_metrics() -> List[Dict[str, Any]]:
-    entries: List[Dict[str, Any]] = []
+    # Served from the shared telemetry ring buffer; the background sampler is
+    # the only caller of NVML / nvidia-smi.
+    return get_gpu_sampler().gpus()
 
-    # Prefer NVML when present to avoid spawning subprocesses on every call.
-    try:
-        import pynvml  # type: ignore
-    except Exception:
-        pynvml = None  # type: ignore
-
-    if pynvml is not None:
-        try:
-            pynvml.nvmlInit()
-            count = pynvml.nvmlDeviceGetCount()
-            for idx in range(count):
-                handle = pynvml.nvmlDeviceGetHandleByIndex(idx)
-                name = pynvml.nvmlDeviceGetName(handle).decode(
-                    "utf-8", errors="replace"
-                )
-                util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-                mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
-                temp = pynvml.nvmlDeviceGetTemperature(
-                    handle, pynvml.NVML_TEMPERATURE_GPU
-                )
-                entries.append(
-                    {
-                        "id": idx,
-                        "name": name,
-                        "util": int(getattr(util, "gpu", 0)),
-                        "mem_used": int(mem.used // (1024 * 1024)),
-                        "mem_total": int(mem.total // (1024 * 1024)),
-                        "temp_c": int(temp),
-                    }
-                )
-        except Exception:
-            entries.clear()
-        finally:
-            try:
-                pynvml.nvmlShutdown()
-            except Exception:  # pragma: no cover - shutdown best effort
-                pass
-
-    if entries:
-        return entries
-
-    nvidia_smi = shutil.which("nvidia-smi")
-    if not nvidia_smi:
-        return entries
-
-    query_args = [
-        nvidia_smi,
-        "--query-gpu=index,name,utilization.gpu,memory.used,memory.total,temperature.gpu",
-        "--format=csv,noheader,nounits",
-    ]
-    try:
-        result = subprocess.run(
-            query_args,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=0.6,
-        )
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return entries
-
-    for line in result.stdout.splitlines():
-        parts = [segment.strip() for segment in line.split(",")]
-        if len(parts) != 6:
-            continue
-        idx, name, util, mem_used, mem_total, temp = parts
-        try:
-            entries.append(
-                {
-                    "id": int(idx),
-                    "name": name,
-                    "util": int(float(util)),
-                    "mem_used": int(float(mem_used)),
-                    "mem_total": int(float(mem_total)),
-                    "temp_c": int(float(temp)),
-                }
-            )
-        except (TypeError, ValueError):
-            continue
-    return entries
-
-
-def collect_system_metrics() -> Dict[str, Any]:
-    """Return a lightweight snapshot of CPU, RAM, and (first) GPU state."""
+
+def collect_system_metrics(window: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Return a lightweight snapshot of CPU, RAM, and (first) GPU state.
+
+    When ``window`` (seconds) is given, ``gpu_window`` carries per-GPU
+    min/max/avg aggregates over that span of buffered telemetry.
+    """
 
     psutil, exc = _safe_import_psutil()
     if psutil is None:
@@ -138,4 +67,64 @@ def collect_system_metrics() -> Dict[str, Any]:
         metrics["first_gpu"] = metrics["gpus"][0]
     else:
         metrics["first_gpu"] = None
+    if window is not None:
+        metrics["gpu_window"] = get_gpu_sampler().window(window)
     return metrics
+
+
+class MetricsBroadcaster:
+    """
+    Share metrics samples between concurrent stream subscribers.
+
+    Each subscriber asks for a sample once per interval; samples younger than
+    ``min_age`` are reused, so N open streams cost one collection per tick
+    instead of N.  Collection runs in a worker thread because
+    `collect_system_metrics` blocks for its CPU sampling window.
+    """
+
+    def __init__(
+        self,
+        sampler: Callable[[], Dict[str, Any]] = collect_system_metrics,
+        *,
+        min_age: float = 0.5,
+    ) -> None:
+        self._sampler = sampler
+        self.min_age = float(min_age)
+        self._sample: Optional[Dict[str, Any]] = None
+        self._stamp = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def sample(self) -> Dict[str, Any]:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            now = time.monotonic()
+            if self._sample is None or now - self._stamp >= self.min_age:
+                self._sample = await asyncio.to_thread(self._sampler)
+                self._stamp = time.monotonic()
+            return self._sample
+
+
+METRICS_BROADCASTER = MetricsBroadcaster()
+
+
+async def iter_metrics_sse(
+    interval: float = 2.0,
+    *,
+    limit: Optional[int] = None,
+    broadcaster: Optional[MetricsBroadcaster] = None,
+) -> AsyncIterator[bytes]:
+    """Yield ``event: metrics`` SSE frames every ``interval`` seconds."""
+
+    broadcaster = broadcaster or METRICS_BROADCASTER
+    retry_ms = int(max(interval, 1.0) * 1000)
+    yield f"retry: {retry_ms}\n\n".encode()
+    sent = 0
+    while limit is None or sent < limit:
+        payload = await broadcaster.sample()
+        data = json.dumps(payload, separators=(",", ":"))
+        yield f"event: metrics\ndata: {data}\n\n".encode()
+        sent += 1
+        if limit is not None and sent >= limit:
+            break
+        await asyncio.sleep(interval)
@@ -4,17 +4,23 @@ Asset registry facade for the Studio shell.
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import shutil
 import sqlite3
 import threading
 import time
-import wave
-from array import array
-from concurrent.futures import Future, ThreadPoolExecutor, wait
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
@@ -47,6 +53,7 @@ except Exception:  # pragma: no cover - mutagen optional
 
 from .base_registry import BaseRegistry
 from .provenance_registry import ProvenanceRegistry
+from .thumbnailer import render_image_thumbnails, render_waveform_preview
 
 LOGGER = logging.getLogger(__name__)
 PROVENANCE_TAG = "comfyvn_provenance"
@@ -70,8 +77,14 @@ class AssetRegistry(BaseRegistry):
     }
     _AUDIO_WAVEFORM_SUFFIXES = {".wav", ".wave"}
     THUMB_SIZES = (256, 512)
-    _thumb_executor: ThreadPoolExecutor | None = None
+    # "thread" (default) renders in-process; "process" opts into a small spawn
+    # pool for bulk imports, at the cost of each worker importing the package.
+    THUMB_EXECUTOR_KIND = os.getenv("COMFYVN_THUMB_EXECUTOR", "thread").lower()
+    THUMB_PROCESS_WORKERS = 4
+    _thumb_executor: Executor | None = None
+    _thumb_fallback_executor: ThreadPoolExecutor | None = None
     _thumb_executor_lock = threading.Lock()
+    _thumb_atexit_registered = False
     _pending_futures: set[Future] = set()
     _pending_lock = threading.Lock()
     HOOK_ASSET_REGISTERED = "asset_registered"
@@ -1050,16 +1063,65 @@ class AssetRegistry(BaseRegistry):
         return prepared_meta
 
     @classmethod
-    def _get_thumbnail_executor(cls) -> ThreadPoolExecutor:
+    def _get_thumbnail_executor(cls) -> Executor:
         if cls._thumb_executor is None:
             with cls._thumb_executor_lock:
                 if cls._thumb_executor is None:
-                    cls._thumb_executor = ThreadPoolExecutor(
-                        max_workers=2,
-                        thread_name_prefix="AssetThumb",
-                    )
+                    cls._thumb_executor = cls._create_thumbnail_executor()
+                    if not cls._thumb_atexit_registered:
+                        atexit.register(cls.shutdown_thumbnail_executors)
+                        cls._thumb_atexit_registered = True
         return cls._thumb_executor
 
+    @classmethod
+    def shutdown_thumbnail_executors(cls) -> None:
+        """Stop the shared preview pools; the next render recreates them."""
+        with cls._thumb_executor_lock:
+            executors = {cls._thumb_executor, cls._thumb_fallback_executor}
+            cls._thumb_executor = None
+            cls._thumb_fallback_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _create_thumbnail_executor(cls) -> Executor:
+        if cls.THUMB_EXECUTOR_KIND == "process":
+            try:
+                return ProcessPoolExecutor(
+                    max_workers=max(
+                        1, min(cls.THUMB_PROCESS_WORKERS, os.cpu_count() or 1)
+                    ),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except Exception as exc:  # pragma: no cover - platform dependent
+                LOGGER.info(
+                    "Thumbnail process pool unavailable (%s); using threads", exc
+                )
+        return cls._thread_executor()
+
+    @classmethod
+    def _submit_preview_render(cls, fn: Callable[..., Any], *args: Any) -> Future:
+        executor = cls._get_thumbnail_executor()
+        try:
+            return executor.submit(fn, *args)
+        except Exception as exc:  # BrokenProcessPool / interpreter shutdown
+            LOGGER.warning("Thumbnail executor unavailable (%s); using threads", exc)
+            with cls._thumb_executor_lock:
+                cls._thumb_executor = cls._thread_executor()
+                executor = cls._thumb_executor
+            return executor.submit(fn, *args)
+
+    @classmethod
+    def _thread_executor(cls) -> ThreadPoolExecutor:
+        """Return the thread-pool fallback; callers hold ``_thumb_executor_lock``."""
+        if cls._thumb_fallback_executor is None:
+            cls._thumb_fallback_executor = ThreadPoolExecutor(
+                max_workers=2,
+                thread_name_prefix="AssetThumb",
+            )
+        return cls._thumb_fallback_executor
+
     def _schedule_preview(
         self, dest: Path, uid: str
     ) -> tuple[Optional[str], Optional[str], Optional[Dict[str, Any]]]:
@@ -1071,24 +1133,21 @@ class AssetRegistry(BaseRegistry):
                 return (None, None, None)
             preview_kind = "thumbnail"
             thumb_paths: Dict[str, str] = {}
+            targets: List[tuple[int, str]] = []
             primary_rel: Optional[str] = None
-            executor = self._get_thumbnail_executor()
-            for index, size in enumerate(self.THUMB_SIZES):
+            primary_path: Optional[Path] = None
+            for size in self.THUMB_SIZES:
                 thumb_path = self.THUMB_ROOT / f"{uid}_{size}{suffix}"
                 thumb_rel = str((self._thumb_rel_base / thumb_path.name).as_posix())
                 thumb_paths[str(size)] = thumb_rel
-                primary_rel = primary_rel or thumb_rel
-                future = executor.submit(
-                    self._thumbnail_job,
-                    dest,
-                    thumb_path,
-                    thumb_rel,
-                    uid,
-                    preview_kind,
-                    size,
-                    primary=index == 0,
-                )
-                self._register_thumbnail_future(future)
+                targets.append((size, str(thumb_path)))
+                if primary_rel is None:
+                    primary_rel, primary_path = thumb_rel, thumb_path
+            # One job per image: decode once, derive every size from it.
+            future = self._submit_preview_render(
+                render_image_thumbnails, str(dest), targets
+            )
+            self._track_preview(future, uid, preview_kind, primary_path)
             preview_payload = {
                 "kind": preview_kind,
                 "paths": thumb_paths,
@@ -1099,23 +1158,68 @@ class AssetRegistry(BaseRegistry):
             thumb_path = self.THUMB_ROOT / f"{uid}.waveform.json"
             thumb_rel = str((self._thumb_rel_base / thumb_path.name).as_posix())
             preview_kind = "waveform"
-            executor = self._get_thumbnail_executor()
-            future = executor.submit(
-                self._thumbnail_job,
-                dest,
-                thumb_path,
-                thumb_rel,
-                uid,
-                preview_kind,
-                None,
-                primary=True,
+            future = self._submit_preview_render(
+                render_waveform_preview, str(dest), str(thumb_path)
             )
-            self._register_thumbnail_future(future)
+            self._track_preview(future, uid, preview_kind, thumb_path)
             preview_payload = {"kind": preview_kind, "path": thumb_rel}
             return thumb_rel, preview_kind, preview_payload
         LOGGER.debug("Skipping preview for %s (unsupported suffix)", dest)
         return (None, None, None)
 
+    def _track_preview(
+        self,
+        render: Future,
+        uid: str,
+        preview_kind: str,
+        primary_path: Optional[Path],
+    ) -> None:
+        """Finish a render in this process and expose it to ``wait_for_thumbnails``."""
+        tracked: Future = Future()
+        self._register_thumbnail_future(tracked)
+
+        def _finish(fut: Future) -> None:
+            try:
+                self._finish_preview(fut, uid, preview_kind, primary_path)
+            finally:
+                tracked.set_result(None)
+
+        render.add_done_callback(_finish)
+
+    def _finish_preview(
+        self,
+        render: Future,
+        uid: str,
+        preview_kind: str,
+        primary_path: Optional[Path],
+    ) -> None:
+        try:
+            result = render.result()
+        except Exception as exc:
+            LOGGER.warning("%s preview job failed for %s: %s", preview_kind, uid, exc)
+            result = False
+        if isinstance(result, list):
+            failed = [Path(path) for path in result]
+        elif result:
+            failed = []
+        else:
+            failed = [primary_path] if primary_path else []
+        if not failed:
+            return
+        LOGGER.warning(
+            "Clearing %s preview for %s due to generation failure",
+            preview_kind or "thumbnail",
+            uid,
+        )
+        for path in failed:
+            path.unlink(missing_ok=True)
+        if primary_path is not None and primary_path in failed:
+            with self.connection() as conn:
+                conn.execute(
+                    f"UPDATE {self.TABLE} SET path_thumb = NULL WHERE project_id = ? AND uid = ?",
+                    (self.project_id, uid),
+                )
+
     @classmethod
     def _register_thumbnail_future(cls, future: Future) -> None:
         with cls._pending_lock:
@@ -1136,122 +1240,6 @@ class AssetRegistry(BaseRegistry):
         done, not_done = wait(pending, timeout=timeout)
         return not not_done
 
-    def _thumbnail_job(
-        self,
-        source: Path,
-        thumb_path: Path,
-        thumb_rel: str,
-        uid: str,
-        preview_kind: Optional[str],
-        thumb_size: Optional[int],
-        *,
-        primary: bool,
-    ) -> None:
-        success = self._create_preview_file(source, thumb_path, thumb_size=thumb_size)
-        if not success:
-            LOGGER.warning(
-                "Clearing %s preview for %s due to generation failure",
-                preview_kind or "thumbnail",
-                uid,
-            )
-            thumb_path.unlink(missing_ok=True)
-            if primary:
-                with self.connection() as conn:
-                    conn.execute(
-                        f"UPDATE {self.TABLE} SET path_thumb = NULL WHERE project_id = ? AND uid = ?",
-                        (self.project_id, uid),
-                    )
-
-    def _create_preview_file(
-        self, source: Path, thumb_path: Path, *, thumb_size: Optional[int]
-    ) -> bool:
-        suffix = source.suffix.lower()
-        if suffix in self._IMAGE_SUFFIXES:
-            return self._create_image_thumbnail(source, thumb_path, thumb_size)
-        if suffix in self._AUDIO_WAVEFORM_SUFFIXES:
-            return self._create_waveform_preview(source, thumb_path)
-        return False
-
-    @staticmethod
-    def _create_image_thumbnail(
-        source: Path, thumb_path: Path, thumb_size: Optional[int]
-    ) -> bool:
-        if Image is None:
-            return False
-        try:
-            with Image.open(source) as img:  # type: ignore[attr-defined]
-                size = int(thumb_size or 256)
-                img.thumbnail((size, size))
-                thumb_path.parent.mkdir(parents=True, exist_ok=True)
-                img.save(thumb_path)
-            return True
-        except Exception as exc:  # pragma: no cover - optional
-            LOGGER.warning("Thumbnail generation failed for %s: %s", source, exc)
-            return False
-
-    @staticmethod
-    def _create_waveform_preview(source: Path, thumb_path: Path) -> bool:
-        try:
-            with wave.open(str(source), "rb") as wav_file:
-                frames = wav_file.getnframes()
-                channels = wav_file.getnchannels()
-                sampwidth = wav_file.getsampwidth()
-                framerate = wav_file.getframerate()
-                if frames <= 0 or sampwidth not in (1, 2):
-                    LOGGER.debug("Unsupported waveform parameters for %s", source)
-                    return False
-                raw = wav_file.readframes(frames)
-        except wave.Error as exc:
-            LOGGER.debug("Waveform probe failed for %s: %s", source, exc)
-            return False
-        except Exception as exc:  # pragma: no cover - defensive
-            LOGGER.warning("Waveform read failed for %s: %s", source, exc)
-            return False
-
-        if sampwidth == 1:
-            samples = array("b", raw)
-        else:
-            samples = array("h")
-            samples.frombytes(raw)
-
-        if channels > 1:
-            samples = samples[::channels]
-
-        if not samples:
-            LOGGER.debug("No samples available for waveform preview in %s", source)
-            return False
-
-        max_amplitude = max(1, max(abs(int(v)) for v in samples))
-        target_points = 512
-        step = max(1, len(samples) // target_points)
-        points: List[float] = []
-        for idx in range(0, len(samples), step):
-            window = samples[idx : idx + step]
-            if not window:
-                break
-            peak = max(window)
-            trough = min(window)
-            amplitude = max(abs(int(peak)), abs(int(trough))) / max_amplitude
-            points.append(round(float(amplitude), 4))
-            if len(points) >= target_points:
-                break
-
-        payload = {
-            "kind": "waveform",
-            "channels": channels,
-            "sample_rate": framerate,
-            "points": points,
-        }
-        try:
-            thumb_path.parent.mkdir(parents=True, exist_ok=True)
-            thumb_path.write_text(
-                json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
-            return True
-        except Exception as exc:  # pragma: no cover - defensive
-            LOGGER.warning("Failed to write waveform preview for %s: %s", source, exc)
-            return False
-
     # ---------------------
     # Provenance helpers
     # ---------------------
@@ -0,0 +1,206 @@
+"""CPU-bound preview rendering used by :class:`AssetRegistry`.
+
+The functions here are module-level and take only paths/ints so they can run
+inside a process pool. Each image is decoded once (JPEGs via ``draft`` at the
+largest requested size) and every thumbnail size is derived from that single
+decode by successive reducing resizes. Waveform peaks are computed over a
+memory-mapped view of the WAV data when NumPy is available.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+import wave
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:  # thumbnail generation optional
+    from PIL import Image  # type: ignore
+except Exception:  # pragma: no cover - pillow optional
+    Image = None  # type: ignore
+
+try:  # numpy is optional but keeps waveform peaks off the Python loop
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
+LOGGER = logging.getLogger(__name__)
+WAVEFORM_POINTS = 512
+
+
+def render_image_thumbnails(
+    source: str | Path, targets: Sequence[Tuple[int, str | Path]]
+) -> List[str]:
+    """Write one thumbnail per ``(size, path)`` target; return failed paths."""
+    if Image is None:
+        return [str(path) for _, path in targets]
+    ordered = sorted(targets, key=lambda item: int(item[0] or 256), reverse=True)
+    failed: List[str] = []
+    try:
+        with Image.open(source) as img:  # type: ignore[attr-defined]
+            largest = int(ordered[0][0] or 256)
+            if img.format == "JPEG":
+                img.draft(img.mode, (largest, largest))
+            img.load()
+            working = img
+            for size, thumb_path in ordered:
+                size = int(size or 256)
+                try:
+                    working.thumbnail((size, size))
+                    path = Path(thumb_path)
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    working.save(path)
+                except Exception as exc:  # pragma: no cover - optional
+                    LOGGER.warning(
+                        "Thumbnail generation failed for %s (%s): %s",
+                        source,
+                        size,
+                        exc,
+                    )
+                    failed.append(str(thumb_path))
+    except Exception as exc:  # pragma: no cover - optional
+        LOGGER.warning("Thumbnail generation failed for %s: %s", source, exc)
+        return [str(path) for _, path in targets]
+    return failed
+
+
+def render_waveform_preview(source: str | Path, thumb_path: str | Path) -> bool:
+    """Write a peak-envelope JSON preview for a 8/16-bit PCM WAV file."""
+    try:
+        with wave.open(str(source), "rb") as wav_file:
+            frames = wav_file.getnframes()
+            channels = wav_file.getnchannels()
+            sampwidth = wav_file.getsampwidth()
+            framerate = wav_file.getframerate()
+            if frames <= 0 or sampwidth not in (1, 2):
+                LOGGER.debug("Unsupported waveform parameters for %s", source)
+                return False
+            raw = None if np is not None else wav_file.readframes(frames)
+    except wave.Error as exc:
+        LOGGER.debug("Waveform probe failed for %s: %s", source, exc)
+        return False
+    except Exception as exc:  # pragma: no cover - defensive
+        LOGGER.warning("Waveform read failed for %s: %s", source, exc)
+        return False
+
+    points: Optional[List[float]] = None
+    if np is not None:
+        points = _waveform_points_mapped(Path(source), frames, channels, sampwidth)
+        if points is None:
+            with wave.open(str(source), "rb") as wav_file:
+                raw = wav_file.readframes(frames)
+    if points is None:
+        points = _waveform_points_python(raw or b"", channels, sampwidth)
+    if points is None:
+        LOGGER.debug("No samples available for waveform preview in %s", source)
+        return False
+
+    payload = {
+        "kind": "waveform",
+        "channels": channels,
+        "sample_rate": framerate,
+        "points": points,
+    }
+    try:
+        path = Path(thumb_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+        return True
+    except Exception as exc:  # pragma: no cover - defensive
+        LOGGER.warning("Failed to write waveform preview for %s: %s", source, exc)
+        return False
+
+
+def _wav_data_span(source: Path) -> Optional[Tuple[int, int]]:
+    """Return ``(offset, size)`` of the RIFF ``data`` chunk."""
+    with source.open("rb") as handle:
+        header = handle.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+        while True:
+            chunk = handle.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk)
+            if chunk_id == b"data":
+                return handle.tell(), chunk_size
+            handle.seek(chunk_size + (chunk_size & 1), 1)
+
+
+def _waveform_points_mapped(
+    source: Path, frames: int, channels: int, sampwidth: int
+) -> Optional[List[float]]:
+    try:
+        span = _wav_data_span(source)
+    except OSError:
+        return None
+    if span is None:
+        return None
+    offset, size = span
+    frame_bytes = sampwidth * channels
+    frames = min(frames, size // frame_bytes)
+    if frames <= 0:
+        return None
+    dtype = np.int8 if sampwidth == 1 else np.dtype("<i2")
+    mapped = np.memmap(
+        source, dtype=dtype, mode="r", offset=offset, shape=(frames * channels,)
+    )
+    samples = mapped[::channels] if channels > 1 else mapped
+    peak_max = int(samples.max())
+    peak_min = int(samples.min())
+    max_amplitude = max(1, abs(peak_max), abs(peak_min))
+
+    step = max(1, len(samples) // WAVEFORM_POINTS)
+    windows = min(WAVEFORM_POINTS, -(-len(samples) // step))
+    full = min(windows, len(samples) // step)
+    peaks: List[Tuple[int, int]] = []
+    if full:
+        block = np.asarray(samples[: full * step]).reshape(full, step)
+        peaks.extend(zip(block.max(axis=1).tolist(), block.min(axis=1).tolist()))
+    if windows > full:
+        tail = samples[full * step : (full + 1) * step]
+        peaks.append((int(tail.max()), int(tail.min())))
+    del mapped
+    return [
+        round(float(max(abs(peak), abs(trough)) / max_amplitude), 4)
+        for peak, trough in peaks
+    ]
+
+
+def _waveform_points_python(
+    raw: bytes, channels: int, sampwidth: int
+) -> Optional[List[float]]:
+    if sampwidth == 1:
+        samples = array("b", raw)
+    else:
+        samples = array("h")
+        samples.frombytes(raw)
+
+    if channels > 1:
+        samples = samples[::channels]
+
+    if not samples:
+        return None
+
+    max_amplitude = max(1, max(abs(int(v)) for v in samples))
+    step = max(1, len(samples) // WAVEFORM_POINTS)
+    points: List[float] = []
+    for idx in range(0, len(samples), step):
+        window = samples[idx : idx + step]
+        if not window:
+            break
+        peak = max(window)
+        trough = min(window)
+        amplitude = max(abs(int(peak)), abs(int(trough))) / max_amplitude
+        points.append(round(float(amplitude), 4))
+        if len(points) >= WAVEFORM_POINTS:
+            break
+    return points
+
+
+__all__ = ["render_image_thumbnails", "render_waveform_preview"]
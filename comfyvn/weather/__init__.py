@@ -8,8 +8,14 @@ can access the most recent compiled plan without needing to manage locking or
 state merging themselves.
 """
 
-from .engine import WeatherPlanStore, compile_plan
+from .engine import WeatherPlanStore, compile_plan, frozen_plan, plan_json
 
 WEATHER_PLANNER = WeatherPlanStore()
 
-__all__ = ["compile_plan", "WEATHER_PLANNER", "WeatherPlanStore"]
+__all__ = [
+    "compile_plan",
+    "frozen_plan",
+    "plan_json",
+    "WEATHER_PLANNER",
+    "WeatherPlanStore",
+]
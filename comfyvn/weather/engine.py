@@ -7,9 +7,14 @@ Weather plan compiler used by GUI previews and export pipelines.
 deterministic scene lighting, overlay, and transition directives.  A tiny
 in-memory store (`WeatherPlanStore`) keeps track of the latest compiled plan so
 API routes can update state without blocking downstream readers.
+
+The state space is small (time of day x weather x ambience), so plans are
+memoised per canonical combination as frozen structures (`FrozenDict` /
+`FrozenList`) together with their JSON encoding.  `frozen_plan()` and
+`WeatherPlanStore.snapshot()` hand those out without copying;
+`compile_plan()` still returns a mutable copy for callers that edit plans.
 """
 
-import copy
 import hashlib
 import json
 import threading
@@ -468,23 +473,7 @@ def _plan_hash(state: Mapping[str, Any]) -> str:
     return digest[:12]
 
 
-def compile_plan(state: Mapping[str, Any] | None) -> Dict[str, Any]:
-    """
-    Compile the supplied weather state into deterministic presentation data.
-
-    Returns a dictionary consumable by scene exporters and previews:
-
-    {
-        "state": {...},
-        "scene": {"background_layers": [...], "light_rig": {...}},
-        "transition": {...},
-        "particles": {...}|None,
-        "sfx": {...},
-        "meta": {"hash": "...", "warnings": [...]}
-    }
-    """
-
-    canonical, warnings = _normalize_state(state)
+def _build_plan(canonical: Dict[str, str], warnings: list[str]) -> Dict[str, Any]:
     time_cfg = _TIME_PRESETS[canonical["time_of_day"]]
     weather_cfg = _WEATHER_PRESETS[canonical["weather"]]
     ambience_cfg = _AMBIENCE_PRESETS[canonical["ambience"]]
@@ -518,53 +507,220 @@ def compile_plan(state: Mapping[str, Any] | None) -> Dict[str, Any]:
     return plan
 
 
+class FrozenDict(dict):
+    """Read-only ``dict`` shared between plan readers.
+
+    Still a real ``dict`` so JSON encoding, equality and pydantic validation
+    work unchanged.  ``copy.deepcopy`` returns a mutable copy (see `thaw`).
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise TypeError("weather plans are read-only; use thaw() for a copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return thaw(self)
+
+    def __reduce__(self) -> Any:
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only ``list`` counterpart of `FrozenDict`."""
+
+    __slots__ = ()
+
+    def _readonly(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise TypeError("weather plans are read-only; use thaw() for a copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly  # type: ignore
+    append = extend = insert = remove = pop = clear = _readonly  # type: ignore
+    sort = reverse = _readonly  # type: ignore[assignment]
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> list:
+        return thaw(self)
+
+    def __reduce__(self) -> Any:
+        return (list, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists into `FrozenDict`/`FrozenList`."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a fully mutable deep copy of a (possibly frozen) plan."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+def _encode(plan: Mapping[str, Any]) -> bytes:
+    return json.dumps(plan, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+_PLAN_TABLE: Dict[Tuple[str, str, str], Tuple[FrozenDict, bytes]] = {}
+_PLAN_TABLE_LOCK = threading.Lock()
+
+
+def _canonical_entry(canonical: Mapping[str, str]) -> Tuple[FrozenDict, bytes]:
+    key = (canonical["time_of_day"], canonical["weather"], canonical["ambience"])
+    entry = _PLAN_TABLE.get(key)
+    if entry is None:
+        plan = freeze(_build_plan(dict(canonical), []))
+        with _PLAN_TABLE_LOCK:
+            entry = _PLAN_TABLE.setdefault(key, (plan, _encode(plan)))
+    return entry
+
+
+def _with_meta(plan: FrozenDict, **meta: Any) -> FrozenDict:
+    """Share every section of ``plan`` except a rebuilt ``meta`` block."""
+    merged = dict(plan["meta"])
+    merged.update(meta)
+    return FrozenDict({**plan, "meta": freeze(merged)})
+
+
+def warm_plan_table() -> int:
+    """Precompute every canonical preset combination; returns the table size."""
+    for time_of_day in _TIME_PRESETS:
+        for weather in _WEATHER_PRESETS:
+            for ambience in _AMBIENCE_PRESETS:
+                _canonical_entry(
+                    {
+                        "time_of_day": time_of_day,
+                        "weather": weather,
+                        "ambience": ambience,
+                    }
+                )
+    return len(_PLAN_TABLE)
+
+
+def frozen_plan(state: Mapping[str, Any] | None) -> FrozenDict:
+    """
+    Return the shared, read-only plan for ``state``.
+
+    Canonical states are served straight from the memo table; inputs that
+    produce warnings get a shallow wrapper with their own ``meta`` block.
+    """
+    canonical, warnings = _normalize_state(state)
+    plan, _ = _canonical_entry(canonical)
+    if warnings:
+        return _with_meta(plan, warnings=warnings)
+    return plan
+
+
+def plan_json(state: Mapping[str, Any] | None) -> bytes:
+    """Return the JSON encoding of ``frozen_plan(state)``."""
+    canonical, warnings = _normalize_state(state)
+    plan, encoded = _canonical_entry(canonical)
+    if warnings:
+        return _encode(_with_meta(plan, warnings=warnings))
+    return encoded
+
+
+def compile_plan(state: Mapping[str, Any] | None) -> Dict[str, Any]:
+    """
+    Compile the supplied weather state into deterministic presentation data.
+
+    Returns a dictionary consumable by scene exporters and previews:
+
+    {
+        "state": {...},
+        "scene": {"background_layers": [...], "light_rig": {...}},
+        "transition": {...},
+        "particles": {...}|None,
+        "sfx": {...},
+        "meta": {"hash": "...", "warnings": [...]}
+    }
+
+    The result is a mutable copy of the memoised plan; use `frozen_plan` on
+    hot read paths.
+    """
+    return thaw(frozen_plan(state))
+
+
 @dataclass
 class WeatherPlanStore:
-    """Thread-safe store for the most recently compiled weather plan."""
+    """Thread-safe store for the most recently compiled weather plan.
+
+    Plans are held frozen alongside their JSON bytes; `snapshot()` and
+    `snapshot_json()` return them without copying or locking.
+    """
 
     _lock: threading.Lock = field(default_factory=threading.Lock)
-    _plan: Dict[str, Any] = field(default=None)  # type: ignore[assignment]
+    _current: Tuple[FrozenDict, bytes] = field(default=None)  # type: ignore[assignment]
     _version: int = 0
 
     def __post_init__(self) -> None:
-        if self._plan is None:
-            initial = compile_plan(DEFAULT_STATE)
-            meta = dict(initial.get("meta", {}))
-            meta["version"] = 0
-            meta["updated_at"] = datetime.now(timezone.utc).isoformat()
-            initial["meta"] = meta
-            self._plan = initial
-
-    def update(self, state: Mapping[str, Any] | None) -> Dict[str, Any]:
-        plan = compile_plan(state)
-        timestamp = datetime.now(timezone.utc).isoformat()
+        if self._current is None:
+            self._current = self._stamp(frozen_plan(DEFAULT_STATE), 0)
+
+    @staticmethod
+    def _stamp(plan: FrozenDict, version: int) -> Tuple[FrozenDict, bytes]:
+        stamped = _with_meta(
+            plan,
+            version=version,
+            updated_at=datetime.now(timezone.utc).isoformat(),
+        )
+        return stamped, _encode(stamped)
+
+    def update(self, state: Mapping[str, Any] | None) -> Tuple[FrozenDict, bytes]:
+        """Store the plan for ``state`` and return it with its encoding.
+
+        Both come from the version this call wrote, even when other updates
+        land right after it.
+        """
+        plan = frozen_plan(state)
         with self._lock:
             self._version += 1
-            meta = dict(plan.get("meta", {}))
-            meta["version"] = self._version
-            meta["updated_at"] = timestamp
-            plan["meta"] = meta
-            self._plan = plan
-            return copy.deepcopy(self._plan)
-
-    def snapshot(self) -> Dict[str, Any]:
-        with self._lock:
-            return copy.deepcopy(self._plan)
+            self._current = self._stamp(plan, self._version)
+            return self._current
+
+    def snapshot(self) -> FrozenDict:
+        return self._current[0]
+
+    def snapshot_json(self) -> bytes:
+        return self._current[1]
+
+    def snapshot_with_json(self) -> Tuple[FrozenDict, bytes]:
+        """Return the current plan and its encoding from the same version."""
+        return self._current
 
     def clear(self) -> None:
         """Reset to defaults. Mainly used by tests."""
         with self._lock:
-            baseline = compile_plan(DEFAULT_STATE)
-            meta = dict(baseline.get("meta", {}))
-            meta["version"] = 0
-            meta["updated_at"] = datetime.now(timezone.utc).isoformat()
-            baseline["meta"] = meta
-            self._plan = baseline
             self._version = 0
+            self._current = self._stamp(frozen_plan(DEFAULT_STATE), 0)
 
 
 __all__ = [
     "DEFAULT_STATE",
+    "FrozenDict",
+    "FrozenList",
     "WeatherPlanStore",
     "compile_plan",
+    "freeze",
+    "frozen_plan",
+    "plan_json",
+    "thaw",
+    "warm_plan_table",
 ]
@@ -2,19 +2,42 @@ from __future__ import annotations
 
 import hashlib
 import json
+import logging
+import os
 import re
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from comfyvn.assets.pose_utils import load_pose as _load_pose
 from comfyvn.ext.plugins import PluginManager
 from comfyvn.workflows.models import NodeSpec, WorkflowSpec
 
+LOGGER = logging.getLogger(__name__)
+
 CACHE_DIR = Path("./data/runtime_cache")
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+DEFAULT_CACHE_MAX_ENTRIES = int(
+    os.getenv("COMFYVN_RUNTIME_CACHE_MAX_ENTRIES", "2048") or 2048
+)
+DEFAULT_CACHE_MAX_BYTES = int(
+    os.getenv("COMFYVN_RUNTIME_CACHE_MAX_BYTES", str(256 * 1024 * 1024))
+    or 256 * 1024 * 1024
+)
+DEFAULT_MAX_WORKERS = 4
+# Per node type (lower-cased) caps on concurrently running nodes.  Types not
+# listed may use the whole pool; callers can override per runtime.
+DEFAULT_TYPE_LIMITS: Dict[str, int] = {
+    "poseinterpolatorworkflow": 1,
+}
+
+_REF_PATTERN = re.compile(r"\$\{([a-zA-Z0-9_\.]+)\}")
+
 
 def _hash(o: Any) -> str:
     return hashlib.sha256(
@@ -69,6 +92,131 @@ class RunRecord:
     outputs: Dict[str, Any] = field(default_factory=dict)
 
 
+class RuntimeCache:
+    """
+    Size-bounded, content-addressed store for node results.
+
+    Entries are JSON files named by the hash of ``(node type, payload)`` so
+    identical work shares one entry across nodes and workflows.  An in-memory
+    LRU index (seeded from file mtimes on first use) enforces ``max_entries``
+    and ``max_bytes``; hits refresh recency and the least recently used files
+    are deleted first.
+    """
+
+    def __init__(
+        self,
+        root: Path | str = CACHE_DIR,
+        *,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        self.root = Path(root)
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self._lock = threading.Lock()
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        if self._index is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            entries: List[Tuple[float, str, int]] = []
+            for path in self.root.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path.stem, stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((key, size) for _, key, size in entries)
+            self._bytes = sum(self._index.values())
+            self._evict()
+        return self._index
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            index = self._load_index()
+            if key not in index:
+                self.misses += 1
+                return None
+            path = self._path(key)
+            try:
+                value = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                self._bytes -= index.pop(key, 0)
+                self.misses += 1
+                return None
+            index.move_to_end(key)
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        data = json.dumps(value)
+        size = len(data.encode("utf-8"))
+        with self._lock:
+            index = self._load_index()
+            if size > self.max_bytes:
+                return
+            try:
+                self._path(key).write_text(data, encoding="utf-8")
+            except OSError:
+                LOGGER.debug("Runtime cache write failed for %s", key, exc_info=True)
+                return
+            self._bytes += size - index.pop(key, 0)
+            index[key] = size
+            self._evict()
+
+    def _evict(self) -> None:
+        index = self._index
+        if index is None:
+            return
+        while index and (len(index) > self.max_entries or self._bytes > self.max_bytes):
+            key, size = index.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            index = self._load_index()
+            for key in list(index):
+                try:
+                    self._path(key).unlink()
+                except OSError:
+                    pass
+            index.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            index = self._load_index()
+            return {
+                "entries": len(index),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+RUNTIME_CACHE = RuntimeCache(CACHE_DIR)
+
+
 class NodeExec:
     def __init__(self):
         self.pm = PluginManager()
@@ -220,62 +368,102 @@ class NodeExec:
 
 
 class WorkflowRuntime:
+    """
+    Execute a workflow DAG, running independent ready nodes concurrently.
+
+    Nodes are dispatched to a thread pool as soon as every node they read from
+    (``inputs`` references and ``${name}`` references to another node's
+    ``$output.name``) has finished, subject to ``max_workers`` overall and
+    ``type_limits`` per lower-cased node type.  Parameters, ``when`` guards and
+    cache lookups are evaluated on the calling thread; only ``NodeExec.call``
+    runs in the pool.  The first failing node stops new dispatches, nodes
+    already running are allowed to finish, and the reported ``nodes`` stay in
+    topological order.
+    """
+
     def __init__(
         self,
         wf: Dict[str, Any],
         run_id: str,
         inputs: Dict[str, Any] | None = None,
         cache: bool = True,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        type_limits: Optional[Mapping[str, int]] = None,
+        result_cache: Optional[RuntimeCache] = None,
     ):
         self.spec = WorkflowSpec.model_validate(wf)
         self.inputs = inputs or {}
         self.exec = NodeExec()
         self.cache_enabled = cache
+        self.cache = result_cache or RUNTIME_CACHE
         self.run_id = run_id
+        self.max_workers = max(1, int(max_workers))
+        self.type_limits = {**DEFAULT_TYPE_LIMITS}
+        for typ, limit in (type_limits or {}).items():
+            self.type_limits[str(typ).lower()] = max(1, int(limit))
         self.values: Dict[str, Dict[str, Any]] = {}  # node -> outputs
         self.ctx = {"input": self.inputs, **self.inputs}
+        self._nodes: Dict[str, NodeSpec] = {n.id: n for n in self.spec.nodes}
+        self._exposed: Dict[str, str] = {}  # $output name -> producing node
+        for n in self.spec.nodes:
+            for target in (n.outputs or {}).values():
+                if target.startswith("$output."):
+                    self._exposed.setdefault(target.split(".", 1)[1], n.id)
 
     def _node_deps(self, n: NodeSpec) -> Set[str]:
         deps: Set[str] = set()
         for src in list(n.inputs.values()):
-            if src and "." in src and not src.startswith("$input."):
-                snode, _ = src.split(".", 1)
-                deps.add(snode)
+            if not src or src.startswith("$input."):
+                continue
+            for part in src.split("|"):
+                part = part.strip()
+                if "." in part:
+                    snode, _ = part.split(".", 1)
+                    if snode in self._nodes:
+                        deps.add(snode)
+        # ${name} in params reads ctx values other nodes expose via $output.
+        for ref in _REF_PATTERN.findall(json.dumps(n.params or {}, default=str)):
+            producer = self._exposed.get(ref.split(".", 1)[0])
+            if producer is not None and producer != n.id:
+                deps.add(producer)
         return deps
 
     def _toposort(self) -> List[str]:
-        ids = {n.id: self._node_deps(n) for n in self.spec.nodes}
+        deps = {n.id: self._node_deps(n) for n in self.spec.nodes}
+        dependents: Dict[str, List[str]] = {nid: [] for nid in deps}
+        for nid, needs in deps.items():
+            for dep in needs:
+                dependents[dep].append(nid)
+        remaining = {nid: len(needs) for nid, needs in deps.items()}
+        position = {nid: i for i, nid in enumerate(deps)}
+        level = [nid for nid, count in remaining.items() if not count]
         out: List[str] = []
-        while ids:
-            ready = [k for k, v in list(ids.items()) if not v]
-            if not ready:  # cycle
-                raise ValueError("cycle detected in workflow")
-            for r in ready:
-                out.append(r)
-                ids.pop(r)
-            for v in ids.values():
-                v.difference_update(set(ready))
+        while level:
+            out.extend(level)
+            following: List[str] = []
+            for nid in level:
+                for child in dependents[nid]:
+                    remaining[child] -= 1
+                    if not remaining[child]:
+                        following.append(child)
+            level = sorted(following, key=position.__getitem__)
+        if len(out) != len(deps):
+            raise ValueError("cycle detected in workflow")
         return out
 
     def _cache_key(self, n: NodeSpec, payload: Dict[str, Any]) -> str:
-        base = {"id": n.id, "type": n.type, "payload": payload}
-        return _hash(base)
+        return _hash({"type": n.type.lower(), "payload": payload})
 
     def _read_cache(self, key: str) -> Optional[Dict[str, Any]]:
         if not self.cache_enabled:
             return None
-        p = CACHE_DIR / f"{key}.json"
-        if p.exists():
-            try:
-                return json.loads(p.read_text(encoding="utf-8"))
-            except Exception:
-                return None
-        return None
+        return self.cache.get(key)
 
     def _write_cache(self, key: str, out: Dict[str, Any]):
         if not self.cache_enabled:
             return
-        (CACHE_DIR / f"{key}.json").write_text(json.dumps(out), encoding="utf-8")
+        self.cache.put(key, out)
 
     def _eval_inputs(self, n: NodeSpec) -> Dict[str, Any]:
         def resolve(src):
@@ -312,52 +500,119 @@ class WorkflowRuntime:
         # simple interpolation only
         return _interpolate(params, self.ctx)
 
+    def _expose(self, node: NodeSpec) -> None:
+        # expose node.outputs -> $output
+        for port, target in (node.outputs or {}).items():
+            if target.startswith("$output."):
+                oname = target.split(".", 1)[1]
+                self.ctx[oname] = self.values[node.id].get(port)
+
     def run(self) -> Dict[str, Any]:
         order = self._toposort()
-        record: Dict[str, Any] = {}
-        for nid in order:
-            node = next(n for n in self.spec.nodes if n.id == nid)
-            # optional conditional: when=false skips
-            when = (
-                node.params.get("when", True) if isinstance(node.params, dict) else True
-            )
-            if isinstance(when, str):
-                when = bool(_interpolate(when, self.ctx))
-            if not when:
-                self.values[nid] = {}
-                continue
-            payload = {
-                **self._coerce_params(node.params or {}),
-                **self._eval_inputs(node),
-            }
-            key = self._cache_key(node, payload)
-            cached = self._read_cache(key)
-            ns = NodeResult(started=time.time())
-            if cached is not None:
-                ns.outputs = cached
-                ns.finished = time.time()
-                ns.cached = True
-                self.values[nid] = cached
-            else:
-                res = self.exec.call(node.type, payload) or {}
-                ok = bool(res.get("ok", True))
-                ns.ok = ok
-                if not ok:
-                    ns.error = str(res.get("error", "error"))
+        rank = {nid: i for i, nid in enumerate(order)}
+        waiting = {nid: set(self._node_deps(self._nodes[nid])) for nid in order}
+        dependents: Dict[str, List[str]] = {nid: [] for nid in order}
+        for nid, needs in waiting.items():
+            for dep in needs:
+                dependents[dep].append(nid)
+        ready: deque[str] = deque(nid for nid in order if not waiting[nid])
+        record: Dict[str, NodeResult] = {}
+        running: Dict[Future, Tuple[NodeSpec, str, NodeResult]] = {}
+        active: Dict[str, int] = {}
+        failed = False
+        error: Optional[BaseException] = None
+
+        def _finish(nid: str) -> None:
+            for child in dependents[nid]:
+                needs = waiting[child]
+                needs.discard(nid)
+                if not needs:
+                    ready.append(child)
+
+        def _dispatch(pool: ThreadPoolExecutor) -> None:
+            deferred: List[str] = []
+            while ready:
+                nid = ready.popleft()
+                node = self._nodes[nid]
+                # optional conditional: when=false skips
+                when = (
+                    node.params.get("when", True)
+                    if isinstance(node.params, dict)
+                    else True
+                )
+                if isinstance(when, str):
+                    when = bool(_interpolate(when, self.ctx))
+                if not when:
+                    self.values[nid] = {}
+                    _finish(nid)
+                    continue
+                typ = node.type.lower()
+                limit = self.type_limits.get(typ, self.max_workers)
+                if len(running) >= self.max_workers or active.get(typ, 0) >= limit:
+                    deferred.append(nid)
+                    continue
+                payload = {
+                    **self._coerce_params(node.params or {}),
+                    **self._eval_inputs(node),
+                }
+                key = self._cache_key(node, payload)
+                ns = NodeResult(started=time.time())
+                cached = self._read_cache(key)
+                if cached is not None:
+                    ns.outputs = cached
                     ns.finished = time.time()
+                    ns.cached = True
+                    self.values[nid] = cached
                     record[nid] = ns
+                    self._expose(node)
+                    _finish(nid)
+                    continue
+                active[typ] = active.get(typ, 0) + 1
+                future = pool.submit(self.exec.call, node.type, payload)
+                running[future] = (node, key, ns)
+            # keep topological priority for nodes held back by limits
+            ready.extendleft(reversed(deferred))
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"wf-{self.run_id}"[:32],
+        ) as pool:
+            while True:
+                if not failed and error is None:
+                    try:
+                        _dispatch(pool)
+                    except Exception as exc:
+                        error = exc
+                if not running:
                     break
-                outs = {k: v for k, v in res.items() if k not in {"ok"}}
-                ns.outputs = outs
-                ns.finished = time.time()
-                self._write_cache(key, outs)
-                self.values[nid] = outs
-            record[nid] = ns
-            # expose node.outputs -> $output
-            for port, target in (node.outputs or {}).items():
-                if target.startswith("$output."):
-                    oname = target.split(".", 1)[1]
-                    self.ctx[oname] = self.values[nid].get(port)
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: rank[running[f][0].id]):
+                    node, key, ns = running.pop(future)
+                    typ = node.type.lower()
+                    active[typ] -= 1
+                    try:
+                        res = future.result() or {}
+                    except Exception as exc:
+                        if error is None:
+                            error = exc
+                        continue
+                    ok = bool(res.get("ok", True))
+                    ns.ok = ok
+                    record[node.id] = ns
+                    if not ok:
+                        ns.error = str(res.get("error", "error"))
+                        ns.finished = time.time()
+                        failed = True
+                        continue
+                    outs = {k: v for k, v in res.items() if k not in {"ok"}}
+                    ns.outputs = outs
+                    ns.finished = time.time()
+                    self._write_cache(key, outs)
+                    self.values[node.id] = outs
+                    self._expose(node)
+                    _finish(node.id)
+        if error is not None:
+            raise error
         # build final outputs from wf.outputs
         outputs: Dict[str, Any] = {}
         for name, ref in (self.spec.outputs or {}).items():
@@ -367,5 +622,5 @@ class WorkflowRuntime:
         return {
             "ok": True,
             "outputs": outputs,
-            "nodes": {k: vars(v) for k, v in record.items()},
+            "nodes": {nid: vars(record[nid]) for nid in order if nid in record},
         }
@@ -525,6 +525,8 @@ def _install_settings_stub() -> None:
                     result[key] = copy.deepcopy(value)
             return result
 
+    # Tests that exercise the real manager reach it through this handle.
+    settings_module._REAL_SETTINGS_MANAGER = settings_module.SettingsManager
     settings_module.SettingsManager = _SettingsStub  # type: ignore[assignment]
     settings_module._TEST_SETTINGS_STUB = True
 
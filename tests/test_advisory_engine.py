@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from comfyvn.advisory import scanner
+from comfyvn.advisory.engine import ScanCache, ScanEngine
+from comfyvn.core import advisory
+
+
+def _bundle(**scene_text: str) -> dict:
+    return {
+        "project_id": "proj",
+        "timeline_id": "main",
+        "scenes": {
+            scene_id: {"dialogue": [{"speaker": "Aya", "text": text}]}
+            for scene_id, text in scene_text.items()
+        },
+        "characters": {"aya": {"name": "Aya"}},
+        "licenses": [{"name": "MIT"}],
+        "metadata": {"source": "test"},
+    }
+
+
+def test_engine_rescans_only_edited_nodes(tmp_path, monkeypatch):
+    monkeypatch.setattr(advisory, "advisory_logs", [])
+    engine = ScanEngine(ScanCache(tmp_path / "scan.db"), max_workers=4)
+    bundle = _bundle(s1="Mario waves.", s2="Quiet rain.", s3="Plain text.")
+
+    first = engine.scan(bundle)
+    jobs = engine.last_stats["jobs"]
+    assert engine.last_stats["scanned"] == jobs and engine.last_stats["cached"] == 0
+    assert any(
+        entry["code"] == "copyright" and entry["detail"].get("node") == "scene:s1"
+        for entry in first
+    )
+    logged = len(advisory.advisory_logs)
+
+    assert engine.scan(bundle) == first
+    assert engine.last_stats["cached"] == jobs
+    assert len(advisory.advisory_logs) == logged  # hits are not re-logged
+
+    edited = _bundle(s1="Mario waves.", s2="Zelda hums.", s3="Plain text.")
+    findings = engine.scan(edited)
+    node_plugins = sum(1 for p in engine._plugins() if p.scope == "node")
+    bundle_plugins = len(engine._plugins()) - node_plugins
+    assert engine.last_stats["scanned"] == node_plugins + bundle_plugins
+    assert any(
+        entry["code"] == "copyright" and entry["detail"].get("node") == "scene:s2"
+        for entry in findings
+    )
+    engine.close()
+
+    reopened = ScanEngine(ScanCache(tmp_path / "scan.db"), max_workers=2)
+    assert reopened.scan(edited) == findings
+    assert reopened.last_stats["cached"] == jobs
+    reopened.close()
+
+
+def test_plugin_version_bump_invalidates_cached_findings(monkeypatch):
+    monkeypatch.setattr(advisory, "advisory_logs", [])
+    monkeypatch.setattr(scanner, "_PLUGINS", [])
+    calls = []
+
+    def plugin(context):
+        calls.append(sorted(context.scenes))
+        return []
+
+    scanner.register_scanner_plugin("count_calls", plugin, scope="node")
+    engine = ScanEngine(max_workers=1)
+    bundle = _bundle(s1="one", s2="two")
+
+    engine.scan(bundle)
+    engine.scan(bundle)
+    assert sorted(calls) == [[], [], ["s1"], ["s2"]]  # 4 nodes, scanned once
+
+    scanner.register_scanner_plugin(
+        "count_calls", plugin, scope="node", version="2", replace=True
+    )
+    streamed = list(engine.iter_scan(bundle))
+    assert len(calls) == 8
+    assert engine.last_stats["scanned"] == 4
+    assert all("level" in entry for entry in streamed)
+    engine.close()
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+import wave
+from array import array
 from collections import defaultdict
 from pathlib import Path
 
@@ -11,6 +14,7 @@ except Exception:  # pragma: no cover
     Image = None  # type: ignore
 
 from comfyvn.core import modder_hooks
+from comfyvn.studio.core import thumbnailer
 from comfyvn.studio.core.asset_registry import AssetRegistry
 
 
@@ -176,3 +180,61 @@ def test_image_thumbnail_generates_multiple_sizes(tmp_path):
     for rel in paths.values():
         thumb_path = thumb_root / Path(rel).name
         assert thumb_path.exists(), f"expected thumbnail at {thumb_path}"
+
+
+@pytest.mark.skipif(Image is None, reason="Pillow required for thumbnail generation")
+def test_jpeg_thumbnails_share_one_decode(tmp_path):
+    source = tmp_path / "plate.jpg"
+    Image.new("RGB", (1600, 900), color="green").save(source)  # type: ignore[attr-defined]
+    targets = [(256, tmp_path / "t_256.jpg"), (512, tmp_path / "t_512.jpg")]
+
+    failed = thumbnailer.render_image_thumbnails(source, targets)
+
+    assert failed == []
+    with Image.open(targets[0][1]) as small, Image.open(targets[1][1]) as large:  # type: ignore[attr-defined]
+        assert max(small.size) == 256
+        assert max(large.size) == 512
+
+
+def test_waveform_preview_matches_python_fallback(tmp_path, monkeypatch):
+    source = tmp_path / "tone.wav"
+    frames = array("h", [int(12000 * ((i % 97) / 48.0 - 1.0)) for i in range(44_100)])
+    with wave.open(str(source), "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(22_050)
+        wav_file.writeframes(frames.tobytes())
+
+    mapped_path = tmp_path / "mapped.json"
+    assert thumbnailer.render_waveform_preview(source, mapped_path)
+    monkeypatch.setattr(thumbnailer, "np", None)
+    python_path = tmp_path / "python.json"
+    assert thumbnailer.render_waveform_preview(source, python_path)
+
+    mapped = json.loads(mapped_path.read_text(encoding="utf-8"))
+    fallback = json.loads(python_path.read_text(encoding="utf-8"))
+    assert mapped == fallback
+    assert mapped["channels"] == 2
+    assert 0 < len(mapped["points"]) <= thumbnailer.WAVEFORM_POINTS
+
+
+def test_thumbnail_executor_defaults_to_threads_and_shuts_down(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    AssetRegistry.shutdown_thumbnail_executors()
+    assert AssetRegistry.THUMB_EXECUTOR_KIND == "thread"
+    executor = AssetRegistry._get_thumbnail_executor()
+    assert isinstance(executor, ThreadPoolExecutor)
+    assert executor.submit(sum, [1, 2]).result(timeout=5) == 3
+
+    AssetRegistry.shutdown_thumbnail_executors()
+    assert AssetRegistry._thumb_executor is None
+    assert AssetRegistry._get_thumbnail_executor() is not executor
+
+    monkeypatch.setattr(AssetRegistry, "THUMB_EXECUTOR_KIND", "process")
+    monkeypatch.setattr("os.cpu_count", lambda: 64)
+    pool = AssetRegistry._create_thumbnail_executor()
+    try:
+        assert pool._max_workers == AssetRegistry.THUMB_PROCESS_WORKERS
+    finally:
+        pool.shutdown(wait=False)
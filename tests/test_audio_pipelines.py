@@ -6,6 +6,7 @@ import shutil
 import wave
 from pathlib import Path
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -224,3 +225,43 @@ def test_music_api_returns_asset_and_style(tmp_path, monkeypatch):
         assert data_cached["asset_id"] == data["asset_id"]
         assert data_cached["artifact"] == data["artifact"]
         assert data_cached["duration_ms"] == data["duration_ms"]
+
+
+def test_vectorised_synthesis_matches_python_fallback(monkeypatch):
+    from comfyvn.core import audio_synth
+
+    if not audio_synth.numpy_available():
+        pytest.skip("numpy not installed")
+
+    def _render():
+        voice, _ = audio_stub._generate_samples(
+            "Hello there, friend! 42?",
+            voice="alice",
+            lang="en",
+            style="warm",
+            sample_rate=audio_stub.DEFAULT_SAMPLE_RATE,
+            seed_value=1234,
+        )
+        profile = {
+            "tempo": 128.0,
+            "root_freq": 220.0,
+            "harmony_spread": 0.32,
+            "layer_count": 4,
+        }
+        layers = music_remix._plan_music_layers(style_profile=profile, seed=7)
+        chunks = music_remix._music_chunks(
+            duration=1.5,
+            sample_rate=8000,
+            style_profile=profile,
+            layers=layers,
+            chunk_frames=1000,
+        )
+        stereo = b"".join(audio_synth._stereo_chunks(chunks, phase_offset=16))
+        return bytes(voice.tobytes()), stereo
+
+    vectorised = _render()
+    monkeypatch.setattr(audio_synth, "np", None)
+    fallback = _render()
+
+    assert vectorised[0] == fallback[0]
+    assert vectorised[1] == fallback[1]
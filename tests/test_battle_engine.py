@@ -102,3 +102,53 @@ def test_simulate_formula_roll_breakdown_matches_expected_fields() -> None:
         } <= entry.components.keys()
         total_components = sum(entry.components.values())
         assert abs(total_components - entry.total) < 1e-6
+
+
+def test_simulate_batch_matches_single_simulations() -> None:
+    stats = {
+        "hero": {"base": 5, "str": 3, "agi": 2, "rng": 4},
+        "villain": {"base": 6, "str": 2, "weapon_tier": 2, "rng": 3},
+        "Guard": {"base": 7.25},
+    }
+    batch = engine.simulate_batch(stats, count=400, seed=11, include_outcomes=True)
+    expected = [
+        engine.simulate(stats, seed=seed, narrate=False).outcome
+        for seed in range(11, 411)
+    ]
+    assert batch.outcomes == expected
+    assert sum(batch.wins.values()) == 400
+
+    payload = batch.as_dict()
+    assert sum(payload["margin_histogram"]["counts"]) == 400
+    assert payload["win_probability"]["hero"]["ci95"][0] <= (
+        payload["win_probability"]["hero"]["win_rate"]
+    )
+    # Raising a contender's own stat never lowers their win rate.
+    assert batch.sensitivity["hero"]["str"] > 0
+    assert batch.sensitivity["villain"]["base"] > 0
+
+
+def test_simulate_batch_handles_large_runs_and_caps_bins() -> None:
+    stats = {"a": {"base": 5, "rng": 2}, "b": {"base": 5.5, "rng": 2}}
+    result = engine.simulate_batch(stats, count=100_000, seed=1, sensitivity=False)
+    assert result.simulations == 100_000
+    assert sum(result.wins.values()) == 100_000
+    assert result.wins["b"] > result.wins["a"] > 0
+    histogram = result.as_dict()["margin_histogram"]
+    assert sum(histogram["counts"]) == 100_000
+    assert len(histogram["counts"]) == engine.DEFAULT_HISTOGRAM_BINS
+
+    capped = engine.simulate_batch(
+        stats, count=10, seed=1, bins=engine.MAX_HISTOGRAM_BINS, sensitivity=False
+    )
+    assert len(capped.as_dict()["margin_histogram"]["counts"]) == (
+        engine.MAX_HISTOGRAM_BINS
+    )
+    with pytest.raises(ValueError):
+        engine.simulate_batch(stats, count=10, bins=engine.MAX_HISTOGRAM_BINS + 1)
+
+    with pytest.raises(ValueError):
+        engine.simulate_batch(stats, count=0)
+    for bad in ({"delta": "nan"}, {"delta": float("inf")}, {"bins": 10**9}):
+        with pytest.raises(ValueError):
+            engine.simulate_batch(stats, count=10, **bad)
@@ -120,3 +120,13 @@ def test_battle_resolve_updates_state_and_emits_hook() -> None:
     assert hook_payload["formula"] == engine.FORMULA_V0
     assert hook_payload["log"]
     assert hook_payload["seed"] == 17
+
+
+def test_battle_sim_batch_rejects_invalid_parameters() -> None:
+    stats = {"team_a": {"base": 5}, "team_b": {"base": 5}}
+    with TestClient(create_app()) as client:
+        for extra in ({"delta": "nan"}, {"bins": 10**9}):
+            response = client.post(
+                "/api/battle/sim/batch", json={"stats": stats, "count": 10, **extra}
+            )
+            assert response.status_code == 400, response.text
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from comfyvn.gui.services.bridge_transport import (
+    BridgeTransport,
+    MetricsStream,
+    iter_sse,
+)
+from comfyvn.server.system_metrics import MetricsBroadcaster, iter_metrics_sse
+
+
+def test_transport_coalesces_identical_gets_and_resolves_timeouts():
+    calls = {"GET": 0, "POST": 0}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            calls[request.method] += 1
+        time.sleep(0.15)
+        return httpx.Response(200, json={"items": [1, 2, 3]})
+
+    transport = BridgeTransport(
+        max_workers=4,
+        timeouts={"/system/ping": 0.5, "/system": 3.0},
+        transport=httpx.MockTransport(handler),
+    )
+    assert transport.timeout_for("http://x/system/ping") == 0.5
+    assert transport.timeout_for("http://x/system/metrics") == 3.0
+    assert transport.timeout_for("http://x/api/other") == transport.default_timeout
+
+    results = []
+    done = threading.Semaphore(0)
+
+    def collect(result):
+        results.append(result)
+        done.release()
+
+    for _ in range(4):
+        transport.submit(
+            lambda: transport.request(
+                "GET", "http://x/api/items", params={"b": 2, "a": 1}
+            ),
+            collect,
+        )
+    for _ in range(4):
+        done.acquire()
+    assert calls["GET"] == 1
+    assert transport.stats()["coalesced"] == 3
+    assert all(result["ok"] and result["status"] == 200 for result in results)
+    results[0]["data"]["items"].append(4)
+    assert results[1]["data"] == {"items": [1, 2, 3]}
+
+    transport.request("POST", "http://x/api/items", json_payload={"a": 1})
+    transport.request("POST", "http://x/api/items", json_payload={"a": 1})
+    assert calls["POST"] == 2
+    transport.close()
+
+    def broken(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    failing = BridgeTransport(transport=httpx.MockTransport(broken))
+    result = failing.request("GET", "http://x/health")
+    assert result["ok"] is False and result["status"] is None
+    assert "refused" in result["error"]
+    failing.close()
+
+
+def test_metrics_sse_is_shared_and_followed_by_stream_client():
+    samples = {"count": 0}
+
+    def sampler():
+        samples["count"] += 1
+        return {"ok": True, "cpu": 1.0, "n": samples["count"]}
+
+    broadcaster = MetricsBroadcaster(sampler, min_age=5.0)
+
+    async def drain():
+        async def one():
+            return [
+                frame
+                async for frame in iter_metrics_sse(
+                    0.01, limit=3, broadcaster=broadcaster
+                )
+            ]
+
+        return await asyncio.gather(one(), one())
+
+    first, second = asyncio.run(drain())
+    assert first == second
+    assert first[0].startswith(b"retry:")
+    assert samples["count"] == 1
+    text = b"".join(first).decode()
+    events = list(iter_sse(text.split("\n")))
+    assert [name for name, _ in events] == ["metrics"] * 3
+    assert list(iter_sse([": ping", "data: a", "data: b", ""])) == [("message", "a\nb")]
+
+    received = []
+    states = []
+    got = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["interval"] == "0.5"
+        return httpx.Response(
+            200,
+            content=text.encode(),
+            headers={"content-type": "text/event-stream"},
+        )
+
+    def on_event(payload):
+        received.append(payload)
+        got.set()
+
+    stream = MetricsStream(
+        "http://x/system/metrics/stream",
+        on_event,
+        on_state=states.append,
+        interval=0.5,
+        backoff=(5.0,),
+        transport=httpx.MockTransport(handler),
+    )
+    stream.start()
+    assert got.wait(2.0)
+    assert received[0] == {"ok": True, "cpu": 1.0, "n": 1}
+    assert stream.live() or "disconnected" in states
+    stream.stop()
+    assert states[0] == "connected"
+    assert not stream.live()
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from pathlib import Path
+from typing import Any, Dict, List
 
 import pytest
+from fastapi import WebSocketDisconnect
 from fastapi.testclient import TestClient
 
-from comfyvn.collab import CRDTOperation
+from comfyvn.collab import CRDTDocument, CRDTOperation
+from comfyvn.collab.room import (
+    ClientOutbox,
+    CollabClientState,
+    CollabHub,
+    CollabRoom,
+)
 from comfyvn.server.app import app
 from comfyvn.server.core import storage
 from comfyvn.server.core.collab import HUB, get_room
+from comfyvn.server.modules.collab_api import collab_ws
 
 
 def _set_scene_root(tmp_path: Path) -> None:
@@ -162,3 +172,226 @@ def test_collab_room_rest_lifecycle(api_client: TestClient, tmp_path) -> None:
     assert leave_payload["presence"]["participants"] == []
 
     HUB.discard_empty()
+
+
+class _ScriptedSocket:
+    """Minimal stand-in for Starlette's WebSocket driven from a queue."""
+
+    def __init__(self, user: str, query: Dict[str, str]) -> None:
+        self.headers = {"x-comfyvn-user": user}
+        self.query_params = query
+        self.inbox: asyncio.Queue[str | None] = asyncio.Queue()
+        self.sent: List[Dict[str, Any]] = []
+
+    async def accept(self) -> None:
+        return None
+
+    async def receive_text(self) -> str:
+        message = await self.inbox.get()
+        if message is None:
+            raise WebSocketDisconnect(code=1000)
+        return message
+
+    async def send_text(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+    async def close(self, code: int = 1000) -> None:
+        await self.inbox.put(None)
+
+    def of_type(self, msg_type: str) -> List[Dict[str, Any]]:
+        return [item for item in self.sent if item.get("type") == msg_type]
+
+
+async def _wait_for(ws: _ScriptedSocket, msg_type: str) -> Dict[str, Any]:
+    for _ in range(200):
+        found = ws.of_type(msg_type)
+        if found:
+            return found[-1]
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"no {msg_type} message received")
+
+
+def test_collab_ws_delta_and_snapshot_modes(tmp_path) -> None:
+    _set_scene_root(tmp_path)
+
+    async def scenario() -> None:
+        alice = _ScriptedSocket("alice", {"scene_id": "delta_scene"})
+        bob = _ScriptedSocket("bob", {"scene_id": "delta_scene", "mode": "snapshot"})
+        tasks = [asyncio.create_task(collab_ws(ws)) for ws in (alice, bob)]
+        assert (await _wait_for(alice, "room.joined"))["mode"] == "delta"
+        assert (await _wait_for(bob, "room.joined"))["mode"] == "snapshot"
+
+        operation = {
+            "op_id": "alice:1",
+            "clock": 3,
+            "kind": "scene.field.set",
+            "payload": {"field": "title", "value": "Delta"},
+        }
+        await alice.inbox.put(
+            json.dumps({"type": "doc.apply", "operations": [operation]})
+        )
+        delta = await _wait_for(alice, "doc.update")
+        assert "snapshot" not in delta
+        assert delta["base_version"] == delta["version"] - 1
+        assert delta["vector"] == {"alice": 3}
+        assert delta["operations"][0]["applied"] is True
+        assert (await _wait_for(bob, "doc.update"))["snapshot"]["title"] == "Delta"
+
+        since = delta["base_version"]
+        await alice.inbox.put(json.dumps({"type": "doc.resync", "since": since}))
+        history = (await _wait_for(alice, "doc.history"))["history"]
+        assert [item["op_id"] for item in history] == ["alice:1"]
+        assert not alice.of_type("doc.snapshot")
+
+        for ws in (alice, bob):
+            await ws.inbox.put(None)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    HUB.discard_empty()
+
+
+def test_collab_modder_hook_carries_snapshot_in_delta_rooms(
+    tmp_path, monkeypatch
+) -> None:
+    _set_scene_root(tmp_path)
+    from comfyvn.server.modules import collab_api
+
+    emitted: List[Dict[str, Any]] = []
+    monkeypatch.setattr(
+        collab_api,
+        "emit_modder_hook",
+        lambda name, payload: (
+            emitted.append(payload) if name == "on_collab_operation" else None
+        ),
+    )
+
+    async def scenario() -> None:
+        alice = _ScriptedSocket("alice", {"scene_id": "hook_scene"})
+        task = asyncio.create_task(collab_ws(alice))
+        await _wait_for(alice, "room.joined")
+        operation = {
+            "op_id": "alice:1",
+            "clock": 1,
+            "kind": "scene.field.set",
+            "payload": {"field": "title", "value": "Hooked"},
+        }
+        await alice.inbox.put(
+            json.dumps({"type": "doc.apply", "operations": [operation]})
+        )
+        assert "snapshot" not in await _wait_for(alice, "doc.update")
+        await alice.inbox.put(None)
+        await task
+
+    asyncio.run(scenario())
+    HUB.discard_empty()
+    assert emitted and emitted[-1]["snapshot"]["title"] == "Hooked"
+
+
+class _RecordingSocket:
+    def __init__(self, *, stall: bool = False) -> None:
+        self.stall = stall
+        self.messages: List[str] = []
+        self.closed_with: int | None = None
+
+    async def send_text(self, message: str) -> None:
+        if self.stall:
+            await asyncio.Event().wait()
+        self.messages.append(message)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+
+def test_room_broadcast_queues_once_and_evicts_slow_consumers() -> None:
+    async def scenario() -> None:
+        room = CollabRoom("fanout", CRDTDocument("fanout"))
+        sockets: Dict[str, _RecordingSocket] = {}
+        for index in range(20):
+            client_id = f"editor{index}"
+            socket = _RecordingSocket(stall=index == 0)
+            outbox = ClientOutbox(socket, max_pending=2)
+            room.join(
+                CollabClientState(
+                    client_id=client_id,
+                    user_name=client_id,
+                    websocket=socket,
+                    outbox=outbox,
+                )
+            )
+            outbox.start()
+            sockets[client_id] = socket
+
+        frames = [f'{{"seq":{seq}}}' for seq in range(4)]
+        evicted: List[str] = []
+        for frame in frames:
+            evicted.extend(room.broadcast(frame))
+            await asyncio.sleep(0)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert evicted == ["editor0"]
+        assert "editor0" not in room.clients
+        assert sockets["editor0"].closed_with == 1013
+        for client_id in list(room.clients):
+            received = sockets[client_id].messages
+            assert received == frames
+            assert all(a is b for a, b in zip(received, frames))
+        for state in room.clients.values():
+            await state.outbox.close()
+
+    asyncio.run(scenario())
+
+
+def test_room_op_log_coalesces_snapshots_and_replays(tmp_path) -> None:
+    saved: List[Dict[str, Any]] = []
+
+    def _hub() -> CollabHub:
+        return CollabHub(
+            loader=lambda scene_id: dict(saved[-1]) if saved else {},
+            saver=saved.append,
+            oplog_path=lambda scene_id: tmp_path / f"{scene_id}.jsonl",
+            snapshot_interval=60.0,
+            snapshot_ops=3,
+        )
+
+    def _title(seq: int) -> CRDTOperation:
+        return _op(
+            f"typist:{seq}",
+            "typist",
+            seq,
+            "scene.field.set",
+            {"field": "title", "value": f"draft {seq}"},
+        )
+
+    async def scenario() -> None:
+        hub = _hub()
+        room = await hub.room("logged")
+        for seq in (1, 2):
+            room.apply_operations("typist", [_title(seq)])
+            await room.checkpoint()
+        assert saved == []  # durable in the log, no snapshot yet
+
+        room.apply_operations("typist", [_title(3)])
+        await room.checkpoint()
+        await asyncio.sleep(0.05)
+        assert len(saved) == 1
+        assert saved[0]["title"] == "draft 3"
+        assert saved[0]["oplog_seq"] == 3
+        assert (tmp_path / "logged.jsonl").read_text(encoding="utf-8") == ""
+
+        room.apply_operations("typist", [_title(4), _title(5)])
+        await room.checkpoint()
+        hub.discard_empty()
+
+        reloaded = await _hub().room("logged")
+        assert len(saved) == 1
+        assert reloaded.document.snapshot()["title"] == "draft 5"
+        assert reloaded.document.version == room.document.version
+        assert reloaded.document.clock == room.document.clock
+        assert reloaded.dirty
+        assert await reloaded.flush() is True
+        assert saved[-1]["oplog_seq"] == 5
+        reloaded.close()
+
+    asyncio.run(scenario())
@@ -127,3 +127,70 @@ def test_script_line_order_merges() -> None:
     lines = snapshot["lines"]
     assert [ln["line_id"] for ln in lines] == ["l2", "l1"]
     assert json.dumps(lines[0], sort_keys=True)
+
+
+def _line(op_id: str, clock: int, line_id: str, **placement) -> CRDTOperation:
+    payload = {"line": {"line_id": line_id, "text": line_id}, **placement}
+    return _op(op_id, op_id.split(":")[0], clock, "script.line.upsert", payload)
+
+
+def test_concurrent_reorder_keeps_inserted_lines() -> None:
+    doc = CRDTDocument(
+        "scene",
+        initial={"lines": [{"line_id": f"l{i}", "text": str(i)} for i in range(4)]},
+    )
+    # Bob inserts after l1 while Alice (who has not seen it) reverses the order.
+    doc.apply_operation(_line("bob:1", 1, "b1", after="l1"))
+    doc.apply_operation(
+        _op(
+            "alice:1",
+            "alice",
+            1,
+            "script.order.replace",
+            {"order": ["l3", "l2", "l1", "l0"]},
+        )
+    )
+    order = doc.snapshot()["order"]
+    assert [lid for lid in order if lid != "b1"] == ["l3", "l2", "l1", "l0"]
+    assert "b1" in order
+
+    moved = _op("bob:2", "bob", 2, "script.line.move", {"line_id": "b1", "index": 0})
+    assert doc.apply_operation(moved).applied is True
+    assert doc.snapshot()["order"][0] == "b1"
+
+
+def test_removed_line_anchor_and_compaction() -> None:
+    doc = CRDTDocument("scene", initial={"lines": [{"line_id": "a"}, {"line_id": "b"}]})
+    doc.apply_operation(_op("x:1", "x", 1, "script.line.remove", {"line_id": "a"}))
+    # A late insert anchored on the removed line still lands where it was.
+    doc.apply_operation(_line("y:1", 1, "late", after="a"))
+    assert doc.snapshot()["order"] == ["late", "b"]
+
+    restored = CRDTDocument("scene", initial=doc.persistable())
+    assert restored.snapshot()["order"] == ["late", "b"]
+    assert restored.persistable()["sequence"] == doc.persistable()["sequence"]
+
+    doc.max_history = 1
+    doc.apply_operation(
+        _op("z:1", "z", 5, "scene.field.set", {"field": "title", "value": "T"})
+    )
+    assert doc.compact_tombstones() == 1
+    doc.apply_operation(_line("y:2", 6, "orphan", after="a"))
+    assert doc.snapshot()["order"] == ["late", "b", "orphan"]
+
+
+def test_self_anchored_insert_and_rebalanced_snapshot() -> None:
+    doc = CRDTDocument("scene", initial={"lines": [{"line_id": "a"}, {"line_id": "b"}]})
+    # ``after`` pointing at the line itself must not drop the new line.
+    assert doc.apply_operation(_line("x:1", 1, "self", after="self")).applied
+    assert doc.snapshot()["order"] == ["a", "b", "self"]
+
+    doc.apply_operation(_op("x:2", "x", 2, "script.line.remove", {"line_id": "b"}))
+    doc._line_order.rebalance()
+    snapshot = doc.snapshot()
+    assert snapshot["order"] == ["a", "self"]
+    assert [line["line_id"] for line in snapshot["lines"]] == ["a", "self"]
+    # The tombstone was re-keyed with the live lines, so an insert anchored
+    # on the removed line still lands between its old neighbours.
+    doc.apply_operation(_line("y:1", 3, "late", after="b"))
+    assert doc.snapshot()["order"] == ["a", "late", "self"]
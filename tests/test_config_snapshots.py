@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from comfyvn.config import feature_flags
+from comfyvn.config.snapshots import SnapshotCell
+
+
+def test_snapshot_cell_rebuilds_only_when_signature_moves() -> None:
+    state = {"signature": 1, "builds": 0}
+
+    def build() -> dict:
+        state["builds"] += 1
+        return {"value": state["signature"]}
+
+    cell = SnapshotCell("test", build, lambda: state["signature"], poll_interval=0)
+    seen: list[int] = []
+    unsubscribe = cell.subscribe(lambda snapshot: seen.append(snapshot.version))
+
+    first = cell.current()
+    assert cell.current() is first
+    assert state["builds"] == 1
+
+    state["signature"] = 2
+    second = cell.current()
+    assert second.version > first.version
+    assert second.get("value") == 2
+    assert seen == [first.version, second.version]
+
+    unsubscribe()
+    published = cell.publish({"value": 3})
+    assert cell.current() is published
+    assert seen == [first.version, second.version]
+
+
+def test_feature_flags_serve_snapshot_until_files_change(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config").mkdir()
+    config = tmp_path / "config" / "comfyvn.json"
+    config.write_text(json.dumps({"features": {"enable_props": True}}))
+
+    assert feature_flags.is_enabled("enable_props", refresh=True) is True
+    snapshot = feature_flags.snapshot()
+    assert feature_flags.snapshot() is snapshot
+
+    changes: list[int] = []
+    unsubscribe = feature_flags.subscribe(lambda snap: changes.append(snap.version))
+    try:
+        config.write_text(json.dumps({"features": {"enable_props": False}}))
+        assert feature_flags.is_enabled("enable_props", refresh=True) is False
+        assert changes and changes[-1] > snapshot.version
+    finally:
+        unsubscribe()
+        monkeypatch.undo()
+        feature_flags.refresh_cache()
+
+
+def test_settings_managers_share_source_and_write_only_changed_keys(
+    tmp_path: Path,
+) -> None:
+    import sqlite3
+    from contextlib import closing
+
+    from comfyvn.core import settings_manager
+
+    # conftest swaps in a stub; this test needs the real shared-source manager.
+    SettingsManager = settings_manager._REAL_SETTINGS_MANAGER
+    config = tmp_path / "config.json"
+    db = tmp_path / "settings.db"
+    first = SettingsManager(config, db)
+    second = SettingsManager(config, db)
+    assert first._source is second._source
+    first._cell.poll_interval = 0  # check signatures on every read
+
+    first.merge({"alpha": 1, "beta": {"nested": True}})
+    assert second.get("alpha") == 1
+    assert second.snapshot() is first.snapshot()
+
+    with closing(sqlite3.connect(db)) as conn, conn:
+        conn.execute("CREATE TABLE writes (key TEXT)")
+        conn.execute(
+            "CREATE TRIGGER log_writes AFTER INSERT ON settings "
+            "BEGIN INSERT INTO writes VALUES (NEW.key); END"
+        )
+    second.patch("alpha", 2)
+    with closing(sqlite3.connect(db)) as conn:
+        written = [row[0] for row in conn.execute("SELECT key FROM writes")]
+    assert written == ["alpha"]
+    assert first.get("alpha") == 2
+
+    # An external DB edit alone is picked up without an explicit refresh.
+    version = first.version
+    with closing(sqlite3.connect(db)) as conn, conn:
+        conn.execute(
+            "UPDATE settings SET value_json = ? WHERE key = 'alpha'",
+            (json.dumps("from-db"),),
+        )
+    assert first.get("alpha") == "from-db"
+    assert first.version > version
+    assert second.get("alpha") == "from-db"
+
+    # The DB wins over a conflicting value in the JSON file.
+    payload = json.loads(config.read_text(encoding="utf-8"))
+    payload["alpha"] = "from-file"
+    payload["gamma"] = "file-only"
+    config.write_text(json.dumps(payload), encoding="utf-8")
+    assert first.get("gamma") == "file-only"
+    assert first.get("alpha") == "from-db"
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw
+
+from comfyvn.pipelines import flat2layers
+from comfyvn.pipelines.flat2layers import FlatToLayersOptions, FlatToLayersPipeline
+
+np = pytest.importorskip("numpy")
+
+
+def _plate(width: int = 203, height: int = 131) -> Image.Image:
+    image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    for y in range(0, height, 9):
+        draw.line([(0, y), (width, y)], fill=(y % 255, 90, 200 - y % 200, 255))
+    draw.ellipse((60, 20, 150, 120), fill=(240, 210, 180, 255))
+    return image
+
+
+def test_tiled_stages_match_whole_image():
+    image = _plate()
+    mask = image.getchannel("A").point(lambda px: 255 if px > 8 else 0)
+    thresholds = [0.2, 0.45, 0.7]
+
+    whole_depth = flat2layers._depth_gradient(image)
+    tiled_depth = flat2layers._depth_gradient_tiled(image, 37)
+    assert np.array_equal(np.array(whole_depth, dtype=np.uint16), tiled_depth)
+
+    whole = flat2layers._split_planes(
+        whole_depth, thresholds=thresholds, plane_count=4, mask=mask
+    )
+    tiled = flat2layers._split_planes_tiled(
+        tiled_depth, thresholds=thresholds, plane_count=4, mask=mask, tile_size=37
+    )
+    assert [bucket for bucket, _ in whole] == [bucket for bucket, _ in tiled]
+    for (_, expected), (_, actual) in zip(whole, tiled):
+        assert expected.tobytes() == actual.tobytes()
+
+    assert flat2layers._mask_statistics(mask) == flat2layers._mask_statistics(
+        mask, tile_size=37
+    )
+
+
+def test_run_many_outputs_match_untiled_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        flat2layers.feature_flags, "is_enabled", lambda *args, **kwargs: True
+    )
+    source = tmp_path / "plate.png"
+    _plate().save(source)
+
+    def _options(root: Path, tile_size):
+        return FlatToLayersOptions(
+            source_path=source,
+            output_root=root,
+            character_id="plate",
+            tile_size=tile_size,
+        )
+
+    pipeline = FlatToLayersPipeline()
+    baseline = pipeline.run(_options(tmp_path / "whole", None))
+    results = pipeline.run_many(
+        [_options(tmp_path / "a", 48), _options(tmp_path / "b", 64)], max_workers=2
+    )
+
+    def _pixels(result):
+        # PNGs embed a per-run provenance chunk, so compare decoded pixels.
+        planes = [plane.image_path for plane in result.planes]
+        return [Image.open(path).tobytes() for path in [result.mask_path, *planes]]
+
+    expected_pixels = _pixels(baseline)
+    expected_anchors = json.loads(baseline.anchors_path.read_text(encoding="utf-8"))
+    for result in results:
+        assert _pixels(result) == expected_pixels
+        anchors = json.loads(result.anchors_path.read_text(encoding="utf-8"))
+        assert anchors == expected_anchors
+    assert pipeline.last_result is results[-1]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import subprocess
+import time
+
+import pytest
+
+from comfyvn.core import gpu_telemetry
+from comfyvn.core.gpu_telemetry import (
+    FakeGPUBackend,
+    GPUTelemetrySampler,
+    NvidiaSmiBackend,
+    TelemetryBackend,
+    select_backend,
+)
+
+
+class _CountingBackend(FakeGPUBackend):
+    def __init__(self, values):
+        super().__init__(count=1)
+        self.values = list(values)
+
+    def sample(self):
+        entry = super().sample()[0]
+        util = self.values[(self.calls - 1) % len(self.values)]
+        return [dict(entry, util=util, temp_c=40 + util)]
+
+
+@pytest.fixture()
+def fake_sampler():
+    sampler = GPUTelemetrySampler(FakeGPUBackend(count=2), interval=0.01, capacity=5)
+    gpu_telemetry.reset_gpu_sampler(sampler)
+    yield sampler
+    gpu_telemetry.reset_gpu_sampler(None)
+    sampler.stop()
+
+
+def test_ring_buffer_is_bounded_and_window_aggregates():
+    sampler = GPUTelemetrySampler(
+        _CountingBackend([10, 30, 20, 90]), interval=60, capacity=3
+    )
+    for _ in range(4):
+        sampler.sample_now()
+    assert len(sampler.samples()) == 3  # oldest (util=10) evicted
+
+    window = sampler.window(60)
+    assert window["samples"] == 3
+    gpu = window["gpus"][0]
+    assert gpu["util"] == {"min": 20, "max": 90, "avg": pytest.approx(46.67)}
+    assert gpu["temp_c"]["max"] == 130
+    assert sampler.window(0.0)["samples"] == 0
+    assert sampler.stats()["buffered"] == 3
+
+
+def test_background_thread_serves_reads_from_buffer():
+    backend = FakeGPUBackend()
+    sampler = GPUTelemetrySampler(backend, interval=0.02, capacity=100).start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while backend.calls < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sampler.running and backend.calls >= 3
+        sampler.stop(close_backend=False)
+        calls = backend.calls
+        sampler.interval = 60  # buffered sample stays fresh
+        for _ in range(50):
+            assert sampler.gpus()[0]["name"] == "Fake GPU 0"
+        assert backend.calls == calls
+    finally:
+        sampler.stop()
+
+
+def test_stale_buffer_and_disabled_backend():
+    backend = FakeGPUBackend()
+    sampler = GPUTelemetrySampler(backend, interval=0.01)
+    assert sampler.latest() is not None and backend.calls == 1
+    time.sleep(0.05)
+    sampler.gpus()
+    assert backend.calls == 2
+
+    idle = GPUTelemetrySampler(TelemetryBackend()).start()
+    assert not idle.running
+    assert idle.gpus() == [] and idle.window(10)["gpus"] == []
+
+
+def test_smi_backend_parses_csv(monkeypatch):
+    captured = {}
+
+    def fake_run(args, **kwargs):
+        captured["args"] = args
+        stdout = "0, RTX 4090, 37, 1024, 24564, 51\n1, broken line\n"
+        return subprocess.CompletedProcess(args, 0, stdout, "")
+
+    monkeypatch.setattr(gpu_telemetry.shutil, "which", lambda name: "/bin/smi")
+    monkeypatch.setattr(gpu_telemetry.subprocess, "run", fake_run)
+    assert NvidiaSmiBackend().sample() == [
+        {
+            "id": 0,
+            "name": "RTX 4090",
+            "util": 37,
+            "mem_used": 1024,
+            "mem_total": 24564,
+            "temp_c": 51,
+        }
+    ]
+    assert captured["args"][0] == "/bin/smi"
+
+    monkeypatch.setattr(gpu_telemetry.shutil, "which", lambda name: None)
+    assert select_backend("smi").name == "none"
+    assert select_backend("fake").name == "fake"
+
+
+def test_metrics_routes_read_the_shared_sampler(fake_sampler):
+    pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from comfyvn.server.modules import gpu_api
+    from comfyvn.server.system_metrics import collect_system_metrics
+
+    metrics = collect_system_metrics(window=60)
+    assert [gpu["name"] for gpu in metrics["gpus"]] == ["Fake GPU 0", "Fake GPU 1"]
+    assert metrics["first_gpu"]["id"] == 0
+    assert len(metrics["gpu_window"]["gpus"]) == 2
+
+    app = FastAPI()
+    app.include_router(gpu_api.router)
+    with TestClient(app) as client:
+        payload = client.get("/api/gpu/telemetry", params={"window": 30}).json()
+    assert payload["sampler"]["backend"] == "fake"
+    assert payload["sampler"]["capacity"] == 5
+    assert payload["window"]["window_s"] == 30
+    assert {gpu["id"] for gpu in payload["latest"]["gpus"]} == {0, 1}
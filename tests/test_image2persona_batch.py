@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pytest
+from PIL import Image, ImageDraw
+
+from comfyvn.persona import image2persona
+from comfyvn.persona.image2persona import (
+    ImageLoadError,
+    ImagePersonaAnalyzer,
+    PersonaImageOptions,
+)
+
+
+def _reference(path, size, color, *, orientation=None):
+    width, height = size
+    image = Image.new("RGB", size, (245, 245, 240))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((width * 0.3, height * 0.2, width * 0.7, height * 0.9), fill=color)
+    kwargs = {}
+    if orientation:
+        exif = Image.Exif()
+        exif[0x0112] = orientation
+        kwargs["exif"] = exif
+    image.save(path, **kwargs)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    image2persona.clear_batch_cache()
+    yield
+    image2persona.clear_batch_cache()
+
+
+def test_batch_streams_progress_and_reuses_cached_features(tmp_path):
+    rotated = _reference(tmp_path / "a.jpg", (1200, 800), (200, 40, 40), orientation=6)
+    plain = _reference(tmp_path / "b.png", (600, 900), (40, 60, 200))
+    in_memory = Image.open(plain)
+    sources = [rotated, plain, in_memory, rotated]
+    analyzer = ImagePersonaAnalyzer()
+
+    events = list(analyzer.iter_analyze_batch(sources, max_workers=1))
+    assert [event.completed for event in events] == [1, 2, 3, 4]
+    assert sorted(event.index for event in events) == [0, 1, 2, 3]
+    assert not any(event.cached or event.error for event in events)
+    by_index = {event.index: event.report for event in events}
+    assert (by_index[0].width, by_index[0].height) == (800, 1200)
+    assert by_index[0].digest == by_index[3].digest
+
+    serial = analyzer.analyze_images(sources)
+    for index, report in enumerate(serial.per_image):
+        batch = by_index[index]
+        assert (batch.width, batch.height) == (report.width, report.height)
+        assert batch.appearance["primary_color"] == report.appearance["primary_color"]
+        assert batch.source == report.source
+
+    again = list(analyzer.iter_analyze_batch(sources, max_workers=1))
+    assert all(event.cached for event in again)
+
+    suggestion = analyzer.analyze_batch(sources, persona_id="hero", max_workers=1)
+    assert [report.source for report in suggestion.per_image] == [
+        report.source for report in serial.per_image
+    ]
+    assert suggestion.summary["persona_id"] == "hero"
+
+
+def test_batch_reports_missing_files_and_hooks_force_serial(tmp_path):
+    good = _reference(tmp_path / "ok.png", (300, 400), (40, 160, 60))
+    analyzer = ImagePersonaAnalyzer()
+    events = list(analyzer.iter_analyze_batch([good, tmp_path / "missing.png"]))
+    errors = [event for event in events if event.error]
+    assert len(errors) == 1 and errors[0].index == 1
+    with pytest.raises(ImageLoadError):
+        analyzer.analyze_batch([good, tmp_path / "missing.png"], max_workers=1)
+
+    seen = []
+    hooked = ImagePersonaAnalyzer(
+        PersonaImageOptions(
+            hooks={"palette": lambda image, palette: seen.append(image.size)}
+        )
+    )
+    result = hooked.analyze_batch([good], max_workers=4)
+    assert seen == [(300, 400)]
+    assert result.per_image[0].width == 300
+
+
+def test_batch_process_pool_matches_inline_and_is_reused(tmp_path):
+    colors = [(200, 40, 40), (40, 60, 200), (40, 160, 60), (180, 160, 30)]
+    sources = [
+        _reference(tmp_path / f"ref_{index}.jpg", (640, 960), color)
+        for index, color in enumerate(colors)
+    ]
+    analyzer = ImagePersonaAnalyzer()
+    inline = analyzer.analyze_batch(sources, max_workers=1)
+    assert image2persona._BATCH_POOL is None
+    image2persona.clear_batch_cache()
+    try:
+        # Four uncached images give each of the two workers two jobs.
+        pooled = analyzer.analyze_batch(sources, max_workers=2)
+        pool = image2persona._BATCH_POOL
+        assert pool is not None and image2persona._BATCH_POOL_WORKERS == 2
+        assert pooled.summary == inline.summary
+
+        image2persona.clear_batch_cache()
+        events = list(analyzer.iter_analyze_batch(sources, max_workers=2))
+        assert image2persona._BATCH_POOL is pool
+        assert not any(event.cached or event.error for event in events)
+
+        # Fewer than two images per worker stay inline.
+        image2persona.shutdown_batch_pool()
+        image2persona.clear_batch_cache()
+        analyzer.analyze_batch(sources[:3], max_workers=2)
+        assert image2persona._BATCH_POOL is None
+    finally:
+        image2persona.shutdown_batch_pool()
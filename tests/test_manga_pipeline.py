@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from PIL import Image
+
+from comfyvn.manga import providers as manga_providers
+from comfyvn.manga.pipeline import MangaPipeline, build_config
+from comfyvn.manga.providers import (
+    ProviderMetadata,
+    StageContext,
+    StageProvider,
+    StageResult,
+)
+
+
+class _EchoOCR(StageProvider):
+    metadata = ProviderMetadata(
+        id="test_echo_ocr",
+        stage="ocr",
+        label="Echo OCR (tests)",
+        kind="open_source",
+        description="Emit the page stem as dialogue.",
+    )
+    page_local = True
+
+    def run(self, ctx: StageContext, settings: Dict[str, Any]) -> StageResult:
+        results: List[Dict[str, Any]] = []
+        for page in ctx.data.get("panels") or []:
+            for panel in page.get("panels", []):
+                results.append(
+                    {
+                        "panel_id": panel["panel_id"],
+                        "page": page["page"],
+                        "text": f"Alice: {Path(page['page']).stem}",
+                        "confidence": 0.9,
+                    }
+                )
+        target = ctx.ocr_dir / "ocr_results.json"
+        target.write_text(json.dumps(results), encoding="utf-8")
+        return StageResult(payload=results, artifacts=[target])
+
+
+class _WholeBookOCR(_EchoOCR):
+    metadata = ProviderMetadata(
+        id="test_whole_book_ocr",
+        stage="ocr",
+        label="Whole-book OCR (tests)",
+        kind="open_source",
+        description="Echo OCR that does not declare itself page-local.",
+    )
+    page_local = StageProvider.page_local
+
+
+def _ensure_echo_provider() -> None:
+    for provider in (_EchoOCR(), _WholeBookOCR()):
+        try:
+            manga_providers.get_provider(provider.metadata.id)
+        except KeyError:
+            manga_providers.REGISTRY.register(provider)
+
+
+def _make_pages(root: Path, count: int) -> Path:
+    root.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        Image.new("L", (32, 48), color=255).save(root / f"page_{index:02d}.png")
+    (root / "notes.txt").write_text("not a page", encoding="utf-8")
+    return root
+
+
+def _run(
+    tmp_path: Path, name: str, *, streaming: bool, ocr: str = "test_echo_ocr"
+) -> Dict[str, Any]:
+    _ensure_echo_provider()
+    sources = _make_pages(tmp_path / f"src_{name}", 6)
+    pipeline = MangaPipeline(base_root=tmp_path / name)
+    config = build_config(
+        sources=[str(sources)],
+        providers={
+            "segment": "basic_panel",
+            "ocr": ocr,
+            "group": "page_flow",
+            "speaker": "pattern_match",
+        },
+        streaming=streaming,
+        stage_workers={"ocr": 3},
+        queue_size=2,
+    )
+    job_id = pipeline.start(config)
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        snapshot = pipeline.status(job_id)
+        if snapshot["state"] in {"done", "error"}:
+            return snapshot
+        time.sleep(0.02)
+    raise AssertionError("manga pipeline job did not finish")
+
+
+def _scene_payloads(snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
+    job_id = snapshot["job"]
+    scenes = []
+    for path in sorted(Path(snapshot["artifacts"]["scenes"]).glob("*.json")):
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload["scene_id"] = payload["scene_id"].replace(job_id, "JOB")
+        payload["meta"]["job_id"] = "JOB"
+        for line in payload["lines"]:
+            line["meta"]["panel_id"] = line["meta"]["panel_id"].replace(job_id, "JOB")
+        scenes.append(payload)
+    return scenes
+
+
+def test_streaming_matches_batch_output(tmp_path: Path) -> None:
+    batch = _run(tmp_path, "batch", streaming=False)
+    streamed = _run(tmp_path, "stream", streaming=True)
+
+    assert batch["state"] == "done", batch.get("error")
+    assert streamed["state"] == "done", streamed.get("error")
+    assert _scene_payloads(streamed) == _scene_payloads(batch)
+    assert len(_scene_payloads(streamed)) == 6
+
+    groups = json.loads(
+        (Path(streamed["artifacts"]["group"]) / "groups.json").read_text("utf-8")
+    )
+    assert [group["page"] for group in groups] == [
+        f"page_{index:02d}.png" for index in range(6)
+    ]
+    page_files = sorted(
+        (Path(streamed["artifacts"]["base"]) / "pages").glob("*/page.json")
+    )
+    assert len(page_files) == 6
+    assert streamed["progress"] == 1.0
+
+
+def test_providers_without_page_local_run_whole_book(tmp_path: Path) -> None:
+    assert StageProvider.page_local is False
+    snapshot = _run(tmp_path, "whole", streaming=True, ocr="test_whole_book_ocr")
+
+    assert snapshot["state"] == "done", snapshot.get("error")
+    assert len(_scene_payloads(snapshot)) == 6
+    assert not (Path(snapshot["artifacts"]["base"]) / "pages").exists()
@@ -87,3 +87,54 @@ def test_lazy_asset_trimming_invokes_unload_handler():
     manager.refresh_queue()  # triggers lazy trim
 
     assert "asset-1" in evicted
+
+
+def test_refresh_readmits_by_budget_class_headroom():
+    metrics = MetricsProbe()
+    manager = BudgetManager(metrics_provider=metrics)
+    manager.configure(
+        max_cpu_percent=80.0,
+        max_vram_mb=1024,
+        max_running_jobs=0,
+        max_queue_depth=0,
+        evaluation_interval=0.0,
+    )
+    metrics.set(cpu=70.0)
+    for index, cpu in enumerate((5.0, 20.0, 40.0)):
+        result = manager.register_job(
+            f"cpu-{index}", kind="render", payload={"perf": {"cpu_percent": cpu}}
+        )
+        assert result["queue_state"] == ("queued" if cpu <= 10.0 else "delayed")
+    manager.register_job("vram-0", kind="render", payload={"perf": {"vram_mb": 2048}})
+    manager.register_job("gone", kind="render", payload={"perf": {"vram_mb": 1}})
+    manager.mark_finished("gone", status="canceled")
+    queue = manager.health()["queue"]
+    assert queue["delayed_by_class"] == {
+        "capacity": 0,
+        "jobs": 0,
+        "cpu": 2,
+        "ram": 0,
+        "vram": 1,
+    }
+    assert manager.refresh_queue() == []
+
+    metrics.set(cpu=50.0)
+    transitions = manager.refresh_queue()
+    assert [item["job"]["id"] for item in transitions] == ["cpu-1"]
+    _ensure_transition(transitions, "cpu-1", "queued")
+
+    metrics.set(cpu=30.0, first_gpu={"mem_used": 0.0})
+    transitions = manager.refresh_queue()
+    assert [item["job"]["id"] for item in transitions] == ["cpu-2"]
+
+    manager.configure(max_vram_mb=4096)
+    transitions = manager.refresh_queue()
+    _ensure_transition(transitions, "vram-0", "queued")
+
+    snapshot = manager.snapshot()
+    assert snapshot["delayed_ids"] == []
+    assert snapshot["queued_ids"] == ["cpu-0", "cpu-1", "cpu-2", "vram-0"]
+    queue = manager.health()["queue"]
+    assert sum(queue["delayed_by_class"].values()) == 0
+    assert queue["readmitted_by_class"]["cpu"] == 2
+    assert queue["readmitted_by_class"]["vram"] == 1
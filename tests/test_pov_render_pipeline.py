@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from pathlib import Path
 
 from comfyvn.bridge.comfy_hardening import LoRAEntry
@@ -16,6 +18,10 @@ class _FakeBridge:
         self.enabled = True
         self._root = root
         self._counter = 0
+        self._lock = threading.Lock()
+        self.delay = 0.0
+        self.active = 0
+        self.peak = 0
 
     def reload(self) -> None:
         return None
@@ -24,20 +30,30 @@ class _FakeBridge:
         return [LoRAEntry(path="models/lora/test.safetensors", weight=0.85)]
 
     def submit(self, payload):
-        self._counter += 1
-        artifact_path = self._root / f"artifact_{self._counter}.png"
+        with self._lock:
+            self._counter += 1
+            counter = self._counter
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            return self._result(payload, counter)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def _result(self, payload, counter):
+        artifact_path = self._root / f"artifact_{counter}.png"
         artifact_path.write_bytes(b"\x89PNG\r\n\x1a\n")
-        sidecar_path = self._root / f"artifact_{self._counter}.json"
-        sidecar_path.write_text(
-            json.dumps({"counter": self._counter}), encoding="utf-8"
-        )
+        sidecar_path = self._root / f"artifact_{counter}.json"
+        sidecar_path.write_text(json.dumps({"counter": counter}), encoding="utf-8")
         return {
             "ok": True,
             "workflow_id": payload.get("workflow_id"),
-            "prompt_id": f"prompt-{self._counter}",
+            "prompt_id": f"prompt-{counter}",
             "primary_artifact": {"path": str(artifact_path)},
             "sidecar": {"path": str(sidecar_path)},
-            "sidecar_content": {"counter": self._counter},
+            "sidecar_content": {"counter": counter},
             "overrides": {
                 "loras": [
                     {
@@ -45,7 +61,7 @@ class _FakeBridge:
                         "weight": 0.85,
                     }
                 ],
-                "seed": 42 + self._counter,
+                "seed": 42 + counter,
             },
         }
 
@@ -88,3 +104,49 @@ def test_pipeline_renders_and_caches(tmp_path: Path) -> None:
     forced = pipeline.ensure_poses("alice", style="hero", poses=["neutral"], force=True)
     assert forced[0]["cached"] is False
     assert bridge._counter == 2
+
+
+def test_pipeline_renders_missing_poses_concurrently(tmp_path: Path) -> None:
+    pipeline, bridge = _pipeline(tmp_path)
+    bridge.delay = 0.05
+    poses = [f"pose_{idx}" for idx in range(8)]
+
+    writes = []
+    original_persist = pipeline.cache._persist
+
+    def _counting_persist() -> None:
+        writes.append(1)
+        original_persist()
+
+    pipeline.cache._persist = _counting_persist  # type: ignore[method-assign]
+
+    results = pipeline.ensure_poses("alice", style="sheet", poses=poses)
+
+    assert [item["pose"] for item in results] == poses
+    assert all(item["cached"] is False for item in results)
+    assert bridge._counter == len(poses)
+    assert 1 < bridge.peak <= pipeline.max_concurrency
+    assert len(writes) == 1
+
+
+def test_pipeline_coalesces_duplicate_inflight_renders(tmp_path: Path) -> None:
+    pipeline, bridge = _pipeline(tmp_path)
+    bridge.delay = 0.1
+    outputs: list = []
+
+    def _worker() -> None:
+        outputs.append(
+            pipeline.ensure_poses("alice", style="hero", poses=["wave", "wave"])
+        )
+
+    threads = [threading.Thread(target=_worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert bridge._counter == 1
+    flattened = [item for batch in outputs for item in batch]
+    assert len(flattened) == 6
+    assert len({item["asset_path"] for item in flattened}) == 1
+    assert any(item.get("coalesced") for item in flattened)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import sys
 import types
 from typing import Dict
@@ -29,6 +30,7 @@ from comfyvn.config import feature_flags
 from comfyvn.pov.manager import POVManager
 from comfyvn.pov.timeline_worlds import diff_worlds as diff_worlds_fn
 from comfyvn.pov.timeline_worlds import merge_worlds as merge_worlds_fn
+from comfyvn.pov.worldline_store import WorldlineStore
 from comfyvn.pov.worldlines import WORLDLINES, WorldlineRegistry
 
 
@@ -154,6 +156,50 @@ def test_merge_worlds_conflict_and_fast_forward() -> None:
     assert conflict["conflicts"][0]["node"] == "n1"
 
 
+def test_worldline_store_persists_fork_deltas_and_snapshot_index(tmp_path) -> None:
+    from comfyvn.diffmerge import build_worldline_graph, diff_worldline_scenes
+
+    db_path = tmp_path / "worldlines.db"
+    registry = WorldlineRegistry(POVManager(), store=WorldlineStore(db_path))
+    nodes = [f"n{index}" for index in range(200)]
+    registry.create_or_update("canon", metadata={"nodes": nodes, "hash": "abc"})
+    registry.fork("canon", "alt", metadata={"nodes": nodes[:-1] + ["x1"]})
+    registry.record_snapshot(
+        "alt", {"cache_key": "k1", "node": "n3", "scene": "s1", "thumbnail": "a.png"}
+    )
+    registry.record_snapshot("alt", {"cache_key": "k2", "node": "n3"})
+    registry.record_snapshot("alt", {"cache_key": "k1", "node": "n4"})
+
+    # The fork row only carries its own changes, not the inherited node list.
+    row = registry.store._conn.execute(
+        "SELECT delta FROM worldlines WHERE id = 'alt'"
+    ).fetchone()
+    delta = json.loads(row["delta"])
+    assert delta["nodes"] == {"drop": ["n199"], "add": ["x1"]}
+    assert "nodes" not in delta["meta"] and "hash" not in delta["meta"]
+
+    assert [item["node"] for item in registry.find_snapshots(cache_key="k1")] == ["n4"]
+    by_node = registry.find_snapshots(world_id="alt", node="n3")
+    assert [item["cache_key"] for item in by_node] == ["k2"]
+
+    reloaded = WorldlineRegistry(POVManager(), store=WorldlineStore(db_path))
+    for world_id in ("canon", "alt"):
+        original = registry.ensure(world_id)
+        restored = reloaded.ensure(world_id)
+        assert restored.metadata == original.metadata
+        assert restored.parent_id == original.parent_id
+
+    first = build_worldline_graph(target="canon", registry=reloaded)
+    first["timeline"]["canon"].append("mutated")
+    assert build_worldline_graph(target="canon", registry=reloaded) != first
+    diff = diff_worldline_scenes("alt", "canon", registry=reloaded)
+    assert diff["node_changes"]["added"] == ["x1"]
+
+    reloaded.update("alt", metadata={"nodes": ["n0", "x2"]})
+    diff = diff_worldline_scenes("alt", "canon", registry=reloaded)
+    assert diff["node_changes"]["added"] == ["x2"]
+
+
 def test_pov_worlds_api_flow() -> None:
     app = create_app()
     paths = {route.path for route in app.routes}
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+
+from comfyvn.presentation.directives import PresentationNode, SceneState, compile_plan
+from comfyvn.presentation.timeline import (
+    PlanMemo,
+    TimelineScene,
+    compile_timeline,
+    iter_timeline_ndjson,
+)
+
+STATE = {
+    "scene_id": "harbor",
+    "characters": [
+        {"id": "aya", "display_name": "Aya", "portrait": "aya.png"},
+        {"id": "ren", "slot": "left"},
+    ],
+    "camera": {"shot": "medium"},
+    "ambient_sfx": ["gulls"],
+}
+
+
+def _nodes(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"n{i}",
+            "speaker": ("aya", "ren")[i % 2],
+            "directives": {"expression": ("smile", "frown")[i % 2]},
+        }
+        for i in range(count)
+    ]
+
+
+def test_compile_timeline_matches_per_node_plans_and_memoises() -> None:
+    scene = TimelineScene.model_validate({"scene_state": STATE, "nodes": _nodes(40)})
+    memo = PlanMemo()
+    result = compile_timeline([scene], memo=memo)
+
+    state = SceneState.model_validate(STATE)
+    expected = [
+        compile_plan(state, PresentationNode.model_validate(node))
+        for node in _nodes(40)
+    ]
+    assert [entry["plan"] for entry in result["plans"]] == expected
+    assert result["meta"]["nodes"] == 40
+    assert result["meta"]["cache_hits"] == 38
+    assert memo.stats()["entries"] == 2
+
+
+def test_timeline_updates_carry_state_forward_and_stream_ndjson() -> None:
+    scene = TimelineScene.model_validate(
+        {
+            "scene_state": STATE,
+            "nodes": _nodes(4),
+            "updates": {
+                "n2": {
+                    "exit": ["aya"],
+                    "characters": [{"id": "ren", "default_pose": "arms_crossed"}],
+                    "camera": {"angle": "low"},
+                }
+            },
+        }
+    )
+    lines = list(iter_timeline_ndjson([scene], memo=PlanMemo()))
+    records = [json.loads(line) for line in lines]
+    assert records[-1] == {"done": True, "nodes": 4, "count": 17, "cache_hits": 0}
+
+    # n2 is spoken by aya, who has left: the remaining character takes focus.
+    after = {item["channel"]: item for item in records[2]["plan"]}
+    assert after["camera"]["payload"] == {
+        "angle": "low",
+        "focus": "ren",
+        "shot": "medium",
+    }
+    assert after["pose"]["payload"] == {"value": "arms_crossed"}
+    # The patch persists for later nodes.
+    assert records[3]["plan"] == [
+        records[2]["plan"][0],
+        {
+            "channel": "expression",
+            "action": "set",
+            "target": "ren",
+            "payload": {"value": "frown"},
+        },
+        *records[2]["plan"][2:],
+    ]
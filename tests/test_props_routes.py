@@ -199,3 +199,31 @@ def test_remove_prop_emits_hook(_capture_prop_events) -> None:
         evt == "on_prop_removed" and payload["prop_id"] == "hood"
         for evt, payload in events
     )
+
+
+def test_visibility_batch_evaluates_all_props_in_one_pass() -> None:
+    with TestClient(_create_props_app()) as client:
+        resp = client.post(
+            "/api/props/visibility",
+            json={
+                "props": {
+                    "umbrella": 'weather == "rain"',
+                    "fan": ['weather == "clear"', 'emotion != "calm"'],
+                    "hat": None,
+                },
+                "state": {"weather": "rain", "emotion": "calm"},
+            },
+        )
+        assert resp.status_code == 200
+        payload = resp.json()
+        assert payload["visible"] == ["hat", "umbrella"]
+        assert payload["props"]["fan"]["evaluations"] == {
+            'weather == "clear"': False,
+            'emotion != "calm"': False,
+        }
+
+        bad = client.post(
+            "/api/props/visibility",
+            json={"props": {"lamp": "secret == 1"}},
+        )
+        assert bad.status_code == 400
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import math
+import time
+
+import pytest
 
 from comfyvn.compute.scheduler import JobScheduler
 
@@ -97,3 +100,139 @@ def test_completion_records_cost_and_metrics() -> None:
     board = sched.board()
     seg = next(seg for seg in board["jobs"] if seg["id"] == "job-telemetry")
     assert seg["duration_sec"] == done["duration_sec"]
+
+
+def test_store_backed_scheduler_survives_restart_and_leases(tmp_path) -> None:
+    from comfyvn.compute.job_store import JobStore
+
+    db = tmp_path / "jobs.db"
+    sched = JobScheduler(
+        registry=_RegistryStub(), store=JobStore(db), cache_size=2, lease_sec=0
+    )
+    sched.enqueue_many(
+        [{"id": f"job-{i}", "priority": i % 3, "queue": "remote"} for i in range(6)]
+    )
+    first = sched.claim("remote", worker_id="w1")
+    assert first is not None and first["id"] == "job-2"
+    leased = sched.claim("remote", worker_id="w2", lease_sec=60)
+    assert leased is not None and leased["lease_expires_at"]
+    sched.complete(first["id"], duration_sec=5)
+
+    # A second scheduler on the same database never double-claims, even
+    # though both hot caches hold overlapping heads of the queue.
+    other = JobScheduler(
+        registry=_RegistryStub(), store=JobStore(db), recover=False, lease_sec=0
+    )
+    claimed = {sched.claim("remote")["id"], other.claim("remote")["id"]}
+    assert len(claimed) == 2 and leased["id"] not in claimed
+    assert other.queue_depths()["remote"] == 2
+
+    # "Crash": a sole owner reopens with unleased recovery. Unleased running
+    # jobs are requeued, the live lease is kept, and finished jobs come back
+    # from the store.
+    restarted = JobScheduler(
+        registry=_RegistryStub(), store=JobStore(db), recover_unleased=True
+    )
+    assert restarted.queue_depths()["remote"] == 4
+    state = restarted.state()
+    assert [job["id"] for job in state["active"]] == [leased["id"]]
+    assert state["completed"][0]["id"] == "job-2"
+    assert restarted.heartbeat(leased["id"], worker_id="w2", lease_sec=0.01)
+    time.sleep(0.02)
+    assert restarted.expire_leases() == 1
+    requeued = restarted.store.load(leased["id"])
+    assert requeued["status"] == "queued" and requeued["runs"][-1]["expired_at"]
+    with pytest.raises(ValueError):
+        restarted.heartbeat(leased["id"], worker_id="w2")
+
+    ids = []
+    while (job := restarted.claim("remote")) is not None:
+        restarted.complete(job["id"], duration_sec=1)
+        ids.append(job["id"])
+    assert len(ids) == 5
+
+    page = restarted.board(limit=4)
+    assert len(page["jobs"]) == 4 and page["next_offset"] == 4
+    rest = restarted.board(limit=4, offset=4)
+    assert len(rest["jobs"]) == 2 and rest["next_offset"] is None
+
+
+def test_shared_store_default_recovery_keeps_running_jobs(tmp_path) -> None:
+    from comfyvn.compute.job_store import JobStore
+
+    db = tmp_path / "jobs.db"
+    sched = JobScheduler(registry=_RegistryStub(), store=JobStore(db), lease_sec=0)
+    sched.enqueue_many([{"id": f"job-{i}", "queue": "remote"} for i in range(2)])
+    running = sched.claim("remote", worker_id="w1")
+    assert running is not None and not running.get("lease_expires_at")
+
+    # A second process opening the same database must not steal the job.
+    other = JobScheduler(registry=_RegistryStub(), store=JobStore(db))
+    assert other.store.load(running["id"])["status"] == "running"
+    assert other.queue_depths()["remote"] == 1
+    claimed = other.claim("remote")
+    assert claimed is not None and claimed["id"] != running["id"]
+    assert other.claim("remote") is None
+    sched.complete(running["id"], duration_sec=1)
+
+
+def test_store_backed_claims_are_leased_by_default(tmp_path, monkeypatch) -> None:
+    from comfyvn.compute import scheduler as scheduler_module
+    from comfyvn.compute.job_store import JobStore
+
+    assert JobScheduler(registry=_RegistryStub()).lease_sec is None
+    monkeypatch.setenv(scheduler_module.SCHEDULER_LEASE_ENV, "0.01")
+    db = tmp_path / "jobs.db"
+    sched = JobScheduler(registry=_RegistryStub(), store=JobStore(db))
+    assert sched.lease_sec == 0.01
+    sched.enqueue({"id": "job-crash", "queue": "remote"})
+    claimed = sched.claim("remote", worker_id="w1")
+    assert claimed is not None and claimed["lease_expires_at"]
+
+    # The worker dies without a heartbeat; the next process requeues the job.
+    time.sleep(0.02)
+    monkeypatch.delenv(scheduler_module.SCHEDULER_LEASE_ENV)
+    restarted = JobScheduler(registry=_RegistryStub(), store=JobStore(db))
+    assert restarted.lease_sec == scheduler_module.DEFAULT_STORE_LEASE_SEC
+    assert restarted.store.load("job-crash")["status"] == "queued"
+
+
+def test_board_rejects_empty_pages() -> None:
+    sched = JobScheduler(registry=_RegistryStub())
+    for i in range(3):
+        sched.enqueue({"id": f"job-{i}", "queue": "local"})
+        job = sched.claim("local")
+        sched.complete(job["id"], duration_sec=1)
+
+    offset, seen = 0, []
+    while offset is not None:
+        page = sched.board(limit=0, offset=offset)
+        seen.extend(seg["id"] for seg in page["jobs"])
+        assert page["next_offset"] != offset
+        offset = page["next_offset"]
+    assert sorted(seen) == ["job-0", "job-1", "job-2"]
+
+
+def test_schedule_routes_validate_lease_sec() -> None:
+    pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from comfyvn.server.routes import schedule
+
+    app = FastAPI()
+    app.include_router(schedule.router)
+    with TestClient(app) as client:
+        for bad in ("soon", -1, 0, True, "nan"):
+            response = client.post(
+                "/api/schedule/claim", json={"queue": "empty", "lease_sec": bad}
+            )
+            assert response.status_code == 400, (bad, response.text)
+        response = client.post(
+            "/api/schedule/heartbeat", json={"job_id": "missing", "lease_sec": "x"}
+        )
+        assert response.status_code == 400
+        response = client.post(
+            "/api/schedule/claim", json={"queue": "empty", "lease_sec": "30"}
+        )
+        assert response.status_code == 200 and response.json()["job"] is None
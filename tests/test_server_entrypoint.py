@@ -48,3 +48,76 @@ def test_health_routes_available():
         status_result = asyncio.run(status_result)
     assert status_result["ok"] is True
     assert isinstance(status_result.get("routes"), list)
+
+
+def test_deferred_routers_mount_on_first_hit_and_skip_collisions(monkeypatch):
+    from fastapi import APIRouter, FastAPI
+
+    from comfyvn.server import app as server_app
+
+    def _module(name: str, path: str) -> None:
+        module = types.ModuleType(name)
+        module.router = APIRouter()
+
+        @module.router.get(path)
+        async def _endpoint():
+            return {"module": name}
+
+        monkeypatch.setitem(sys.modules, name, module)
+
+    _module("_lazy_alpha", "/alpha/{item}")
+    _module("_lazy_clash", "/alpha/{item}")
+    _module("_lazy_beta", "/beta")
+
+    app = FastAPI()
+    app.state.router_catalog = []
+    app.state.router_import_times = {}
+    app.state.router_prefixes = {}
+    deferred = server_app._DeferredRouters(
+        app,
+        ["_lazy_alpha", "_lazy_clash", "_lazy_beta"],
+        seen=set(),
+        manifest={
+            "_lazy_alpha": ["/alpha/"],
+            "_lazy_clash": ["/alpha/"],
+            "_lazy_beta": ["/beta"],
+        },
+    )
+    app.add_middleware(server_app._LazyRouterMiddleware, deferred=deferred)
+
+    async def _get(path: str) -> int:
+        messages: list[dict] = []
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "headers": [],
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "scheme": "http",
+            "server": ("test", 80),
+            "client": ("test", 1),
+            "root_path": "",
+        }
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await app(scope, receive, send)
+        return messages[0]["status"]
+
+    assert asyncio.run(_get("/alpha/1")) == 200
+    # The first router wins the collision, as it would when mounted eagerly.
+    assert app.state.router_catalog == ["_lazy_alpha"]
+    assert set(deferred.pending) == {"_lazy_beta"}
+    assert "_lazy_alpha" in app.state.router_import_times
+    assert app.state.router_prefixes["_lazy_alpha"] == ["/alpha/"]
+
+    asyncio.run(deferred.warm_all())
+    assert app.state.router_catalog == ["_lazy_alpha", "_lazy_beta"]
+    assert asyncio.run(_get("/beta")) == 200
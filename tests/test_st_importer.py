@@ -8,7 +8,13 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from comfyvn.importers.st_chat import map_to_scenes, parse_st_payload
+from comfyvn.importers.st_chat import (
+    iter_st_file,
+    map_to_scenes,
+    parse_st_file,
+    parse_st_payload,
+)
+from comfyvn.importers.st_chat import parser as st_parser
 from comfyvn.server.routes import import_st
 
 
@@ -83,6 +89,64 @@ def test_map_to_scenes_infers_choices_and_expression():
     assert "Aurora" not in scene["meta"]["unresolved_personas"]
 
 
+def _sample_messages(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "name": "You" if index % 3 == 0 else "Aurora",
+            "mes": f"Line {index} :)" if index % 5 else "",
+            "is_user": index % 3 == 0,
+            "send_date": 1704103422 + index * 60,
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("layout", ["array", "object", "jsonl"])
+def test_iter_st_file_matches_whole_payload_parse(tmp_path, monkeypatch, layout):
+    messages = _sample_messages(40)
+    if layout == "array":
+        text = json.dumps([*messages[:3], "junk", *messages[3:]], indent=2)
+        expected = parse_st_payload(text, source_hint="json")
+        path = tmp_path / "chat.json"
+    elif layout == "object":
+        text = json.dumps({"title": "Run", "messages": messages})
+        expected = parse_st_payload(text, source_hint="json")
+        path = tmp_path / "chat.json"
+    else:
+        lines = [json.dumps({"user_name": "You"})] + [json.dumps(m) for m in messages]
+        text = "\n".join(lines[:4] + ["not json", ""] + lines[4:])
+        expected = parse_st_payload(text, source_hint="json")
+        path = tmp_path / "chat.jsonl"
+    path.write_text(text, encoding="utf-8")
+    # Tiny chunks force values to straddle buffer boundaries.
+    monkeypatch.setattr(st_parser, "STREAM_CHUNK_CHARS", 5)
+
+    assert expected
+    assert list(iter_st_file(path)) == expected
+
+
+def test_iter_st_file_yields_array_turns_lazily(tmp_path):
+    path = tmp_path / "chat.json"
+    # Truncated export: the last message is cut off mid-object.
+    path.write_text(json.dumps(_sample_messages(7))[:-20], encoding="utf-8")
+
+    stream = iter_st_file(path)
+    first = next(stream)
+    assert first["speaker"] == "You"
+    assert first["meta"]["source"] == "st_json"
+    # Turns decoded before the damage are kept; the stream then stops.
+    assert [turn["meta"]["index"] for turn in [first, *stream]] == [0, 1, 2, 3, 4]
+
+
+def test_transcript_file_matches_text_payload(tmp_path):
+    transcript = (
+        "Aurora: Hello\nstill talking\n\n[2024-01-01 10:00:00] You: Hi\nNarrator: end"
+    )
+    path = tmp_path / "chat.txt"
+    path.write_text(transcript, encoding="utf-8")
+    assert parse_st_file(path) == parse_st_payload(transcript, source_hint="txt")
+
+
 @pytest.fixture()
 def st_app(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
     # Enable feature flag for the importer.
@@ -150,3 +214,18 @@ def test_import_start_endpoint_generates_artifacts(st_app: TestClient, tmp_path:
         (run_dir / import_st.SCENES_FILE).read_text(encoding="utf-8")
     )
     assert scene_snapshot["scenes"]
+
+
+def test_import_start_streams_uploaded_file(st_app: TestClient):
+    messages = _sample_messages(12)
+    response = st_app.post(
+        "/api/import/st/start",
+        data={"projectId": "demo"},
+        files={"file": ("chat.json", json.dumps(messages), "application/json")},
+    )
+    assert response.status_code == 200, response.text
+    run_dir = import_st.IMPORT_ROOT / response.json()["runId"]
+    spooled = json.loads((run_dir / import_st.TURN_FILE).read_text(encoding="utf-8"))
+    assert spooled["turns"] == parse_st_payload(messages)
+    preview = json.loads((run_dir / import_st.PREVIEW_FILE).read_text(encoding="utf-8"))
+    assert preview["turn_count"] == len(spooled["turns"])
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+
+from comfyvn.core import term_matcher
+from comfyvn.core.term_matcher import TermMatcher, compile_terms, term_set_key
+
+GROUPS = {
+    "Warner": ["Harry Potter", "potter", "hogwarts"],
+    "Ghibli": ["totoro", "tot"],
+    "Tokens": ["18+", "aa"],
+}
+
+
+@pytest.mark.parametrize("threshold", [10_000, 1])
+def test_engines_report_every_overlapping_occurrence(monkeypatch, threshold):
+    monkeypatch.setattr(term_matcher, "REGEX_MIN_TERMS", threshold)
+    matcher = TermMatcher(GROUPS)
+    assert matcher.engine == ("find" if threshold > 1 else "regex")
+
+    text = "Harry POTTER met Totoro at Hogwarts, aaa 18+"
+    hits = [(hit.start, hit.term) for hit in matcher.finditer(text)]
+    assert hits == [
+        (0, "harry potter"),
+        (6, "potter"),
+        (17, "totoro"),
+        (17, "tot"),
+        (27, "hogwarts"),
+        (37, "aa"),
+        (38, "aa"),
+        (41, "18+"),
+    ]
+    assert matcher.finditer(text)[2].categories == ("Ghibli",)
+    assert matcher.categorize(text) == {
+        "Ghibli": ["tot", "totoro"],
+        "Tokens": ["18+", "aa"],
+        "Warner": ["harry potter", "hogwarts", "potter"],
+    }
+
+    tokens = TermMatcher(GROUPS, whole_tokens=True)
+    assert tokens.matched_terms("totoro 18++ aa potter!") == {"totoro", "aa"}
+    assert "TOT" in tokens and "toto" not in tokens
+
+
+def test_compiled_matchers_are_cached_per_term_set_version():
+    term_matcher.clear_cache()
+    first = compile_terms(GROUPS)
+    assert compile_terms({key: list(terms) for key, terms in GROUPS.items()}) is first
+    assert compile_terms(GROUPS, whole_tokens=True) is not first
+
+    edited = dict(GROUPS, Ghibli=["totoro", "tot", "ponyo"])
+    assert term_set_key(edited) != first.key
+    assert "ponyo" in compile_terms(edited)
+    assert "ponyo" not in compile_terms(GROUPS)
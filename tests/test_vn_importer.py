@@ -268,6 +268,40 @@ def test_import_vn_adapter_detection(tmp_path: Path):
     assert (data_root / "scenes" / "start.json").exists()
 
 
+def test_import_streams_members_in_parallel(tmp_path: Path, monkeypatch):
+    package_path = _build_sample_package(tmp_path)
+    blobs = {
+        f"assets/sprites/pose_{idx:02d}.bin": bytes([idx]) * 4096 for idx in range(12)
+    }
+    with zipfile.ZipFile(package_path, "a") as archive:
+        for name, payload in blobs.items():
+            archive.writestr(name, payload)
+
+    def _no_whole_reads(self, *args, **kwargs):
+        raise AssertionError("members must be streamed, not read whole")
+
+    monkeypatch.setattr(zipfile.ZipFile, "read", _no_whole_reads)
+    events: list[dict] = []
+    data_root = tmp_path / "stream_data"
+
+    summary = import_vn_package(
+        package_path, data_root=data_root, max_workers=4, progress=events.append
+    )
+
+    assert summary["scenes"] == ["demo_scene"]
+    assert summary["manifest"]["id"] == "demo-project"
+    assert summary["assets"] == ["backgrounds/bg1.png"] + [
+        name.split("/", 1)[1] for name in blobs
+    ]
+    for name, payload in blobs.items():
+        assert (data_root / name).read_bytes() == payload
+    assert len(events) == 6 + len(blobs)
+    assert sorted(event["completed"] for event in events) == list(
+        range(1, len(events) + 1)
+    )
+    assert {event["total"] for event in events} == {len(events)}
+
+
 def test_import_with_external_tool(tmp_path: Path):
     from comfyvn.server.core import external_extractors as ext_mgr
 
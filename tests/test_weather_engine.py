@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from comfyvn.weather import WEATHER_PLANNER
@@ -68,13 +70,14 @@ def test_plan_store_tracks_versions():
     baseline = store.snapshot()
     assert baseline["meta"]["version"] == 0
 
-    updated = store.update({"weather": "rain"})
+    updated, body = store.update({"weather": "rain"})
+    assert json.loads(body) == updated
     assert updated["state"]["weather"] == "rain"
     assert updated["meta"]["version"] == 1
 
     current_state = dict(updated["state"])
     current_state["time_of_day"] = "night"
-    again = store.update(current_state)
+    again, _ = store.update(current_state)
     assert again["state"]["weather"] == "rain"
     assert again["state"]["time_of_day"] == "night"
     assert again["meta"]["version"] == 2
@@ -83,3 +86,31 @@ def test_plan_store_tracks_versions():
     reset = store.snapshot()
     assert reset["state"] == DEFAULT_STATE
     assert reset["meta"]["version"] == 0
+
+
+def test_plans_are_memoised_frozen_and_preserialised():
+    import copy
+
+    from comfyvn.weather.engine import frozen_plan, plan_json, warm_plan_table
+
+    assert warm_plan_table() == 4 * 6 * 5
+    first = frozen_plan({"weather": "rainy", "time_of_day": "night"})
+    again = frozen_plan({"weather": "rain", "time_of_day": "night"})
+    assert first is again
+    assert json.loads(plan_json({"weather": "rain", "time_of_day": "night"})) == first
+
+    with pytest.raises(TypeError):
+        first["scene"]["light_rig"]["key"] = 0.0
+    with pytest.raises(TypeError):
+        first["sfx"]["tags"].append("extra")
+
+    editable = compile_plan({"weather": "rain", "time_of_day": "night"})
+    editable["scene"]["light_rig"]["key"] = 0.0
+    assert copy.deepcopy(first)["scene"]["light_rig"]["key"] != 0.0
+
+    store = WeatherPlanStore()
+    plan, body = store.update({"weather": "fog"})
+    assert store.snapshot() is plan
+    assert store.snapshot_json() is body
+    assert json.loads(store.snapshot_json())["meta"]["version"] == 1
+    assert plan["particles"] is frozen_plan({"weather": "fog"})["particles"]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from comfyvn.workflows.runtime import RuntimeCache, WorkflowRuntime
+
+
+def _wide_workflow(width: int) -> dict:
+    nodes = [
+        {
+            "id": f"voice{i}",
+            "type": "SlowVoice",
+            "params": {"message": f"line {i}"},
+            "outputs": {"out": f"$output.line{i}"},
+        }
+        for i in range(width)
+    ]
+    nodes.append(
+        {
+            "id": "join",
+            "type": "concat",
+            "params": {"a": "${line0}|"},
+            "inputs": {"b": "|".join(f"voice{i}.out" for i in range(width))},
+        }
+    )
+    return {"name": "wide", "nodes": nodes, "outputs": {"final": "join.out"}}
+
+
+def _slow_exec(delay: float, peak: list[int], barrier: threading.Barrier | None = None):
+    lock = threading.Lock()
+    running = [0]
+
+    def call(typ, payload):
+        if typ != "SlowVoice":
+            return {"ok": True, "out": f"{payload['a']}{payload['b']}"}
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        if barrier is not None:
+            # Only returns once every independent node is running at once.
+            barrier.wait()
+        time.sleep(delay)
+        with lock:
+            running[0] -= 1
+        return {"ok": True, "out": payload["message"]}
+
+    return call
+
+
+def test_runtime_runs_ready_nodes_concurrently_with_type_limits(tmp_path):
+    cache = RuntimeCache(tmp_path)
+    peak = [0]
+    runtime = WorkflowRuntime(
+        _wide_workflow(6), "wide", cache=False, max_workers=6, result_cache=cache
+    )
+    runtime.exec.call = _slow_exec(0.0, peak, threading.Barrier(6, timeout=10))
+    result = runtime.run()
+
+    assert peak[0] == 6
+    assert list(result["nodes"]) == [f"voice{i}" for i in range(6)] + ["join"]
+    # ${line0} in join's params makes it wait for voice0's exposed output.
+    assert result["outputs"]["final"].startswith("line 0|")
+    assert "line 5" in result["outputs"]["final"]
+
+    peak = [0]
+    limited = WorkflowRuntime(
+        _wide_workflow(4),
+        "limited",
+        cache=False,
+        max_workers=4,
+        type_limits={"SlowVoice": 2},
+        result_cache=cache,
+    )
+    limited.exec.call = _slow_exec(0.02, peak)
+    limited.run()
+    assert peak[0] == 2
+
+
+def test_runtime_cache_is_content_addressed_and_bounded(tmp_path):
+    cache = RuntimeCache(tmp_path, max_entries=3)
+    wf = {
+        "name": "echoes",
+        "nodes": [
+            {"id": "a", "type": "echo", "params": {"message": "same"}},
+            {"id": "b", "type": "echo", "params": {"message": "same"}},
+        ],
+        "outputs": {"a": "a.out", "b": "b.out"},
+    }
+    first = WorkflowRuntime(wf, "one", result_cache=cache).run()
+    second = WorkflowRuntime(wf, "two", result_cache=cache).run()
+    assert first["outputs"] == second["outputs"] == {"a": "same", "b": "same"}
+    assert all(node["cached"] for node in second["nodes"].values())
+
+    for index in range(5):
+        cache.put(f"k{index}", {"out": index})
+    cache.get("k2")
+    cache.put("k5", {"out": 5})
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["evictions"] >= 3
+    assert cache.get("k2") == {"out": 2}
+    assert cache.get("k3") is None
+    assert sorted(path.stem for path in tmp_path.glob("*.json")) == ["k2", "k4", "k5"]
+
+    reopened = RuntimeCache(tmp_path, max_entries=3)
+    assert reopened.stats()["entries"] == 3
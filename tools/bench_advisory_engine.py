@@ -0,0 +1,167 @@
+"""
+Benchmark incremental advisory scans on a synthetic large project.
+
+Builds a bundle with N scenes (default 5000) of dialogue, a few hundred
+characters and a licence/asset manifest, then times:
+
+* ``legacy``      — ``comfyvn.advisory.scanner.scan`` over the whole bundle;
+* ``engine cold`` — ``ScanEngine.scan`` with an empty cache (every job runs);
+* ``engine warm`` — the same bundle again (all cache hits);
+* ``one edit``    — a single scene changed between scans.
+
+``--plugin-ms`` registers an extra node-scoped plugin that sleeps that long
+per scene, standing in for a model-backed classifier that releases the GIL;
+it is what the worker pool parallelises.
+
+Findings are kept in memory (``advisory.advisory_logs``) so the timings are
+not dominated by the findings database.
+
+Usage:
+    python tools/bench_advisory_engine.py [--scenes 5000] [--workers 8]
+        [--plugin-ms 0.5] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from comfyvn.advisory import scanner  # noqa: E402
+from comfyvn.advisory.engine import ScanCache, ScanEngine  # noqa: E402
+from comfyvn.core import advisory  # noqa: E402
+
+_WORDS = (
+    "the she he they walks into room and says hello there mysterious garden "
+    "light shadow sword castle hero rain whisper look over dream market why "
+    "never always tomorrow letter train station quietly smiles turns away"
+).split()
+_EXTRAS = ("Mario", "Hogwarts", "explicit", "gore", "Pixar")
+
+
+def _scene(rng: random.Random, lines: int) -> Dict[str, Any]:
+    dialogue = []
+    for _ in range(lines):
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(6, 14))]
+        if rng.random() < 0.005:
+            words.insert(rng.randrange(len(words)), rng.choice(_EXTRAS))
+        dialogue.append(
+            {"speaker": rng.choice(("Aya", "Ren")), "text": " ".join(words)}
+        )
+    return {"dialogue": dialogue}
+
+
+def _bundle(scenes: int, lines: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    return {
+        "project_id": "bench",
+        "timeline_id": "main",
+        "scenes": {f"scene_{i:05d}": _scene(rng, lines) for i in range(scenes)},
+        "characters": {
+            f"char_{i:04d}": {"name": f"Character {i}", "bio": "quiet hero"}
+            for i in range(max(1, scenes // 20))
+        },
+        "licenses": [{"name": "CC-BY-4.0"}, {"name": "CC-BY-NC"}],
+        "assets": [{"path": f"bg/{i}.png", "license": "CC-BY-4.0"} for i in range(200)],
+        "metadata": {"source": "bench"},
+    }
+
+
+def _slow_plugin(delay: float):
+    def handler(context) -> List[Any]:
+        time.sleep(delay * len(context.scenes or {}))
+        return []
+
+    return handler
+
+
+def _timed(fn) -> Dict[str, Any]:
+    started = time.perf_counter()
+    findings = fn()
+    return {"sec": time.perf_counter() - started, "findings": len(findings)}
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenes", type=int, default=5000)
+    parser.add_argument("--lines", type=int, default=20, help="Dialogue per scene.")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=5)
+    parser.add_argument(
+        "--plugin-ms", type=float, default=0.0, help="Simulated per-scene plugin cost."
+    )
+    parser.add_argument("--skip-legacy", action="store_true")
+    parser.add_argument("--json", action="store_true", help="Emit JSON only.")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)  # log_issue warns once per finding
+    advisory.advisory_logs = []
+    bundle = _bundle(args.scenes, args.lines, args.seed)
+    if args.plugin_ms > 0:
+        scanner.register_scanner_plugin(
+            "bench_slow",
+            _slow_plugin(args.plugin_ms / 1000),
+            scope="node",
+            replace=True,
+        )
+    results: List[Dict[str, Any]] = []
+
+    if not args.skip_legacy:
+        results.append({"case": "legacy scan", **_timed(lambda: scanner.scan(bundle))})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = ScanEngine(
+            ScanCache(Path(tmp) / "scan_cache.db"), max_workers=args.workers
+        )
+        for case in ("engine cold", "engine warm"):
+            row = {"case": case, **_timed(lambda: engine.scan(bundle))}
+            results.append({**row, **engine.last_stats})
+
+        edited = dict(bundle, scenes=dict(bundle["scenes"]))
+        edited["scenes"]["scene_00042"] = {
+            "dialogue": [{"speaker": "Aya", "text": "A trip to Hogwarts."}]
+        }
+        row = {"case": "one scene edited", **_timed(lambda: engine.scan(edited))}
+        results.append({**row, **engine.last_stats})
+
+        reopened = ScanEngine(
+            ScanCache(Path(tmp) / "scan_cache.db"), max_workers=args.workers
+        )
+        row = {"case": "new process (sqlite)", **_timed(lambda: reopened.scan(edited))}
+        results.append({**row, **reopened.last_stats})
+        engine.close()
+        reopened.close()
+        engine.cache.close()
+        reopened.cache.close()
+
+    for row in results:
+        row["ms"] = round(row.pop("sec") * 1000, 2)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(
+        f"scenes: {args.scenes}  workers: {args.workers}  "
+        f"plugin ms/scene: {args.plugin_ms}"
+    )
+    print(f"{'case':<22} {'ms':>10} {'findings':>9} {'scanned':>8} {'cached':>7}")
+    for row in results:
+        print(
+            f"{row['case']:<22} {row['ms']:>10} {row['findings']:>9} "
+            f"{row.get('scanned', ''):>8} {row.get('cached', ''):>7}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+"""
+Benchmark Monte Carlo battle balance runs.
+
+Times ``engine.simulate_batch`` on a two-contender stat block two ways:
+
+* ``loop``  — ``engine.simulate(stats, seed=k, narrate=False)`` per seed, the
+  path callers used before batch analysis existed (capped at ``--loop``
+  seeds and extrapolated);
+* ``batch`` — one ``simulate_batch`` call over ``--count`` seeds, with and
+  without the sensitivity pass.
+
+Usage:
+    python tools/bench_battle_batch.py [--count 100000] [--loop 2000] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from comfyvn.battle import engine  # noqa: E402
+
+STATS = {
+    "hero": {"base": 5, "str": 3, "agi": 2, "rng": 4},
+    "villain": {"base": 6, "str": 2, "weapon_tier": 2, "rng": 3},
+}
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--loop", type=int, default=2_000)
+    parser.add_argument("--json", action="store_true", help="Emit JSON only.")
+    args = parser.parse_args(argv)
+
+    loop_count = max(1, min(args.loop, args.count))
+    started = time.perf_counter()
+    for seed in range(loop_count):
+        engine.simulate(STATS, seed=seed, narrate=False)
+    loop_sec = (time.perf_counter() - started) * args.count / loop_count
+
+    results: List[Dict[str, Any]] = [
+        {"case": "loop", "sec": round(loop_sec, 3), "extrapolated": True}
+    ]
+    for label, sensitivity in (("batch", False), ("batch+sens", True)):
+        started = time.perf_counter()
+        engine.simulate_batch(STATS, count=args.count, seed=0, sensitivity=sensitivity)
+        results.append({"case": label, "sec": round(time.perf_counter() - started, 3)})
+    for row in results:
+        row["sims_per_s"] = round(args.count / row["sec"]) if row["sec"] else None
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    backend = "numpy" if engine.np is not None else "pure python"
+    print(f"simulations: {args.count}  backend: {backend}")
+    print(f"{'case':<12} {'sec':>8} {'sims/s':>12}")
+    for row in results:
+        print(f"{row['case']:<12} {row['sec']:>8} {row['sims_per_s']:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
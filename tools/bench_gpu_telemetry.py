@@ -0,0 +1,103 @@
+"""
+Benchmark per-request GPU queries against the shared telemetry buffer.
+
+Times N metric reads (default 500) two ways:
+
+* ``per-request`` — ``NvidiaSmiBackend.sample()`` on every read: one
+  fork/exec of ``nvidia-smi``, the old fallback path of the metrics routes;
+* ``buffered``    — ``GPUTelemetrySampler.gpus()`` while the sampler polls the
+  same backend in the background at ``--interval``.
+
+Hosts without ``nvidia-smi`` get a stand-in shell script that prints the
+same CSV. That measures the process spawn cost only, without driver time,
+so the real gap is larger.
+
+Usage:
+    python tools/bench_gpu_telemetry.py [--reads 500] [--interval 1.0] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from comfyvn.core.gpu_telemetry import (  # noqa: E402
+    GPUTelemetrySampler,
+    NvidiaSmiBackend,
+)
+
+_STAND_IN = """#!/bin/sh
+echo "0, Stand-in GPU, 37, 1024, 24564, 51"
+"""
+
+
+def _timed(label: str, reads: int, read: Callable[[], Any]) -> Dict[str, Any]:
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for _ in range(reads):
+        tick = time.perf_counter()
+        read()
+        latencies.append((time.perf_counter() - tick) * 1000)
+    total = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "case": label,
+        "reads": reads,
+        "sec": round(total, 3),
+        "p50_ms": round(statistics.median(latencies), 4),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 4),
+        "reads_per_s": round(reads / total, 1) if total else None,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reads", type=int, default=500)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--json", action="store_true", help="Emit JSON only.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        executable = shutil.which("nvidia-smi")
+        if not executable:
+            executable = str(Path(tmp) / "nvidia-smi")
+            Path(executable).write_text(_STAND_IN)
+            os.chmod(executable, 0o755)
+        backend = NvidiaSmiBackend(executable)
+
+        results = [_timed("per-request", args.reads, backend.sample)]
+        sampler = GPUTelemetrySampler(backend, interval=args.interval).start()
+        sampler.gpus()  # first sample
+        results.append(_timed("buffered", args.reads, sampler.gpus))
+        stats = sampler.stats()
+        sampler.stop()
+        results[-1]["backend_samples"] = stats["buffered"]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    source = "nvidia-smi" if shutil.which("nvidia-smi") else "stand-in script"
+    print(f"reads: {args.reads}  interval: {args.interval}s  backend: {source}")
+    print(f"{'case':<12} {'sec':>8} {'p50 ms':>9} {'p99 ms':>9} {'reads/s':>10}")
+    for row in results:
+        print(
+            f"{row['case']:<12} {row['sec']:>8} {row['p50_ms']:>9} "
+            f"{row['p99_ms']:>9} {row['reads_per_s']:>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
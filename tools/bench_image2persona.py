@@ -0,0 +1,181 @@
+"""
+Benchmark image2persona serial analysis against the batch mode.
+
+Generates N reference images (default 500; a JPEG/PNG mix of portrait
+character sheets, some with EXIF rotation) in a temporary directory, then
+runs each mode in a fresh subprocess so peak RSS is measured in isolation:
+
+* ``serial`` — ``ImagePersonaAnalyzer.analyze_images`` (full decode per image);
+* ``batch``  — ``analyze_batch``: reduced-size decoding, process-pool
+  quantisation, and a warm second pass served from the content-hash cache.
+
+Peak RSS is the high-water mark of the analysing process; for the batch
+mode the largest pool worker (``ru_maxrss`` of children, which on Linux
+includes the RSS inherited at spawn) is reported separately.
+
+Usage:
+    python tools/bench_image2persona.py [--images 500] [--edge 2048] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from PIL import Image, ImageDraw  # noqa: E402
+
+from comfyvn.persona.image2persona import (  # noqa: E402
+    ImagePersonaAnalyzer,
+    shutdown_batch_pool,
+)
+
+
+def _peak_rss_mb(who: int) -> float:
+    if who == resource.RUSAGE_SELF:
+        # Linux carries ru_maxrss across fork+exec, so the launcher's peak
+        # would leak in; VmHWM is reset with the new address space.
+        try:
+            for line in Path("/proc/self/status").read_text().splitlines():
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+        except OSError:
+            pass
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(resource.getrusage(who).ru_maxrss / scale, 1)
+
+
+def _generate(directory: Path, count: int, edge: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    paths: List[str] = []
+    for index in range(count):
+        width, height = int(edge * rng.uniform(0.6, 0.8)), edge
+        image = Image.new("RGB", (width, height), (rng.randint(200, 255),) * 3)
+        draw = ImageDraw.Draw(image)
+        body = tuple(rng.randint(0, 255) for _ in range(3))
+        draw.rectangle(
+            (width * 0.3, height * 0.25, width * 0.7, height * 0.95), fill=body
+        )
+        draw.ellipse(
+            (width * 0.38, height * 0.05, width * 0.62, height * 0.28),
+            fill=(rng.randint(150, 240), rng.randint(110, 200), rng.randint(90, 170)),
+        )
+        for _ in range(6):
+            x, y = rng.uniform(0, width), rng.uniform(0, height)
+            accent = tuple(rng.randint(0, 255) for _ in range(3))
+            draw.ellipse((x, y, x + width * 0.08, y + width * 0.08), fill=accent)
+        if index % 5 == 4:
+            path = directory / f"ref_{index:04d}.png"
+            image.save(path, "PNG")
+        else:
+            path = directory / f"ref_{index:04d}.jpg"
+            exif = Image.Exif()
+            if index % 7 == 0:
+                exif[0x0112] = 6
+            image.save(path, "JPEG", quality=90, exif=exif)
+        paths.append(str(path))
+    return paths
+
+
+def _run_mode(mode: str, paths: List[str], workers: int) -> Dict[str, Any]:
+    analyzer = ImagePersonaAnalyzer()
+    started = time.perf_counter()
+    if mode == "serial":
+        suggestion = analyzer.analyze_images(paths)
+        result: Dict[str, Any] = {"sec": time.perf_counter() - started}
+    else:
+        ticks: List[float] = []
+        suggestion = analyzer.analyze_batch(
+            paths,
+            max_workers=workers,
+            progress=lambda _event: ticks.append(time.perf_counter()),
+        )
+        result = {
+            "sec": time.perf_counter() - started,
+            "first_result_sec": round(ticks[0] - started, 3),
+        }
+        warm = time.perf_counter()
+        analyzer.analyze_batch(paths, max_workers=workers)
+        result["warm_sec"] = round(time.perf_counter() - warm, 3)
+        shutdown_batch_pool(wait=True)  # reap workers so their RSS is counted
+        result["worker_peak_rss_mb"] = _peak_rss_mb(resource.RUSAGE_CHILDREN)
+    result.update(
+        mode=mode,
+        images=len(suggestion.per_image),
+        sec=round(result["sec"], 3),
+        peak_rss_mb=_peak_rss_mb(resource.RUSAGE_SELF),
+        primary_color=suggestion.summary["appearance"]["primary_color"],
+    )
+    return result
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--images", type=int, default=500)
+    parser.add_argument("--edge", type=int, default=2048, help="Image height in px.")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--mode", choices=("serial", "batch", "both"), default="both")
+    parser.add_argument("--json", action="store_true", help="Emit JSON only.")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        spec = json.loads(Path(args.child).read_text(encoding="utf-8"))
+        print(json.dumps(_run_mode(spec["mode"], spec["paths"], args.workers)))
+        return 0
+
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        paths = _generate(directory, args.images, args.edge, args.seed)
+        modes = ("serial", "batch") if args.mode == "both" else (args.mode,)
+        for mode in modes:
+            spec = directory / f"{mode}.json"
+            spec.write_text(json.dumps({"mode": mode, "paths": paths}))
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    str(Path(__file__).resolve()),
+                    "--child",
+                    str(spec),
+                    "--workers",
+                    str(args.workers),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"images: {args.images}  edge: {args.edge}px  workers: {args.workers}")
+    print(
+        f"{'mode':<7} {'sec':>8} {'first s':>8} {'warm s':>7} "
+        f"{'peak MB':>8} {'worker MB':>10}"
+    )
+    for row in results:
+        print(
+            f"{row['mode']:<7} {row['sec']:>8} {row.get('first_result_sec', ''):>8} "
+            f"{row.get('warm_sec', ''):>7} {row['peak_rss_mb']:>8} "
+            f"{row.get('worker_peak_rss_mb', ''):>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,124 @@
+"""
+Throughput benchmark for the compute JobScheduler.
+
+Enqueues N jobs (in batches through ``enqueue_many``), then lets W worker
+threads claim and complete them until the queues are empty.  Runs once with
+the in-memory heaps and once with the SQLite `JobStore` behind them, and
+reports enqueue/claim rates plus the claim latency tail.
+
+Usage:
+    python tools/bench_job_scheduler.py [--jobs 100000] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from comfyvn.compute.job_store import JobStore  # noqa: E402
+from comfyvn.compute.scheduler import JobScheduler  # noqa: E402
+
+
+def _run(
+    mode: str, jobs: int, workers: int, batch: int, db_dir: Optional[Path]
+) -> Dict[str, Any]:
+    store = JobStore(db_dir / "bench_jobs.db") if db_dir is not None else None
+    sched = JobScheduler(store=store, history_limit=200)
+
+    started = time.perf_counter()
+    for offset in range(0, jobs, batch):
+        sched.enqueue_many(
+            {
+                "id": f"job-{index}",
+                "queue": "remote" if index % 5 == 0 else "local",
+                "priority": index % 4,
+            }
+            for index in range(offset, min(jobs, offset + batch))
+        )
+    enqueue_sec = time.perf_counter() - started
+
+    latencies: List[List[float]] = [[] for _ in range(workers)]
+    claimed = [0] * workers
+
+    def worker(slot: int) -> None:
+        queues = ("local", "remote")
+        idle = 0
+        while idle < len(queues):
+            queue = queues[(claimed[slot] + idle) % len(queues)]
+            t0 = time.perf_counter()
+            job = sched.claim(queue, worker_id=f"w{slot}")
+            if job is None:
+                idle += 1
+                continue
+            latencies[slot].append(time.perf_counter() - t0)
+            sched.complete(job["id"], duration_sec=0.0)
+            claimed[slot] += 1
+            idle = 0
+
+    threads = [threading.Thread(target=worker, args=(slot,)) for slot in range(workers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    claim_sec = time.perf_counter() - started
+
+    flat = sorted(value for bucket in latencies for value in bucket)
+    p99 = flat[min(len(flat) - 1, int(len(flat) * 0.99))] if flat else 0.0
+    if store is not None:
+        store.close()
+    return {
+        "mode": mode,
+        "jobs": jobs,
+        "workers": workers,
+        "claimed": sum(claimed),
+        "enqueue_per_sec": round(jobs / enqueue_sec, 1),
+        "claim_complete_per_sec": round(sum(claimed) / claim_sec, 1),
+        "claim_p99_ms": round(p99 * 1000, 3),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--mode", choices=("memory", "sqlite", "both"), default="both")
+    parser.add_argument("--json", action="store_true", help="Emit JSON only.")
+    args = parser.parse_args(argv)
+
+    results = []
+    modes = ("memory", "sqlite") if args.mode == "both" else (args.mode,)
+    for mode in modes:
+        if mode == "sqlite":
+            with tempfile.TemporaryDirectory() as tmp:
+                results.append(
+                    _run(mode, args.jobs, args.workers, args.batch, Path(tmp))
+                )
+        else:
+            results.append(_run(mode, args.jobs, args.workers, args.batch, None))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'mode':<8} {'enqueue/s':>11} {'claim+done/s':>13} {'p99 ms':>9}")
+    for row in results:
+        print(
+            f"{row['mode']:<8} {row['enqueue_per_sec']:>11} "
+            f"{row['claim_complete_per_sec']:>13} {row['claim_p99_ms']:>9}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,186 @@
+"""
+Stress benchmark for the perf BudgetManager delayed queue.
+
+Registers N jobs (default 50k) while the host is "saturated" so every job is
+deferred by a CPU, RAM or VRAM budget, then lowers the synthetic load over a
+series of refresh ticks until everything has been re-admitted.  Two paths
+are compared:
+
+* ``legacy`` — the previous approach: rescan the whole delayed list on each
+  tick and drop admitted jobs with ``list.remove``;
+* ``heap`` — `BudgetManager`: per-budget-class heaps keyed by required
+  headroom, so a tick only touches the jobs it admits.
+
+Usage:
+    python tools/bench_perf_budgets.py [--jobs 50000] [--ticks 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from comfyvn.perf import budgets as budgets_mod  # noqa: E402
+from comfyvn.perf.budgets import BudgetManager, JobRecord  # noqa: E402
+
+
+class _Load:
+    """Synthetic metrics provider; ``level`` 1.0 is fully saturated."""
+
+    def __init__(self) -> None:
+        self.level = 1.0
+
+    def __call__(self) -> Dict[str, Any]:
+        gpu = {"mem_used": 8192.0 * self.level, "mem_total": 8192.0}
+        return {
+            "ok": True,
+            "cpu": 80.0 * self.level,
+            "mem_used_mb": 16384.0 * self.level,
+            "gpus": [gpu],
+            "first_gpu": gpu,
+        }
+
+
+def _payloads(jobs: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    payloads = []
+    for index in range(jobs):
+        kind = index % 3
+        perf = {"cpu_percent": rng.uniform(1.0, 60.0)}
+        if kind == 1:
+            perf = {"ram_mb": rng.uniform(64.0, 8192.0)}
+        elif kind == 2:
+            perf = {"vram_mb": rng.uniform(64.0, 4096.0)}
+        payloads.append({"perf": perf})
+    return payloads
+
+
+def _manager(load: _Load) -> BudgetManager:
+    manager = BudgetManager(metrics_provider=load)
+    budgets_mod.modder_hooks = None  # keep hook fan-out out of the timings
+    manager.configure(
+        max_cpu_percent=80.0,
+        max_mem_mb=16384,
+        max_vram_mb=8192,
+        max_running_jobs=0,
+        max_queue_depth=0,
+        lazy_asset_target_mb=0,
+        evaluation_interval=0.0,
+    )
+    return manager
+
+
+def _run_heap(payloads: List[Dict[str, Any]], ticks: int) -> Dict[str, Any]:
+    load = _Load()
+    manager = _manager(load)
+    started = time.perf_counter()
+    for index, payload in enumerate(payloads):
+        manager.register_job(f"job-{index}", kind="render", payload=payload)
+    register_sec = time.perf_counter() - started
+
+    tick_times: List[float] = []
+    admitted = 0
+    for tick in range(1, ticks + 1):
+        load.level = 1.0 - tick / ticks
+        t0 = time.perf_counter()
+        admitted += len(manager.refresh_queue())
+        tick_times.append(time.perf_counter() - t0)
+    return _summary("heap", len(payloads), register_sec, tick_times, admitted)
+
+
+def _run_legacy(payloads: List[Dict[str, Any]], ticks: int) -> Dict[str, Any]:
+    load = _Load()
+    manager = _manager(load)
+    records = {}
+    delayed: List[str] = []
+    queued: List[str] = []
+    started = time.perf_counter()
+    for index, payload in enumerate(payloads):
+        job_id = f"job-{index}"
+        record = JobRecord(
+            job_id=job_id,
+            kind="render",
+            payload=payload,
+            requirements=budgets_mod.ResourceRequirements.from_payload(payload),
+        )
+        records[job_id] = record
+        budget_class, _ = manager._classify(record, load())
+        (queued if budget_class is None else delayed).append(job_id)
+    register_sec = time.perf_counter() - started
+
+    tick_times: List[float] = []
+    admitted = 0
+    for tick in range(1, ticks + 1):
+        load.level = 1.0 - tick / ticks
+        t0 = time.perf_counter()
+        metrics = load()
+        for job_id in list(delayed):
+            budget_class, reason = manager._classify(records[job_id], metrics)
+            records[job_id].reason = reason
+            if budget_class is None:
+                delayed.remove(job_id)
+                queued.append(job_id)
+                admitted += 1
+        tick_times.append(time.perf_counter() - t0)
+    return _summary("legacy", len(payloads), register_sec, tick_times, admitted)
+
+
+def _summary(
+    mode: str, jobs: int, register_sec: float, ticks: List[float], admitted: int
+) -> Dict[str, Any]:
+    ordered = sorted(ticks)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return {
+        "mode": mode,
+        "jobs": jobs,
+        "admitted": admitted,
+        "register_per_sec": round(jobs / register_sec, 1),
+        "refresh_total_sec": round(sum(ticks), 3),
+        "tick_p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "tick_p99_ms": round(p99 * 1000, 3),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--mode", choices=("legacy", "heap", "both"), default="both")
+    parser.add_argument("--json", action="store_true", help="Emit JSON only.")
+    args = parser.parse_args(argv)
+
+    payloads = _payloads(args.jobs, args.seed)
+    results = []
+    if args.mode in ("legacy", "both"):
+        results.append(_run_legacy(payloads, args.ticks))
+    if args.mode in ("heap", "both"):
+        results.append(_run_heap(payloads, args.ticks))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(
+        f"{'mode':<7} {'register/s':>11} {'refresh s':>10} "
+        f"{'tick p50 ms':>12} {'tick p99 ms':>12} {'admitted':>9}"
+    )
+    for row in results:
+        print(
+            f"{row['mode']:<7} {row['register_per_sec']:>11} "
+            f"{row['refresh_total_sec']:>10} {row['tick_p50_ms']:>12} "
+            f"{row['tick_p99_ms']:>12} {row['admitted']:>9}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
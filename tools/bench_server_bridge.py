@@ -0,0 +1,220 @@
+"""
+Loopback benchmark for the GUI ServerBridge transport.
+
+Starts a small FastAPI stand-in on 127.0.0.1, then fires the same burst
+workload through two request paths:
+
+* ``legacy`` — what ServerBridge did before: a fresh ``httpx.Client`` and a
+  fresh thread per callback-style request;
+* ``pooled`` — `BridgeTransport`: one keep-alive pool, a bounded executor and
+  coalescing of identical in-flight GETs.
+
+Reports requests per second, p50/p99 latency (submit → callback) and how many
+requests actually reached the server.
+
+Usage:
+    python tools/bench_server_bridge.py [--requests 2000] [--burst 32]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from comfyvn.gui.services.bridge_transport import BridgeTransport  # noqa: E402
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _build_app(latency: float, hits: Dict[str, int]):
+    import asyncio
+
+    from fastapi import FastAPI, Request
+
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def _count(request: Request, call_next):
+        hits["server"] += 1
+        return await call_next(request)
+
+    @app.get("/system/metrics")
+    async def metrics():
+        await asyncio.sleep(latency)
+        return {"ok": True, "cpu": 12.5, "mem": 40.0, "gpus": []}
+
+    @app.get("/api/items")
+    async def items(page: int = 0):
+        await asyncio.sleep(latency)
+        return {"page": page, "items": [{"id": i} for i in range(20)]}
+
+    @app.post("/api/echo")
+    async def echo(payload: Dict[str, Any]):
+        await asyncio.sleep(latency)
+        return payload
+
+    return app
+
+
+class _Server:
+    def __init__(self, app, port: int) -> None:
+        import uvicorn
+
+        config = uvicorn.Config(
+            app, host="127.0.0.1", port=port, log_level="error", access_log=False
+        )
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self) -> "_Server":
+        self.thread.start()
+        deadline = time.monotonic() + 10.0
+        while not self.server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("stand-in server did not start")
+            time.sleep(0.02)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.server.should_exit = True
+        self.thread.join(timeout=5.0)
+
+
+def _workload(base: str, total: int) -> List[tuple[str, str, Any]]:
+    calls: List[tuple[str, str, Any]] = []
+    for index in range(total):
+        kind = index % 4
+        if kind == 0:
+            calls.append(("GET", f"{base}/system/metrics", None))
+        elif kind in (1, 2):
+            calls.append(("GET", f"{base}/api/items", {"page": index % 3}))
+        else:
+            calls.append(("POST", f"{base}/api/echo", {"n": index}))
+    return calls
+
+
+def _legacy_submit(
+    method: str, url: str, payload: Any, done: Callable[[Dict[str, Any]], None]
+) -> threading.Thread:
+    def worker() -> None:
+        with httpx.Client(timeout=5.0) as cli:
+            if method == "GET":
+                response = cli.get(url, params=payload)
+            else:
+                response = cli.request(method, url, json=payload)
+        done({"ok": response.status_code < 400, "data": response.json()})
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    return thread
+
+
+def _run(mode: str, base: str, total: int, burst: int, workers: int) -> Dict[str, Any]:
+    transport = BridgeTransport(max_workers=workers) if mode == "pooled" else None
+    latencies: List[float] = []
+    failures = 0
+    lock = threading.Lock()
+    calls = _workload(base, total)
+    started = time.perf_counter()
+    for offset in range(0, total, burst):
+        pending = threading.Semaphore(0)
+        chunk = calls[offset : offset + burst]
+        for method, url, payload in chunk:
+            submitted = time.perf_counter()
+
+            def done(result: Dict[str, Any], submitted: float = submitted) -> None:
+                nonlocal failures
+                with lock:
+                    latencies.append(time.perf_counter() - submitted)
+                    if not result.get("ok"):
+                        failures += 1
+                pending.release()
+
+            if transport is None:
+                _legacy_submit(method, url, payload, done)
+            else:
+                if method == "GET":
+                    fn = lambda url=url, payload=payload: transport.request(  # noqa: E731
+                        "GET", url, params=payload
+                    )
+                else:
+                    fn = lambda url=url, payload=payload: transport.request(  # noqa: E731
+                        "POST", url, json_payload=payload
+                    )
+                transport.submit(fn, done)
+        for _ in chunk:
+            pending.acquire()
+    elapsed = time.perf_counter() - started
+    stats = transport.stats() if transport is not None else {}
+    if transport is not None:
+        transport.close()
+    latencies.sort()
+    p99_index = min(len(latencies) - 1, int(len(latencies) * 0.99))
+    return {
+        "mode": mode,
+        "requests": total,
+        "failures": failures,
+        "seconds": round(elapsed, 3),
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[p99_index] * 1000, 2),
+        "coalesced": stats.get("coalesced", 0),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--burst", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument(
+        "--latency", type=float, default=0.002, help="Stand-in handler delay (s)."
+    )
+    parser.add_argument("--json", action="store_true", help="Emit JSON only.")
+    args = parser.parse_args(argv)
+
+    hits = {"server": 0}
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    results = []
+    with _Server(_build_app(args.latency, hits), port):
+        for mode in ("legacy", "pooled"):
+            hits["server"] = 0
+            result = _run(mode, base, args.requests, args.burst, args.workers)
+            result["server_hits"] = hits["server"]
+            results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    header = (
+        f"{'mode':<8} {'rps':>9} {'p50 ms':>9} {'p99 ms':>9} {'hits':>7} {'fail':>5}"
+    )
+    print(header)
+    for row in results:
+        print(
+            f"{row['mode']:<8} {row['rps']:>9} {row['p50_ms']:>9} "
+            f"{row['p99_ms']:>9} {row['server_hits']:>7} {row['failures']:>5}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
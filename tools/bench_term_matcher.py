@@ -0,0 +1,209 @@
+"""
+Benchmark the shared term matcher on a synthetic script corpus.
+
+Builds a ~10 MB visual-novel style corpus (dialogue lines with a sprinkle of
+franchise names and rating keywords), then times:
+
+* ``ip``      — the advisory IP term set: the old per-term ``in`` loop versus
+  ``TermMatcher.matched_terms`` (presence) and ``finditer`` (spans);
+* ``scaling`` — synthetic term sets of growing size through both engines
+  (``find`` per-term scans vs the single-pass regex trie);
+* ``rating``  — ``RatingClassifier.classify`` over the corpus in scene-sized
+  chunks, old per-character token cleaning versus the compiled path.
+
+Usage:
+    python tools/bench_term_matcher.py [--mb 10] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from comfyvn.core import term_matcher  # noqa: E402
+from comfyvn.core.term_matcher import TermMatcher  # noqa: E402
+from comfyvn.rating.classifier_stub import (  # noqa: E402
+    RATING_MATRIX,
+    RatingClassifier,
+)
+
+# Mirrors comfyvn.advisory.scanner._IP_TERMS without importing the advisory
+# package (which pulls in the settings stack).
+IP_TERMS = {
+    "Nintendo": {"nintendo", "mario", "zelda", "pokemon", "metroid"},
+    "Disney": {"disney", "pixar", "marvel", "star wars", "lucasfilm"},
+    "Warner": {"warner", "dc comics", "harry potter", "hogwarts"},
+    "Sony": {"playstation", "spider-man", "uncharted", "last of us"},
+    "Universal": {"jurassic", "dreamworks", "minions", "fast & furious"},
+}
+
+_WORDS = (
+    "the she he they walks into room and says hello there mysterious garden "
+    "light shadow sword castle hero rain whisper look over dream market why "
+    "never always tomorrow letter train station quietly smiles, turns away."
+).split()
+
+
+def _corpus(megabytes: float, seed: int) -> str:
+    rng = random.Random(seed)
+    extras = [term for terms in IP_TERMS.values() for term in terms]
+    extras += [
+        term for rule in RATING_MATRIX.values() for term in rule.get("keywords", ())
+    ]
+    target = int(megabytes * 1_000_000)
+    lines: List[str] = []
+    size = 0
+    while size < target:
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(6, 16))]
+        if rng.random() < 0.01:
+            words.insert(rng.randrange(len(words)), rng.choice(extras).title())
+        line = f"{rng.choice(('Aya', 'Ren', 'Mio'))}: \"{' '.join(words)}\""
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines)
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _bench_ip(corpus: str, repeat: int) -> List[Dict[str, Any]]:
+    matcher = TermMatcher(IP_TERMS)
+
+    def legacy() -> Dict[str, set]:
+        haystack = corpus.lower()
+        found: Dict[str, set] = {}
+        for owner, tokens in IP_TERMS.items():
+            for token in tokens:
+                if token in haystack:
+                    found.setdefault(owner, set()).add(token)
+        return found
+
+    spans = len(matcher.finditer(corpus))
+    return [
+        {"case": "ip legacy in-loop", "sec": _time(legacy, repeat), "count": None},
+        {
+            "case": f"ip matched_terms ({matcher.engine})",
+            "sec": _time(lambda: matcher.categorize(corpus), repeat),
+            "count": None,
+        },
+        {
+            "case": f"ip finditer spans ({matcher.engine})",
+            "sec": _time(lambda: matcher.finditer(corpus), repeat),
+            "count": spans,
+        },
+    ]
+
+
+def _bench_scaling(corpus: str, repeat: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    rows: List[Dict[str, Any]] = []
+    for count in (25, 100, 400, 1600):
+        terms = [
+            "".join(
+                rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 12))
+            )
+            for _ in range(count)
+        ]
+        for engine, threshold in (("find", 10**9), ("regex", 0)):
+            term_matcher.REGEX_MIN_TERMS = threshold
+            matcher = TermMatcher({"synthetic": terms})
+            rows.append(
+                {
+                    "case": f"{count} terms {engine}",
+                    "sec": _time(lambda: matcher.matched_terms(corpus), repeat),
+                    "count": None,
+                }
+            )
+    term_matcher.REGEX_MIN_TERMS = 160
+    return rows
+
+
+def _legacy_classify(payload: Dict[str, Any]) -> List[str]:
+    tokens = set()
+    for token in payload["text"].lower().split():
+        cleaned = "".join(ch for ch in token if ch.isalnum() or ch in {"+", "#"})
+        if cleaned:
+            tokens.add(cleaned)
+    return [
+        candidate
+        for rule in RATING_MATRIX.values()
+        for candidate in (*rule.get("keywords", ()), *rule.get("tags", ()))
+        if candidate.lower() in tokens
+    ]
+
+
+def _bench_rating(corpus: str, repeat: int) -> List[Dict[str, Any]]:
+    lines = corpus.split("\n")
+    scenes = [
+        {"text": "\n".join(lines[index : index + 200])}
+        for index in range(0, len(lines), 200)
+    ]
+    classifier = RatingClassifier()
+    return [
+        {
+            "case": "rating legacy tokens",
+            "sec": _time(lambda: [_legacy_classify(s) for s in scenes], repeat),
+            "count": len(scenes),
+        },
+        {
+            "case": "rating compiled",
+            "sec": _time(
+                lambda: [classifier.classify("scene", s) for s in scenes], repeat
+            ),
+            "count": len(scenes),
+        },
+    ]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mb", type=float, default=10.0, help="Corpus size in MB.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument(
+        "--only", choices=("ip", "scaling", "rating"), help="Run a single section."
+    )
+    parser.add_argument("--json", action="store_true", help="Emit JSON only.")
+    args = parser.parse_args(argv)
+
+    corpus = _corpus(args.mb, args.seed)
+    results: List[Dict[str, Any]] = []
+    if args.only in (None, "ip"):
+        results += _bench_ip(corpus, args.repeat)
+    if args.only in (None, "scaling"):
+        results += _bench_scaling(corpus, args.repeat, args.seed)
+    if args.only in (None, "rating"):
+        results += _bench_rating(corpus, args.repeat)
+    for row in results:
+        row["sec"] = round(row["sec"], 4)
+        row["mb_per_sec"] = round(len(corpus) / 1_000_000 / row["sec"], 1)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"corpus: {len(corpus) / 1_000_000:.1f} MB")
+    print(f"{'case':<32} {'sec':>9} {'MB/s':>8} {'count':>7}")
+    for row in results:
+        count = "" if row["count"] is None else row["count"]
+        print(f"{row['case']:<32} {row['sec']:>9} {row['mb_per_sec']:>8} {count:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
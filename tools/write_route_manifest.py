@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Regenerate the route manifest used by ``COMFYVN_ROUTER_MODE=lazy``."""
+
+import argparse
+import os
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("COMFYVN_SKIP_APP_AUTOLOAD", "1")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output",
+        type=pathlib.Path,
+        default=None,
+        help="Manifest path (defaults to COMFYVN_ROUTE_MANIFEST or cache/route_manifest.json)",
+    )
+    args = parser.parse_args()
+
+    from comfyvn.server.app import write_route_manifest
+
+    target = write_route_manifest(args.output)
+    print(f"Wrote {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())